@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import asyncio
+import argparse
+import platform
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from .compare import compare, format_table, load_results, save_results
+
+
+_BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _parse_args(args: Optional[List[str]]) -> argparse.Namespace:
+    _parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the full request path and compare with baselines.",
+    )
+    _parser.add_argument(
+        "-d",
+        "--driver",
+        choices=["asgi", "load"],
+        default="asgi",
+        help="'asgi': in-process ASGI calls, 'load': HTTP load against a uvicorn subprocess.",
+    )
+    _parser.add_argument("-n", "--requests", type=int, default=2000)
+    _parser.add_argument(
+        "-c", "--concurrency", type=int, default=None, help="Defaults: asgi=1, load=16."
+    )
+    _parser.add_argument("-w", "--warmup", type=int, default=100)
+    _parser.add_argument("--workers", type=int, default=1, help="Uvicorn workers (load).")
+    _parser.add_argument(
+        "-s", "--scenarios", default="", help="Comma separated scenario names (default all)."
+    )
+    _parser.add_argument("-o", "--output", default=None, help="Results JSON file path.")
+    _parser.add_argument("-b", "--baseline", default=None, help="Baseline JSON file path.")
+    _parser.add_argument(
+        "--compare", action="store_true", help="Exit with code 1 on regressions."
+    )
+    _parser.add_argument(
+        "--save-baseline", action="store_true", help="Save results as the new baseline."
+    )
+    _parser.add_argument("--max-rps-drop", type=float, default=0.2)
+    _parser.add_argument("--max-p99-rise", type=float, default=0.5)
+    _parser.add_argument("--max-alloc-rise", type=float, default=0.2)
+    return _parser.parse_args(args)
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Command line entry: `python -m benchmarks [--driver=asgi|load] [--compare] [--save-baseline]`.
+
+    Args:
+        args (Optional[List[str]], optional): Command line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: Exit code, 1 if `--compare` found regressions.
+    """
+
+    _args = _parse_args(args)
+    ## Resolved before importing the application, it changes the working directory:
+    _output = os.path.abspath(
+        _args.output or os.path.join(_BENCHMARKS_DIR, "results", f"{_args.driver}.json")
+    )
+    _baseline_path = os.path.abspath(
+        _args.baseline
+        or os.path.join(_BENCHMARKS_DIR, "baselines", f"{_args.driver}.json")
+    )
+    _concurrency: int = _args.concurrency or (1 if _args.driver == "asgi" else 16)
+
+    from ._app import BENCH_AUTH_PATH, app, create_access_token
+    from ._scenarios import filter_scenarios, get_scenarios
+    from api.config import config
+
+    _api_prefix = config.api.prefix
+    _scenarios = filter_scenarios(
+        get_scenarios(
+            api_prefix=_api_prefix,
+            auth_path=BENCH_AUTH_PATH,
+            access_token=create_access_token(),
+        ),
+        [_name.strip() for _name in _args.scenarios.split(",") if _name.strip()],
+    )
+
+    if _args.driver == "asgi":
+        from ._asgi import run_asgi
+
+        _results = asyncio.run(
+            run_asgi(
+                app=app,
+                api_prefix=_api_prefix,
+                scenarios=_scenarios,
+                requests=_args.requests,
+                concurrency=_concurrency,
+                warmup=_args.warmup,
+            )
+        )
+    else:
+        from ._load import run_load, start_server, stop_server, wait_ready
+
+        _process, _base_url = start_server(workers=_args.workers)
+        try:
+            wait_ready(_process, _base_url, ping_path=f"{_api_prefix}/ping")
+            _results = asyncio.run(
+                run_load(
+                    base_url=_base_url,
+                    api_prefix=_api_prefix,
+                    scenarios=_scenarios,
+                    requests=_args.requests,
+                    concurrency=_concurrency,
+                    warmup=_args.warmup,
+                )
+            )
+        finally:
+            stop_server(_process)
+
+    _current: Dict[str, Any] = {
+        "driver": _args.driver,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "settings": {
+            "requests": _args.requests,
+            "concurrency": _concurrency,
+            "warmup": _args.warmup,
+            "workers": _args.workers if _args.driver == "load" else None,
+        },
+        "results": _results,
+    }
+    save_results(_current, _output)
+
+    _baseline: Optional[Dict[str, Any]] = None
+    if os.path.isfile(_baseline_path):
+        _baseline = load_results(_baseline_path)
+
+    print(format_table(current=_current, baseline=_baseline))
+    print(f"Results saved: {_output}")
+
+    _exit_code = 0
+    if _args.compare:
+        if _baseline is None:
+            print(f"Baseline not found: {_baseline_path}", file=sys.stderr)
+        else:
+            _regressions = compare(
+                current=_current,
+                baseline=_baseline,
+                max_rps_drop=_args.max_rps_drop,
+                max_p99_rise=_args.max_p99_rise,
+                max_alloc_rise=_args.max_alloc_rise,
+            )
+            for _regression in _regressions:
+                print(f"REGRESSION: {_regression}", file=sys.stderr)
+
+            if _regressions:
+                _exit_code = 1
+
+    if _args.save_baseline:
+        save_results(_current, _baseline_path)
+        print(f"Baseline saved: {_baseline_path}")
+
+    return _exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
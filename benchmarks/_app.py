@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import uuid
+
+## Benchmarks measure request handling, not client quotas (set before the config is loaded):
+os.environ.setdefault("FT_API_SECURITY_RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("FT_API_LOAD_SHEDDING_ENABLED", "false")
+os.environ.setdefault("FT_API_LIVE_RELOAD_WATCH", "false")
+
+from fastapi import Depends, FastAPI, Request  # noqa: E402
+
+from src.main import app as _main_app  # noqa: E402
+from api.config import config  # noqa: E402
+from api.core.dependencies.auth import get_user_id  # noqa: E402
+from api.core.responses import BaseResponse  # noqa: E402
+from api.logger import set_log_level  # noqa: E402
+
+
+BENCH_AUTH_PATH = f"{config.api.prefix}/_bench/me"
+
+
+def _add_bench_routes(app: FastAPI) -> None:
+    """Add routes that only exist for benchmarks (no JWT protected routes in the template yet)."""
+
+    async def get_bench_me(request: Request, user_id: str = Depends(get_user_id)):
+        return BaseResponse(request=request, content={"user_id": user_id})
+
+    app.add_api_route(
+        BENCH_AUTH_PATH, get_bench_me, methods=["GET"], include_in_schema=False
+    )
+    return
+
+
+app: FastAPI = _main_app
+_add_bench_routes(app)
+## Per-request logs would dominate the results (4xx scenarios log warnings), only errors are logged by default:
+set_log_level(os.getenv("FT_BENCH_LOG_LEVEL", "ERROR"))
+
+
+def create_access_token(sub: str = "bench_user", expires_in: int = 3600) -> str:
+    """Create a valid access token for JWT protected routes.
+
+    Args:
+        sub        (str, optional): Token subject (user ID). Defaults to 'bench_user'.
+        expires_in (int, optional): Expiration time in seconds. Defaults to 3600.
+
+    Returns:
+        str: Access token.
+    """
+
+    ## Imported on first use, `jwt` pulls in `cryptography`:
+    from api.helpers.crypto import jwt as jwt_helper
+
+    _token: str = jwt_helper.encode(
+        payload={
+            "sub": sub,
+            "jti": uuid.uuid4().hex,
+            "exp": int(time.time()) + expires_in,
+        },
+        key=config.api.security.jwt.secret,
+        algorithm=config.api.security.jwt.algorithm,
+    )
+    return _token
+
+
+__all__ = ["app", "BENCH_AUTH_PATH", "create_access_token"]
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+import json
+import time
+import asyncio
+import tracemalloc
+from typing import Any, Dict, List, Tuple
+
+from ._scenarios import PREPARE_TASKS, TASK_BODY, Scenario
+from ._stats import summarize
+
+
+_Headers = List[Tuple[bytes, bytes]]
+
+
+class ASGIDriver:
+    """Calls the ASGI application directly, without sockets or an HTTP client.
+    Measures the whole middleware stack and route handlers, nothing else.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def request(
+        self, method: str, path: str, headers: _Headers, body: bytes = b""
+    ) -> Tuple[int, bytes]:
+        """Send one request.
+
+        Args:
+            method  (str     , required): HTTP method.
+            path    (str     , required): Path with optional query string.
+            headers (_Headers, required): Raw request headers.
+            body    (bytes   , optional): Request body. Defaults to b''.
+
+        Returns:
+            Tuple[int, bytes]: Response status code and body.
+        """
+
+        _path, _, _query = path.partition("?")
+        _scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.3"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": _path,
+            "raw_path": _path.encode("latin-1"),
+            "query_string": _query.encode("latin-1"),
+            "root_path": "",
+            "headers": headers,
+            "client": ("127.0.0.1", 50000),
+            "server": ("127.0.0.1", 8000),
+            "state": {},
+        }
+        _request_messages = [{"type": "http.request", "body": body, "more_body": False}]
+        _done = asyncio.Event()
+        _status = 0
+        _chunks: List[bytes] = []
+
+        async def _receive() -> Dict[str, Any]:
+            if _request_messages:
+                return _request_messages.pop()
+
+            await _done.wait()
+            return {"type": "http.disconnect"}
+
+        async def _send(message: Dict[str, Any]) -> None:
+            nonlocal _status
+            if message["type"] == "http.response.start":
+                _status = message["status"]
+            elif message["type"] == "http.response.body":
+                _chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    _done.set()
+
+        await self.app(_scope, _receive, _send)
+        _done.set()
+        return _status, b"".join(_chunks)
+
+
+def _make_headers(scenario: Scenario) -> _Headers:
+    _headers: _Headers = [(b"host", b"127.0.0.1:8000"), (b"accept", b"*/*")]
+    for _name, _val in scenario.headers.items():
+        _headers.append((_name.lower().encode("latin-1"), _val.encode("latin-1")))
+
+    if scenario.body is not None:
+        _headers.append((b"content-length", str(len(scenario.body)).encode()))
+
+    return _headers
+
+
+async def _create_tasks(driver: ASGIDriver, api_prefix: str, count: int) -> List[str]:
+    _headers: _Headers = [
+        (b"host", b"127.0.0.1:8000"),
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(TASK_BODY)).encode()),
+    ]
+    _task_ids: List[str] = []
+    for _ in range(count):
+        _status, _body = await driver.request(
+            "POST", f"{api_prefix}/tasks/", _headers, TASK_BODY
+        )
+        if _status != 201:
+            raise RuntimeError(f"Failed to create task, status: {_status}!")
+
+        _task_ids.append(json.loads(_body)["data"]["id"])
+
+    return _task_ids
+
+
+async def _run_scenario(
+    driver: ASGIDriver,
+    scenario: Scenario,
+    paths: List[str],
+    concurrency: int,
+) -> Tuple[List[int], int, float]:
+    _headers = _make_headers(scenario)
+    _body = scenario.body or b""
+    _latencies_ns: List[int] = []
+    _errors = 0
+    _paths = iter(paths)
+
+    async def _worker() -> None:
+        nonlocal _errors
+        for _path in _paths:
+            _start_ns = time.perf_counter_ns()
+            try:
+                _status, _ = await driver.request(
+                    scenario.method, _path, _headers, _body
+                )
+            except Exception:
+                _status = 0
+
+            _latencies_ns.append(time.perf_counter_ns() - _start_ns)
+            if _status != scenario.status:
+                _errors += 1
+
+    _start_time = time.perf_counter()
+    await asyncio.gather(*[_worker() for _ in range(concurrency)])
+    return _latencies_ns, _errors, time.perf_counter() - _start_time
+
+
+async def _measure_alloc(
+    driver: ASGIDriver, scenario: Scenario, paths: List[str]
+) -> float:
+    """Mean peak traced memory per request, measured separately, tracing slows requests down."""
+
+    _headers = _make_headers(scenario)
+    _body = scenario.body or b""
+    _total = 0
+    tracemalloc.start()
+    try:
+        for _path in paths:
+            _current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await driver.request(scenario.method, _path, _headers, _body)
+            _, _peak = tracemalloc.get_traced_memory()
+            _total += _peak - _current
+    finally:
+        tracemalloc.stop()
+
+    return _total / len(paths) if paths else 0.0
+
+
+async def run_asgi(
+    app: Any,
+    api_prefix: str,
+    scenarios: List[Scenario],
+    requests: int = 2000,
+    concurrency: int = 1,
+    warmup: int = 100,
+    alloc_requests: int = 100,
+) -> Dict[str, Dict[str, Any]]:
+    """Run scenarios in-process, with the application lifespan.
+
+    Args:
+        app            (Any           , required): ASGI application.
+        api_prefix     (str           , required): API prefix, e.g. '/api/v1'.
+        scenarios      (List[Scenario], required): Scenarios to run.
+        requests       (int           , optional): Timed requests per scenario. Defaults to 2000.
+        concurrency    (int           , optional): Concurrent requests. Defaults to 1.
+        warmup         (int           , optional): Untimed requests before timing. Defaults to 100.
+        alloc_requests (int           , optional): Requests to measure allocations with. Defaults to 100.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Scenario name -> summary (see `summarize()`).
+    """
+
+    _driver = ASGIDriver(app=app)
+    _results: Dict[str, Dict[str, Any]] = {}
+    async with app.router.lifespan_context(app):
+        _task_ids = await _create_tasks(_driver, api_prefix, PREPARE_TASKS)
+        for _scenario in scenarios:
+            _count = warmup + requests + alloc_requests
+            if _scenario.fresh_task:
+                _ids = await _create_tasks(_driver, api_prefix, _count)
+            else:
+                _ids = [_task_ids[len(_task_ids) // 2]] * _count
+
+            _paths = [_scenario.path.format(task_id=_id) for _id in _ids]
+            await _run_scenario(_driver, _scenario, _paths[:warmup], concurrency)
+            _latencies_ns, _errors, _elapsed = await _run_scenario(
+                _driver, _scenario, _paths[warmup : warmup + requests], concurrency
+            )
+            _alloc_bytes = await _measure_alloc(
+                _driver, _scenario, _paths[warmup + requests :]
+            )
+            _results[_scenario.name] = summarize(
+                latencies_ns=_latencies_ns,
+                elapsed=_elapsed,
+                errors=_errors,
+                alloc_bytes=_alloc_bytes,
+            )
+
+    return _results
+
+
+__all__ = ["ASGIDriver", "run_asgi"]
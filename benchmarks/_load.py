@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import socket
+import asyncio
+import subprocess
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from ._scenarios import PREPARE_TASKS, TASK_BODY, Scenario
+from ._stats import summarize
+
+
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _get_free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as _socket:
+        _socket.bind((host, 0))
+        return _socket.getsockname()[1]
+
+
+def start_server(
+    host: str = "127.0.0.1", port: Optional[int] = None, workers: int = 1
+) -> Tuple[subprocess.Popen, str]:
+    """Start the benchmark application (`benchmarks._app:app`) with uvicorn in a subprocess.
+
+    Args:
+        host    (str          , optional): Bind host. Defaults to '127.0.0.1'.
+        port    (Optional[int], optional): Bind port. Defaults to a free port.
+        workers (int          , optional): Uvicorn worker processes. Defaults to 1.
+
+    Returns:
+        Tuple[subprocess.Popen, str]: Server process and its base URL.
+    """
+
+    if port is None:
+        port = _get_free_port(host)
+
+    _process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "benchmarks._app:app",
+            f"--host={host}",
+            f"--port={port}",
+            f"--workers={workers}",
+            "--log-level=warning",
+            "--no-access-log",
+        ],
+        cwd=_PROJECT_DIR,
+        ## Application logs are not part of the results:
+        stdout=subprocess.DEVNULL,
+    )
+    return _process, f"http://{host}:{port}"
+
+
+def wait_ready(
+    process: subprocess.Popen, base_url: str, ping_path: str, timeout: float = 60.0
+) -> None:
+    """Wait until the server answers the ping endpoint.
+
+    Args:
+        process   (subprocess.Popen, required): Server process.
+        base_url  (str             , required): Server base URL.
+        ping_path (str             , required): Ping endpoint path.
+        timeout   (float           , optional): Seconds to wait. Defaults to 60.0.
+
+    Raises:
+        RuntimeError: If the server exited or didn't start in time.
+    """
+
+    _deadline = time.monotonic() + timeout
+    while time.monotonic() < _deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}!")
+
+        try:
+            if httpx.get(f"{base_url}{ping_path}", timeout=1.0).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+
+        time.sleep(0.2)
+
+    raise RuntimeError(f"Server didn't start in {timeout} seconds!")
+
+
+def stop_server(process: subprocess.Popen, timeout: float = 15.0) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+async def _create_tasks(
+    client: httpx.AsyncClient, api_prefix: str, count: int
+) -> List[str]:
+    _task_ids: List[str] = []
+    for _ in range(count):
+        _response = await client.post(
+            f"{api_prefix}/tasks/",
+            content=TASK_BODY,
+            headers={"Content-Type": "application/json"},
+        )
+        _response.raise_for_status()
+        _task_ids.append(_response.json()["data"]["id"])
+
+    return _task_ids
+
+
+async def _run_scenario(
+    client: httpx.AsyncClient, scenario: Scenario, paths: List[str], concurrency: int
+) -> Tuple[List[int], int, float]:
+    _latencies_ns: List[int] = []
+    _errors = 0
+    _paths = iter(paths)
+
+    async def _worker() -> None:
+        nonlocal _errors
+        for _path in _paths:
+            _start_ns = time.perf_counter_ns()
+            try:
+                _response = await client.request(
+                    scenario.method,
+                    _path,
+                    content=scenario.body,
+                    headers=scenario.headers,
+                )
+                _status = _response.status_code
+            except httpx.HTTPError:
+                _status = 0
+
+            _latencies_ns.append(time.perf_counter_ns() - _start_ns)
+            if _status != scenario.status:
+                _errors += 1
+
+    _start_time = time.perf_counter()
+    await asyncio.gather(*[_worker() for _ in range(concurrency)])
+    return _latencies_ns, _errors, time.perf_counter() - _start_time
+
+
+async def run_load(
+    base_url: str,
+    api_prefix: str,
+    scenarios: List[Scenario],
+    requests: int = 2000,
+    concurrency: int = 16,
+    warmup: int = 100,
+) -> Dict[str, Dict[str, Any]]:
+    """Run scenarios against a running server over HTTP/1.1 keep-alive connections.
+
+    Args:
+        base_url    (str           , required): Server base URL.
+        api_prefix  (str           , required): API prefix, e.g. '/api/v1'.
+        scenarios   (List[Scenario], required): Scenarios to run.
+        requests    (int           , optional): Timed requests per scenario. Defaults to 2000.
+        concurrency (int           , optional): Concurrent connections. Defaults to 16.
+        warmup      (int           , optional): Untimed requests before timing. Defaults to 100.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Scenario name -> summary (see `summarize()`), without allocations.
+    """
+
+    _results: Dict[str, Dict[str, Any]] = {}
+    _limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=_limits, timeout=30.0
+    ) as _client:
+        _task_ids = await _create_tasks(_client, api_prefix, PREPARE_TASKS)
+        for _scenario in scenarios:
+            _count = warmup + requests
+            if _scenario.fresh_task:
+                _ids = await _create_tasks(_client, api_prefix, _count)
+            else:
+                _ids = [_task_ids[len(_task_ids) // 2]] * _count
+
+            _paths = [_scenario.path.format(task_id=_id) for _id in _ids]
+            await _run_scenario(_client, _scenario, _paths[:warmup], concurrency)
+            _latencies_ns, _errors, _elapsed = await _run_scenario(
+                _client, _scenario, _paths[warmup:], concurrency
+            )
+            _results[_scenario.name] = summarize(
+                latencies_ns=_latencies_ns, elapsed=_elapsed, errors=_errors
+            )
+
+    return _results
+
+
+__all__ = ["start_server", "wait_ready", "stop_server", "run_load"]
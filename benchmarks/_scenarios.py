@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One benchmarked request.
+
+    `{task_id}` in `path` is replaced with an existing task ID, or a new task for each request if `fresh_task`
+    (e.g. delete). Fresh tasks are created before timing starts.
+    """
+
+    name: str
+    method: str
+    path: str
+    status: int = 200
+    body: Optional[bytes] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    fresh_task: bool = False
+
+
+## Body to create tasks, also used to prepare tasks before timing:
+TASK_BODY = b'{"name":"Bench task","point":70}'
+## Tasks created before timing, so the largest list page is full:
+PREPARE_TASKS = 1000
+
+
+def get_scenarios(
+    api_prefix: str, auth_path: str, access_token: str
+) -> List[Scenario]:
+    """Get all benchmark scenarios, read-only ones first so writes don't change list sizes under them.
+
+    Args:
+        api_prefix   (str, required): API prefix, e.g. '/api/v1'.
+        auth_path    (str, required): JWT protected route path.
+        access_token (str, required): Valid access token.
+
+    Returns:
+        List[Scenario]: Benchmark scenarios.
+    """
+
+    _json = {"Content-Type": "application/json"}
+    _tasks = f"{api_prefix}/tasks"
+    _scenarios = [
+        Scenario(name="ping", method="GET", path=f"{api_prefix}/ping"),
+        Scenario(name="health", method="GET", path=f"{api_prefix}/health"),
+        Scenario(name="tasks_list_10", method="GET", path=f"{_tasks}/?limit=10"),
+        Scenario(name="tasks_list_100", method="GET", path=f"{_tasks}/?limit=100"),
+        Scenario(name="tasks_list_1000", method="GET", path=f"{_tasks}/?limit=1000"),
+        Scenario(name="task_get", method="GET", path=f"{_tasks}/{{task_id}}"),
+        Scenario(
+            name="auth_jwt",
+            method="GET",
+            path=auth_path,
+            headers={"Authorization": f"Bearer {access_token}"},
+        ),
+        Scenario(name="auth_missing_401", method="GET", path=auth_path, status=401),
+        Scenario(
+            name="task_not_found_404",
+            method="GET",
+            path=f"{_tasks}/1700000000_00000000000000000000000000000000",
+            status=404,
+        ),
+        Scenario(
+            name="task_invalid_422",
+            method="POST",
+            path=f"{_tasks}/",
+            status=422,
+            body=b'{"name":"","point":1000}',
+            headers=_json,
+        ),
+        Scenario(
+            name="task_create",
+            method="POST",
+            path=f"{_tasks}/",
+            status=201,
+            body=TASK_BODY,
+            headers=_json,
+        ),
+        Scenario(
+            name="task_update",
+            method="PUT",
+            path=f"{_tasks}/{{task_id}}",
+            body=b'{"name":"Bench task updated","point":80}',
+            headers=_json,
+        ),
+        Scenario(
+            name="task_delete",
+            method="DELETE",
+            path=f"{_tasks}/{{task_id}}",
+            status=204,
+            fresh_task=True,
+        ),
+    ]
+    return _scenarios
+
+
+def filter_scenarios(
+    scenarios: List[Scenario], names: Optional[List[str]]
+) -> List[Scenario]:
+    """Select scenarios by name, all if no names are given.
+
+    Args:
+        scenarios (List[Scenario]     , required): All scenarios.
+        names     (Optional[List[str]], required): Scenario names to select.
+
+    Raises:
+        ValueError: If a scenario name is unknown.
+
+    Returns:
+        List[Scenario]: Selected scenarios, in the original order.
+    """
+
+    if not names:
+        return scenarios
+
+    _unknown = set(names) - {_scenario.name for _scenario in scenarios}
+    if _unknown:
+        raise ValueError(f"Unknown scenario(s): {', '.join(sorted(_unknown))}!")
+
+    return [_scenario for _scenario in scenarios if _scenario.name in names]
+
+
+__all__ = [
+    "Scenario",
+    "TASK_BODY",
+    "PREPARE_TASKS",
+    "get_scenarios",
+    "filter_scenarios",
+]
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import math
+from typing import Any, Dict, List, Optional
+
+
+def percentile(sorted_vals: List[float], pct: float) -> float:
+    """Nearest-rank percentile.
+
+    Args:
+        sorted_vals (List[float], required): Values sorted ascending.
+        pct         (float      , required): Percentile: [0 < pct <= 100].
+
+    Returns:
+        float: Percentile value, 0.0 if there are no values.
+    """
+
+    if not sorted_vals:
+        return 0.0
+
+    _rank = max(math.ceil(pct / 100 * len(sorted_vals)), 1)
+    return sorted_vals[_rank - 1]
+
+
+def summarize(
+    latencies_ns: List[int],
+    elapsed: float,
+    errors: int = 0,
+    alloc_bytes: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Summarize one scenario run.
+
+    Args:
+        latencies_ns (List[int]      , required): Latency of each request in nanoseconds.
+        elapsed      (float          , required): Wall time of the whole run in seconds.
+        errors       (int            , optional): Requests with unexpected status or failed. Defaults to 0.
+        alloc_bytes  (Optional[float], optional): Mean peak allocated bytes per request. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: Requests, errors, RPS, mean/p50/p95/p99/max latency in milliseconds and allocations.
+    """
+
+    _latencies_ms = sorted(_latency / 1e6 for _latency in latencies_ns)
+    _count = len(_latencies_ms)
+    _result: Dict[str, Any] = {
+        "requests": _count,
+        "errors": errors,
+        "rps": round(_count / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(sum(_latencies_ms) / _count, 4) if _count else 0.0,
+        "p50_ms": round(percentile(_latencies_ms, 50), 4),
+        "p95_ms": round(percentile(_latencies_ms, 95), 4),
+        "p99_ms": round(percentile(_latencies_ms, 99), 4),
+        "max_ms": round(_latencies_ms[-1], 4) if _count else 0.0,
+    }
+    if alloc_bytes is not None:
+        _result["alloc_bytes"] = int(alloc_bytes)
+
+    return _result
+
+
+__all__ = ["percentile", "summarize"]
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+"""Bulk file removal against the previous implementation (`async_remove_files()`, one `aiofiles.os` threadpool
+call per path, sequentially awaited). Files are recreated before each round. Run it explicitly:
+
+    python -m pytest benchmarks/bench_bulk_io.py --benchmark-columns=median,ops
+"""
+
+import os
+import asyncio
+from typing import List
+
+import pytest
+
+from src.main import app  # noqa: F401
+from api.core import utils
+
+
+_FILES_COUNT = 2000
+
+
+def _create_files(dir_path: str) -> List[str]:
+    _file_paths: List[str] = []
+    for _i in range(_FILES_COUNT):
+        _file_path = os.path.join(dir_path, f"file{_i}.tmp")
+        with open(_file_path, "wb") as _file:
+            _file.write(b"data")
+
+        _file_paths.append(_file_path)
+
+    return _file_paths
+
+
+@pytest.mark.parametrize("impl", ["legacy", "current"])
+def test_bench_remove_files(benchmark, tmp_path, impl: str):
+    """2000 small files, removal."""
+
+    _dir_path = str(tmp_path)
+
+    def _run(file_paths: List[str]) -> None:
+        if impl == "legacy":
+            asyncio.run(utils.async_remove_files(file_paths=file_paths))
+        else:
+            asyncio.run(utils.async_bulk_remove_files(file_paths=file_paths))
+
+    benchmark.group = "remove-2000-files"
+    benchmark.pedantic(
+        _run, setup=lambda: ((_create_files(_dir_path),), {}), rounds=5, iterations=1
+    )
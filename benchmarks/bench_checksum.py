@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+"""Checksum engine against the previous implementation (`aiofiles` reads of 4KB, one threadpool call per chunk,
+one hash method per pass). Run it explicitly:
+
+    python -m pytest benchmarks/bench_checksum.py --benchmark-columns=median,ops
+"""
+
+import os
+import asyncio
+import hashlib
+from typing import List
+
+import aiofiles
+import pytest
+
+from src.main import app  # noqa: F401
+from api.core import utils
+
+
+_FILE_SIZE = 32 * 1024 * 1024
+_FILES_COUNT = 8
+_FILES_SIZE = 4 * 1024 * 1024
+
+
+async def _legacy_async_get_file_checksum(
+    file_path: str, hash_method: str = "md5", chunk_size: int = 4096
+) -> str:
+    _file_hash = hashlib.new(hash_method)
+    async with aiofiles.open(file_path, "rb") as _file:
+        while True:
+            _file_chunk = await _file.read(chunk_size)
+            if not _file_chunk:
+                break
+            _file_hash.update(_file_chunk)
+
+    return _file_hash.hexdigest()
+
+
+@pytest.fixture(scope="module")
+def big_file(tmp_path_factory) -> str:
+    _file_path = str(tmp_path_factory.mktemp("checksum") / "big.bin")
+    with open(_file_path, "wb") as _file:
+        _file.write(os.urandom(_FILE_SIZE))
+
+    return _file_path
+
+
+@pytest.fixture(scope="module")
+def many_files(tmp_path_factory) -> List[str]:
+    _dir_path = tmp_path_factory.mktemp("checksums")
+    _file_paths: List[str] = []
+    for _i in range(_FILES_COUNT):
+        _file_path = str(_dir_path / f"file{_i}.bin")
+        with open(_file_path, "wb") as _file:
+            _file.write(os.urandom(_FILES_SIZE))
+
+        _file_paths.append(_file_path)
+
+    return _file_paths
+
+
+def _run(benchmark, coro_func, *args, **kwargs) -> None:
+    benchmark.pedantic(
+        lambda: asyncio.run(coro_func(*args, **kwargs)), rounds=5, iterations=1
+    )
+
+
+@pytest.mark.parametrize("impl", ["legacy", "current"])
+def test_bench_md5(benchmark, big_file: str, impl: str):
+    """32MB file, md5."""
+
+    benchmark.group = "md5-32MB"
+    if impl == "legacy":
+        _run(benchmark, _legacy_async_get_file_checksum, big_file)
+    else:
+        _run(benchmark, utils.async_get_file_checksum, big_file)
+
+
+@pytest.mark.parametrize("impl", ["legacy", "current"])
+def test_bench_md5_sha256(benchmark, big_file: str, impl: str):
+    """32MB file, md5 and sha256: two passes (legacy) or one pass."""
+
+    benchmark.group = "md5+sha256-32MB"
+
+    async def _legacy() -> None:
+        await _legacy_async_get_file_checksum(big_file, "md5")
+        await _legacy_async_get_file_checksum(big_file, "sha256")
+
+    if impl == "legacy":
+        _run(benchmark, _legacy)
+    else:
+        _run(benchmark, utils.async_get_file_checksums, big_file, ["md5", "sha256"])
+
+
+@pytest.mark.parametrize("impl", ["legacy", "sequential", "parallel", "sidecar"])
+def test_bench_many_files(benchmark, many_files: List[str], impl: str):
+    """8 files of 4MB, md5 and sha256."""
+
+    benchmark.group = "md5+sha256-8x4MB"
+
+    async def _legacy() -> None:
+        for _file_path in many_files:
+            await _legacy_async_get_file_checksum(_file_path, "md5")
+            await _legacy_async_get_file_checksum(_file_path, "sha256")
+
+    async def _sequential() -> None:
+        for _file_path in many_files:
+            await utils.async_get_file_checksums(_file_path)
+
+    if impl == "legacy":
+        _run(benchmark, _legacy)
+    elif impl == "sequential":
+        _run(benchmark, _sequential)
+    elif impl == "parallel":
+        _run(benchmark, utils.async_get_files_checksums, many_files, max_workers=4)
+    else:
+        ## Unchanged files, checksums are read from sidecar files:
+        utils.get_files_checksums(many_files, use_sidecar=True)
+        _run(benchmark, utils.async_get_files_checksums, many_files, use_sidecar=True)
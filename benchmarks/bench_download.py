@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""File download response against Starlette's `FileResponse` (64KB `anyio` reads, one threadpool call per read).
+Both are called directly as ASGI apps with a sink `send`, without middlewares. Run it explicitly:
+
+    python -m pytest benchmarks/bench_download.py --benchmark-columns=median,ops
+"""
+
+import os
+import asyncio
+from typing import Any, Dict
+
+import pytest
+from starlette.responses import FileResponse
+
+from src.main import app  # noqa: F401
+from api.core.responses import FileStreamResponse
+
+
+_FILE_SIZE = 32 * 1024 * 1024
+
+
+@pytest.fixture(scope="module")
+def big_file(tmp_path_factory) -> str:
+    _file_path = str(tmp_path_factory.mktemp("download") / "big.bin")
+    with open(_file_path, "wb") as _file:
+        _file.write(os.urandom(_FILE_SIZE))
+
+    return _file_path
+
+
+async def _download(response: Any, extensions: Dict[str, Any]) -> None:
+    _scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [],
+        "extensions": extensions,
+    }
+
+    async def _receive() -> Dict[str, Any]:
+        await asyncio.sleep(60)
+        return {"type": "http.disconnect"}
+
+    async def _send(message: Dict[str, Any]) -> None:
+        pass
+
+    await response(_scope, _receive, _send)
+
+
+@pytest.mark.parametrize("impl", ["legacy", "current", "current-pathsend"])
+def test_bench_download(benchmark, big_file: str, impl: str):
+    """32MB file, full download."""
+
+    def _run() -> None:
+        if impl == "legacy":
+            asyncio.run(_download(FileResponse(big_file), {}))
+        elif impl == "current":
+            asyncio.run(_download(FileStreamResponse(big_file), {}))
+        else:
+            asyncio.run(
+                _download(FileStreamResponse(big_file), {"http.response.pathsend": {}})
+            )
+
+    benchmark.group = "download-32MB"
+    benchmark.pedantic(_run, rounds=5, iterations=1)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+"""`gen_unique_id()` modes against the previous implementation (`validate_call`, `now_ts()`, `uuid4()`,
+`str()` and `lower()` on every call). Run it explicitly:
+
+    python -m pytest benchmarks/bench_ids.py --benchmark-columns=median,ops
+"""
+
+import uuid
+
+import pytest
+from pydantic import validate_call, constr
+
+from src.main import app  # noqa: F401
+from api.core import utils
+from api.core.constants import UniqueIdModeEnum
+
+
+@validate_call
+def _legacy_gen_unique_id(prefix: constr(strip_whitespace=True, max_length=32) = "") -> str:  # type: ignore
+    return str(f"{prefix}{utils.now_ts()}_{uuid.uuid4().hex}").lower()
+
+
+@pytest.mark.parametrize("prefix", ["", "res"])
+@pytest.mark.parametrize("impl", ["legacy", "timestamp_uuid", "ulid"])
+def test_bench_gen_unique_id(benchmark, impl: str, prefix: str):
+    benchmark.group = f"gen_unique_id-prefix_{bool(prefix)}"
+    if impl == "legacy":
+        benchmark(_legacy_gen_unique_id, prefix)
+        return
+
+    utils.set_unique_id_mode(UniqueIdModeEnum(impl))
+    try:
+        benchmark(utils.gen_unique_id, prefix)
+    finally:
+        utils.set_unique_id_mode(UniqueIdModeEnum.timestamp_uuid)
+
+
+@pytest.mark.parametrize("impl", ["legacy", "timestamp_uuid", "ulid"])
+def test_bench_gen_unique_id_bulk(benchmark, impl: str):
+    """100k IDs, as in a bulk import."""
+
+    benchmark.group = "gen_unique_id-100k"
+    if impl == "legacy":
+        _func = _legacy_gen_unique_id
+    else:
+        utils.set_unique_id_mode(UniqueIdModeEnum(impl))
+        _func = utils.gen_unique_id
+
+    try:
+        benchmark.pedantic(
+            lambda: [_func() for _ in range(100_000)], rounds=3, iterations=1
+        )
+    finally:
+        utils.set_unique_id_mode(UniqueIdModeEnum.timestamp_uuid)
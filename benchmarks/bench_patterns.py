@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+"""Precompiled pattern registry and `str.translate()` fast paths against the previous implementation
+(pattern strings passed to `re` on every call, mode resolved with an if-chain). Run it explicitly:
+
+    python -m pytest benchmarks/bench_patterns.py --benchmark-columns=median,ops
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Tuple
+
+import pytest
+
+from src.main import app  # noqa: F401
+from api.core import utils
+from api.core.constants import (
+    ALPHANUM_HOST_REGEX,
+    REQUEST_ID_REGEX,
+    SPECIAL_CHARS_BASE_REGEX,
+    SPECIAL_CHARS_LOW_REGEX,
+    SPECIAL_CHARS_MEDIUM_REGEX,
+    SPECIAL_CHARS_HIGH_REGEX,
+    SPECIAL_CHARS_STRICT_REGEX,
+)
+
+
+def _legacy_get_pattern(mode: str) -> str:
+    mode = mode.upper()
+    if (mode == "BASE") or (mode == "HTML"):
+        return SPECIAL_CHARS_BASE_REGEX
+    elif mode == "LOW":
+        return SPECIAL_CHARS_LOW_REGEX
+    elif mode == "MEDIUM":
+        return SPECIAL_CHARS_MEDIUM_REGEX
+    elif (mode == "HIGH") or (mode == "SCRIPT") or (mode == "SQL"):
+        return SPECIAL_CHARS_HIGH_REGEX
+    elif mode == "STRICT":
+        return SPECIAL_CHARS_STRICT_REGEX
+
+    raise ValueError(f"Unsupported mode: {mode}")
+
+
+def _legacy_has_special_chars(val: str, mode: str = "LOW") -> bool:
+    return bool(re.search(pattern=_legacy_get_pattern(mode), string=val))
+
+
+def _legacy_clean_special_chars(val: str, mode: str = "LOW") -> str:
+    return re.sub(pattern=_legacy_get_pattern(mode), repl="", string=val)
+
+
+def _legacy_is_valid(val: str, pattern: str) -> bool:
+    return bool(re.match(pattern=pattern, string=val))
+
+
+def _legacy_is_request_id(val: str) -> bool:
+    return bool(re.match(pattern=REQUEST_ID_REGEX, string=val))
+
+
+_TEXTS: Dict[str, str] = {
+    "short": "Task name with <script>alert('x');</script>",
+    "short_clean": "Plain task name without special characters 123",
+    "long_clean": "Plain task name without special characters 123 " * 40,
+    "non_ascii": "작업 이름 <Ажлын нэр> & 'quotes' " * 4,
+}
+
+## name -> (legacy, current, args without text):
+_FUNCS: Dict[str, Tuple[Callable[..., Any], Callable[..., Any], Tuple[Any, ...]]] = {
+    "has_special_chars": (
+        _legacy_has_special_chars,
+        utils.validator.has_special_chars.raw_function,
+        ("HIGH",),
+    ),
+    "clean_special_chars": (
+        _legacy_clean_special_chars,
+        utils.sanitizer.clean_special_chars.raw_function,
+        ("HIGH",),
+    ),
+}
+
+
+def _get_params() -> List[Any]:
+    _params: List[Any] = []
+    for _func_name in _FUNCS:
+        for _text_name in _TEXTS:
+            for _impl in ("legacy", "current"):
+                _params.append(
+                    pytest.param(
+                        _func_name,
+                        _text_name,
+                        _impl,
+                        id=f"{_func_name}-{_text_name}-{_impl}",
+                    )
+                )
+
+    return _params
+
+
+@pytest.mark.parametrize("func_name, text_name, impl", _get_params())
+def test_bench_special_chars(benchmark, func_name: str, text_name: str, impl: str):
+    _legacy, _current, _args = _FUNCS[func_name]
+    _text = _TEXTS[text_name]
+    assert _legacy(_text, *_args) == _current(_text, *_args)
+
+    benchmark.group = f"{func_name}-{text_name}"
+    benchmark(_legacy if impl == "legacy" else _current, _text, *_args)
+
+
+@pytest.mark.parametrize("impl", ["legacy", "current"])
+def test_bench_is_valid(benchmark, impl: str):
+    _func = (
+        _legacy_is_valid if impl == "legacy" else utils.validator.is_valid.raw_function
+    )
+    benchmark.group = "is_valid"
+    benchmark(_func, "example.com", ALPHANUM_HOST_REGEX)
+
+
+@pytest.mark.parametrize("impl", ["legacy", "current"])
+def test_bench_is_request_id(benchmark, impl: str):
+    _func = (
+        _legacy_is_request_id
+        if impl == "legacy"
+        else utils.validator.is_request_id.raw_function
+    )
+    benchmark.group = "is_request_id"
+    benchmark(_func, "0b8c2ea0c5c04b6f8c3d2c8e7e4a3f1b")
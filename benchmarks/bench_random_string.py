@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+"""`gen_random_string()` with one bulk random bytes draw against the previous implementation
+(`secrets.choice()` per character), and `gen_random_strings()` against single calls. Run it explicitly:
+
+    python -m pytest benchmarks/bench_random_string.py --benchmark-columns=median,ops
+"""
+
+import string
+import secrets
+
+import pytest
+
+from src.main import app  # noqa: F401
+from api.core import utils
+
+
+def _legacy_gen_random_string(length: int = 16, is_alphanum: bool = True) -> str:
+    _base_chars = string.ascii_letters + string.digits
+    if not is_alphanum:
+        _base_chars += string.punctuation
+
+    return "".join(secrets.choice(_base_chars) for _i in range(length))
+
+
+@pytest.mark.parametrize("length", [8, 16, 64, 256])
+@pytest.mark.parametrize("impl", ["legacy", "current"])
+def test_bench_gen_random_string(benchmark, impl: str, length: int):
+    benchmark.group = f"gen_random_string-{length}"
+    if impl == "legacy":
+        benchmark(_legacy_gen_random_string, length)
+    else:
+        benchmark(utils.gen_random_string.raw_function, length)
+
+
+@pytest.mark.parametrize("impl", ["single", "batch"])
+def test_bench_gen_random_strings(benchmark, impl: str):
+    """1000 strings of 32 characters."""
+
+    benchmark.group = "gen_random_strings-1000x32"
+    if impl == "single":
+        benchmark(lambda: [utils.gen_random_string(32) for _ in range(1000)])
+    else:
+        benchmark(utils.gen_random_strings, 1000, 32)
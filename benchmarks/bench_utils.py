@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""Microbenchmarks of `api.core.utils` helpers used on (nearly) every request.
+
+Each helper is measured as called by the application (with `validate_call`) and without it (`raw_function`),
+and the median per-call time must stay under its threshold. Run it explicitly, it is not part of the tests:
+
+    python -m pytest benchmarks/bench_utils.py --benchmark-storage=./benchmarks/baselines/utils \
+        --benchmark-compare --benchmark-compare-fail=median:50%
+"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+import pytest
+from starlette.requests import Request
+
+from src.main import app  # noqa: F401
+from api.core import utils
+from api.core.constants import ALPHANUM_EXTEND_REGEX
+
+
+class _Case(NamedTuple):
+    func: Callable[..., Any]
+    args: Tuple[Any, ...]
+    ## Maximum median per-call time in microseconds: (with `validate_call`, without it):
+    max_us: Tuple[float, float]
+
+
+def _make_request() -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/v1/tasks/",
+            "root_path": "",
+            "query_string": b"skip=0&limit=100",
+            "headers": [(b"host", b"testserver")],
+            "server": ("testserver", 80),
+        }
+    )
+
+
+_TEXT = "Task name with <script>alert('x');</script> & some 'quotes' -- DROP TABLE"
+
+_CASES: Dict[str, _Case] = {
+    "gen_unique_id": _Case(utils.gen_unique_id, (), (40.0, 30.0)),
+    "now_utc_dt": _Case(utils.now_utc_dt, (), (5.0, 5.0)),
+    "datetime_to_iso": _Case(utils.datetime_to_iso, (utils.now_utc_dt(),), (20.0, 15.0)),
+    "get_http_status": _Case(utils.get_http_status, (404,), (10.0, 5.0)),
+    "get_relative_url": _Case(utils.get_relative_url, (_make_request(),), (10.0, 5.0)),
+    "is_valid": _Case(
+        utils.validator.is_valid, ("Task 1", ALPHANUM_EXTEND_REGEX), (15.0, 5.0)
+    ),
+    "has_special_chars": _Case(
+        utils.validator.has_special_chars, (_TEXT, "HIGH"), (10.0, 5.0)
+    ),
+    "clean_special_chars": _Case(
+        utils.sanitizer.clean_special_chars, (_TEXT, "HIGH"), (20.0, 15.0)
+    ),
+    "hash_str": _Case(utils.hash_str, (_TEXT,), (15.0, 10.0)),
+}
+
+
+def _get_params() -> List[Any]:
+    _params: List[Any] = []
+    for _name in _CASES:
+        _params.append(pytest.param(_name, True, id=f"{_name}-validated"))
+        _params.append(pytest.param(_name, False, id=f"{_name}-raw"))
+
+    return _params
+
+
+@pytest.mark.parametrize("name, is_validated", _get_params())
+def test_bench_utils(benchmark, name: str, is_validated: bool):
+    _case = _CASES[name]
+    _func = _case.func
+    if not is_validated:
+        _func = getattr(_func, "raw_function", _func)
+
+    benchmark.group = name
+    benchmark(_func, *_case.args)
+
+    ## Not available with `--benchmark-disable`:
+    if benchmark.stats:
+        _median_us = benchmark.stats.stats.median * 1_000_000
+        _max_us = _case.max_us[0] if is_validated else _case.max_us[1]
+        assert (
+            _median_us <= _max_us
+        ), f"'{name}' median {_median_us:.2f}us > {_max_us}us threshold!"
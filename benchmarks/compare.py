@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import argparse
+from typing import Any, Dict, List, Optional
+
+
+def load_results(file_path: str) -> Dict[str, Any]:
+    with open(file_path, "r", encoding="utf-8") as _file:
+        _results: Dict[str, Any] = json.load(_file)
+
+    return _results
+
+
+def save_results(results: Dict[str, Any], file_path: str) -> None:
+    _dir_path = os.path.dirname(file_path)
+    if _dir_path:
+        os.makedirs(_dir_path, exist_ok=True)
+
+    with open(file_path, "w", encoding="utf-8") as _file:
+        json.dump(results, _file, ensure_ascii=False, indent=2)
+        _file.write("\n")
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    max_rps_drop: float = 0.2,
+    max_p99_rise: float = 0.5,
+    max_alloc_rise: float = 0.2,
+) -> List[str]:
+    """Compare benchmark results with a baseline, scenarios missing in either are skipped.
+
+    Args:
+        current        (Dict[str, Any], required): Current results.
+        baseline       (Dict[str, Any], required): Baseline results.
+        max_rps_drop   (float         , optional): Allowed RPS drop ratio. Defaults to 0.2.
+        max_p99_rise   (float         , optional): Allowed p99 latency rise ratio. Defaults to 0.5.
+        max_alloc_rise (float         , optional): Allowed allocation rise ratio. Defaults to 0.2.
+
+    Returns:
+        List[str]: Regression messages, empty if there are none.
+    """
+
+    _regressions: List[str] = []
+    for _name, _base in baseline.get("results", {}).items():
+        _cur: Optional[Dict[str, Any]] = current.get("results", {}).get(_name)
+        if _cur is None:
+            continue
+
+        if _cur["errors"]:
+            _regressions.append(f"{_name}: {_cur['errors']} failed requests")
+
+        if _cur["rps"] < _base["rps"] * (1 - max_rps_drop):
+            _regressions.append(
+                f"{_name}: RPS {_cur['rps']} < baseline {_base['rps']} (-{max_rps_drop:.0%})"
+            )
+
+        if _base["p99_ms"] * (1 + max_p99_rise) < _cur["p99_ms"]:
+            _regressions.append(
+                f"{_name}: p99 {_cur['p99_ms']}ms > baseline {_base['p99_ms']}ms (+{max_p99_rise:.0%})"
+            )
+
+        if (
+            ("alloc_bytes" in _base)
+            and ("alloc_bytes" in _cur)
+            and (_base["alloc_bytes"] * (1 + max_alloc_rise) < _cur["alloc_bytes"])
+        ):
+            _regressions.append(
+                f"{_name}: allocations {_cur['alloc_bytes']}B > baseline {_base['alloc_bytes']}B (+{max_alloc_rise:.0%})"
+            )
+
+    return _regressions
+
+
+def format_table(
+    current: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None
+) -> str:
+    """Format results as a text table, with RPS change against the baseline if given.
+
+    Args:
+        current  (Dict[str, Any]          , required): Current results.
+        baseline (Optional[Dict[str, Any]], optional): Baseline results. Defaults to None.
+
+    Returns:
+        str: Results table.
+    """
+
+    _lines = [
+        f"{'scenario':<20} {'rps':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'alloc B':>9} {'errors':>6} {'vs base':>8}"
+    ]
+    _base_results: Dict[str, Any] = (baseline or {}).get("results", {})
+    for _name, _cur in current.get("results", {}).items():
+        _change = ""
+        if (_name in _base_results) and _base_results[_name]["rps"]:
+            _change = f"{_cur['rps'] / _base_results[_name]['rps'] - 1:+.1%}"
+
+        _lines.append(
+            f"{_name:<20} {_cur['rps']:>10.1f} {_cur['p50_ms']:>9.3f} {_cur['p95_ms']:>9.3f} "
+            f"{_cur['p99_ms']:>9.3f} {_cur.get('alloc_bytes', '-'):>9} {_cur['errors']:>6} {_change:>8}"
+        )
+
+    return "\n".join(_lines)
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Command line entry: `python -m benchmarks.compare <current.json> <baseline.json>`.
+
+    Args:
+        args (Optional[List[str]], optional): Command line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: Exit code, 1 if there are regressions.
+    """
+
+    _parser = argparse.ArgumentParser(
+        description="Compare benchmark results with a baseline."
+    )
+    _parser.add_argument("current", help="Current results JSON file.")
+    _parser.add_argument("baseline", help="Baseline results JSON file.")
+    _parser.add_argument("--max-rps-drop", type=float, default=0.2)
+    _parser.add_argument("--max-p99-rise", type=float, default=0.5)
+    _parser.add_argument("--max-alloc-rise", type=float, default=0.2)
+    _args = _parser.parse_args(args)
+
+    _current = load_results(_args.current)
+    _baseline = load_results(_args.baseline)
+    print(format_table(current=_current, baseline=_baseline))
+
+    _regressions = compare(
+        current=_current,
+        baseline=_baseline,
+        max_rps_drop=_args.max_rps_drop,
+        max_p99_rise=_args.max_p99_rise,
+        max_alloc_rise=_args.max_alloc_rise,
+    )
+    for _regression in _regressions:
+        print(f"REGRESSION: {_regression}", file=sys.stderr)
+
+    return 1 if _regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+__all__ = ["load_results", "save_results", "compare", "format_table", "main"]
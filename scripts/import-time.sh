@@ -0,0 +1,67 @@
+#!/bin/bash
+set -euo pipefail
+
+
+## --- Base --- ##
+# Getting path of this script file:
+_SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" >/dev/null 2>&1 && pwd)"
+_PROJECT_DIR="$(cd "${_SCRIPT_DIR}/.." >/dev/null 2>&1 && pwd)"
+cd "${_PROJECT_DIR}" || exit 2
+
+# Loading base script:
+# shellcheck disable=SC1091
+source ./scripts/base.sh
+
+
+if [ -z "$(which python)" ]; then
+	echoError "'python' not found or not installed."
+	exit 1
+fi
+## --- Base --- ##
+
+
+## --- Variables --- ##
+# Load from envrionment variables:
+IMPORT_MODULE="${IMPORT_MODULE:-main}"
+
+_TOP_N=20
+## --- Variables --- ##
+
+
+## --- Main --- ##
+main()
+{
+	## --- Menu arguments --- ##
+	if [ -n "${1:-}" ]; then
+		for _input in "${@:-}"; do
+			case ${_input} in
+				-m=* | --module=*)
+					IMPORT_MODULE="${_input#*=}"
+					shift;;
+				-n=* | --top=*)
+					_TOP_N="${_input#*=}"
+					shift;;
+				*)
+					echoError "Failed to parsing input -> ${_input}"
+					echoInfo "USAGE: ${0}  -m=*, --module=* | -n=*, --top=*"
+					exit 1;;
+			esac
+		done
+	fi
+	## --- Menu arguments --- ##
+
+
+	echoInfo "Profiling import time of '${IMPORT_MODULE}' module..."
+	# '-X importtime' writes to stderr, app output (if any) is dropped:
+	_import_log=$(cd ./src && python -X importtime -c "import ${IMPORT_MODULE}" 2>&1 >/dev/null | grep "^import time:" | grep -v "self \[us\]") || exit 2
+
+	_total_us=$(echo "${_import_log}" | awk -F'|' -v _module="${IMPORT_MODULE}" '{ _name=$3; gsub(/ /, "", _name); if (_name == _module) { gsub(/ /, "", $2); print $2 } }')
+	echoInfo "Total import time: $(awk -v _us="${_total_us:-0}" 'BEGIN { printf "%.1f", _us / 1000 }')ms"
+
+	echoInfo "Top ${_TOP_N} modules by cumulative import time [us]:"
+	echo "${_import_log}" | sort -t'|' -k2 -n -r | head -n "${_TOP_N}" | sed 's/^import time://'
+	echoOk "Done."
+}
+
+main "${@:-}"
+## --- Main --- ##
@@ -0,0 +1,66 @@
+#!/bin/bash
+set -euo pipefail
+
+
+## --- Base --- ##
+# Getting path of this script file:
+_SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" >/dev/null 2>&1 && pwd)"
+_PROJECT_DIR="$(cd "${_SCRIPT_DIR}/.." >/dev/null 2>&1 && pwd)"
+cd "${_PROJECT_DIR}" || exit 2
+
+# Loading base script:
+# shellcheck disable=SC1091
+source ./scripts/base.sh
+
+
+if [ -z "$(which python)" ]; then
+	echoError "'python' not found or not installed."
+	exit 1
+fi
+## --- Base --- ##
+
+
+## --- Variables --- ##
+# Load from envrionment variables:
+OPENAPI_FILE_PATH="${OPENAPI_FILE_PATH:-${_PROJECT_DIR}/docs/pages/api-docs/openapi.json}"
+
+# Flags:
+_IS_CHECK=false
+## --- Variables --- ##
+
+
+## --- Main --- ##
+main()
+{
+	## --- Menu arguments --- ##
+	if [ -n "${1:-}" ]; then
+		for _input in "${@:-}"; do
+			case ${_input} in
+				-o=* | --output=*)
+					OPENAPI_FILE_PATH="${_input#*=}"
+					shift;;
+				-c | --check)
+					_IS_CHECK=true
+					shift;;
+				*)
+					echoError "Failed to parsing input -> ${_input}"
+					echoInfo "USAGE: ${0}  -o=*, --output=* | -c, --check"
+					exit 1;;
+			esac
+		done
+	fi
+	## --- Menu arguments --- ##
+
+
+	if [ "${_IS_CHECK}" == true ]; then
+		echoInfo "Checking OpenAPI schema file '${OPENAPI_FILE_PATH}'..."
+		(cd ./src && python -m api.helpers.openapi --output="${OPENAPI_FILE_PATH}" --check) >/dev/null || exit 2
+	else
+		echoInfo "Generating OpenAPI schema file '${OPENAPI_FILE_PATH}'..."
+		(cd ./src && python -m api.helpers.openapi --output="${OPENAPI_FILE_PATH}") >/dev/null || exit 2
+	fi
+	echoOk "Done."
+}
+
+main "${@:-}"
+## --- Main --- ##
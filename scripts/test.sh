@@ -30,6 +30,7 @@ fi
 _IS_LOGGING=false
 _IS_COVERAGE=false
 _IS_VERBOSE=false
+_IS_BENCHMARK=false
 ## --- Variables --- ##
 
 
@@ -49,9 +50,12 @@ main()
 				-v | --verbose)
 					_IS_VERBOSE=true
 					shift;;
+				-b | --benchmark)
+					_IS_BENCHMARK=true
+					shift;;
 				*)
 					echoError "Failed to parsing input -> ${_input}"
-					echoInfo "USAGE: ${0}  -l, --log | -c, --cov | -v, --verbose"
+					echoInfo "USAGE: ${0}  -l, --log | -c, --cov | -v, --verbose | -b, --benchmark"
 					exit 1;;
 			esac
 		done
@@ -82,9 +86,21 @@ main()
 		_verbose_param="-svv"
 	fi
 
+	echoInfo "Checking OpenAPI schema file is up to date..."
+	./scripts/openapi.sh --check || exit 2
+
 	echoInfo "Running test..."
 	# shellcheck disable=SC2086
 	python -m pytest -v ${_coverage_param} ${_logging_param} ${_verbose_param} || exit 2
+
+	if [ "${_IS_BENCHMARK}" == true ]; then
+		echoInfo "Running benchmarks and comparing with baseline..."
+		python -m benchmarks --compare || exit 2
+		python -m pytest ./benchmarks/bench_utils.py \
+			--benchmark-storage=./benchmarks/baselines/utils \
+			--benchmark-compare \
+			--benchmark-compare-fail=median:50% || exit 2
+	fi
 	echoOk "Done."
 }
 
@@ -2,11 +2,9 @@
 
 ## Standard libraries
 import os
-from typing import Union
+from typing import Callable, Union
 
 ## Third-party libraries
-import uvicorn
-from uvicorn._types import ASGIApplication
 from pydantic import validate_call
 from fastapi import FastAPI
 
@@ -34,7 +32,9 @@ def create_app() -> FastAPI:
         version=config.version,
         lifespan=lifespan,
         default_response_class=BaseResponse,
-        **config.api.docs.model_dump(exclude={"enabled"}),
+        **config.api.docs.model_dump(
+            exclude={"enabled", "openapi_file", "openapi_cache_control"}
+        ),
     )
 
     add_middlewares(app=app)
@@ -46,13 +46,16 @@ def create_app() -> FastAPI:
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
-def run_server(app: Union[ASGIApplication, str] = "main:app") -> None:
+def run_server(app: Union[Callable, str] = "main:app") -> None:
     """Run uvicorn server.
 
     Args:
-        app (Union[ASGIApplication, str], optional): ASGI application instance or module path.
+        app (Union[Callable, str], optional): ASGI application instance or module path.
     """
 
+    ## Only needed to start the server, workers spawned by uvicorn already have it loaded:
+    import uvicorn
+
     _ssl_keyfile: Union[str, None] = None
     _ssl_certfile: Union[str, None] = None
 
@@ -74,6 +77,8 @@ def run_server(app: Union[ASGIApplication, str] = "main:app") -> None:
         forwarded_allow_ips=config.api.security.forwarded_allow_ips,
         ssl_keyfile=_ssl_keyfile,
         ssl_certfile=_ssl_certfile,
+        ## Server rejects larger frames before buffering them, app check is only a fallback:
+        ws_max_size=config.api.websocket.max_message_size,
         **config.api.dev.model_dump(),
     )
 
@@ -1,24 +1,47 @@
 # -*- coding: utf-8 -*-
 
+import os
 import pathlib
 
-from onion_config import ConfigLoader
 from beans_logging import logger
 
-from api.core.configs import MainConfig
+from api.core import utils
+from api.core.constants import ENV_PREFIX
+from api.core.configs import (
+    MainConfig,
+    RuntimeConfig,
+    VersionedConfig,
+    load_config,
+)
 
 
+CONFIGS_DIR = str(pathlib.Path(__file__).parent.resolve() / "configs")
+## Set to a directory to reuse the resolved config snapshot between processes (e.g. workers):
+_SNAPSHOT_DIR_ENV = f"{ENV_PREFIX}CONFIG_SNAPSHOT_DIR"
+
 config: MainConfig
 try:
-    _parent_dir = pathlib.Path(__file__).parent.resolve()
-    _config_loader = ConfigLoader(
-        config_schema=MainConfig, configs_dirs=[str(_parent_dir / "configs")]
-    )
     ## Main config object:
-    config: MainConfig = _config_loader.load()
+    config: MainConfig = load_config(
+        config_schema=MainConfig,
+        configs_dirs=[CONFIGS_DIR],
+        snapshot_dir=os.getenv(_SNAPSHOT_DIR_ENV),
+    )
 except Exception:
     logger.exception("Failed to load config:")
     raise SystemExit(1)
 
+## Before any resource is created (also for scripts that only import the config):
+utils.set_unique_id_mode(config.api.unique_id_mode)
+
+## Hot-reloadable subset of the main config, read it through `runtime_config.get()`:
+runtime_config = VersionedConfig(
+    config=RuntimeConfig(
+        log_level=config.logger.level.value,
+        gzip_min_size=config.api.gzip_min_size,
+        cors=config.api.security.cors,
+    )
+)
+
 
-__all__ = ["config"]
+__all__ = ["CONFIGS_DIR", "config", "runtime_config"]
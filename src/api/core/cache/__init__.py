@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+
+from ._base import *
+from ._memory import *
+from ._redis import *
+from ._tiered import *
+from ._factory import *
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+
+
+class BaseCache(ABC):
+    """Base class for async key-value cache backends, values are raw bytes (callers serialize)."""
+
+    async def connect(self) -> None:
+        """Open connections/resources, called once on startup."""
+
+        return
+
+    async def close(self) -> None:
+        """Release connections/resources, called once on shutdown."""
+
+        return
+
+    @abstractmethod
+    async def get(self, key: str) -> Union[bytes, None]:
+        """Get value by key.
+
+        Args:
+            key (str, required): Cache key.
+
+        Returns:
+            Union[bytes, None]: Cached value or None if missing/expired.
+        """
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Set value by key.
+
+        Args:
+            key   (str            , required): Cache key.
+            value (bytes          , required): Value to cache.
+            ttl   (Optional[float], optional): Time to live in seconds, backend default if None. Defaults to None.
+        """
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Delete value by key.
+
+        Args:
+            key (str, required): Cache key.
+        """
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Delete all values owned by this cache."""
+
+        raise NotImplementedError()
+
+    async def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        """Get values of multiple keys.
+
+        Args:
+            keys (List[str], required): Cache keys.
+
+        Returns:
+            Dict[str, bytes]: Found keys and values, missing keys are omitted.
+        """
+
+        _values: Dict[str, bytes] = {}
+        for _key in keys:
+            _value = await self.get(_key)
+            if _value is not None:
+                _values[_key] = _value
+
+        return _values
+
+    async def set_many(
+        self, mapping: Dict[str, bytes], ttl: Optional[float] = None
+    ) -> None:
+        """Set values of multiple keys.
+
+        Args:
+            mapping (Dict[str, bytes], required): Keys and values to cache.
+            ttl     (Optional[float] , optional): Time to live in seconds, backend default if None. Defaults to None.
+        """
+
+        for _key, _value in mapping.items():
+            await self.set(_key, _value, ttl=ttl)
+
+        return
+
+    async def incr(self, key: str, amount: int = 1, ttl: Optional[float] = None) -> int:
+        """Increment integer counter by key, a missing key is created with `ttl` (expiry is not extended).
+        Default implementation is not atomic, backends override it.
+
+        Args:
+            key    (str            , required): Cache key.
+            amount (int            , optional): Amount to add. Defaults to 1.
+            ttl    (Optional[float], optional): Time to live in seconds of a new counter, backend default if None.
+                                                Defaults to None.
+
+        Returns:
+            int: Counter value after increment.
+        """
+
+        _value = await self.get(key)
+        _count = (int(_value) if _value is not None else 0) + amount
+        await self.set(key, str(_count).encode(), ttl=ttl)
+        return _count
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[bytes]],
+        ttl: Optional[float] = None,
+    ) -> bytes:
+        """Read-through: get value by key, or load, cache and return it on a miss.
+
+        Args:
+            key    (str                          , required): Cache key.
+            loader (Callable[[], Awaitable[bytes]], required): Async function to load the value on a miss.
+            ttl    (Optional[float]              , optional): Time to live in seconds, backend default if None. Defaults to None.
+
+        Returns:
+            bytes: Cached or loaded value.
+        """
+
+        _value = await self.get(key)
+        if _value is None:
+            _value = await loader()
+            await self.set(key, _value, ttl=ttl)
+
+        return _value
+
+    async def __aenter__(self) -> "BaseCache":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+
+__all__ = ["BaseCache"]
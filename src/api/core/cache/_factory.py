@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+from pydantic import validate_call
+
+from api.core.constants import CacheBackendEnum
+from api.core.configs import CacheConfig
+from ._base import BaseCache
+from ._memory import MemoryCache
+from ._redis import RedisCache
+from ._tiered import TieredCache
+
+
+@validate_call
+def create_cache(cache_config: CacheConfig) -> BaseCache:
+    """Create cache backend from config, call `connect()` on it before use.
+
+    Args:
+        cache_config (CacheConfig, required): Cache config.
+
+    Returns:
+        BaseCache: Memory, Redis or tiered (memory on top of Redis) cache backend.
+    """
+
+    if cache_config.backend == CacheBackendEnum.memory:
+        return MemoryCache(**cache_config.memory.model_dump())
+
+    _redis_cache = RedisCache(**cache_config.redis.model_dump())
+    if cache_config.backend == CacheBackendEnum.redis:
+        return _redis_cache
+
+    _cache = TieredCache(
+        l1=MemoryCache(**cache_config.memory.model_dump()),
+        l2=_redis_cache,
+        l1_ttl=cache_config.l1_ttl,
+    )
+    return _cache
+
+
+__all__ = ["create_cache"]
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+
+from pydantic import validate_call, conint, confloat
+
+from ._base import BaseCache
+
+
+class MemoryCache(BaseCache):
+    """In-process LRU cache with per-key TTL, safe to share between event loop and worker threads."""
+
+    @validate_call
+    def __init__(
+        self,
+        max_size: conint(ge=1) = 10_000,  # type: ignore
+        default_ttl: Optional[confloat(gt=0)] = None,  # type: ignore
+    ) -> None:
+        """Constructor method for MemoryCache class.
+
+        Args:
+            max_size    (int            , optional): Maximum number of keys, least recently used are evicted. Defaults to 10000.
+            default_ttl (Optional[float], optional): Default time to live in seconds, no expiry if None. Defaults to None.
+        """
+
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+
+        ## Key -> (expire time by `time.monotonic()` or None, value):
+        self._entries: OrderedDict[str, Tuple[Union[float, None], bytes]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_nowait(self, key: str) -> Union[bytes, None]:
+        """Get value by key without awaiting, for sync callers.
+
+        Args:
+            key (str, required): Cache key.
+
+        Returns:
+            Union[bytes, None]: Cached value or None if missing/expired.
+        """
+
+        with self._lock:
+            _entry = self._entries.get(key)
+            if _entry is None:
+                return None
+
+            _expire_at, _value = _entry
+            if (_expire_at is not None) and (_expire_at <= time.monotonic()):
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+        return _value
+
+    def set_nowait(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Set value by key without awaiting, for sync callers.
+
+        Args:
+            key   (str            , required): Cache key.
+            value (bytes          , required): Value to cache.
+            ttl   (Optional[float], optional): Time to live in seconds, `default_ttl` if None. Defaults to None.
+        """
+
+        if ttl is None:
+            ttl = self.default_ttl
+
+        _expire_at: Union[float, None] = None
+        if ttl is not None:
+            _expire_at = time.monotonic() + ttl
+
+        with self._lock:
+            self._entries[key] = (_expire_at, value)
+            self._entries.move_to_end(key)
+            while self.max_size < len(self._entries):
+                self._entries.popitem(last=False)
+
+        return
+
+    def delete_nowait(self, key: str) -> None:
+        """Delete value by key without awaiting, for sync callers.
+
+        Args:
+            key (str, required): Cache key.
+        """
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+        return
+
+    def incr_nowait(self, key: str, amount: int = 1, ttl: Optional[float] = None) -> int:
+        """Increment integer counter by key atomically without awaiting, for sync callers.
+
+        Args:
+            key    (str            , required): Cache key.
+            amount (int            , optional): Amount to add. Defaults to 1.
+            ttl    (Optional[float], optional): Time to live in seconds of a new counter, `default_ttl` if None.
+                                                Defaults to None.
+
+        Returns:
+            int: Counter value after increment.
+        """
+
+        if ttl is None:
+            ttl = self.default_ttl
+
+        _now = time.monotonic()
+        with self._lock:
+            _entry = self._entries.get(key)
+            if (_entry is None) or (
+                (_entry[0] is not None) and (_entry[0] <= _now)
+            ):
+                _entry = (None if ttl is None else _now + ttl, b"0")
+
+            _count = int(_entry[1]) + amount
+            self._entries[key] = (_entry[0], str(_count).encode())
+            self._entries.move_to_end(key)
+            while self.max_size < len(self._entries):
+                self._entries.popitem(last=False)
+
+        return _count
+
+    async def get(self, key: str) -> Union[bytes, None]:
+        return self.get_nowait(key)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self.set_nowait(key, value, ttl=ttl)
+        return
+
+    async def delete(self, key: str) -> None:
+        self.delete_nowait(key)
+        return
+
+    async def incr(self, key: str, amount: int = 1, ttl: Optional[float] = None) -> int:
+        return self.incr_nowait(key, amount=amount, ttl=ttl)
+
+    async def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+        return
+
+    async def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        _values: Dict[str, bytes] = {}
+        for _key in keys:
+            _value = self.get_nowait(_key)
+            if _value is not None:
+                _values[_key] = _value
+
+        return _values
+
+
+__all__ = ["MemoryCache"]
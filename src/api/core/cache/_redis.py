@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import validate_call, conint, confloat, constr
+
+from ._base import BaseCache
+
+
+class RedisCache(BaseCache):
+    """Shared cache on a Redis-protocol server, with a connection pool and pipelined batch operations."""
+
+    @validate_call
+    def __init__(
+        self,
+        url: constr(strip_whitespace=True, min_length=8) = "redis://localhost:6379/0",  # type: ignore
+        key_prefix: str = "",
+        max_connections: conint(ge=1) = 32,  # type: ignore
+        socket_timeout: confloat(gt=0) = 5.0,  # type: ignore
+        default_ttl: Optional[confloat(gt=0)] = None,  # type: ignore
+    ) -> None:
+        """Constructor method for RedisCache class.
+
+        Args:
+            url             (str            , optional): Redis server URL. Defaults to 'redis://localhost:6379/0'.
+            key_prefix      (str            , optional): Prefix for all keys, to share one server between apps, required by `clear()`. Defaults to ''.
+            max_connections (int            , optional): Maximum connections in the pool. Defaults to 32.
+            socket_timeout  (float          , optional): Connect and read/write timeout in seconds. Defaults to 5.0.
+            default_ttl     (Optional[float], optional): Default time to live in seconds, no expiry if None. Defaults to None.
+        """
+
+        self.url = url
+        self.key_prefix = key_prefix
+        self.max_connections = max_connections
+        self.socket_timeout = socket_timeout
+        self.default_ttl = default_ttl
+
+        self._pool = None
+        self._client = None
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            raise RuntimeError(
+                f"'{self.__class__.__name__}' is not connected, call `connect()` first!"
+            )
+
+        return self._client
+
+    async def connect(self) -> None:
+        if self._client is not None:
+            return
+
+        ## Imported lazily, only needed when a Redis backend is configured:
+        from redis.asyncio import ConnectionPool, Redis
+
+        self._pool = ConnectionPool.from_url(
+            self.url,
+            max_connections=self.max_connections,
+            socket_timeout=self.socket_timeout,
+            socket_connect_timeout=self.socket_timeout,
+        )
+        self._client = Redis(connection_pool=self._pool)
+        try:
+            await self._client.ping()
+        except Exception:
+            await self.close()
+            raise
+
+        return
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+        if self._pool is not None:
+            await self._pool.disconnect()
+            self._pool = None
+
+        return
+
+    def _get_px(self, ttl: Optional[float]) -> Union[int, None]:
+        if ttl is None:
+            ttl = self.default_ttl
+
+        if ttl is None:
+            return None
+
+        return max(int(ttl * 1000), 1)
+
+    async def get(self, key: str) -> Union[bytes, None]:
+        return await self.client.get(self.key_prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        await self.client.set(self.key_prefix + key, value, px=self._get_px(ttl))
+        return
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.key_prefix + key)
+        return
+
+    async def incr(self, key: str, amount: int = 1, ttl: Optional[float] = None) -> int:
+        _key = self.key_prefix + key
+        _px = self._get_px(ttl)
+        if _px is None:
+            return await self.client.incrby(_key, amount)
+
+        ## Expiry is set only when the counter is created (`NX`), one round trip:
+        async with self.client.pipeline(transaction=False) as _pipe:
+            _pipe.set(_key, b"0", px=_px, nx=True)
+            _pipe.incrby(_key, amount)
+            _results = await _pipe.execute()
+
+        return _results[-1]
+
+    async def clear(self) -> None:
+        ## Empty prefix would match (and delete) every key on a shared server:
+        if not self.key_prefix:
+            raise RuntimeError(
+                f"'{self.__class__.__name__}' refuses to `clear()` without `key_prefix`!"
+            )
+
+        ## Only keys with our prefix, server may be shared:
+        _pattern = "".join(
+            f"\\{_char}" if _char in "*?[]\\" else _char for _char in self.key_prefix
+        )
+        _batch: List[bytes] = []
+        async for _key in self.client.scan_iter(match=f"{_pattern}*", count=500):
+            _batch.append(_key)
+            if 500 <= len(_batch):
+                await self.client.delete(*_batch)
+                _batch = []
+
+        if _batch:
+            await self.client.delete(*_batch)
+
+        return
+
+    async def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        if not keys:
+            return {}
+
+        _values: List[Union[bytes, None]] = await self.client.mget(
+            [self.key_prefix + _key for _key in keys]
+        )
+        return {
+            _key: _value for _key, _value in zip(keys, _values) if _value is not None
+        }
+
+    async def set_many(
+        self, mapping: Dict[str, bytes], ttl: Optional[float] = None
+    ) -> None:
+        if not mapping:
+            return
+
+        _px = self._get_px(ttl)
+        ## One round trip for all commands, no MULTI/EXEC needed:
+        async with self.client.pipeline(transaction=False) as _pipe:
+            for _key, _value in mapping.items():
+                _pipe.set(self.key_prefix + _key, _value, px=_px)
+
+            await _pipe.execute()
+
+        return
+
+
+__all__ = ["RedisCache"]
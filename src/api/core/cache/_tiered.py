@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict, List, Optional, Union
+
+from pydantic import validate_call, confloat
+
+from ._base import BaseCache
+from ._memory import MemoryCache
+
+
+class TieredCache(BaseCache):
+    """Two-level read-through cache: in-process L1 (`MemoryCache`) on top of a shared L2 (e.g. `RedisCache`).
+
+    Reads hit L1 first, then L2 and back-fill L1. Writes and deletes go to both levels.
+    L1 entries live at most `l1_ttl` seconds, which bounds staleness between processes.
+    """
+
+    @validate_call(config={"arbitrary_types_allowed": True})
+    def __init__(
+        self,
+        l1: MemoryCache,
+        l2: BaseCache,
+        l1_ttl: Optional[confloat(gt=0)] = 5.0,  # type: ignore
+    ) -> None:
+        """Constructor method for TieredCache class.
+
+        Args:
+            l1     (MemoryCache    , required): In-process cache level.
+            l2     (BaseCache      , required): Shared cache level.
+            l1_ttl (Optional[float], optional): Maximum time to live in L1, in seconds. Defaults to 5.0.
+        """
+
+        self.l1 = l1
+        self.l2 = l2
+        self.l1_ttl = l1_ttl
+
+    def _get_l1_ttl(self, ttl: Optional[float]) -> Union[float, None]:
+        if ttl is None:
+            return self.l1_ttl
+
+        if self.l1_ttl is None:
+            return ttl
+
+        return min(ttl, self.l1_ttl)
+
+    async def connect(self) -> None:
+        await self.l1.connect()
+        await self.l2.connect()
+        return
+
+    async def close(self) -> None:
+        await self.l2.close()
+        await self.l1.close()
+        return
+
+    async def get(self, key: str) -> Union[bytes, None]:
+        _value = self.l1.get_nowait(key)
+        if _value is None:
+            _value = await self.l2.get(key)
+            if _value is not None:
+                self.l1.set_nowait(key, _value, ttl=self.l1_ttl)
+
+        return _value
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        await self.l2.set(key, value, ttl=ttl)
+        self.l1.set_nowait(key, value, ttl=self._get_l1_ttl(ttl))
+        return
+
+    async def delete(self, key: str) -> None:
+        await self.l2.delete(key)
+        self.l1.delete_nowait(key)
+        return
+
+    async def incr(self, key: str, amount: int = 1, ttl: Optional[float] = None) -> int:
+        ## Counters are shared state, never served from L1:
+        return await self.l2.incr(key, amount=amount, ttl=ttl)
+
+    async def clear(self) -> None:
+        await self.l2.clear()
+        await self.l1.clear()
+        return
+
+    async def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        _values: Dict[str, bytes] = await self.l1.get_many(keys)
+        _missing_keys = [_key for _key in keys if _key not in _values]
+        if _missing_keys:
+            _l2_values = await self.l2.get_many(_missing_keys)
+            for _key, _value in _l2_values.items():
+                self.l1.set_nowait(_key, _value, ttl=self.l1_ttl)
+
+            _values.update(_l2_values)
+
+        return _values
+
+    async def set_many(
+        self, mapping: Dict[str, bytes], ttl: Optional[float] = None
+    ) -> None:
+        await self.l2.set_many(mapping, ttl=ttl)
+        _l1_ttl = self._get_l1_ttl(ttl)
+        for _key, _value in mapping.items():
+            self.l1.set_nowait(_key, _value, ttl=_l1_ttl)
+
+        return
+
+
+__all__ = ["TieredCache"]
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+
+from ._adaptive import *
+from ._threadpool import *
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+import math
+from typing import Optional
+
+from pydantic import validate_call, confloat, conint
+
+from api.core.constants import ConcurrencyAlgorithmEnum
+
+
+## Samples of the long-term (baseline) latency average:
+_LONG_WINDOW = 100
+_LONG_ALPHA = 2.0 / (_LONG_WINDOW + 1)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limiter with a limit adapted to observed latency, requests over the limit are rejected.
+
+    - AIMD: limit is increased by one while latency is under `latency_threshold` and the limit is in use,
+      and multiplied by `backoff_ratio` when latency goes over it.
+    - Gradient: limit follows the ratio of long-term (baseline) latency to the latest latency,
+      with `sqrt(limit)` headroom to absorb queueing; growing latency shrinks the limit before timeouts happen.
+
+    Only used on the event loop, no locks are needed.
+    """
+
+    @validate_call
+    def __init__(
+        self,
+        algorithm: ConcurrencyAlgorithmEnum = ConcurrencyAlgorithmEnum.gradient,
+        initial_limit: conint(ge=1) = 20,  # type: ignore
+        min_limit: conint(ge=1) = 2,  # type: ignore
+        max_limit: conint(ge=1) = 200,  # type: ignore
+        latency_threshold: confloat(gt=0) = 1.0,  # type: ignore
+        backoff_ratio: confloat(gt=0, lt=1) = 0.9,  # type: ignore
+        tolerance: confloat(ge=1) = 1.5,  # type: ignore
+        smoothing: confloat(gt=0, le=1) = 0.2,  # type: ignore
+    ) -> None:
+        """Constructor method for AdaptiveConcurrencyLimiter class.
+
+        Args:
+            algorithm         (ConcurrencyAlgorithmEnum, optional): Limit algorithm. Defaults to 'gradient'.
+            initial_limit     (int                     , optional): Starting limit. Defaults to 20.
+            min_limit         (int                     , optional): Minimum limit. Defaults to 2.
+            max_limit         (int                     , optional): Maximum limit. Defaults to 200.
+            latency_threshold (float                   , optional): AIMD overload latency in seconds. Defaults to 1.0.
+            backoff_ratio     (float                   , optional): AIMD limit decrease multiplier. Defaults to 0.9.
+            tolerance         (float                   , optional): Gradient tolerated latency increase ratio. Defaults to 1.5.
+            smoothing         (float                   , optional): Gradient new limit weight. Defaults to 0.2.
+        """
+
+        self.algorithm = algorithm
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold = latency_threshold
+        self.backoff_ratio = backoff_ratio
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._long_latency: Optional[float] = None
+        self.inflight = 0
+        self.rejected = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def try_acquire(self) -> bool:
+        """Take a slot if the limit is not reached.
+
+        Returns:
+            bool: True if acquired, `release()` must be called after the request.
+        """
+
+        if self._limit <= self.inflight:
+            self.rejected += 1
+            return False
+
+        self.inflight += 1
+        return True
+
+    def release(self, latency: Optional[float] = None) -> None:
+        """Release a slot and update the limit with the request latency.
+
+        Args:
+            latency (Optional[float], optional): Request latency in seconds, None to skip the update (e.g. errors).
+                                                 Defaults to None.
+        """
+
+        ## Sampled with the in-flight count of the request, before releasing it:
+        _inflight = self.inflight
+        self.inflight -= 1
+        if latency is None:
+            return
+
+        if self.algorithm == ConcurrencyAlgorithmEnum.aimd:
+            self._update_aimd(latency=latency, inflight=_inflight)
+        else:
+            self._update_gradient(latency=latency, inflight=_inflight)
+
+    def _update_aimd(self, latency: float, inflight: int) -> None:
+        if self.latency_threshold < latency:
+            self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+        elif (self._limit / 2) <= inflight:
+            ## Only grow while the limit is in use, idle periods don't inflate it:
+            self._limit = min(float(self.max_limit), self._limit + 1.0)
+
+    def _update_gradient(self, latency: float, inflight: int) -> None:
+        _latency = max(latency, 1e-6)
+        if self._long_latency is None:
+            self._long_latency = _latency
+            return
+
+        self._long_latency += _LONG_ALPHA * (_latency - self._long_latency)
+        _long_latency = self._long_latency
+        if (2 * _latency) < _long_latency:
+            ## Recovered from a slow period, let the baseline come down faster:
+            self._long_latency = _long_latency * 0.95
+
+        if inflight < (self._limit / 2):
+            return
+
+        _gradient = max(0.5, min(1.0, self.tolerance * _long_latency / _latency))
+        _new_limit = (self._limit * _gradient) + math.sqrt(self._limit)
+        _new_limit = (self._limit * (1 - self.smoothing)) + (_new_limit * self.smoothing)
+        self._limit = max(float(self.min_limit), min(float(self.max_limit), _new_limit))
+
+
+__all__ = ["AdaptiveConcurrencyLimiter"]
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import functools
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import anyio.to_thread
+from anyio import CapacityLimiter
+
+
+_T = TypeVar("_T")
+
+
+class ThreadPoolGroups:
+    """Named threadpool capacity limiters, so a group of sync work (e.g. password hashing)
+    can't take all threads from another (e.g. CRUD routes).
+
+    All groups share anyio worker threads, only the number of concurrently running calls per group is limited.
+    Unknown or not configured groups use the default anyio threadpool limiter.
+    """
+
+    def __init__(self) -> None:
+        self._limiters: Dict[str, CapacityLimiter] = {}
+
+    def configure(self, default_tokens: int, groups: Dict[str, int]) -> None:
+        """Set the default threadpool capacity and create group limiters, must be called in the event loop.
+
+        Args:
+            default_tokens (int           , required): Default anyio threadpool capacity.
+            groups         (Dict[str, int], required): Group name -> capacity.
+        """
+
+        anyio.to_thread.current_default_thread_limiter().total_tokens = default_tokens
+        ## New limiters for each event loop (e.g. application restarted in tests):
+        self._limiters = {
+            _group: CapacityLimiter(_tokens) for _group, _tokens in groups.items()
+        }
+
+    def get_limiter(self, group: Optional[str] = None) -> CapacityLimiter:
+        """Get capacity limiter of the group.
+
+        Args:
+            group (Optional[str], optional): Group name. Defaults to None (default limiter).
+
+        Returns:
+            CapacityLimiter: Group limiter, or the default anyio threadpool limiter.
+        """
+
+        _limiter = self._limiters.get(group) if group else None
+        if _limiter is None:
+            _limiter = anyio.to_thread.current_default_thread_limiter()
+
+        return _limiter
+
+    async def run_sync(
+        self, group: Optional[str], func: Callable[..., _T], *args, **kwargs
+    ) -> _T:
+        """Run sync function in a worker thread, limited by the group capacity.
+
+        Args:
+            group    (Optional[str], required): Group name, None for the default limiter.
+            func     (Callable     , required): Sync function to run.
+            *args    (Any          , optional): Positional arguments for the function.
+            **kwargs (Any          , optional): Keyword arguments for the function.
+
+        Returns:
+            Any: Function result.
+        """
+
+        if kwargs:
+            func = functools.partial(func, **kwargs)
+
+        return await anyio.to_thread.run_sync(
+            func, *args, limiter=self.get_limiter(group)
+        )
+
+    def route(self, group: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Route decorator to run a sync route handler in the group threadpool instead of the default one.
+        Handler signature is kept (`functools.wraps`), FastAPI resolves parameters as usual.
+
+        Args:
+            group (str, required): Group name.
+
+        Returns:
+            Callable[[Callable[..., Any]], Callable[..., Any]]: Route handler decorator.
+        """
+
+        def _decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            if asyncio.iscoroutinefunction(func):
+                raise TypeError(f"'{func.__name__}' must be a sync function!")
+
+            @functools.wraps(func)
+            async def _wrapper(*args, **kwargs) -> Any:
+                return await self.run_sync(group, func, *args, **kwargs)
+
+            return _wrapper
+
+        return _decorator
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get usage of every threadpool, must be called in the event loop.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Group name ('default' for anyio threadpool) -> total, busy and queued counts.
+        """
+
+        _limiters: Dict[str, CapacityLimiter] = {
+            "default": anyio.to_thread.current_default_thread_limiter(),
+            **self._limiters,
+        }
+        _stats: Dict[str, Dict[str, int]] = {}
+        for _group, _limiter in _limiters.items():
+            _statistics = _limiter.statistics()
+            _stats[_group] = {
+                "total": int(_statistics.total_tokens),
+                "busy": _statistics.borrowed_tokens,
+                "queued": _statistics.tasks_waiting,
+            }
+
+        return _stats
+
+
+thread_pools = ThreadPoolGroups()
+
+
+__all__ = ["ThreadPoolGroups", "thread_pools"]
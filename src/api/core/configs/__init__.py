@@ -1,4 +1,16 @@
 # -*- coding: utf-8 -*-
 
 from ._base import *
+from ._cache import *
+from ._cleanup import *
+from ._compression import *
+from ._events import *
+from ._jobs import *
+from ._load_shedding import *
 from ._main import *
+from ._snapshot import *
+from ._runtime import *
+from ._security import *
+from ._threadpool import *
+from ._uploads import *
+from ._websocket import *
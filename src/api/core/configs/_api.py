@@ -6,10 +6,20 @@ from typing import Any, Dict
 from pydantic import Field, constr, field_validator, ValidationInfo, model_validator
 from pydantic_settings import SettingsConfigDict
 
-from api.core.constants import ENV_PREFIX_API, HTTPSchemeEnum
+from api.core.constants import ENV_PREFIX_API, HTTPSchemeEnum, UniqueIdModeEnum
 from ._base import BaseConfig
 from ._dev import DevConfig
 from ._security import SecurityConfig
+from ._cache import CacheConfig
+from ._cleanup import CleanupConfig
+from ._jobs import JobsConfig
+from ._compression import CompressionConfig
+from ._events import EventsConfig
+from ._load_shedding import LoadSheddingConfig
+from ._runtime import LiveReloadConfig
+from ._threadpool import ThreadPoolConfig
+from ._uploads import UploadsConfig
+from ._websocket import WebSocketConfig
 from ._docs import DocsConfig, FrozenDocsConfig
 from ._paths import PathsConfig, FrozenPathsConfig
 
@@ -25,8 +35,19 @@ class ApiConfig(BaseConfig):
     gzip_min_size: int = Field(..., ge=0, le=10_485_760)  # 512 bytes
     behind_proxy: bool = Field(...)
     behind_cf_proxy: bool = Field(...)
+    unique_id_mode: UniqueIdModeEnum = Field(default=UniqueIdModeEnum.timestamp_uuid)
     dev: DevConfig = Field(...)
     security: SecurityConfig = Field(...)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    compression: CompressionConfig = Field(default_factory=CompressionConfig)
+    load_shedding: LoadSheddingConfig = Field(default_factory=LoadSheddingConfig)
+    live_reload: LiveReloadConfig = Field(default_factory=LiveReloadConfig)
+    threadpool: ThreadPoolConfig = Field(default_factory=ThreadPoolConfig)
+    uploads: UploadsConfig = Field(default_factory=UploadsConfig)
+    cleanup: CleanupConfig = Field(default_factory=CleanupConfig)
+    jobs: JobsConfig = Field(default_factory=JobsConfig)
+    events: EventsConfig = Field(default_factory=EventsConfig)
+    websocket: WebSocketConfig = Field(default_factory=WebSocketConfig)
     docs: DocsConfig = Field(...)
     paths: PathsConfig = Field(...)
 
@@ -90,12 +111,50 @@ class ApiConfig(BaseConfig):
             elif "{tmp_dir}" in val.uploads_dir:
                 val.uploads_dir = val.uploads_dir.format(tmp_dir=val.tmp_dir)
 
+            if "{tmp_dir}" in val.partial_uploads_dir:
+                val.partial_uploads_dir = val.partial_uploads_dir.format(
+                    tmp_dir=val.tmp_dir
+                )
+
             if "{api_slug}" in val.data_dir:
                 val.data_dir = val.data_dir.format(api_slug=info.data["slug"])
 
         val = FrozenPathsConfig(**val.model_dump())
         return val
 
+    @field_validator("cache")
+    @classmethod
+    def _check_cache(cls, val: CacheConfig, info: ValidationInfo) -> CacheConfig:
+        if ("slug" in info.data) and ("{api_slug}" in val.redis.key_prefix):
+            _redis = val.redis.model_copy(
+                update={
+                    "key_prefix": val.redis.key_prefix.format(
+                        api_slug=info.data["slug"]
+                    )
+                }
+            )
+            val = val.model_copy(update={"redis": _redis})
+
+        return val
+
+    @field_validator("compression")
+    @classmethod
+    def _check_compression(
+        cls, val: CompressionConfig, info: ValidationInfo
+    ) -> CompressionConfig:
+        if "prefix" in info.data:
+            _static = val.static.model_copy(
+                update={
+                    "paths": [
+                        _path.format(api_prefix=info.data["prefix"])
+                        for _path in val.static.paths
+                    ]
+                }
+            )
+            val = val.model_copy(update={"static": _static})
+
+        return val
+
     @model_validator(mode="before")
     @classmethod
     def _check_args(cls, values: Dict[str, Any]) -> Dict[str, Any]:
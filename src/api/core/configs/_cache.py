@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict, Optional
+
+from pydantic import Field, constr
+from pydantic_settings import SettingsConfigDict
+
+from api.core.constants import ENV_PREFIX_API, CacheBackendEnum
+from ._base import FrozenBaseConfig
+
+
+_ENV_PREFIX_CACHE = f"{ENV_PREFIX_API}CACHE_"
+
+
+class ResponseCacheConfig(FrozenBaseConfig):
+    enabled: bool = Field(default=True)
+    max_size: int = Field(default=1024, ge=1, le=1_000_000)
+    default_cache_control: constr(strip_whitespace=True) = Field(  # type: ignore
+        default="no-cache", min_length=1, max_length=256
+    )
+    cache_control: Dict[
+        constr(strip_whitespace=True, min_length=1, max_length=128),  # type: ignore
+        constr(strip_whitespace=True, min_length=1, max_length=256),  # type: ignore
+    ] = Field(default_factory=dict)
+
+    model_config = SettingsConfigDict(env_prefix=f"{_ENV_PREFIX_CACHE}RESPONSE_")
+
+
+class MemoryCacheConfig(FrozenBaseConfig):
+    max_size: int = Field(default=10_000, ge=1, le=10_000_000)
+    default_ttl: Optional[float] = Field(default=None, gt=0)
+
+    model_config = SettingsConfigDict(env_prefix=f"{_ENV_PREFIX_CACHE}MEMORY_")
+
+
+class RedisCacheConfig(FrozenBaseConfig):
+    url: constr(strip_whitespace=True) = Field(  # type: ignore
+        default="redis://localhost:6379/0", min_length=8, max_length=1024
+    )
+    key_prefix: constr(strip_whitespace=True) = Field(default="", max_length=128)  # type: ignore
+    max_connections: int = Field(default=32, ge=1, le=10_000)
+    socket_timeout: float = Field(default=5.0, gt=0, le=300)
+    default_ttl: Optional[float] = Field(default=None, gt=0)
+
+    model_config = SettingsConfigDict(env_prefix=f"{_ENV_PREFIX_CACHE}REDIS_")
+
+
+class CacheConfig(FrozenBaseConfig):
+    backend: CacheBackendEnum = Field(default=CacheBackendEnum.memory)
+    ## Maximum time to live of in-process entries for `tiered` backend:
+    l1_ttl: Optional[float] = Field(default=5.0, gt=0)
+    memory: MemoryCacheConfig = Field(default_factory=MemoryCacheConfig)
+    redis: RedisCacheConfig = Field(default_factory=RedisCacheConfig)
+    response: ResponseCacheConfig = Field(default_factory=ResponseCacheConfig)
+
+    model_config = SettingsConfigDict(env_prefix=_ENV_PREFIX_CACHE)
+
+
+__all__ = [
+    "CacheConfig",
+    "MemoryCacheConfig",
+    "RedisCacheConfig",
+    "ResponseCacheConfig",
+]
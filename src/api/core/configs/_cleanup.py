@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from api.core.constants import ENV_PREFIX_API
+from ._base import FrozenBaseConfig
+
+
+class CleanupConfig(FrozenBaseConfig):
+    enabled: bool = Field(default=True)
+    interval: int = Field(default=3600, ge=10)  # Seconds (1 hour)
+    ## Entries of `tmp_dir` not modified for this long are removed, upload directories are excluded:
+    tmp_max_age: int = Field(default=86400, ge=60)  # Seconds (1 day)
+    max_concurrency: int = Field(default=4, ge=1, le=256)
+    batch_size: int = Field(default=256, ge=1, le=100_000)
+
+    model_config = SettingsConfigDict(env_prefix=f"{ENV_PREFIX_API}CLEANUP_")
+
+
+__all__ = ["CleanupConfig"]
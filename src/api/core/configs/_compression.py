@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict, List
+
+from pydantic import Field, constr
+from pydantic_settings import SettingsConfigDict
+
+from api.core.constants import ENV_PREFIX_API, CompressionEncodingEnum
+from ._base import FrozenBaseConfig
+
+
+_ENV_PREFIX_COMPRESSION = f"{ENV_PREFIX_API}COMPRESSION_"
+
+
+class CompressionLevelsConfig(FrozenBaseConfig):
+    br: int = Field(default=4, ge=0, le=11)
+    zstd: int = Field(default=3, ge=1, le=22)
+    gzip: int = Field(default=6, ge=1, le=9)
+
+
+class StaticCompressionConfig(FrozenBaseConfig):
+    enabled: bool = Field(default=True)
+    ## Paths of responses that never change, compressed once and served from memory:
+    paths: List[constr(strip_whitespace=True, min_length=1, max_length=256)] = Field(  # type: ignore
+        default_factory=list
+    )
+    ## Compressed only once, highest levels are affordable:
+    levels: CompressionLevelsConfig = Field(
+        default_factory=lambda: CompressionLevelsConfig(br=11, zstd=19, gzip=9)
+    )
+
+    model_config = SettingsConfigDict(env_prefix=f"{_ENV_PREFIX_COMPRESSION}STATIC_")
+
+
+class CompressionConfig(FrozenBaseConfig):
+    enabled: bool = Field(default=True)
+    ## Server preference order when client accepts multiple encodings with the same weight:
+    encodings: List[CompressionEncodingEnum] = Field(
+        default_factory=lambda: [
+            CompressionEncodingEnum.br,
+            CompressionEncodingEnum.zstd,
+            CompressionEncodingEnum.gzip,
+        ],
+        min_length=1,
+    )
+    ## Bodies this size or larger are compressed in the threadpool, not on the event loop:
+    offload_min_size: int = Field(default=262_144, ge=0)
+    ## Content type prefix -> levels, longest matching prefix wins, other content types are not compressed:
+    levels: Dict[
+        constr(strip_whitespace=True, to_lower=True, min_length=1, max_length=128),  # type: ignore
+        CompressionLevelsConfig,
+    ] = Field(
+        default_factory=lambda: {
+            "application/json": CompressionLevelsConfig(),
+            "text/": CompressionLevelsConfig(),
+        }
+    )
+    exclude_content_types: List[
+        constr(strip_whitespace=True, to_lower=True, min_length=1, max_length=128)  # type: ignore
+    ] = Field(default_factory=lambda: ["text/event-stream"])
+    static: StaticCompressionConfig = Field(default_factory=StaticCompressionConfig)
+
+    model_config = SettingsConfigDict(env_prefix=_ENV_PREFIX_COMPRESSION)
+
+
+__all__ = [
+    "CompressionConfig",
+    "CompressionLevelsConfig",
+    "StaticCompressionConfig",
+]
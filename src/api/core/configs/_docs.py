@@ -37,6 +37,13 @@ class DocsConfig(BaseConfig):
     license_info: Optional[Dict[str, Any]] = Field(default=None)
     openapi_tags: Optional[List[Dict[str, Any]]] = Field(default=None)
     swagger_ui_parameters: Optional[Dict[str, Any]] = Field(default=None)
+    ## Prebuilt OpenAPI schema file (see 'scripts/openapi.sh'), generated at startup if not set or outdated:
+    openapi_file: Optional[
+        constr(strip_whitespace=True, min_length=1, max_length=1024)  # type: ignore
+    ] = Field(default=None)
+    openapi_cache_control: constr(strip_whitespace=True) = Field(  # type: ignore
+        default="public, max-age=300", min_length=1, max_length=256
+    )
 
     model_config = SettingsConfigDict(env_prefix=f"{ENV_PREFIX_API}DOCS_")
 
@@ -69,6 +76,9 @@ class FrozenDocsConfig(DocsConfig):
         if values["swagger_ui_oauth2_redirect_url"] == "":
             values["swagger_ui_oauth2_redirect_url"] = None
 
+        if values.get("openapi_file") == "":
+            values["openapi_file"] = None
+
         if validator.is_falsy(values["enabled"]):
             values["openapi_url"] = None
             values["docs_url"] = None
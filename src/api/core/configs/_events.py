@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from api.core.constants import ENV_PREFIX_API
+from ._base import FrozenBaseConfig
+
+
+class EventsConfig(FrozenBaseConfig):
+    enabled: bool = Field(default=True)
+    ## Recent events kept per stream, clients reconnecting with an older `Last-Event-ID` get a `reset` event:
+    buffer_size: int = Field(default=1024, ge=1, le=1_000_000)
+    ## Undelivered events per connection, slower clients are disconnected and resume with `Last-Event-ID`:
+    queue_size: int = Field(default=256, ge=1, le=100_000)
+    ## Concurrent connections per stream in one process:
+    max_subscribers: int = Field(default=10_000, ge=1, le=1_000_000)
+    heartbeat: float = Field(default=15.0, gt=0, le=300)  # Seconds
+    ## Client reconnection delay (`retry` field):
+    retry: int = Field(default=3000, ge=0, le=600_000)  # Milliseconds
+
+    model_config = SettingsConfigDict(env_prefix=f"{ENV_PREFIX_API}EVENTS_")
+
+
+__all__ = ["EventsConfig"]
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+from typing import Optional
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from api.core.constants import ENV_PREFIX_API, JobQueueBackendEnum
+from ._base import FrozenBaseConfig
+
+
+class JobsConfig(FrozenBaseConfig):
+    enabled: bool = Field(default=True)
+    ## `sqlite` keeps queued jobs across restarts and shares them between processes (`api.paths.jobs_db_file`):
+    backend: JobQueueBackendEnum = Field(default=JobQueueBackendEnum.memory)
+    ## Number of jobs running at the same time in one process:
+    workers: int = Field(default=4, ge=1, le=1024)
+    ## Processes for CPU-bound jobs (registered with `process` executor), started on first use:
+    process_workers: int = Field(default=2, ge=1, le=256)
+    ## Maximum number of queued and running jobs, new jobs are rejected with 503:
+    max_queue_size: int = Field(default=10_000, ge=1, le=10_000_000)
+    max_retries: int = Field(default=3, ge=0, le=100)
+    ## Retry delay doubles on every attempt, with random jitter:
+    retry_backoff: float = Field(default=1.0, gt=0, le=3600)  # Seconds
+    retry_backoff_max: float = Field(default=300.0, gt=0, le=86400)  # Seconds (5 minutes)
+    timeout: Optional[float] = Field(default=3600.0, gt=0)  # Seconds (1 hour)
+    ## Maximum delay to pick up jobs queued by other processes or retried later:
+    poll_interval: float = Field(default=1.0, gt=0, le=60)  # Seconds
+    ## Running jobs get this long to finish on shutdown, the rest are queued again:
+    drain_timeout: float = Field(default=30.0, ge=0, le=3600)  # Seconds
+    ## Finished jobs are deleted after this:
+    result_ttl: int = Field(default=86400, ge=60)  # Seconds (1 day)
+
+    model_config = SettingsConfigDict(env_prefix=f"{ENV_PREFIX_API}JOBS_")
+
+
+__all__ = ["JobsConfig"]
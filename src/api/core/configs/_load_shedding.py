@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict, List
+
+from pydantic import Field, constr, model_validator
+from pydantic_settings import SettingsConfigDict
+
+from api.core.constants import ENV_PREFIX_API, ConcurrencyAlgorithmEnum
+from ._base import FrozenBaseConfig
+
+
+_ENV_PREFIX_LOAD_SHEDDING = f"{ENV_PREFIX_API}LOAD_SHEDDING_"
+
+
+class ConcurrencyLimitConfig(FrozenBaseConfig):
+    initial_limit: int = Field(default=20, ge=1)
+    min_limit: int = Field(default=2, ge=1)
+    max_limit: int = Field(default=200, ge=1)
+    ## AIMD: latency above this is treated as overload and the limit is decreased:
+    latency_threshold: float = Field(default=1.0, gt=0)  # Seconds
+    ## AIMD: multiplier to decrease the limit:
+    backoff_ratio: float = Field(default=0.9, gt=0, lt=1)
+    ## Gradient: how much latency increase over the baseline is tolerated before the limit is decreased:
+    tolerance: float = Field(default=1.5, ge=1)
+    ## Gradient: weight of the new limit estimate in each update:
+    smoothing: float = Field(default=0.2, gt=0, le=1)
+
+    @model_validator(mode="after")
+    def _check_limits(self) -> "ConcurrencyLimitConfig":
+        if not (self.min_limit <= self.initial_limit <= self.max_limit):
+            raise ValueError(
+                f"`min_limit` <= `initial_limit` <= `max_limit` is required, "
+                f"got {self.min_limit}, {self.initial_limit}, {self.max_limit}!"
+            )
+
+        return self
+
+
+class LoadSheddingConfig(FrozenBaseConfig):
+    enabled: bool = Field(default=False)
+    algorithm: ConcurrencyAlgorithmEnum = Field(
+        default=ConcurrencyAlgorithmEnum.gradient
+    )
+    ## `Retry-After` header seconds of rejected requests:
+    retry_after: int = Field(default=1, ge=0, le=3600)
+    ## Route class name -> limit, each class has its own limiter:
+    classes: Dict[
+        constr(strip_whitespace=True, min_length=1, max_length=64),  # type: ignore
+        ConcurrencyLimitConfig,
+    ] = Field(default_factory=lambda: {"default": ConcurrencyLimitConfig()})
+    ## Route name -> route class name, other routes are in the "default" class:
+    routes: Dict[
+        constr(strip_whitespace=True, min_length=1, max_length=128),  # type: ignore
+        constr(strip_whitespace=True, min_length=1, max_length=64),  # type: ignore
+    ] = Field(default_factory=dict)
+    exempt_routes: List[
+        constr(strip_whitespace=True, min_length=1, max_length=128)  # type: ignore
+    ] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def _check_classes(self) -> "LoadSheddingConfig":
+        if "default" not in self.classes:
+            raise ValueError("`default` route class is required!")
+
+        for _route_name, _class_name in self.routes.items():
+            if _class_name not in self.classes:
+                raise ValueError(
+                    f"Unknown route class '{_class_name}' of route '{_route_name}'!"
+                )
+
+        return self
+
+    model_config = SettingsConfigDict(env_prefix=_ENV_PREFIX_LOAD_SHEDDING)
+
+
+__all__ = ["ConcurrencyLimitConfig", "LoadSheddingConfig"]
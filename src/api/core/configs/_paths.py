@@ -15,6 +15,10 @@ class PathsConfig(BaseConfig):
     uploads_dir: constr(strip_whitespace=True) = Field(  # type: ignore
         ..., min_length=2, max_length=1024
     )
+    ## Incomplete (resumable) uploads, moved into `uploads_dir` when completed:
+    partial_uploads_dir: constr(strip_whitespace=True) = Field(  # type: ignore
+        default="{tmp_dir}/partial_uploads", min_length=2, max_length=1024
+    )
     data_dir: constr(strip_whitespace=True) = Field(  # type: ignore
         ..., min_length=2, max_length=1024
     )
@@ -25,6 +29,10 @@ class PathsConfig(BaseConfig):
     asymmetric_keys_dir: constr(strip_whitespace=True) = Field(  # type: ignore
         ..., min_length=2, max_length=1024
     )
+    ## SQLite database of the durable job queue (`api.jobs.backend: "sqlite"`):
+    jobs_db_file: constr(strip_whitespace=True) = Field(  # type: ignore
+        default="{data_dir}/jobs.sqlite3", min_length=2, max_length=1024
+    )
     # models_dir: constr(strip_whitespace=True) = Field(  # type: ignore
     #     ..., min_length=2, max_length=1024
     # )
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+import os
+import glob
+import threading
+from typing import Any, Dict, List, Tuple
+
+from pydantic import Field, constr, validate_call
+from pydantic_settings import SettingsConfigDict
+
+from api.core.constants import ENV_PREFIX_API, LOG_LEVEL_REGEX
+from api.core import utils
+from ._base import BaseConfig, FrozenBaseConfig
+from ._security import CorsConfig
+
+
+class LiveReloadConfig(BaseConfig):
+    watch: bool = Field(default=True)
+    sighup: bool = Field(default=True)
+    debounce: int = Field(default=500, ge=50, le=60_000)  # Milliseconds
+
+    model_config = SettingsConfigDict(env_prefix=f"{ENV_PREFIX_API}LIVE_RELOAD_")
+
+
+## Hot-reloadable subset of `MainConfig`, everything else needs a restart:
+class RuntimeConfig(FrozenBaseConfig):
+    log_level: constr(strip_whitespace=True, to_upper=True, pattern=LOG_LEVEL_REGEX) = (  # type: ignore
+        Field(default="INFO")
+    )
+    gzip_min_size: int = Field(..., ge=0, le=10_485_760)
+    cors: CorsConfig = Field(...)
+
+    model_config = SettingsConfigDict(env_prefix=ENV_PREFIX_API)
+
+
+class VersionedConfig:
+    """Holder of the current `RuntimeConfig`, swapped atomically as a whole.
+
+    Readers call `get()` once per request and compare the version to rebuild anything derived from it,
+    a single attribute read, no locks on the read path.
+    """
+
+    def __init__(self, config: RuntimeConfig) -> None:
+        self._state: Tuple[int, RuntimeConfig] = (1, config)
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._state[0]
+
+    @property
+    def config(self) -> RuntimeConfig:
+        return self._state[1]
+
+    def get(self) -> Tuple[int, RuntimeConfig]:
+        """Get version and config as a consistent pair.
+
+        Returns:
+            Tuple[int, RuntimeConfig]: Current version and config.
+        """
+
+        return self._state
+
+    def swap(self, config: RuntimeConfig) -> int:
+        """Replace current config with a new one, if it is different.
+
+        Args:
+            config (RuntimeConfig, required): New validated config.
+
+        Returns:
+            int: Current version after the swap.
+        """
+
+        with self._lock:
+            _version, _config = self._state
+            if config != _config:
+                _version += 1
+                self._state = (_version, config)
+
+        return _version
+
+
+@validate_call
+def load_runtime_config(configs_dirs: List[str]) -> RuntimeConfig:
+    """Read config files again and validate only the hot-reloadable subset.
+
+    Args:
+        configs_dirs (List[str], required): Config directories to load YAML config files from.
+
+    Raises:
+        ValidationError: If the new values are invalid, current config stays in use.
+
+    Returns:
+        RuntimeConfig: New runtime config.
+    """
+
+    ## Imported lazily, startup may skip YAML entirely (config snapshot):
+    import yaml
+
+    _config_data: Dict[str, Any] = {}
+    for _configs_dir in configs_dirs:
+        _file_paths = glob.glob(os.path.join(_configs_dir, "*.yaml")) + glob.glob(
+            os.path.join(_configs_dir, "*.yml")
+        )
+        for _file_path in sorted(_file_paths):
+            with open(_file_path, "r", encoding="utf-8") as _file:
+                _config_data = utils.deep_merge(_config_data, yaml.safe_load(_file) or {})
+
+    _api_data: Dict[str, Any] = _config_data.get("api", {})
+    _runtime_config = RuntimeConfig(
+        log_level=_config_data.get("logger", {}).get("level", "INFO"),
+        gzip_min_size=_api_data.get("gzip_min_size"),
+        cors=_api_data.get("security", {}).get("cors"),
+    )
+    return _runtime_config
+
+
+__all__ = ["LiveReloadConfig", "RuntimeConfig", "VersionedConfig", "load_runtime_config"]
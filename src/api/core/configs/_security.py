@@ -7,6 +7,7 @@ from pydantic_settings import SettingsConfigDict
 
 from api.core.constants import (
     ENV_PREFIX_API,
+    RateLimitKeyEnum,
     HTTP_METHOD_REGEX,
     ASYMMETRIC_ALGORITHM_REGEX,
     JWT_ALGORITHM_REGEX,
@@ -103,6 +104,43 @@ class PasswordConfig(FrozenBaseConfig):
     model_config = SettingsConfigDict(env_prefix=f"{_ENV_PREFIX_SECURITY}PASSWORD_")
 
 
+class RateLimitRuleConfig(FrozenBaseConfig):
+    rate: float = Field(..., gt=0, le=1_000_000)  # Requests (tokens) per second
+    burst: int = Field(..., ge=1, le=1_000_000)  # Bucket capacity
+
+
+class RateLimitConfig(FrozenBaseConfig):
+    enabled: bool = Field(default=False)
+    ## Identity of the client, first available one is used:
+    key_by: List[RateLimitKeyEnum] = Field(
+        default_factory=lambda: [RateLimitKeyEnum.jwt, RateLimitKeyEnum.ip],
+        min_length=1,
+    )
+    api_key_header: constr(strip_whitespace=True) = Field(  # type: ignore
+        default="X-API-Key", min_length=1, max_length=128
+    )
+    ## Known API keys, only these are used as identity, unknown keys fall back to the next `key_by`:
+    api_keys: List[SecretStr] = Field(default_factory=list)
+    ## Also enforce limits cluster-wide with `app.state.cache` (e.g. Redis), in-process buckets still apply:
+    shared: bool = Field(default=False)
+    max_keys: int = Field(default=100_000, ge=1, le=100_000_000)
+    headers: bool = Field(default=True)
+    default: RateLimitRuleConfig = Field(
+        default_factory=lambda: RateLimitRuleConfig(rate=20, burst=40)
+    )
+    ## Route name -> rule:
+    routes: Dict[
+        constr(strip_whitespace=True, min_length=1, max_length=128),  # type: ignore
+        RateLimitRuleConfig,
+    ] = Field(default_factory=dict)
+    ## Route names without limits:
+    exempt_routes: List[
+        constr(strip_whitespace=True, min_length=1, max_length=128)  # type: ignore
+    ] = Field(default_factory=list)
+
+    model_config = SettingsConfigDict(env_prefix=f"{_ENV_PREFIX_SECURITY}RATE_LIMIT_")
+
+
 class SecurityConfig(FrozenBaseConfig):
     allowed_hosts: List[constr(strip_whitespace=True, min_length=1, max_length=256)] = (  # type: ignore
         Field(...)
@@ -115,6 +153,7 @@ class SecurityConfig(FrozenBaseConfig):
     asymmetric: AsymmetricConfig = Field(...)
     jwt: JWTConfig = Field(...)
     password: PasswordConfig = Field(default_factory=PasswordConfig)
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
 
     model_config = SettingsConfigDict(env_prefix=_ENV_PREFIX_SECURITY)
 
@@ -127,4 +166,6 @@ __all__ = [
     "AsymmetricConfig",
     "JWTConfig",
     "PasswordConfig",
+    "RateLimitRuleConfig",
+    "RateLimitConfig",
 ]
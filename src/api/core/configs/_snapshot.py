@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import glob
+import pickle
+import hashlib
+from typing import List, Optional, Type
+
+import pydantic
+import beans_logging
+from pydantic import validate_call, BaseModel
+from beans_logging import logger
+
+from api.__version__ import __version__
+from api.core.constants import ENV_PREFIX
+
+
+_SNAPSHOT_FNAME = "config.snapshot.pkl"
+## Environment variables read by config validators without the `ENV_PREFIX`:
+_ENV_NAMES = ["ENV", "DEBUG", "ONION_CONFIG_EXTRA_DIR"]
+## Config schema source code, snapshot must not outlive schema changes:
+_SCHEMA_DIRS = [
+    os.path.dirname(os.path.abspath(__file__)),
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "constants"),
+]
+## Read by `FrozenDocsConfig` from a fixed path, not only from config directories:
+_DESCRIPTION_FILE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "configs",
+    "docs",
+    "description.md",
+)
+
+
+def _load(config_schema: Type[BaseModel], configs_dirs: List[str]) -> BaseModel:
+    ## Imported lazily, not needed at all when the snapshot is valid:
+    from onion_config import ConfigLoader
+
+    _config_loader = ConfigLoader(config_schema=config_schema, configs_dirs=configs_dirs)
+    _config: BaseModel = _config_loader.load()
+    return _config
+
+
+def _get_snapshot_key(configs_dirs: List[str]) -> str:
+    """Get hash of everything that affects the loaded config:
+    all files of config directories (recursive), relevant environment variables, process arguments, schema code and library versions.
+
+    Args:
+        configs_dirs (List[str], required): Config directories to load config files from.
+
+    Returns:
+        str: Snapshot key as hex digest.
+    """
+
+    _hash = hashlib.sha256()
+    _hash.update(
+        f"{sys.version}|{pydantic.VERSION}|{beans_logging.__version__}|{__version__}".encode()
+    )
+
+    for _schema_dir in _SCHEMA_DIRS:
+        for _file_path in sorted(glob.glob(os.path.join(_schema_dir, "*.py"))):
+            _stat = os.stat(_file_path)
+            _hash.update(f"{_file_path}|{_stat.st_mtime_ns}|{_stat.st_size}".encode())
+
+    _configs_dirs = list(configs_dirs)
+    if os.getenv("ONION_CONFIG_EXTRA_DIR"):
+        _configs_dirs.append(os.getenv("ONION_CONFIG_EXTRA_DIR"))
+
+    ## Every file of config directories (e.g. 'locale/*.yml', 'docs/description.md'), not only known extensions:
+    _file_paths: List[str] = []
+    for _configs_dir in _configs_dirs:
+        for _dir_path, _dir_names, _file_names in os.walk(_configs_dir):
+            _dir_names[:] = sorted(_name for _name in _dir_names if _name != "__pycache__")
+            _file_paths.extend(
+                os.path.join(_dir_path, _file_name)
+                for _file_name in sorted(_file_names)
+                if not _file_name.startswith(_SNAPSHOT_FNAME)
+            )
+
+    if os.path.isfile(_DESCRIPTION_FILE_PATH):
+        _file_paths.append(_DESCRIPTION_FILE_PATH)
+
+    for _file_path in _file_paths:
+        with open(_file_path, "rb") as _file:
+            _hash.update(_file_path.encode() + b"|" + _file.read())
+
+    for _key, _val in sorted(os.environ.items()):
+        if _key.startswith(ENV_PREFIX) or (_key in _ENV_NAMES):
+            _hash.update(f"{_key}={_val}\n".encode())
+
+    ## Server arguments (e.g. uvicorn '--port') are read by `ApiConfig`:
+    _hash.update("\0".join(sys.argv).encode())
+    return _hash.hexdigest()
+
+
+@validate_call
+def load_config(
+    config_schema: Type[BaseModel],
+    configs_dirs: List[str],
+    snapshot_dir: Optional[str] = None,
+) -> BaseModel:
+    """Load and validate config, or load the resolved config snapshot if nothing changed since it was saved.
+
+    Snapshot is a pickle file prefixed by a hash of all config inputs (see `_get_snapshot_key()`).
+    Any change of config files, environment variables, arguments or schema code invalidates it.
+    Only point `snapshot_dir` to a directory writable by the service user alone, pickle is not safe
+    to load from untrusted sources.
+
+    Args:
+        config_schema (Type[BaseModel], required): Main config schema.
+        configs_dirs  (List[str]      , required): Config directories to load config files from.
+        snapshot_dir  (Optional[str]  , optional): Directory to save/load the snapshot, disabled if None.
+                                                   Defaults to None.
+
+    Returns:
+        BaseModel: Main config object.
+    """
+
+    if not snapshot_dir:
+        return _load(config_schema=config_schema, configs_dirs=configs_dirs)
+
+    ## Same as `ConfigLoader`, '.env' values must be in environment before hashing:
+    from dotenv import load_dotenv
+
+    _env_file_path = os.path.join(os.getcwd(), ".env")
+    if os.path.isfile(_env_file_path):
+        load_dotenv(dotenv_path=_env_file_path, override=True, encoding="utf-8")
+
+    _snapshot_key: bytes = _get_snapshot_key(configs_dirs=configs_dirs).encode()
+    _snapshot_path = os.path.join(snapshot_dir, _SNAPSHOT_FNAME)
+    try:
+        with open(_snapshot_path, "rb") as _file:
+            if _file.readline().rstrip(b"\n") == _snapshot_key:
+                _config = pickle.load(_file)
+                if isinstance(_config, config_schema):
+                    return _config
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.warning(f"Failed to load '{_snapshot_path}' config snapshot, reloading.")
+
+    _config: BaseModel = _load(config_schema=config_schema, configs_dirs=configs_dirs)
+
+    ## Written to a temporary file and renamed, other workers never read a partial snapshot:
+    _tmp_path = f"{_snapshot_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(snapshot_dir, exist_ok=True)
+        with open(
+            os.open(_tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb"
+        ) as _file:
+            _file.write(_snapshot_key + b"\n")
+            pickle.dump(_config, _file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(_tmp_path, _snapshot_path)
+    except Exception:
+        logger.warning(f"Failed to save '{_snapshot_path}' config snapshot!")
+        if os.path.isfile(_tmp_path):
+            os.remove(_tmp_path)
+
+    return _config
+
+
+__all__ = ["load_config"]
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+import os
+from typing import Dict, Union
+
+from pydantic import Field, constr, field_validator
+from pydantic_settings import SettingsConfigDict
+
+from api.core.constants import ENV_PREFIX_API
+from ._base import FrozenBaseConfig
+
+
+def _resolve_tokens(val: Union[int, str]) -> int:
+    if isinstance(val, str):
+        val = int(val.format(cpu_count=os.cpu_count() or 1))
+
+    if val < 1:
+        raise ValueError(f"Threadpool tokens must be >= 1, got {val}!")
+
+    return val
+
+
+class ThreadPoolConfig(FrozenBaseConfig):
+    ## Default anyio threadpool (sync routes without a group, `run_in_threadpool()` calls):
+    default_tokens: Union[int, constr(strip_whitespace=True)] = Field(default=40)  # type: ignore
+    ## Group name -> tokens, each group has its own capacity limiter.
+    ## Tokens can be an integer or '{cpu_count}' to size by CPU cores:
+    groups: Dict[
+        constr(strip_whitespace=True, min_length=1, max_length=64),  # type: ignore
+        Union[int, constr(strip_whitespace=True)],  # type: ignore
+    ] = Field(default_factory=dict)
+
+    @field_validator("default_tokens")
+    @classmethod
+    def _check_default_tokens(cls, val: Union[int, str]) -> int:
+        return _resolve_tokens(val)
+
+    @field_validator("groups")
+    @classmethod
+    def _check_groups(cls, val: Dict[str, Union[int, str]]) -> Dict[str, int]:
+        return {_group: _resolve_tokens(_tokens) for _group, _tokens in val.items()}
+
+    model_config = SettingsConfigDict(env_prefix=f"{ENV_PREFIX_API}THREADPOOL_")
+
+
+__all__ = ["ThreadPoolConfig"]
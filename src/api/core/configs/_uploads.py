@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+from typing import List, Optional
+
+from pydantic import Field, constr
+from pydantic_settings import SettingsConfigDict
+
+from api.core.constants import ENV_PREFIX_API, HashAlgoEnum
+from ._base import FrozenBaseConfig
+
+
+_ENV_PREFIX_UPLOADS = f"{ENV_PREFIX_API}UPLOADS_"
+
+
+class UploadsDownloadConfig(FrozenBaseConfig):
+    ## Read buffer when the file is streamed by the application:
+    chunk_size: int = Field(default=1024 * 1024, ge=4096, le=64 * 1024**2)  # Bytes (1MB)
+    ## More ranges in one request are ignored and the full file is sent:
+    max_ranges: int = Field(default=16, ge=1, le=1024)
+    cache_control: constr(strip_whitespace=True) = Field(  # type: ignore
+        default="private, no-cache", min_length=1, max_length=256
+    )
+    ## Send files with ASGI 'http.response.pathsend'/'http.response.zerocopysend' extensions when supported:
+    zero_copy: bool = Field(default=True)
+    ## Let the reverse proxy send the file, e.g. 'X-Accel-Redirect' (nginx) or 'X-Sendfile' (Apache, lighttpd):
+    accel_header: Optional[
+        constr(strip_whitespace=True, min_length=1, max_length=64)  # type: ignore
+    ] = Field(default=None)
+    ## Internal proxy location of uploads directory (`X-Accel-Redirect`) or path as seen by the proxy (`X-Sendfile`):
+    accel_prefix: constr(strip_whitespace=True) = Field(  # type: ignore
+        default="/protected/uploads", min_length=1, max_length=1024
+    )
+
+    model_config = SettingsConfigDict(env_prefix=f"{_ENV_PREFIX_UPLOADS}DOWNLOAD_")
+
+
+class UploadsConfig(FrozenBaseConfig):
+    enabled: bool = Field(default=True)
+    ## Maximum size of one upload:
+    max_size: int = Field(default=10 * 1024**3, ge=1)  # Bytes (10GB)
+    ## Maximum total size of completed and in-progress uploads (declared lengths):
+    quota: int = Field(default=100 * 1024**3, ge=1)  # Bytes (100GB)
+    ## Free disk space to keep, new uploads that don't fit are rejected:
+    min_free_space: int = Field(default=1024**3, ge=0)  # Bytes (1GB)
+    ## Incomplete uploads expire after this:
+    expire: int = Field(default=86400, ge=60)  # Seconds (1 day)
+    ## Received data is written to disk in blocks of this size:
+    write_buffer_size: int = Field(default=1024 * 1024, ge=4096, le=64 * 1024**2)  # Bytes (1MB)
+    ## Computed while receiving data:
+    hash_methods: List[HashAlgoEnum] = Field(
+        default_factory=lambda: [HashAlgoEnum.md5, HashAlgoEnum.sha256], min_length=1
+    )
+    download: UploadsDownloadConfig = Field(default_factory=UploadsDownloadConfig)
+
+    model_config = SettingsConfigDict(env_prefix=_ENV_PREFIX_UPLOADS)
+
+
+__all__ = ["UploadsConfig", "UploadsDownloadConfig"]
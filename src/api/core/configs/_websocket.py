@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from api.core.constants import ENV_PREFIX_API
+from ._base import FrozenBaseConfig
+
+
+class WebSocketConfig(FrozenBaseConfig):
+    enabled: bool = Field(default=True)
+    ## Concurrent connections per endpoint in one process, new connections are closed with 1013 code:
+    max_connections: int = Field(default=1000, ge=1, le=1_000_000)
+    ## Larger messages close the connection with 1009 code:
+    max_message_size: int = Field(default=1_048_576, ge=1024, le=67_108_864)  # Bytes (1 MiB)
+    ## Operations in one message:
+    max_ops: int = Field(default=1000, ge=1, le=100_000)
+    ## Queued messages are executed together up to this many operations, results are sent in one message:
+    max_batch_ops: int = Field(default=5000, ge=1, le=1_000_000)
+    ## Received but not executed messages per connection, reading pauses when it's full (backpressure):
+    queue_size: int = Field(default=16, ge=1, le=10_000)
+    idle_timeout: float = Field(default=300.0, gt=0, le=86400)  # Seconds (5 minutes)
+    ## Slow clients not reading results within this are disconnected:
+    send_timeout: float = Field(default=10.0, gt=0, le=600)  # Seconds
+    ## Also accept `access_token` query parameter, it's written to access logs of the server and proxies:
+    allow_query_token: bool = Field(default=False)
+
+    model_config = SettingsConfigDict(env_prefix=f"{ENV_PREFIX_API}WEBSOCKET_")
+
+
+__all__ = ["WebSocketConfig"]
@@ -50,6 +50,58 @@ class HTTPSchemeEnum(str, Enum):
     https = "https"
 
 
+class CacheBackendEnum(str, Enum):
+    memory = "memory"
+    redis = "redis"
+    tiered = "tiered"
+
+
+class RateLimitKeyEnum(str, Enum):
+    api_key = "api_key"
+    jwt = "jwt"
+    ip = "ip"
+
+
+class ConcurrencyAlgorithmEnum(str, Enum):
+    aimd = "aimd"
+    gradient = "gradient"
+
+
+class CompressionEncodingEnum(str, Enum):
+    br = "br"
+    zstd = "zstd"
+    gzip = "gzip"
+
+
+class UniqueIdModeEnum(str, Enum):
+    timestamp_uuid = "timestamp_uuid"
+    ulid = "ulid"
+
+
+class PathOpStatusEnum(str, Enum):
+    removed = "removed"
+    missing = "missing"
+    failed = "failed"
+
+
+class JobStatusEnum(str, Enum):
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+
+
+class JobQueueBackendEnum(str, Enum):
+    memory = "memory"
+    sqlite = "sqlite"
+
+
+class JobExecutorEnum(str, Enum):
+    asyncio = "asyncio"
+    thread = "thread"
+    process = "process"
+
+
 __all__ = [
     "ENV_PREFIX",
     "ENV_PREFIX_API",
@@ -59,4 +111,13 @@ __all__ = [
     "CurrencyEnum",
     "HashAlgoEnum",
     "HTTPSchemeEnum",
+    "CacheBackendEnum",
+    "RateLimitKeyEnum",
+    "ConcurrencyAlgorithmEnum",
+    "CompressionEncodingEnum",
+    "UniqueIdModeEnum",
+    "PathOpStatusEnum",
+    "JobStatusEnum",
+    "JobQueueBackendEnum",
+    "JobExecutorEnum",
 ]
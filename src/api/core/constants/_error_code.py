@@ -163,6 +163,14 @@ class ErrorCodeEnum(Enum):
         description=f"{HTTPStatus(429).description}.",
         detail=None,
     )
+    RATE_LIMITED = ErrorCodePM(
+        code="429_00001",
+        name="RATE_LIMITED",
+        status_code=429,
+        message="Rate limit exceeded, try again later!",
+        description="The client has sent too many requests, retry after the time in the `Retry-After` header.",
+        detail=None,
+    )
     INTERNAL_SERVER_ERROR = ErrorCodePM(
         code="500_00000",
         name="INTERNAL_SERVER_ERROR",
@@ -211,6 +219,22 @@ class ErrorCodeEnum(Enum):
         description=f"{HTTPStatus(503).description}.",
         detail=None,
     )
+    OVERLOADED = ErrorCodePM(
+        code="503_00001",
+        name="OVERLOADED",
+        status_code=503,
+        message="Server is overloaded, try again later!",
+        description="The server is at its concurrency limit, retry after the time in the `Retry-After` header.",
+        detail=None,
+    )
+    JOB_QUEUE_FULL = ErrorCodePM(
+        code="503_00002",
+        name="JOB_QUEUE_FULL",
+        status_code=503,
+        message="Job queue is full, try again later!",
+        description="The number of queued and running jobs is at the limit, retry after the time in the `Retry-After` header.",
+        detail=None,
+    )
     DB_CONNECT_ERROR = ErrorCodePM(
         code="503_10000",
         name="DB_CONNECT_ERROR",
@@ -227,6 +251,22 @@ class ErrorCodeEnum(Enum):
         description=f"{HTTPStatus(503).description}.",
         detail=None,
     )
+    INSUFFICIENT_STORAGE = ErrorCodePM(
+        code="507_00000",
+        name="INSUFFICIENT_STORAGE",
+        status_code=507,
+        message=f"{HTTPStatus(507).phrase}!",
+        description="Not enough free disk space to store the data.",
+        detail=None,
+    )
+    UPLOAD_QUOTA_EXCEEDED = ErrorCodePM(
+        code="507_00001",
+        name="UPLOAD_QUOTA_EXCEEDED",
+        status_code=507,
+        message="Upload quota exceeded!",
+        description="Total size of stored and in-progress uploads would exceed the upload quota.",
+        detail=None,
+    )
 
     @classmethod
     def get_by_code(
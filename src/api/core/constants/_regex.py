@@ -22,6 +22,7 @@ REQUEST_ID_REGEX = (
 
 HTTP_METHOD_REGEX = r"^(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS|CONNECT|TRACE|\*)$"
 ASYMMETRIC_ALGORITHM_REGEX = r"^(RS256|RS384|RS512)$"
+LOG_LEVEL_REGEX = r"^(TRACE|DEBUG|INFO|SUCCESS|WARNING|ERROR|CRITICAL)$"
 JWT_ALGORITHM_REGEX = r"^(HS256|HS384|HS512|ES256|ES256K|ES384|ES512|RS256|RS384|RS512|PS256|PS384|PS512|EdDSA)$"
 
 
@@ -51,6 +52,7 @@ __all__ = [
     "HTTP_METHOD_REGEX",
     "ASYMMETRIC_ALGORITHM_REGEX",
     "JWT_ALGORITHM_REGEX",
+    "LOG_LEVEL_REGEX",
     "SPECIAL_CHARS_REGEX",
     "SPECIAL_CHARS_BASE_REGEX",
     "SPECIAL_CHARS_LOW_REGEX",
@@ -2,32 +2,35 @@
 
 from typing import Any, Dict, Optional, List
 
-from jwt import ExpiredSignatureError, InvalidTokenError
-from fastapi import Security, Depends, Request
+from fastapi import (
+    Security,
+    Depends,
+    Request,
+    WebSocket,
+    WebSocketException,
+    status,
+)
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi.security.utils import get_authorization_scheme_param
 
 from api.core.constants import ErrorCodeEnum, ALPHANUM_HOST_REGEX
 from api.config import config
 from api.core.utils import validator
-from api.helpers.crypto import jwt as jwt_helper
 from api.core.exceptions import BaseHTTPException
 
 
 _http_bearer = HTTPBearer(auto_error=False)
+## First of two offered subprotocols, the second one is the access token:
+_WS_BEARER_SUBPROTOCOL = "bearer"
 
 
-def auth_jwt(
-    request: Request,
-    authorization: Optional[HTTPAuthorizationCredentials] = Security(_http_bearer),
-) -> Dict[str, Any]:
-    """Dependency function to authenticate the access token (JWT) and get the payload.
+def decode_access_token(access_token: str) -> Dict[str, Any]:
+    """Validate and decode the access token (JWT).
 
     Args:
-        request       (Request                     , required): The FastAPI request object.
-        authorization (HTTPAuthorizationCredentials, required): 'Authorization: Bearer <access_token>' header credentials.
+        access_token (str, required): Access token (JWT).
 
     Raises:
-        BaseHTTPException: If the access token is missing.
         BaseHTTPException: If the access token has expired.
         BaseHTTPException: If the access token is invalid.
 
@@ -35,15 +38,11 @@ def auth_jwt(
         Dict[str, Any]: The decoded access token payload.
     """
 
-    if not authorization:
-        raise BaseHTTPException(
-            error_enum=ErrorCodeEnum.TOKEN_INVALID,
-            message="Not authenticated!",
-            headers={"WWW-Authenticate": 'Bearer error="missing_token"'},
-        )
+    ## Imported on first use, `jwt` pulls in `cryptography`:
+    from jwt import ExpiredSignatureError, InvalidTokenError
+    from api.helpers.crypto import jwt as jwt_helper
 
-    _access_token: str = authorization.credentials
-    if not validator.is_valid(val=_access_token, pattern=ALPHANUM_HOST_REGEX):
+    if not validator.is_valid(val=access_token, pattern=ALPHANUM_HOST_REGEX):
         raise BaseHTTPException(
             error_enum=ErrorCodeEnum.TOKEN_INVALID,
             message="Invalid access token!",
@@ -53,7 +52,7 @@ def auth_jwt(
     _payload: Dict[str, Any] = None
     try:
         _payload: Dict[str, Any] = jwt_helper.decode(
-            token=_access_token,
+            token=access_token,
             key=config.api.security.jwt.secret,
             algorithm=config.api.security.jwt.algorithm,
         )
@@ -70,10 +69,97 @@ def auth_jwt(
             headers={"WWW-Authenticate": 'Bearer error="invalid_token"'},
         )
 
+    return _payload
+
+
+def auth_jwt(
+    request: Request,
+    authorization: Optional[HTTPAuthorizationCredentials] = Security(_http_bearer),
+) -> Dict[str, Any]:
+    """Dependency function to authenticate the access token (JWT) and get the payload.
+
+    Args:
+        request       (Request                     , required): The FastAPI request object.
+        authorization (HTTPAuthorizationCredentials, required): 'Authorization: Bearer <access_token>' header credentials.
+
+    Raises:
+        BaseHTTPException: If the access token is missing.
+        BaseHTTPException: If the access token has expired.
+        BaseHTTPException: If the access token is invalid.
+
+    Returns:
+        Dict[str, Any]: The decoded access token payload.
+    """
+
+    if not authorization:
+        raise BaseHTTPException(
+            error_enum=ErrorCodeEnum.TOKEN_INVALID,
+            message="Not authenticated!",
+            headers={"WWW-Authenticate": 'Bearer error="missing_token"'},
+        )
+
+    _payload: Dict[str, Any] = decode_access_token(access_token=authorization.credentials)
     request.state.user_id = _payload.get("sub")
     return _payload
 
 
+def auth_ws_jwt(websocket: WebSocket) -> Dict[str, Any]:
+    """Dependency function to authenticate the access token (JWT) of a WebSocket connection once, before it's
+    accepted. Token is read from:
+
+    - 'Authorization: Bearer <access_token>' header.
+    - 'Sec-WebSocket-Protocol: bearer, <access_token>' header, for clients which can't send other headers
+      (e.g. browsers). Connection is accepted with 'bearer' subprotocol (`websocket.state.subprotocol`).
+    - `access_token` query parameter, only if `api.websocket.allow_query_token` is enabled. URLs are written to
+      access logs, so it's disabled by default.
+
+    Args:
+        websocket (WebSocket, required): The WebSocket connection.
+
+    Raises:
+        WebSocketException: If WebSocket endpoints are disabled (checked before the token is decoded), or the
+            access token is missing, expired or invalid (1008 close code).
+
+    Returns:
+        Dict[str, Any]: The decoded access token payload.
+    """
+
+    if not config.api.websocket.enabled:
+        raise WebSocketException(
+            code=status.WS_1008_POLICY_VIOLATION, reason="WebSocket endpoints are disabled!"
+        )
+
+    websocket.state.subprotocol = None
+    _access_token: Optional[str] = None
+    _scheme, _credentials = get_authorization_scheme_param(
+        websocket.headers.get("Authorization")
+    )
+    if _credentials and (_scheme.lower() == "bearer"):
+        _access_token = _credentials
+    else:
+        _subprotocols: List[str] = websocket.scope.get("subprotocols", [])
+        if (len(_subprotocols) == 2) and (_subprotocols[0].lower() == _WS_BEARER_SUBPROTOCOL):
+            _access_token = _subprotocols[1]
+            websocket.state.subprotocol = _subprotocols[0]
+        elif config.api.websocket.allow_query_token:
+            _access_token = websocket.query_params.get("access_token")
+
+    if not _access_token:
+        raise WebSocketException(
+            code=status.WS_1008_POLICY_VIOLATION, reason="Not authenticated!"
+        )
+
+    try:
+        _payload: Dict[str, Any] = decode_access_token(access_token=_access_token)
+    except BaseHTTPException as err:
+        raise WebSocketException(
+            code=status.WS_1008_POLICY_VIOLATION, reason=err.detail["message"]
+        )
+
+    websocket.state.user_id = _payload.get("sub")
+    return _payload
+
+
 def get_user_id(payload: Dict[str, Any] = Depends(auth_jwt)) -> str:
     """Dependency function to get the user ID from the token payload.
 
@@ -147,7 +233,9 @@ class AuthScopeDep:
 
 
 __all__ = [
+    "decode_access_token",
     "auth_jwt",
+    "auth_ws_jwt",
     "get_user_id",
     "is_auth",
     "AuthScopeDep",
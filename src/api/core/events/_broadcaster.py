@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import asyncio
+import threading
+import itertools
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Optional, Set, Tuple, Union
+
+from pydantic import BaseModel, validate_call, conint
+
+
+class EventSubscribersLimitError(Exception):
+    """Raised when the number of subscribers is at the limit."""
+
+
+class EventSubscriber:
+    """Bounded queue of pre-encoded Server-Sent Events frames of one client, only used in the event loop.
+    Subscriber is evicted when the queue is full (slow consumer), the client reconnects with `Last-Event-ID`.
+    """
+
+    __slots__ = ("max_size", "last_seq", "is_evicted", "_frames", "_event")
+
+    def __init__(self, max_size: int, last_seq: int = 0) -> None:
+        self.max_size = max_size
+        self.last_seq = last_seq
+        self.is_evicted = False
+
+        self._frames: Deque[bytes] = deque()
+        self._event = asyncio.Event()
+
+    def push(self, seq: int, frame: bytes) -> bool:
+        """Add a frame, already delivered sequences are skipped.
+
+        Args:
+            seq   (int  , required): Event sequence number.
+            frame (bytes, required): Encoded event frame.
+
+        Returns:
+            bool: False if the queue is full and the subscriber is evicted.
+        """
+
+        if seq <= self.last_seq:
+            return True
+
+        if self.max_size <= len(self._frames):
+            self.is_evicted = True
+            self._event.set()
+            return False
+
+        self.last_seq = seq
+        self._frames.append(frame)
+        self._event.set()
+        return True
+
+    def put_nowait(self, frame: bytes) -> None:
+        """Add a frame without sequence check and size limit, e.g. replayed events.
+
+        Args:
+            frame (bytes, required): Encoded event frame.
+        """
+
+        self._frames.append(frame)
+        self._event.set()
+
+    async def get(self, timeout: float) -> Union[bytes, None]:
+        """Wait for frames and take all of them at once.
+
+        Args:
+            timeout (float, required): Seconds to wait.
+
+        Returns:
+            Union[bytes, None]: Joined frames, empty bytes on timeout or None if evicted.
+        """
+
+        if not self._frames:
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        self._event.clear()
+        if self.is_evicted:
+            return None
+
+        _frames = b"".join(self._frames)
+        self._frames.clear()
+        return _frames
+
+
+class EventBroadcaster:
+    """In-process Server-Sent Events fan-out with a replay ring buffer.
+
+    Events are encoded once on publish and shared by all subscribers. `publish()` can be called from any thread,
+    frames are handed to the event loop of subscribers. Event IDs are `<stream ID>-<sequence>`, IDs of another
+    process (e.g. before restart) or older than the ring buffer can't be resumed, those clients get a `reset`
+    event to reload the full state.
+    """
+
+    @validate_call
+    def __init__(
+        self,
+        buffer_size: conint(ge=1) = 1024,  # type: ignore
+        queue_size: conint(ge=1) = 256,  # type: ignore
+        max_subscribers: conint(ge=1) = 10_000,  # type: ignore
+    ) -> None:
+        """Constructor method for EventBroadcaster class.
+
+        Args:
+            buffer_size     (int, optional): Number of recent events kept for `Last-Event-ID` resume. Defaults to 1024.
+            queue_size      (int, optional): Maximum undelivered frames per subscriber. Defaults to 256.
+            max_subscribers (int, optional): Maximum number of subscribers. Defaults to 10000.
+        """
+
+        self.buffer_size = buffer_size
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+
+        self.stream_id = os.urandom(4).hex()
+        self._counter = itertools.count(1)
+        self._last_seq = 0
+        self._buffer: Deque[Tuple[int, bytes]] = deque(maxlen=buffer_size)
+        self._subscribers: Set[EventSubscriber] = set()
+        self._loop: Union[asyncio.AbstractEventLoop, None] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    @staticmethod
+    def _encode_data(data: Any) -> str:
+        if isinstance(data, BaseModel):
+            return data.model_dump_json()
+
+        if isinstance(data, str):
+            return data
+
+        return json.dumps(data, separators=(",", ":"), default=str)
+
+    def _parse_seq(self, event_id: Optional[str]) -> Union[int, None]:
+        if not event_id:
+            return None
+
+        _stream_id, _, _seq = event_id.strip().rpartition("-")
+        if (_stream_id != self.stream_id) or (not _seq.isdigit()):
+            return None
+
+        return int(_seq)
+
+    def _fan_out(self, seq: int, frame: bytes) -> None:
+        _evicted = [
+            _subscriber
+            for _subscriber in self._subscribers
+            if not _subscriber.push(seq, frame)
+        ]
+        for _subscriber in _evicted:
+            self._subscribers.discard(_subscriber)
+
+    def publish(self, event: str, data: Any) -> str:
+        """Publish an event to all subscribers, safe to call from any thread.
+
+        Args:
+            event (str, required): Event type, e.g. 'task.created'.
+            data  (Any, required): Pydantic model, pre-encoded JSON string or JSON serializable data.
+
+        Returns:
+            str: Event ID.
+        """
+
+        _data = self._encode_data(data)
+        with self._lock:
+            _seq = next(self._counter)
+            _frame = f"id: {self.stream_id}-{_seq}\nevent: {event}\ndata: {_data}\n\n".encode()
+            self._buffer.append((_seq, _frame))
+            self._last_seq = _seq
+            if self._subscribers:
+                ## Scheduled under the lock, so frames are delivered in sequence order from any thread:
+                try:
+                    self._loop.call_soon_threadsafe(self._fan_out, _seq, _frame)
+                except RuntimeError:
+                    ## Event loop is closed (e.g. shutdown), nothing to deliver:
+                    pass
+
+        return f"{self.stream_id}-{_seq}"
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> EventSubscriber:
+        """Add a subscriber, must be called in the event loop.
+        Buffered events after `last_event_id` are queued first, or a `reset` event if they can't be resumed.
+
+        Args:
+            last_event_id (Optional[str], optional): `Last-Event-ID` header of a reconnecting client. Defaults to None.
+
+        Raises:
+            EventSubscribersLimitError: If the number of subscribers is at the limit.
+
+        Returns:
+            EventSubscriber: New subscriber.
+        """
+
+        if self.max_subscribers <= len(self._subscribers):
+            raise EventSubscribersLimitError(
+                f"Too many event subscribers, limit: {self.max_subscribers}!"
+            )
+
+        _last_seq = self._parse_seq(last_event_id)
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            _subscriber = EventSubscriber(max_size=self.queue_size, last_seq=self._last_seq)
+            if last_event_id:
+                _oldest_seq = self._buffer[0][0] if self._buffer else (self._last_seq + 1)
+                if (
+                    (_last_seq is None)
+                    or (_last_seq + 1 < _oldest_seq)
+                    or (self._last_seq < _last_seq)
+                ):
+                    _subscriber.put_nowait(
+                        f"id: {self.stream_id}-{self._last_seq}\nevent: reset\ndata: {{}}\n\n".encode()
+                    )
+                else:
+                    ## Replay isn't limited by the queue size:
+                    for _seq, _frame in self._buffer:
+                        if _last_seq < _seq:
+                            _subscriber.put_nowait(_frame)
+
+            self._subscribers.add(_subscriber)
+
+        return _subscriber
+
+    def unsubscribe(self, subscriber: EventSubscriber) -> None:
+        """Remove a subscriber.
+
+        Args:
+            subscriber (EventSubscriber, required): Subscriber to remove.
+        """
+
+        self._subscribers.discard(subscriber)
+
+    async def stream(
+        self,
+        subscriber: EventSubscriber,
+        heartbeat: float = 15.0,
+        retry: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream frames of a subscriber as `text/event-stream` body, the subscriber is removed at the end.
+
+        Args:
+            subscriber (EventSubscriber, required): Subscriber from `subscribe()`.
+            heartbeat  (float          , optional): Seconds of idle time before a ping comment is sent. Defaults to 15.0.
+            retry      (Optional[int]  , optional): Client reconnection time in milliseconds. Defaults to None.
+
+        Returns:
+            AsyncIterator[bytes]: Frames to send.
+        """
+
+        try:
+            ## Comment line flushes headers through proxies right away:
+            yield (f"retry: {retry}\n\n" if retry else ": connected\n\n").encode()
+            while True:
+                _frames = await subscriber.get(timeout=heartbeat)
+                if _frames is None:
+                    ## Evicted slow consumer, client reconnects and resumes from the ring buffer:
+                    break
+
+                yield _frames or b": ping\n\n"
+        finally:
+            self.unsubscribe(subscriber)
+
+
+__all__ = ["EventSubscribersLimitError", "EventSubscriber", "EventBroadcaster"]
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+
+from ._sorted import *
+from ._trie import *
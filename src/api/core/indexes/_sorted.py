@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+import math
+import bisect
+from typing import Any, Iterator, List, Optional, Tuple
+
+
+class SortedIndex:
+    """Secondary index of (key, item) pairs kept sorted with `bisect`, for range queries and ordered scans.
+
+    Items must be unique and orderable (e.g. integer row sequence), so pairs with equal keys keep a stable
+    order. Insert and remove are O(log n) searches plus a list shift (memmove), which is fast up to millions of
+    entries. Not thread-safe, callers lock around mutations and queries.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: List[Tuple[Any, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, key: Any, item: Any) -> None:
+        """Add an item with the key.
+
+        Args:
+            key  (Any, required): Index key, e.g. point or timestamp.
+            item (Any, required): Unique item ID.
+        """
+
+        bisect.insort(self._entries, (key, item))
+
+    def remove(self, key: Any, item: Any) -> bool:
+        """Remove an item, with the same key it was added with.
+
+        Args:
+            key  (Any, required): Index key.
+            item (Any, required): Unique item ID.
+
+        Returns:
+            bool: True if the item was found and removed.
+        """
+
+        _i = bisect.bisect_left(self._entries, (key, item))
+        if (_i < len(self._entries)) and (self._entries[_i] == (key, item)):
+            del self._entries[_i]
+            return True
+
+        return False
+
+    def _bounds(self, min_key: Any, max_key: Any) -> Tuple[int, int]:
+        ## `(key,)` sorts before and `(key, inf)` after all pairs with the key:
+        _start = 0 if min_key is None else bisect.bisect_left(self._entries, (min_key,))
+        _end = (
+            len(self._entries)
+            if max_key is None
+            else bisect.bisect_right(self._entries, (max_key, math.inf))
+        )
+        return _start, max(_start, _end)
+
+    def count(self, min_key: Optional[Any] = None, max_key: Optional[Any] = None) -> int:
+        """Count items in the key range, without scanning them.
+
+        Args:
+            min_key (Optional[Any], optional): Minimum key (inclusive), no limit if None. Defaults to None.
+            max_key (Optional[Any], optional): Maximum key (inclusive), no limit if None. Defaults to None.
+
+        Returns:
+            int: Number of items.
+        """
+
+        _start, _end = self._bounds(min_key, max_key)
+        return _end - _start
+
+    def scan(
+        self,
+        min_key: Optional[Any] = None,
+        max_key: Optional[Any] = None,
+        reverse: bool = False,
+    ) -> Iterator[Any]:
+        """Iterate items in the key range ordered by key (and item).
+
+        Args:
+            min_key (Optional[Any], optional): Minimum key (inclusive), no limit if None. Defaults to None.
+            max_key (Optional[Any], optional): Maximum key (inclusive), no limit if None. Defaults to None.
+            reverse (bool         , optional): Iterate from the largest key. Defaults to False.
+
+        Returns:
+            Iterator[Any]: Item IDs.
+        """
+
+        _start, _end = self._bounds(min_key, max_key)
+        _range = range(_end - 1, _start - 1, -1) if reverse else range(_start, _end)
+        _entries = self._entries
+        return (_entries[_i][1] for _i in _range)
+
+
+__all__ = ["SortedIndex"]
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any, Dict, Iterator, List, Set, Union
+
+
+class _TrieNode:
+    __slots__ = ("children", "items", "count")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.items: Set[Any] = set()
+        ## Number of items in this subtree, prefix counts without scanning:
+        self.count = 0
+
+
+class PrefixTrie:
+    """Case-insensitive prefix index of string keys to items.
+    Add and remove are O(key length), prefix search is O(prefix length + matched items).
+    Not thread-safe, callers lock around mutations and queries.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+
+    def __len__(self) -> int:
+        return self._root.count
+
+    def _find_node(self, prefix: str) -> Union[_TrieNode, None]:
+        _node = self._root
+        for _char in prefix.casefold():
+            _node = _node.children.get(_char)
+            if _node is None:
+                return None
+
+        return _node
+
+    def add(self, key: str, item: Any) -> None:
+        """Add an item with the key.
+
+        Args:
+            key  (str, required): String key, e.g. name.
+            item (Any, required): Unique item ID.
+        """
+
+        _node = self._root
+        _node.count += 1
+        for _char in key.casefold():
+            _node = _node.children.setdefault(_char, _TrieNode())
+            _node.count += 1
+
+        _node.items.add(item)
+
+    def remove(self, key: str, item: Any) -> bool:
+        """Remove an item, with the same key it was added with.
+
+        Args:
+            key  (str, required): String key.
+            item (Any, required): Unique item ID.
+
+        Returns:
+            bool: True if the item was found and removed.
+        """
+
+        _path: List[_TrieNode] = [self._root]
+        _key = key.casefold()
+        for _char in _key:
+            _node = _path[-1].children.get(_char)
+            if _node is None:
+                return False
+
+            _path.append(_node)
+
+        if item not in _path[-1].items:
+            return False
+
+        _path[-1].items.discard(item)
+        for _node in _path:
+            _node.count -= 1
+
+        ## Prune empty branches:
+        for _i in range(len(_key), 0, -1):
+            if _path[_i].count:
+                break
+
+            del _path[_i - 1].children[_key[_i - 1]]
+
+        return True
+
+    def count(self, prefix: str) -> int:
+        """Count items with keys starting with the prefix.
+
+        Args:
+            prefix (str, required): Key prefix.
+
+        Returns:
+            int: Number of items.
+        """
+
+        _node = self._find_node(prefix)
+        return _node.count if _node else 0
+
+    def scan(self, prefix: str) -> Iterator[Any]:
+        """Iterate items with keys starting with the prefix, in no particular order.
+
+        Args:
+            prefix (str, required): Key prefix.
+
+        Returns:
+            Iterator[Any]: Item IDs.
+        """
+
+        _node = self._find_node(prefix)
+        _stack = [_node] if _node else []
+        while _stack:
+            _node = _stack.pop()
+            yield from _node.items
+            _stack.extend(_node.children.values())
+
+
+__all__ = ["PrefixTrie"]
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+
+from ._base import *
+from ._memory import *
+from ._sqlite import *
+from ._registry import *
+from ._worker import *
+from ._factory import *
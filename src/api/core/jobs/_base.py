@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
+
+from pydantic import Field, constr
+
+from api.core import utils
+from api.core.constants import JobStatusEnum
+from api.core.schemas import IdPM, TimestampPM
+
+
+class JobQueueFullError(Exception):
+    """Raised when the number of queued and running jobs is at the queue limit."""
+
+
+class JobTimeoutError(TimeoutError):
+    """Raised when a thread or process job attempt times out, it can't be interrupted and isn't retried."""
+
+
+class JobPM(TimestampPM, IdPM):
+    name: constr(strip_whitespace=True) = Field(  # type: ignore
+        ...,
+        min_length=2,
+        max_length=128,
+        title="Job name",
+        description="Registered name of the job handler.",
+        examples=["tasks.report"],
+    )
+    params: Dict[str, Any] = Field(
+        default_factory=dict,
+        title="Job parameters",
+        description="Keyword arguments of the job handler.",
+        examples=[{"min_point": 50}],
+    )
+    status: JobStatusEnum = Field(
+        default=JobStatusEnum.queued,
+        title="Job status",
+        description="Current status of the job.",
+        examples=["queued"],
+    )
+    attempts: int = Field(
+        default=0,
+        ge=0,
+        title="Attempts",
+        description="Number of started attempts.",
+        examples=[1],
+    )
+    max_attempts: int = Field(
+        default=1,
+        ge=1,
+        title="Maximum attempts",
+        description="Job fails after this many attempts (retries + 1).",
+        examples=[4],
+    )
+    result: Any = Field(
+        default=None,
+        title="Job result",
+        description="JSON result of the succeeded job.",
+        examples=[{"count": 100}],
+    )
+    error: Optional[str] = Field(
+        default=None,
+        title="Error",
+        description="Error of the last failed attempt.",
+        examples=["TimeoutError: "],
+    )
+    run_at: datetime = Field(
+        default_factory=utils.now_utc_dt,
+        title="Run datetime",
+        description="Next attempt is started after this datetime.",
+        examples=["2024-12-01T00:00:00+00:00"],
+    )
+    started_at: Optional[datetime] = Field(
+        default=None,
+        title="Started datetime",
+        description="Start datetime of the last attempt.",
+        examples=["2024-12-01T00:00:00+00:00"],
+    )
+    finished_at: Optional[datetime] = Field(
+        default=None,
+        title="Finished datetime",
+        description="Datetime when the job succeeded or finally failed.",
+        examples=["2024-12-01T00:00:00+00:00"],
+    )
+
+
+class BaseJobQueue(ABC):
+    """Base class for async job queue backends, only called from the event loop."""
+
+    async def connect(self) -> None:
+        """Open connections/resources, called once on startup."""
+
+        return
+
+    async def close(self) -> None:
+        """Release connections/resources, called once on shutdown."""
+
+        return
+
+    @abstractmethod
+    async def put(self, job: JobPM) -> None:
+        """Add a new job to the queue.
+
+        Args:
+            job (JobPM, required): Queued job.
+
+        Raises:
+            JobQueueFullError: If the number of queued and running jobs is at the limit.
+        """
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get(self, id: str) -> Union[JobPM, None]:
+        """Get job by ID.
+
+        Args:
+            id (str, required): Job ID.
+
+        Returns:
+            Union[JobPM, None]: Copy of the job or None if not found.
+        """
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def claim(self) -> Union[JobPM, None]:
+        """Take the next queued job that is due, mark it as running and count the attempt.
+
+        Returns:
+            Union[JobPM, None]: Claimed job or None if no job is due.
+        """
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def save(self, job: JobPM) -> None:
+        """Save status of a claimed job, queued jobs are picked up again after `run_at`.
+
+        Args:
+            job (JobPM, required): Claimed job.
+        """
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def purge(self, before: datetime) -> int:
+        """Delete jobs finished before the datetime.
+
+        Args:
+            before (datetime, required): Finished datetime limit.
+
+        Returns:
+            int: Number of deleted jobs.
+        """
+
+        raise NotImplementedError()
+
+    async def __aenter__(self) -> "BaseJobQueue":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+
+__all__ = ["JobQueueFullError", "JobTimeoutError", "JobPM", "BaseJobQueue"]
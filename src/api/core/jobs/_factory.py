@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+from pydantic import validate_call, constr
+
+from api.core.constants import JobQueueBackendEnum
+from api.core.configs import JobsConfig
+from ._base import BaseJobQueue
+from ._memory import MemoryJobQueue
+from ._sqlite import SQLiteJobQueue
+from ._worker import JobWorkerPool
+
+
+@validate_call
+def create_job_queue(
+    jobs_config: JobsConfig,
+    db_file: constr(strip_whitespace=True, min_length=1),  # type: ignore
+) -> BaseJobQueue:
+    """Create job queue backend from config, call `connect()` on it before use.
+
+    Args:
+        jobs_config (JobsConfig, required): Jobs config.
+        db_file     (str       , required): SQLite database file path for `sqlite` backend.
+
+    Returns:
+        BaseJobQueue: Memory or SQLite job queue.
+    """
+
+    if jobs_config.backend == JobQueueBackendEnum.sqlite:
+        ## Lease outlives the job timeout, a job is claimed again only after its worker is surely gone:
+        _lease = (jobs_config.timeout or 86400) + jobs_config.drain_timeout + 60
+        return SQLiteJobQueue(
+            db_file=db_file, max_size=jobs_config.max_queue_size, lease=_lease
+        )
+
+    return MemoryJobQueue(max_size=jobs_config.max_queue_size)
+
+
+@validate_call
+def create_job_worker_pool(
+    jobs_config: JobsConfig,
+    db_file: constr(strip_whitespace=True, min_length=1),  # type: ignore
+) -> JobWorkerPool:
+    """Create job worker pool and its queue from config, call `start()` on it in the event loop.
+
+    Args:
+        jobs_config (JobsConfig, required): Jobs config.
+        db_file     (str       , required): SQLite database file path for `sqlite` backend.
+
+    Returns:
+        JobWorkerPool: Job worker pool.
+    """
+
+    _pool = JobWorkerPool(
+        queue=create_job_queue(jobs_config=jobs_config, db_file=db_file),
+        **jobs_config.model_dump(
+            include={
+                "workers",
+                "process_workers",
+                "max_retries",
+                "retry_backoff",
+                "retry_backoff_max",
+                "timeout",
+                "poll_interval",
+                "result_ttl",
+            }
+        ),
+    )
+    return _pool
+
+
+__all__ = ["create_job_queue", "create_job_worker_pool"]
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+import heapq
+import itertools
+from datetime import datetime
+from typing import Dict, List, Tuple, Union
+
+from pydantic import validate_call, conint
+
+from api.core import utils
+from api.core.constants import JobStatusEnum
+from ._base import BaseJobQueue, JobPM, JobQueueFullError
+
+
+class MemoryJobQueue(BaseJobQueue):
+    """In-process job queue, jobs are lost on restart and not shared between processes."""
+
+    @validate_call
+    def __init__(self, max_size: conint(ge=1) = 10_000) -> None:  # type: ignore
+        """Constructor method for MemoryJobQueue class.
+
+        Args:
+            max_size (int, optional): Maximum number of queued and running jobs. Defaults to 10000.
+        """
+
+        self.max_size = max_size
+
+        self._jobs: Dict[str, JobPM] = {}
+        ## (run timestamp, sequence, job ID), sequence keeps FIFO order of jobs with the same run time:
+        self._pending: List[Tuple[float, int, str]] = []
+        self._counter = itertools.count()
+        self._unfinished_count = 0
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def _push(self, job: JobPM) -> None:
+        heapq.heappush(
+            self._pending, (job.run_at.timestamp(), next(self._counter), job.id)
+        )
+
+    async def put(self, job: JobPM) -> None:
+        if self.max_size <= self._unfinished_count:
+            raise JobQueueFullError(f"Job queue is full, limit: {self.max_size}!")
+
+        self._jobs[job.id] = job.model_copy(deep=True)
+        self._unfinished_count += 1
+        self._push(job)
+
+    async def get(self, id: str) -> Union[JobPM, None]:
+        _job = self._jobs.get(id)
+        return _job.model_copy(deep=True) if _job else None
+
+    async def claim(self) -> Union[JobPM, None]:
+        _now = utils.now_utc_dt()
+        _now_ts = _now.timestamp()
+        while self._pending and (self._pending[0][0] <= _now_ts):
+            _, _, _id = heapq.heappop(self._pending)
+            _job = self._jobs.get(_id)
+            if (not _job) or (_job.status != JobStatusEnum.queued):
+                continue
+
+            _job.status = JobStatusEnum.running
+            _job.attempts += 1
+            _job.started_at = _now
+            _job.updated_at = _now
+            return _job.model_copy(deep=True)
+
+        return None
+
+    async def save(self, job: JobPM) -> None:
+        _job = self._jobs.get(job.id)
+        if not _job:
+            return
+
+        job.updated_at = utils.now_utc_dt()
+        self._jobs[job.id] = job.model_copy(deep=True)
+        if job.status == JobStatusEnum.queued:
+            self._push(job)
+        elif job.status in (JobStatusEnum.succeeded, JobStatusEnum.failed) and (
+            _job.status not in (JobStatusEnum.succeeded, JobStatusEnum.failed)
+        ):
+            self._unfinished_count -= 1
+
+    async def purge(self, before: datetime) -> int:
+        _ids = [
+            _job.id
+            for _job in self._jobs.values()
+            if _job.finished_at and (_job.finished_at < before)
+        ]
+        for _id in _ids:
+            del self._jobs[_id]
+
+        return len(_ids)
+
+
+__all__ = ["MemoryJobQueue"]
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+from api.core.constants import JobExecutorEnum
+
+
+class JobHandler(NamedTuple):
+    name: str
+    func: Callable[..., Any]
+    executor: JobExecutorEnum
+
+
+_JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+
+def register_job(
+    name: str, executor: Optional[JobExecutorEnum] = None
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator to register a function as job handler, job parameters are passed as keyword arguments.
+    Return value must be JSON serializable.
+
+    Args:
+        name     (str                      , required): Unique job name.
+        executor (Optional[JobExecutorEnum], optional): Where the function runs: 'asyncio' (event loop),
+                                                        'thread' ('jobs' threadpool group) or 'process'
+                                                        (module level functions only). Defaults to
+                                                        'asyncio' for coroutine functions, otherwise 'thread'.
+
+    Raises:
+        ValueError: If the name is already registered or executor doesn't match the function.
+
+    Returns:
+        Callable[[Callable[..., Any]], Callable[..., Any]]: Decorator returning the function unchanged.
+    """
+
+    def _decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        _is_async = asyncio.iscoroutinefunction(func)
+        _executor = executor or (
+            JobExecutorEnum.asyncio if _is_async else JobExecutorEnum.thread
+        )
+        if _is_async != (_executor == JobExecutorEnum.asyncio):
+            raise ValueError(
+                f"'{func.__name__}' job handler doesn't match '{_executor.value}' executor!"
+            )
+
+        if name in _JOB_HANDLERS:
+            raise ValueError(f"'{name}' job handler is already registered!")
+
+        _JOB_HANDLERS[name] = JobHandler(name=name, func=func, executor=_executor)
+        return func
+
+    return _decorator
+
+
+def get_job_handler(name: str) -> Union[JobHandler, None]:
+    """Get registered job handler by name.
+
+    Args:
+        name (str, required): Job name.
+
+    Returns:
+        Union[JobHandler, None]: Job handler or None if not registered.
+    """
+
+    return _JOB_HANDLERS.get(name)
+
+
+def get_job_names() -> List[str]:
+    """Get names of registered job handlers.
+
+    Returns:
+        List[str]: Sorted job names.
+    """
+
+    return sorted(_JOB_HANDLERS)
+
+
+__all__ = ["JobHandler", "register_job", "get_job_handler", "get_job_names"]
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Union
+
+from pydantic import validate_call, constr, conint, confloat
+
+from api.core import utils
+from api.core.concurrency import thread_pools
+from api.core.constants import JobStatusEnum
+from ._base import BaseJobQueue, JobPM, JobQueueFullError
+
+
+_THREAD_GROUP = "jobs"
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    run_at REAL NOT NULL,
+    finished_at REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_jobs_status_run_at ON jobs (status, run_at);
+CREATE INDEX IF NOT EXISTS ix_jobs_finished_at ON jobs (finished_at);
+"""
+
+
+class SQLiteJobQueue(BaseJobQueue):
+    """Durable job queue in a SQLite database (WAL mode), safe to share between processes of one host.
+    Jobs are claimed in `BEGIN IMMEDIATE` transactions, so each job runs only in one process at a time.
+    Claimed jobs are leased: jobs of a crashed process are claimed again when the lease expires.
+    Calls run in the 'jobs' threadpool group.
+    """
+
+    @validate_call
+    def __init__(
+        self,
+        db_file: constr(strip_whitespace=True, min_length=1),  # type: ignore
+        max_size: conint(ge=1) = 10_000,  # type: ignore
+        lease: confloat(gt=0) = 3900.0,  # type: ignore
+        busy_timeout: confloat(gt=0) = 5.0,  # type: ignore
+    ) -> None:
+        """Constructor method for SQLiteJobQueue class.
+
+        Args:
+            db_file      (str  , required): SQLite database file path, created if missing.
+            max_size     (int  , optional): Maximum number of queued and running jobs. Defaults to 10000.
+            lease        (float, optional): Seconds after a running job is claimed again, longer than job timeout.
+                                            Defaults to 3900.0.
+            busy_timeout (float, optional): Seconds to wait for locks of other processes. Defaults to 5.0.
+        """
+
+        self.db_file = db_file
+        self.max_size = max_size
+        self.lease = lease
+        self.busy_timeout = busy_timeout
+
+        self._conn: Union[sqlite3.Connection, None] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> None:
+        _dir_path = os.path.dirname(self.db_file)
+        if _dir_path:
+            os.makedirs(_dir_path, exist_ok=True)
+
+        _conn = sqlite3.connect(
+            self.db_file,
+            timeout=self.busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        _conn.executescript(_SCHEMA_SQL)
+        self._conn = _conn
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def _put(self, job: JobPM) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                (_count,) = self._conn.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE status IN (?, ?)",
+                    (JobStatusEnum.queued.value, JobStatusEnum.running.value),
+                ).fetchone()
+                if self.max_size <= _count:
+                    raise JobQueueFullError(
+                        f"Job queue is full, limit: {self.max_size}!"
+                    )
+
+                self._conn.execute(
+                    "INSERT INTO jobs (id, status, run_at, finished_at, data) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        job.id,
+                        job.status.value,
+                        job.run_at.timestamp(),
+                        None,
+                        job.model_dump_json(),
+                    ),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _get(self, id: str) -> Union[JobPM, None]:
+        with self._lock:
+            _row = self._conn.execute(
+                "SELECT data FROM jobs WHERE id = ?", (id,)
+            ).fetchone()
+
+        return JobPM.model_validate_json(_row[0]) if _row else None
+
+    def _claim(self) -> Union[JobPM, None]:
+        _now = utils.now_utc_dt()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                ## Running jobs are due only after their lease expired (`run_at` is the lease end):
+                _row = self._conn.execute(
+                    "SELECT data FROM jobs WHERE status IN (?, ?) AND run_at <= ? ORDER BY run_at LIMIT 1",
+                    (
+                        JobStatusEnum.queued.value,
+                        JobStatusEnum.running.value,
+                        _now.timestamp(),
+                    ),
+                ).fetchone()
+                if not _row:
+                    self._conn.execute("COMMIT")
+                    return None
+
+                _job = JobPM.model_validate_json(_row[0])
+                _job.status = JobStatusEnum.running
+                _job.attempts += 1
+                _job.started_at = _now
+                _job.updated_at = _now
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, run_at = ?, data = ? WHERE id = ?",
+                    (
+                        _job.status.value,
+                        _now.timestamp() + self.lease,
+                        _job.model_dump_json(),
+                        _job.id,
+                    ),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return _job
+
+    def _save(self, job: JobPM) -> None:
+        job.updated_at = utils.now_utc_dt()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, run_at = ?, finished_at = ?, data = ? WHERE id = ?",
+                (
+                    job.status.value,
+                    job.run_at.timestamp(),
+                    job.finished_at.timestamp() if job.finished_at else None,
+                    job.model_dump_json(),
+                    job.id,
+                ),
+            )
+
+    def _purge(self, before: datetime) -> int:
+        with self._lock:
+            _cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE finished_at < ?", (before.timestamp(),)
+            )
+
+        return _cursor.rowcount
+
+    async def connect(self) -> None:
+        await thread_pools.run_sync(_THREAD_GROUP, self._connect)
+
+    async def close(self) -> None:
+        await thread_pools.run_sync(_THREAD_GROUP, self._close)
+
+    async def put(self, job: JobPM) -> None:
+        await thread_pools.run_sync(_THREAD_GROUP, self._put, job)
+
+    async def get(self, id: str) -> Union[JobPM, None]:
+        return await thread_pools.run_sync(_THREAD_GROUP, self._get, id)
+
+    async def claim(self) -> Union[JobPM, None]:
+        return await thread_pools.run_sync(_THREAD_GROUP, self._claim)
+
+    async def save(self, job: JobPM) -> None:
+        await thread_pools.run_sync(_THREAD_GROUP, self._save, job)
+
+    async def purge(self, before: datetime) -> int:
+        return await thread_pools.run_sync(_THREAD_GROUP, self._purge, before)
+
+
+__all__ = ["SQLiteJobQueue"]
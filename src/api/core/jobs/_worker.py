@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+import time
+import random
+import inspect
+import asyncio
+import functools
+import multiprocessing
+from datetime import timedelta
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import ValidationError
+from pydantic_core import to_jsonable_python
+
+from api.core import utils
+from api.core.concurrency import thread_pools
+from api.core.constants import JobExecutorEnum, JobStatusEnum
+from api.logger import logger
+from ._base import BaseJobQueue, JobPM, JobTimeoutError
+from ._registry import JobHandler, get_job_handler
+
+
+_THREAD_GROUP = "jobs"
+## Finished jobs are purged at most this often:
+_PURGE_INTERVAL = 60
+
+
+class JobWorkerPool:
+    """Bounded pool of asyncio workers running jobs from a queue.
+
+    Each worker claims one job at a time, so at most `workers` jobs run at once in this process.
+    Failed attempts are retried with exponential backoff and jitter until `max_attempts` of the job.
+    On `stop()` the workers stop claiming jobs and running jobs get `timeout` seconds to finish.
+
+    Jobs run at least once, handlers should be idempotent:
+
+    - 'asyncio' jobs are cancelled on attempt timeout (then retried) and on `stop()` timeout (then queued
+      again, picked up on next start with a durable queue).
+    - 'thread' and 'process' jobs can't be interrupted. A timed out attempt fails without retry
+      (`JobTimeoutError`), because it may still be running. On `stop()` they are waited for until they
+      finish, never queued again while running.
+    - Jobs of a crashed process are run again after their lease expires (durable queue).
+    """
+
+    def __init__(
+        self,
+        queue: BaseJobQueue,
+        workers: int = 4,
+        process_workers: int = 2,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        retry_backoff_max: float = 300.0,
+        timeout: Optional[float] = 3600.0,
+        poll_interval: float = 1.0,
+        result_ttl: int = 86400,
+    ) -> None:
+        """Constructor method for JobWorkerPool class.
+
+        Args:
+            queue             (BaseJobQueue   , required): Job queue backend.
+            workers           (int            , optional): Number of jobs running at the same time. Defaults to 4.
+            process_workers   (int            , optional): Processes for 'process' executor jobs. Defaults to 2.
+            max_retries       (int            , optional): Default retries of a failed job. Defaults to 3.
+            retry_backoff     (float          , optional): First retry delay in seconds. Defaults to 1.0.
+            retry_backoff_max (float          , optional): Maximum retry delay in seconds. Defaults to 300.0.
+            timeout           (Optional[float], optional): Maximum seconds of one attempt, no limit if None.
+                                                           Defaults to 3600.0.
+            poll_interval     (float          , optional): Maximum seconds to wait for due jobs. Defaults to 1.0.
+            result_ttl        (int            , optional): Seconds to keep finished jobs. Defaults to 86400.
+        """
+
+        self.queue = queue
+        self.workers = workers
+        self.process_workers = process_workers
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.result_ttl = result_ttl
+
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._is_stopping = False
+        self._process_pool: Union[ProcessPoolExecutor, None] = None
+        self._purged_at = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._tasks) and (not self._is_stopping)
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            ## 'spawn' doesn't copy event loop and threads of this process:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        return self._process_pool
+
+    def _get_retry_delay(self, attempts: int) -> float:
+        _delay = min(self.retry_backoff * (2 ** (attempts - 1)), self.retry_backoff_max)
+        return _delay * random.uniform(0.5, 1.0)
+
+    async def _call(self, handler: JobHandler, params: Dict[str, Any]) -> Any:
+        if handler.executor == JobExecutorEnum.asyncio:
+            return await asyncio.wait_for(handler.func(**params), timeout=self.timeout)
+
+        ## Threads and processes can't be interrupted, timeout and cancellation only abandon the await:
+        _executor: str = JobExecutorEnum(handler.executor).value
+        if handler.executor == JobExecutorEnum.thread:
+            _future = asyncio.ensure_future(
+                thread_pools.run_sync(_THREAD_GROUP, handler.func, **params)
+            )
+        else:
+            _future = asyncio.get_running_loop().run_in_executor(
+                self._get_process_pool(), functools.partial(handler.func, **params)
+            )
+
+        try:
+            try:
+                return await asyncio.wait_for(asyncio.shield(_future), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                raise JobTimeoutError(
+                    f"Attempt timed out after {self.timeout} seconds, its {_executor} may "
+                    "still be running, not retried!"
+                )
+            except asyncio.CancelledError:
+                ## Stopping, it must not be queued again while it's still running:
+                logger.info(f"Waiting for running '{_executor}' job to finish...")
+                return await asyncio.shield(_future)
+        except BrokenProcessPool:
+            ## A child process died (e.g. out of memory), next attempt starts a new pool:
+            self._process_pool = None
+            raise
+
+    async def _run(self, job: JobPM) -> None:
+        _handler = get_job_handler(job.name)
+        try:
+            if not _handler:
+                raise LookupError(f"'{job.name}' job handler is not registered!")
+
+            if job.max_attempts < job.attempts:
+                ## Lease of a crashed worker expired after the last attempt:
+                raise RuntimeError("Job was interrupted in the last attempt!")
+
+            _result = await self._call(_handler, job.params)
+            job.result = to_jsonable_python(_result)
+            job.status = JobStatusEnum.succeeded
+            job.error = None
+            job.finished_at = utils.now_utc_dt()
+            logger.debug(f"Job '{job.id}' ({job.name}) succeeded.")
+        except asyncio.CancelledError:
+            ## Stopped before finishing, not counted as an attempt:
+            job.status = JobStatusEnum.queued
+            job.attempts -= 1
+            job.run_at = utils.now_utc_dt()
+            await asyncio.shield(self.queue.save(job))
+            raise
+        except Exception as err:
+            job.error = f"{type(err).__name__}: {err}"
+            ## Invalid parameters or unknown job won't succeed on retry:
+            _is_final = (
+                isinstance(err, (LookupError, ValidationError, JobTimeoutError))
+                or (job.max_attempts <= job.attempts)
+            )
+            if _is_final:
+                job.status = JobStatusEnum.failed
+                job.finished_at = utils.now_utc_dt()
+                logger.warning(
+                    f"Job '{job.id}' ({job.name}) failed after {job.attempts} attempt(s): {job.error}"
+                )
+            else:
+                job.status = JobStatusEnum.queued
+                job.run_at = utils.now_utc_dt() + timedelta(
+                    seconds=self._get_retry_delay(job.attempts)
+                )
+                logger.info(
+                    f"Job '{job.id}' ({job.name}) attempt {job.attempts} failed, retrying after "
+                    f"'{job.run_at.isoformat()}': {job.error}"
+                )
+
+        await self.queue.save(job)
+
+    async def _purge(self) -> None:
+        _now = time.monotonic()
+        if _now - self._purged_at < _PURGE_INTERVAL:
+            return
+
+        self._purged_at = _now
+        _count = await self.queue.purge(
+            before=utils.now_utc_dt() - timedelta(seconds=self.result_ttl)
+        )
+        if _count:
+            logger.debug(f"Purged {_count} finished job(s).")
+
+    async def _wait(self) -> None:
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+
+        self._wakeup.clear()
+
+    async def _work(self) -> None:
+        while not self._is_stopping:
+            try:
+                _job = await self.queue.claim()
+                if _job is None:
+                    await self._purge()
+                    await self._wait()
+                    continue
+
+                await self._run(_job)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Job worker failed, retrying:")
+                await self._wait()
+
+    async def start(self) -> None:
+        """Connect the queue and start workers, must be called in the event loop."""
+
+        await self.queue.connect()
+        self._is_stopping = False
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"job-worker-{_i}")
+            for _i in range(self.workers)
+        ]
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """Stop claiming jobs, wait for running jobs and close the queue.
+
+        Args:
+            timeout (float, optional): Seconds to wait for running jobs, then 'asyncio' jobs are cancelled and
+                                       queued again, 'thread' and 'process' jobs are waited for. Defaults to 30.0.
+        """
+
+        self._is_stopping = True
+        self._wakeup.set()
+        if self._tasks:
+            _, _pending = await asyncio.wait(self._tasks, timeout=timeout)
+            for _task in _pending:
+                _task.cancel()
+
+            if _pending:
+                logger.warning(
+                    f"Stopping {len(_pending)} running job(s) after {timeout} seconds, 'asyncio' jobs are "
+                    "queued again, others are waited for."
+                )
+                await asyncio.gather(*_pending, return_exceptions=True)
+
+        self._tasks = []
+        if self._process_pool:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+        await self.queue.close()
+
+    async def submit(
+        self,
+        name: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_retries: Optional[int] = None,
+    ) -> JobPM:
+        """Queue a new job.
+
+        Args:
+            name        (str                     , required): Registered job name.
+            params      (Optional[Dict[str, Any]], optional): Keyword arguments of the job handler. Defaults to None.
+            max_retries (Optional[int]           , optional): Retries of a failed job, pool default if None.
+                                                              Defaults to None.
+
+        Raises:
+            LookupError      : If the job name is not registered.
+            TypeError        : If the parameters don't match the job handler signature.
+            JobQueueFullError: If the number of queued and running jobs is at the limit.
+
+        Returns:
+            JobPM: Queued job.
+        """
+
+        _handler = get_job_handler(name)
+        if not _handler:
+            raise LookupError(f"'{name}' job handler is not registered!")
+
+        ## Fail fast on unknown or missing parameters, instead of in every attempt:
+        inspect.signature(_handler.func).bind(**(params or {}))
+
+        if max_retries is None:
+            max_retries = self.max_retries
+
+        _job = JobPM(name=name, params=params or {}, max_attempts=max_retries + 1)
+        await self.queue.put(_job)
+        self._wakeup.set()
+        return _job
+
+    async def get(self, id: str) -> Union[JobPM, None]:
+        """Get job by ID.
+
+        Args:
+            id (str, required): Job ID.
+
+        Returns:
+            Union[JobPM, None]: Job or None if not found (or already purged).
+        """
+
+        return await self.queue.get(id)
+
+
+__all__ = ["JobWorkerPool"]
@@ -2,3 +2,7 @@
 
 from ._process_time import *
 from ._request_id import *
+from ._runtime import *
+from ._compression import *
+from ._rate_limit import *
+from ._load_shedding import *
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import anyio.to_thread
+from beans_logging import logger
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.core import utils
+from api.core.configs import (
+    CompressionConfig,
+    CompressionLevelsConfig,
+    VersionedConfig,
+)
+
+
+_MAX_LEVELS_CACHE_SIZE = 256
+
+
+class _StaticEntry:
+    __slots__ = ("source", "body")
+
+    def __init__(self, source: bytes, body: bytes) -> None:
+        self.source = source
+        self.body = body
+
+
+class CompressionMiddleware:
+    """Compress responses with the best content encoding accepted by the client ('br', 'zstd' or 'gzip').
+
+    - Levels are configured per content type, other content types are passed through.
+    - Bodies smaller than `gzip_min_size` of runtime config (hot-reloadable) are passed through.
+    - Bodies larger than `offload_min_size` are compressed in the threadpool, not on the event loop.
+    - Streaming responses are compressed chunk by chunk, each chunk is flushed.
+    - Bodies of `static.paths` rarely change: compressed once with `static.levels` (regardless of `gzip_min_size`)
+      and reused while the app returns the same body. The app still handles every request, so headers and
+      outer middlewares (e.g. rate limits) stay per request.
+    - Strong `ETag` of compressed responses is suffixed with the encoding (e.g. `"abc-br"`), it identifies
+      the encoded bytes. `304 Not Modified` responses get the suffixed `ETag` the client has sent.
+
+    Args:
+        app                (ASGIApp          , required): Next ASGI application.
+        runtime_config     (VersionedConfig  , required): Versioned runtime config holder.
+        compression_config (CompressionConfig, required): Compression config.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        runtime_config: VersionedConfig,
+        compression_config: CompressionConfig,
+    ) -> None:
+        self.app = app
+        self.runtime_config = runtime_config
+        self.config = compression_config
+
+        _available = utils.get_compression_encodings()
+        _encodings: List[str] = []
+        for _encoding in compression_config.encodings:
+            if _encoding.value in _available:
+                _encodings.append(_encoding.value)
+            else:
+                logger.warning(
+                    f"'{_encoding.value}' compression is disabled, required package is not installed!"
+                )
+
+        self.encodings: Tuple[str, ...] = tuple(_encodings)
+        self._static_paths = frozenset(compression_config.static.paths)
+        self._static_cache: Dict[Tuple[str, str], _StaticEntry] = {}
+        self._levels_cache: Dict[str, Optional[CompressionLevelsConfig]] = {}
+        ## Longest prefix first:
+        self._levels: List[Tuple[str, CompressionLevelsConfig]] = sorted(
+            compression_config.levels.items(), key=lambda _item: len(_item[0]), reverse=True
+        )
+
+    def select_encoding(self, accept_encoding: str) -> Optional[str]:
+        """Select content encoding from 'Accept-Encoding' header value (see `utils.select_encoding()`).
+
+        Args:
+            accept_encoding (str, required): 'Accept-Encoding' header value.
+
+        Returns:
+            Optional[str]: Selected content encoding, None if nothing is acceptable.
+        """
+
+        return utils.select_encoding(accept_encoding, self.encodings)
+
+    def get_levels(self, content_type: str) -> Optional[CompressionLevelsConfig]:
+        """Get compression levels for the content type.
+
+        Args:
+            content_type (str, required): 'Content-Type' header value.
+
+        Returns:
+            Optional[CompressionLevelsConfig]: Compression levels, None if content type is not compressible.
+        """
+
+        if content_type in self._levels_cache:
+            return self._levels_cache[content_type]
+
+        _media_type = content_type.partition(";")[0].strip().lower()
+        _levels: Optional[CompressionLevelsConfig] = None
+        if _media_type not in self.config.exclude_content_types:
+            for _prefix, _prefix_levels in self._levels:
+                if _media_type.startswith(_prefix):
+                    _levels = _prefix_levels
+                    break
+
+        if len(self._levels_cache) >= _MAX_LEVELS_CACHE_SIZE:
+            self._levels_cache.clear()
+
+        self._levels_cache[content_type] = _levels
+        return _levels
+
+    def clear_static(self) -> None:
+        """Clear precompressed static responses, e.g. after OpenAPI schema is changed."""
+
+        self._static_cache.clear()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (scope["type"] != "http") or (not self.config.enabled) or (not self.encodings):
+            await self.app(scope, receive, send)
+            return
+
+        _accept_encoding = ""
+        _if_none_match = ""
+        for _key, _val in scope["headers"]:
+            if _key == b"accept-encoding":
+                _accept_encoding = _val.decode("latin-1")
+            elif _key == b"if-none-match":
+                _if_none_match = _val.decode("latin-1")
+
+        _encoding = self.select_encoding(_accept_encoding) if _accept_encoding else None
+        if _encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        _static_key: Union[Tuple[str, str], None] = None
+        if (
+            self.config.static.enabled
+            and (scope["method"] == "GET")
+            and (scope["path"] in self._static_paths)
+            and (not scope.get("query_string"))
+        ):
+            _static_key = (scope["path"], _encoding)
+
+        _responder = _CompressionResponder(
+            middleware=self,
+            encoding=_encoding,
+            static_key=_static_key,
+            if_none_match=_if_none_match,
+            send=send,
+        )
+        await self.app(scope, receive, _responder.send)
+
+
+class _CompressionResponder:
+    __slots__ = (
+        "middleware",
+        "encoding",
+        "static_key",
+        "if_none_match",
+        "_send",
+        "_start_message",
+        "_is_started",
+        "_is_passthrough",
+        "_compressor",
+    )
+
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        encoding: str,
+        static_key: Union[Tuple[str, str], None],
+        if_none_match: str,
+        send: Send,
+    ) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.static_key = static_key
+        self.if_none_match = if_none_match
+        self._send = send
+
+        self._start_message: Union[Message, None] = None
+        self._is_started = False
+        self._is_passthrough = False
+        self._compressor: Any = None
+
+    async def _compress(self, body: bytes, level: int) -> bytes:
+        if len(body) >= self.middleware.config.offload_min_size:
+            return await anyio.to_thread.run_sync(
+                utils.compress, body, self.encoding, level
+            )
+
+        return utils.compress(body, self.encoding, level)
+
+    def _get_encoded_etag(self, headers: MutableHeaders) -> Union[str, None]:
+        _etag = headers.get("etag")
+        ## Weak entity tags are already shared by semantically equivalent representations:
+        if (not _etag) or (not _etag.startswith('"')):
+            return None
+
+        return f'{_etag[:-1]}-{self.encoding}"'
+
+    async def send(self, message: Message) -> None:
+        _type = message["type"]
+        if _type == "http.response.start":
+            if (message["status"] == 304) and self.if_none_match:
+                _headers = MutableHeaders(raw=message["headers"])
+                _etag = self._get_encoded_etag(_headers)
+                ## Client has validated the compressed representation:
+                if _etag and (_etag in self.if_none_match):
+                    _headers["ETag"] = _etag
+                    _headers.add_vary_header("Accept-Encoding")
+
+            ## Headers depend on the first body chunk:
+            self._start_message = message
+            return
+
+        if self._is_passthrough or (_type != "http.response.body"):
+            if not self._is_started:
+                self._is_passthrough = True
+                await self._start()
+
+            await self._send(message)
+            return
+
+        _body: bytes = message.get("body", b"")
+        _more_body: bool = message.get("more_body", False)
+        if self._compressor:
+            _is_last = not _more_body
+            _body = self._compressor.compress(_body, _is_last)
+            await self._send({"type": "http.response.body", "body": _body, "more_body": _more_body})
+            return
+
+        _headers = MutableHeaders(raw=self._start_message["headers"])
+        _levels = self.middleware.get_levels(_headers.get("content-type", ""))
+        _is_static = (
+            bool(self.static_key) and (not _more_body) and (self._start_message["status"] == 200)
+        )
+        if (
+            (_levels is None)
+            or ("content-encoding" in _headers)
+            ## Byte ranges refer to the uncompressed representation:
+            or ("content-range" in _headers)
+            or (
+                (not _more_body)
+                and (not _is_static)
+                and (len(_body) < self.middleware.runtime_config.config.gzip_min_size)
+            )
+        ):
+            self._is_passthrough = True
+            await self._start()
+            await self._send(message)
+            return
+
+        _headers["Content-Encoding"] = self.encoding
+        _headers.add_vary_header("Accept-Encoding")
+        _etag = self._get_encoded_etag(_headers)
+        if _etag:
+            _headers["ETag"] = _etag
+
+        if _more_body:
+            del _headers["Content-Length"]
+            self._compressor = utils.get_compressor(
+                self.encoding, getattr(_levels, self.encoding)
+            )
+            await self._start()
+            await self._send(
+                {
+                    "type": "http.response.body",
+                    "body": self._compressor.compress(_body, False),
+                    "more_body": True,
+                }
+            )
+            return
+
+        if _is_static:
+            _entry = self.middleware._static_cache.get(self.static_key)
+            if (_entry is None) or (_entry.source != _body):
+                _entry = _StaticEntry(
+                    source=_body,
+                    body=await self._compress(
+                        _body, getattr(self.middleware.config.static.levels, self.encoding)
+                    ),
+                )
+                self.middleware._static_cache[self.static_key] = _entry
+
+            _body = _entry.body
+        else:
+            _body = await self._compress(_body, getattr(_levels, self.encoding))
+
+        _headers["Content-Length"] = str(len(_body))
+
+        await self._start()
+        await self._send({"type": "http.response.body", "body": _body})
+
+    async def _start(self) -> None:
+        self._is_started = True
+        if self._start_message:
+            await self._send(self._start_message)
+
+
+__all__ = ["CompressionMiddleware"]
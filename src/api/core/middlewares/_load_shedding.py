@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.core.constants import ErrorCodeEnum
+from api.core.configs import LoadSheddingConfig
+from api.core.concurrency import AdaptiveConcurrencyLimiter
+from api.core.responses import BaseResponse
+
+
+class LoadSheddingMiddleware:
+    """Adaptive concurrency limit per route class, requests over the limit fail fast with 503.
+
+    Limits follow observed latency (see `AdaptiveConcurrencyLimiter`), so requests don't queue up unbounded in the
+    threadpool when handlers are saturated. Rejected requests get a precomputed 503 response with `Retry-After`.
+    A slot is held until the response starts, streamed response bodies don't hold it.
+
+    Args:
+        app                  (ASGIApp           , required): Next ASGI application.
+        load_shedding_config (LoadSheddingConfig, required): Load shedding config.
+    """
+
+    def __init__(self, app: ASGIApp, load_shedding_config: LoadSheddingConfig) -> None:
+        self.app = app
+        self.config = load_shedding_config
+
+        self.limiters: Dict[str, AdaptiveConcurrencyLimiter] = {
+            _class_name: AdaptiveConcurrencyLimiter(
+                algorithm=load_shedding_config.algorithm, **_limit_config.model_dump()
+            )
+            for _class_name, _limit_config in load_shedding_config.classes.items()
+        }
+        ## Route -> limiter, None for exempt routes, resolved on the first request:
+        self._routes: Union[
+            List[Tuple[BaseRoute, Optional[AdaptiveConcurrencyLimiter]]], None
+        ] = None
+
+        ## Rejected response has nothing request specific, rendered only once:
+        _error = ErrorCodeEnum.OVERLOADED.value.model_dump()
+        _response = BaseResponse(
+            status_code=_error["status_code"],
+            message=_error["message"],
+            error=_error,
+            headers={"Retry-After": str(load_shedding_config.retry_after)},
+        )
+        self._rejected_status: int = _response.status_code
+        self._rejected_headers: List[Tuple[bytes, bytes]] = _response.raw_headers
+        self._rejected_body: bytes = _response.body
+
+    def _get_routes(
+        self, scope: Scope
+    ) -> List[Tuple[BaseRoute, Optional[AdaptiveConcurrencyLimiter]]]:
+        if self._routes is None:
+            _routes = []
+            for _route in scope["app"].router.routes:
+                _name = getattr(_route, "name", None)
+                if _name in self.config.exempt_routes:
+                    _routes.append((_route, None))
+                elif _name in self.config.routes:
+                    _routes.append((_route, self.limiters[self.config.routes[_name]]))
+
+            self._routes = _routes
+
+        return self._routes
+
+    def get_limiter(self, scope: Scope) -> Optional[AdaptiveConcurrencyLimiter]:
+        """Get concurrency limiter of the requested route class.
+
+        Args:
+            scope (Scope, required): ASGI request scope.
+
+        Returns:
+            Optional[AdaptiveConcurrencyLimiter]: Route class limiter, None for exempt routes.
+        """
+
+        for _route, _limiter in self._get_routes(scope):
+            _match, _ = _route.matches(scope)
+            if _match == Match.FULL:
+                return _limiter
+
+        return self.limiters["default"]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (scope["type"] != "http") or (not self.config.enabled):
+            await self.app(scope, receive, send)
+            return
+
+        _limiter = self.get_limiter(scope)
+        if _limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not _limiter.try_acquire():
+            ## Outer middlewares may modify messages, they get their own copies:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": self._rejected_status,
+                    "headers": list(self._rejected_headers),
+                }
+            )
+            await send({"type": "http.response.body", "body": self._rejected_body})
+            return
+
+        _start_time = time.perf_counter()
+        _is_released = False
+
+        async def _send(message: Message) -> None:
+            nonlocal _is_released
+            ## Slot is released at response start, streaming response body (e.g. downloads) depends on
+            ## the client, not on capacity:
+            if (message["type"] == "http.response.start") and (not _is_released):
+                _is_released = True
+                _limiter.release(latency=time.perf_counter() - _start_time)
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            if not _is_released:
+                ## Failed requests don't tell much about capacity, no latency sample:
+                _is_released = True
+                _limiter.release()
+
+
+__all__ = ["LoadSheddingMiddleware"]
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+import math
+import time
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from beans_logging import logger
+from fastapi import Request
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.core.constants import ErrorCodeEnum, RateLimitKeyEnum
+from api.core.configs import JWTConfig, RateLimitConfig, RateLimitRuleConfig
+from api.core.rate_limit import SharedRateLimiter, TokenBucketLimiter
+from api.core.responses import BaseResponse
+
+
+_MAX_TOKENS_CACHE_SIZE = 10_000
+_WARN_INTERVAL = 60.0  # Seconds
+
+
+class RateLimitMiddleware:
+    """Token bucket rate limiting per client and route, rejected requests get 429 with `Retry-After`.
+
+    - Client is identified by known API key (`api_keys` config), verified JWT `sub` or client IP
+      (proxy-aware, from `RequestHTTPInfoMiddleware`), first available one of `key_by` config.
+    - Route rules are matched by route name, other routes use the default rule, exempt routes are not limited.
+    - In-process buckets are checked first, then shared counters (`app.state.cache`) if `shared` is enabled.
+      Shared backend errors don't block requests (fail open).
+
+    Args:
+        app               (ASGIApp        , required): Next ASGI application.
+        rate_limit_config (RateLimitConfig, required): Rate limit config.
+        jwt_config        (JWTConfig      , required): JWT config to verify access tokens.
+    """
+
+    def __init__(
+        self, app: ASGIApp, rate_limit_config: RateLimitConfig, jwt_config: JWTConfig
+    ) -> None:
+        self.app = app
+        self.config = rate_limit_config
+        self.jwt_config = jwt_config
+
+        self.limiter = TokenBucketLimiter(max_keys=rate_limit_config.max_keys)
+        self._api_key_header: bytes = rate_limit_config.api_key_header.lower().encode()
+        ## Hashes of known API keys, random keys must not get their own buckets:
+        self._api_key_hashes = frozenset(
+            self._hash_api_key(_api_key.get_secret_value().encode())
+            for _api_key in rate_limit_config.api_keys
+        )
+        ## Route -> rule, None for exempt routes, resolved on the first request:
+        self._routes: Union[List[Tuple[BaseRoute, Optional[RateLimitRuleConfig]]], None] = None
+        ## Verified access token -> (sub, exp):
+        self._tokens: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self._warned_at = 0.0
+
+    def _get_routes(self, scope: Scope) -> List[Tuple[BaseRoute, Optional[RateLimitRuleConfig]]]:
+        if self._routes is None:
+            _routes = []
+            for _route in scope["app"].router.routes:
+                _name = getattr(_route, "name", None)
+                if _name in self.config.exempt_routes:
+                    _routes.append((_route, None))
+                elif _name in self.config.routes:
+                    _routes.append((_route, self.config.routes[_name]))
+
+            self._routes = _routes
+
+        return self._routes
+
+    def get_rule(self, scope: Scope) -> Tuple[str, Optional[RateLimitRuleConfig]]:
+        """Get rate limit rule of the requested route.
+
+        Args:
+            scope (Scope, required): ASGI request scope.
+
+        Returns:
+            Tuple[str, Optional[RateLimitRuleConfig]]: Rule name (route name or 'default') and rule,
+                                                       None rule for exempt routes.
+        """
+
+        ## Only configured routes are matched, usually a few of them:
+        for _route, _rule in self._get_routes(scope):
+            _match, _ = _route.matches(scope)
+            if _match == Match.FULL:
+                return _route.name, _rule
+
+        return "default", self.config.default
+
+    def _get_jwt_sub(self, token: str) -> Union[str, None]:
+        _entry = self._tokens.get(token)
+        if _entry is not None:
+            if time.time() < _entry[1]:
+                self._tokens.move_to_end(token)
+                return _entry[0]
+
+            del self._tokens[token]
+            return None
+
+        ## Imported on first use, `jwt` pulls in `cryptography`:
+        from jwt import InvalidTokenError
+        from api.helpers.crypto import jwt as jwt_helper
+
+        try:
+            _payload: Dict[str, Any] = jwt_helper.decode(
+                token=token,
+                key=self.jwt_config.secret,
+                algorithm=self.jwt_config.algorithm,
+            )
+        except InvalidTokenError:
+            ## Invalid tokens are not cached, they are not a stable identity:
+            return None
+
+        _sub = str(_payload["sub"])
+        self._tokens[token] = (_sub, float(_payload["exp"]))
+        if _MAX_TOKENS_CACHE_SIZE < len(self._tokens):
+            self._tokens.popitem(last=False)
+
+        return _sub
+
+    @staticmethod
+    def _hash_api_key(api_key: bytes) -> str:
+        return hashlib.blake2b(api_key, digest_size=16).hexdigest()
+
+    def get_client_key(self, scope: Scope) -> str:
+        """Get client identity by `key_by` config order.
+
+        Args:
+            scope (Scope, required): ASGI request scope.
+
+        Returns:
+            str: Client key, e.g. 'sub:<user_id>', 'key:<api_key_hash>' or 'ip:<client_host>'.
+        """
+
+        _headers: Dict[bytes, bytes] = dict(scope["headers"])
+        for _key_by in self.config.key_by:
+            if _key_by == RateLimitKeyEnum.api_key:
+                _api_key = _headers.get(self._api_key_header)
+                if _api_key:
+                    _api_key_hash = self._hash_api_key(_api_key.strip())
+                    ## Unknown keys fall back to the next identity:
+                    if _api_key_hash in self._api_key_hashes:
+                        return f"key:{_api_key_hash}"
+
+            elif _key_by == RateLimitKeyEnum.jwt:
+                _authorization = _headers.get(b"authorization", b"")
+                if _authorization[:7].lower() == b"bearer ":
+                    _sub = self._get_jwt_sub(_authorization[7:].decode("latin-1").strip())
+                    if _sub:
+                        return f"sub:{_sub}"
+
+            elif _key_by == RateLimitKeyEnum.ip:
+                break
+
+        _http_info: Dict[str, Any] = scope.get("state", {}).get("http_info", {})
+        _client_host = _http_info.get("client_host")
+        if (not _client_host) and scope.get("client"):
+            _client_host = scope["client"][0]
+
+        return f"ip:{_client_host or 'unknown'}"
+
+    def _get_headers(self, rule: RateLimitRuleConfig, tokens: float) -> Dict[str, str]:
+        return {
+            "RateLimit-Limit": str(rule.burst),
+            "RateLimit-Remaining": str(max(int(tokens), 0)),
+            "RateLimit-Reset": str(math.ceil((rule.burst - tokens) / rule.rate)),
+            "RateLimit-Policy": f"{rule.burst};w={math.ceil(rule.burst / rule.rate)}",
+        }
+
+    async def _acquire_shared(
+        self, scope: Scope, key: str, rule: RateLimitRuleConfig
+    ) -> Tuple[bool, float]:
+        _cache = getattr(scope["app"].state, "cache", None)
+        if _cache is None:
+            return True, 0.0
+
+        try:
+            return await SharedRateLimiter(cache=_cache).acquire(
+                key=key, rate=rule.rate, burst=rule.burst
+            )
+        except Exception as err:
+            _now = time.monotonic()
+            if _WARN_INTERVAL <= (_now - self._warned_at):
+                self._warned_at = _now
+                logger.warning(f"Shared rate limit backend failed, allowing requests: {err}")
+
+            return True, 0.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (scope["type"] != "http") or (not self.config.enabled):
+            await self.app(scope, receive, send)
+            return
+
+        _rule_name, _rule = self.get_rule(scope)
+        if _rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        _key = f"{_rule_name}:{self.get_client_key(scope)}"
+        _is_allowed, _tokens = self.limiter.acquire(
+            key=_key, rate=_rule.rate, burst=_rule.burst
+        )
+        _retry_after = (1.0 - _tokens) / _rule.rate
+        if _is_allowed and self.config.shared:
+            _is_allowed, _retry_after = await self._acquire_shared(
+                scope=scope, key=_key, rule=_rule
+            )
+
+        _headers: Dict[str, str] = (
+            self._get_headers(rule=_rule, tokens=_tokens) if self.config.headers else {}
+        )
+        if not _is_allowed:
+            _headers["Retry-After"] = str(max(math.ceil(_retry_after), 1))
+            _error = ErrorCodeEnum.RATE_LIMITED.value.model_dump()
+            _response = BaseResponse(
+                request=Request(scope),
+                status_code=_error["status_code"],
+                message=_error["message"],
+                error=_error,
+                headers=_headers,
+            )
+            await _response(scope, receive, send)
+            return
+
+        if not _headers:
+            await self.app(scope, receive, send)
+            return
+
+        _raw_headers = [
+            (_name.lower().encode("latin-1"), _val.encode("latin-1"))
+            for _name, _val in _headers.items()
+        ]
+
+        async def _send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + _raw_headers
+
+            await send(message)
+
+        await self.app(scope, receive, _send)
+
+
+__all__ = ["RateLimitMiddleware"]
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+from typing import Union
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from api.core.configs import VersionedConfig
+
+
+class RuntimeCORSMiddleware:
+    """CORS middleware rebuilt from the hot-reloadable runtime config when its version changes.
+
+    Args:
+        app            (ASGIApp        , required): Next ASGI application.
+        runtime_config (VersionedConfig, required): Versioned runtime config holder.
+    """
+
+    def __init__(self, app: ASGIApp, runtime_config: VersionedConfig) -> None:
+        self.app = app
+        self.runtime_config = runtime_config
+
+        self._version: int = 0
+        self._cors: Union[CORSMiddleware, None] = None
+
+    def _get_cors(self) -> CORSMiddleware:
+        _version, _runtime_config = self.runtime_config.get()
+        _cors = self._cors
+        if (_cors is None) or (_version != self._version):
+            ## Precomputes allowed origins/headers once per config version, not per request:
+            _cors = CORSMiddleware(self.app, **_runtime_config.cors.model_dump())
+            self._cors = _cors
+            self._version = _version
+
+        return _cors
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self._get_cors()(scope, receive, send)
+
+
+__all__ = ["RuntimeCORSMiddleware"]
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+
+from ._bucket import *
+from ._shared import *
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from pydantic import validate_call, conint
+
+
+class TokenBucketLimiter:
+    """In-process token buckets keyed by client (and rule), least recently used buckets are evicted.
+
+    Each bucket holds up to `burst` tokens and refills `rate` tokens per second, a request takes one token.
+    Buckets are only updated on the event loop, no locks are needed.
+    """
+
+    @validate_call
+    def __init__(self, max_keys: conint(ge=1) = 100_000) -> None:  # type: ignore
+        """Constructor method for TokenBucketLimiter class.
+
+        Args:
+            max_keys (int, optional): Maximum number of buckets. Defaults to 100000.
+        """
+
+        self.max_keys = max_keys
+        ## Key -> [tokens, updated time by `time.monotonic()`]:
+        self._buckets: OrderedDict[str, List[float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def acquire(
+        self, key: str, rate: float, burst: int, now: Optional[float] = None
+    ) -> Tuple[bool, float]:
+        """Take one token from the bucket if available.
+
+        Args:
+            key   (str            , required): Bucket key.
+            rate  (float          , required): Tokens refilled per second.
+            burst (int            , required): Bucket capacity.
+            now   (Optional[float], optional): Current `time.monotonic()`, for batching/tests. Defaults to None.
+
+        Returns:
+            Tuple[bool, float]: True if allowed, and tokens left in the bucket.
+        """
+
+        if now is None:
+            now = time.monotonic()
+
+        _bucket = self._buckets.get(key)
+        if _bucket is None:
+            _bucket = [float(burst), now]
+            self._buckets[key] = _bucket
+            if self.max_keys < len(self._buckets):
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            _bucket[0] = min(float(burst), _bucket[0] + (now - _bucket[1]) * rate)
+            _bucket[1] = now
+
+        if _bucket[0] < 1.0:
+            return False, _bucket[0]
+
+        _bucket[0] -= 1.0
+        return True, _bucket[0]
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+
+__all__ = ["TokenBucketLimiter"]
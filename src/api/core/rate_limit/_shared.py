@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+from typing import Optional, Tuple
+
+from api.core.cache import BaseCache
+
+
+class SharedRateLimiter:
+    """Cluster-wide rate limiter on a shared cache backend (e.g. Redis), with sliding window counters.
+
+    Token bucket of `rate` and `burst` is approximated by allowing `burst` requests per window of
+    `burst / rate` seconds, previous window's count is weighted by its remaining overlap.
+    Only an atomic increment and a read are needed per request (`BaseCache.incr()`), no server-side scripts.
+    """
+
+    def __init__(self, cache: BaseCache, key_prefix: str = "rate_limit:") -> None:
+        """Constructor method for SharedRateLimiter class.
+
+        Args:
+            cache      (BaseCache, required): Shared cache backend.
+            key_prefix (str      , optional): Prefix of counter keys. Defaults to 'rate_limit:'.
+        """
+
+        self.cache = cache
+        self.key_prefix = key_prefix
+
+    async def acquire(
+        self, key: str, rate: float, burst: int, now: Optional[float] = None
+    ) -> Tuple[bool, float]:
+        """Count one request and check the limit.
+
+        Args:
+            key   (str            , required): Client (and rule) key.
+            rate  (float          , required): Requests per second.
+            burst (int            , required): Requests per window.
+            now   (Optional[float], optional): Current `time.time()`, for tests. Defaults to None.
+
+        Returns:
+            Tuple[bool, float]: True if allowed, and seconds to wait before retrying if not.
+        """
+
+        if now is None:
+            ## Wall clock, windows must line up across workers and hosts:
+            now = time.time()
+
+        _window = burst / rate
+        _index = int(now // _window)
+        _elapsed = now - (_index * _window)
+        _key = f"{self.key_prefix}{key}:"
+
+        _count, _prev_value = await asyncio.gather(
+            self.cache.incr(f"{_key}{_index}", ttl=_window * 2),
+            self.cache.get(f"{_key}{_index - 1}"),
+        )
+        _prev_count = int(_prev_value) if _prev_value else 0
+        if (_prev_count * (1 - (_elapsed / _window)) + _count) <= burst:
+            return True, 0.0
+
+        return False, _window - _elapsed
+
+
+__all__ = ["SharedRateLimiter"]
@@ -1,3 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from ._base import *
+from ._cache import *
+from ._single_flight import *
+from ._openapi import *
+from ._file import *
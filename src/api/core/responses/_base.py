@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
 
 from http import HTTPStatus
-from typing import Any, Optional, Dict, Type
+from typing import Any, Optional, Dict, Type, Union
 
-from pydantic import validate_call, conint, constr
+from pydantic import validate_call, conint, constr, TypeAdapter
 from starlette.background import BackgroundTask
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 from api.config import config
@@ -14,6 +13,43 @@ from api.core import utils
 from api.core.schemas import BaseResPM
 
 
+def _build_header_templates() -> Dict[int, Dict[str, str]]:
+    """Build default headers for each error status code, used as a base for error responses.
+
+    Returns:
+        Dict[int, Dict[str, str]]: Status code to default headers map.
+    """
+
+    _header_templates: Dict[int, Dict[str, str]] = {}
+    for _status_code in range(400, 600):
+        _headers = {"X-Error-Code": f"{_status_code}_00000"}
+        if 500 <= _status_code:
+            _headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
+            _headers["Pragma"] = "no-cache"
+            _headers["Expires"] = "0"
+
+            if _status_code == 503:
+                _headers["Retry-After"] = "1800"
+
+        _header_templates[_status_code] = _headers
+
+    return _header_templates
+
+
+## Precomputed once per app, only request specific parts are computed per response:
+_HTTP_STATUS_TABLE: Dict[int, HTTPStatus] = {
+    _status_code: utils.get_http_status(status_code=_status_code)[0]
+    for _status_code in range(100, 600)
+}
+_HEADER_TEMPLATES: Dict[int, Dict[str, str]] = _build_header_templates()
+_STATIC_META: Dict[str, str] = {
+    "api_version": config.api.version,
+    "version": config.version,
+}
+## Response schema to `data` field type adapter, built on first use:
+_DATA_ADAPTERS: Dict[Type[BaseResPM], TypeAdapter] = {}
+
+
 class BaseResponse(JSONResponse):
     """Base response class for most of the API responses with JSON format.
     Based on BaseResPM schema.
@@ -38,6 +74,7 @@ class BaseResponse(JSONResponse):
         meta: Optional[Dict[str, Any]] = None,
         error: Any = None,
         response_schema: Optional[Type[BaseResPM]] = BaseResPM,
+        content_json: Optional[bytes] = None,
     ) -> None:
         """Constructor method for BaseResponse class.
         This will prepare the most response data and pass it to `JSONResponse` parent class constructor.
@@ -54,10 +91,10 @@ class BaseResponse(JSONResponse):
             meta            (Optional[Dict[str, Any]] , optional): Meta data for response. Defaults to None.
             error           (Any                      , optional): Error data for response. Defaults to None.
             response_schema (Optional[Type[BaseResPM]], optional): Response schema type. Defaults to `Type[BaseResPM]`.
+            content_json    (Optional[bytes]          , optional): Pre-serialized `data` JSON (see `serialize_content()`), used instead of `content`. Defaults to None.
         """
 
-        _http_status: HTTPStatus
-        _http_status, _ = utils.get_http_status(status_code=status_code)
+        _http_status: HTTPStatus = _HTTP_STATUS_TABLE[status_code]
 
         if not message:
             if error and isinstance(error, dict) and ("message" in error):
@@ -65,68 +102,141 @@ class BaseResponse(JSONResponse):
             else:
                 message: str = _http_status.phrase
 
-        if not links:
-            links = {}
-
-        if not meta:
-            meta = {}
-
-        if not headers:
-            headers = {}
-
+        _links: Dict[str, Any] = dict(links) if links else {}
+        _meta: Dict[str, Any] = dict(meta) if meta else {}
+        _headers: Dict[str, str] = {}
         if request:
             _request_id: str = request.state.request_id
 
-            links["self"] = f"{utils.get_relative_url(request)}"
-            meta["request_id"] = _request_id
-            meta["method"] = request.method
-            meta["base_url"] = str(request.base_url)[:-1]
-
-            if "X-Request-Id" not in headers:
-                headers["X-Request-Id"] = _request_id
+            _links["self"] = utils.get_relative_url(request)
+            _meta["request_id"] = _request_id
+            _meta["method"] = request.method
+            _meta["base_url"] = utils.get_base_url(request)
+            _headers["X-Request-Id"] = _request_id
 
-        meta["api_version"] = config.api.version
-        meta["version"] = config.version
+        _meta.update(_STATIC_META)
 
         if error and isinstance(error, dict):
-            if ("code" in error) and ("X-Error-Code" not in headers):
-                headers["X-Error-Code"] = error.get("code")
+            if "code" in error:
+                _headers["X-Error-Code"] = error.get("code")
 
             if (not config.debug) and (500 <= status_code) and ("detail" in error):
-                error["detail"] = None
+                error = {**error, "detail": None}
 
         if (not error) and (400 <= status_code) and _http_status.description:
             error = f"{_http_status.description}!"
 
-        if (400 <= status_code) and ("X-Error-Code" not in headers):
-            headers["X-Error-Code"] = f"{status_code}_00000"
-
-        if 500 <= status_code:
-            if "Cache-Control" not in headers:
-                headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-
-            if "Pragma" not in headers:
-                headers["Pragma"] = "no-cache"
-
-            if "Expires" not in headers:
-                headers["Expires"] = "0"
-
-            if (status_code == 503) and ("Retry-After" not in headers):
-                headers["Retry-After"] = "1800"
-
-        _response_pm = response_schema(
-            message=message, data=content, links=links, meta=meta, error=error
-        )
-        _content = jsonable_encoder(obj=_response_pm, by_alias=True)
+        if status_code in _HEADER_TEMPLATES:
+            for _key, _val in _HEADER_TEMPLATES[status_code].items():
+                _headers.setdefault(_key, _val)
+
+        if headers:
+            _headers.update(headers)
+
+        if content_json is None:
+            _response_pm = response_schema(
+                message=message, data=content, links=_links, meta=_meta, error=error
+            )
+            ## Serialize in one pass by pydantic-core, `render()` passes bytes through:
+            _content: bytes = _response_pm.model_dump_json(by_alias=True).encode(
+                "utf-8"
+            )
+        else:
+            _response_pm = response_schema(
+                message=message, links=_links, meta=_meta, error=error
+            )
+            _content: bytes = _response_pm.model_dump_json(
+                by_alias=True, exclude={"data"}
+            ).encode("utf-8")
+            ## `data` goes between `message` (JSON string, its quotes are escaped) and `links`:
+            _content = _content.replace(
+                b',"links":', b',"data":' + content_json + b',"links":', 1
+            )
 
         super().__init__(
             content=_content,
             status_code=status_code,
-            headers=headers,
+            headers=_headers,
             media_type=media_type,
             background=background,
         )
+
+        ## Kept to render the same result for another request, see `for_request()`:
+        self._render_kwargs: Dict[str, Any] = {
+            "content": content,
+            "status_code": status_code,
+            "headers": headers,
+            "media_type": media_type,
+            "message": message,
+            "links": links,
+            "meta": meta,
+            "error": error,
+            "response_schema": response_schema,
+            "content_json": content_json,
+        }
         return
 
+    def for_request(self, request: Request) -> "BaseResponse":
+        """Render the same result for another request (e.g. coalesced identical requests).
+        `data` is serialized once and reused, only request specific envelope metadata is rendered again.
+
+        Args:
+            request (Request, required): Request object from FastAPI.
+
+        Returns:
+            BaseResponse: New response object for the request.
+        """
+
+        _render_kwargs = self._render_kwargs
+        if _render_kwargs["content_json"] is None:
+            _render_kwargs = {
+                **_render_kwargs,
+                "content": None,
+                "content_json": serialize_content(
+                    content=_render_kwargs["content"],
+                    response_schema=_render_kwargs["response_schema"],
+                ),
+            }
+            self._render_kwargs = _render_kwargs
+
+        _response = BaseResponse(request=request, **_render_kwargs)
+        return _response
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+
+        return super().render(content)
+
+
+@validate_call
+def serialize_content(
+    content: Any,
+    response_schema: Type[BaseResPM] = BaseResPM,
+    include: Optional[Dict[Any, Any]] = None,
+) -> bytes:
+    """Validate and serialize content as `data` field of the response schema.
+    Result can be cached and passed to `BaseResponse` as `content_json` to skip re-serialization.
+
+    Args:
+        content         (Any                     , required): Main data content for response.
+        response_schema (Type[BaseResPM]         , optional): Response schema type. Defaults to `Type[BaseResPM]`.
+        include         (Optional[Dict[Any, Any]], optional): Fields to serialize (sparse fieldset), other fields are
+                                                              skipped by the serializer, e.g.
+                                                              `{"__all__": {"id", "name"}}` for a list. Defaults to None.
+
+    Returns:
+        bytes: Serialized JSON of `data` field.
+    """
+
+    _adapter: Union[TypeAdapter, None] = _DATA_ADAPTERS.get(response_schema)
+    if _adapter is None:
+        _adapter = TypeAdapter(response_schema.model_fields["data"].annotation)
+        _DATA_ADAPTERS[response_schema] = _adapter
+
+    _data = _adapter.validate_python(content)
+    _content_json: bytes = _adapter.dump_json(_data, by_alias=True, include=include)
+    return _content_json
+
 
-__all__ = ["BaseResponse"]
+__all__ = ["BaseResponse", "serialize_content"]
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Type, Union
+
+from pydantic import validate_call, conint, constr
+from fastapi import Request, Response
+
+from api.core import utils
+from api.core.constants import CompressionEncodingEnum
+from api.core.schemas import BaseResPM
+from ._base import BaseResponse, serialize_content
+
+
+## Suffixes of compressed representation entity tags, e.g. '"abc-br"' (see `CompressionMiddleware`):
+_ENCODING_ETAG_SUFFIXES = tuple(f'-{_encoding.value}"' for _encoding in CompressionEncodingEnum)
+
+
+class ResponseCacheEntry:
+    """Cached response parts, everything except request specific envelope metadata."""
+
+    __slots__ = ("version", "etag", "message", "content_json", "links", "meta")
+
+    def __init__(
+        self,
+        version: int,
+        etag: str,
+        message: Optional[str],
+        content_json: bytes,
+        links: Optional[Dict[str, Any]],
+        meta: Optional[Dict[str, Any]],
+    ) -> None:
+        self.version = version
+        self.etag = etag
+        self.message = message
+        self.content_json = content_json
+        self.links = links
+        self.meta = meta
+
+
+class ResponseCache:
+    """In-process LRU cache of serialized responses with versioned invalidation and conditional GET.
+
+    Entries are keyed by method, path, normalized query and auth scope (`request.state.user_id`),
+    and stored with the data version they were computed from.
+    Any version mismatch (e.g. after create/update/delete) is treated as a miss.
+    """
+
+    @validate_call
+    def __init__(
+        self,
+        max_size: conint(ge=1) = 1024,  # type: ignore
+        default_cache_control: constr(strip_whitespace=True, min_length=1) = "no-cache",  # type: ignore
+        cache_control: Optional[Dict[str, str]] = None,
+        enabled: bool = True,
+    ) -> None:
+        """Constructor method for ResponseCache class.
+
+        Args:
+            max_size              (int                     , optional): Maximum number of cached entries. Defaults to 1024.
+            default_cache_control (str                     , optional): Default `Cache-Control` header value. Defaults to 'no-cache'.
+            cache_control         (Optional[Dict[str, str]], optional): Route name to `Cache-Control` header value map. Defaults to None.
+            enabled               (bool                    , optional): Enable storing and looking up entries. Defaults to True.
+        """
+
+        self.max_size = max_size
+        self.default_cache_control = default_cache_control
+        self.cache_control = dict(cache_control) if cache_control else {}
+        self.enabled = enabled
+
+        self._entries: OrderedDict[str, ResponseCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def make_key(self, request: Request) -> str:
+        """Make cache key from request method, path, normalized query and auth scope.
+
+        Args:
+            request (Request, required): Request object from FastAPI.
+
+        Returns:
+            str: Cache key.
+        """
+
+        _key: str = utils.get_request_key(request)
+        return _key
+
+    def get(self, key: str, version: int) -> Union[ResponseCacheEntry, None]:
+        """Get cached entry if it was computed from the given data version.
+
+        Args:
+            key     (str, required): Cache key.
+            version (int, required): Current data version.
+
+        Returns:
+            Union[ResponseCacheEntry, None]: Cached entry or None.
+        """
+
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            _entry: Union[ResponseCacheEntry, None] = self._entries.get(key)
+            if _entry is None:
+                return None
+
+            if _entry.version != version:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+        return _entry
+
+    def set(
+        self,
+        key: str,
+        version: int,
+        content: Any = None,
+        message: Optional[str] = None,
+        links: Optional[Dict[str, Any]] = None,
+        meta: Optional[Dict[str, Any]] = None,
+        response_schema: Type[BaseResPM] = BaseResPM,
+        etag: Optional[str] = None,
+        include: Optional[Dict[Any, Any]] = None,
+    ) -> ResponseCacheEntry:
+        """Serialize content and store it as a cache entry.
+
+        Args:
+            key             (str                     , required): Cache key.
+            version         (int                     , required): Data version the content was computed from.
+            content         (Any                     , optional): Main data content for response. Defaults to None.
+            message         (Optional[str]           , optional): Message for response. Defaults to None.
+            links           (Optional[Dict[str, Any]], optional): Links for response. Defaults to None.
+            meta            (Optional[Dict[str, Any]], optional): Meta data for response. Defaults to None.
+            response_schema (Type[BaseResPM]         , optional): Response schema type. Defaults to `Type[BaseResPM]`.
+            etag            (Optional[str]           , optional): Entity tag value without quotes, hash of serialized content if not provided.
+                                                                    Defaults to None.
+            include         (Optional[Dict[Any, Any]], optional): Fields of content to serialize, see `serialize_content()`.
+                                                                    Defaults to None.
+
+        Returns:
+            ResponseCacheEntry: Stored (or not stored when disabled) cache entry.
+        """
+
+        _content_json: bytes = serialize_content(
+            content=content, response_schema=response_schema, include=include
+        )
+        if not etag:
+            etag = hashlib.blake2b(_content_json, digest_size=16).hexdigest()
+
+        _entry = ResponseCacheEntry(
+            version=version,
+            etag=f'"{etag}"',
+            message=message,
+            content_json=_content_json,
+            links=links,
+            meta=meta,
+        )
+
+        if self.enabled:
+            with self._lock:
+                self._entries[key] = _entry
+                self._entries.move_to_end(key)
+                while self.max_size < len(self._entries):
+                    self._entries.popitem(last=False)
+
+        return _entry
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+
+        with self._lock:
+            self._entries.clear()
+
+        return
+
+    def get_cache_control(self, request: Request) -> str:
+        """Get `Cache-Control` header value for the matched route.
+
+        Args:
+            request (Request, required): Request object from FastAPI.
+
+        Returns:
+            str: `Cache-Control` header value.
+        """
+
+        _route = request.scope.get("route")
+        _route_name: str = getattr(_route, "name", "")
+        return self.cache_control.get(_route_name, self.default_cache_control)
+
+    @staticmethod
+    def is_not_modified(request: Request, etag: str) -> bool:
+        """Check `If-None-Match` request header against the entity tag (weak comparison, RFC 9110).
+        Entity tags of compressed representations (e.g. `"abc-br"`) also match the uncompressed one.
+
+        Args:
+            request (Request, required): Request object from FastAPI.
+            etag    (str    , required): Quoted entity tag of the current representation.
+
+        Returns:
+            bool: True if the client already has the current representation.
+        """
+
+        _if_none_match: Union[str, None] = request.headers.get("if-none-match")
+        if not _if_none_match:
+            return False
+
+        _if_none_match = _if_none_match.strip()
+        if _if_none_match == "*":
+            return True
+
+        for _tag in _if_none_match.split(","):
+            _tag = _tag.strip()
+            if _tag.startswith("W/"):
+                _tag = _tag[2:]
+
+            if _tag == etag:
+                return True
+
+            if _tag.endswith(_ENCODING_ETAG_SUFFIXES):
+                if f'{_tag.rpartition("-")[0]}"' == etag:
+                    return True
+
+        return False
+
+    def make_response(
+        self,
+        request: Request,
+        entry: ResponseCacheEntry,
+        response_schema: Type[BaseResPM] = BaseResPM,
+    ) -> Response:
+        """Make `304 Not Modified` or full response from the cache entry.
+
+        Args:
+            request         (Request           , required): Request object from FastAPI.
+            entry           (ResponseCacheEntry, required): Cache entry.
+            response_schema (Type[BaseResPM]   , optional): Response schema type. Defaults to `Type[BaseResPM]`.
+
+        Returns:
+            Response: Response object.
+        """
+
+        _headers = {
+            "ETag": entry.etag,
+            "Cache-Control": self.get_cache_control(request),
+            "Vary": "Authorization",
+        }
+
+        if self.is_not_modified(request=request, etag=entry.etag):
+            return Response(status_code=304, headers=_headers)
+
+        _response = BaseResponse(
+            request=request,
+            message=entry.message,
+            content_json=entry.content_json,
+            links=entry.links,
+            meta=entry.meta,
+            headers=_headers,
+            response_schema=response_schema,
+        )
+        return _response
+
+
+__all__ = ["ResponseCacheEntry", "ResponseCache"]
@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import stat
+from secrets import token_hex
+from functools import partial
+from email.utils import parsedate_to_datetime
+from typing import Any, BinaryIO, Dict, List, Mapping, Optional, Tuple, Union
+
+import anyio
+import anyio.to_thread
+from starlette.background import BackgroundTask
+from starlette.datastructures import Headers
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import FileResponse
+from starlette.types import Message, Receive, Scope, Send
+
+from ._cache import ResponseCache
+
+
+_PATHSEND = "http.response.pathsend"
+_ZEROCOPYSEND = "http.response.zerocopysend"
+_RANGE_SPEC_PATTERN = re.compile(r"^(\d*)-(\d*)$", re.ASCII)
+
+
+class RangeNotSatisfiable(Exception):
+    """None of the requested ranges overlap the file."""
+
+    pass
+
+
+def parse_ranges(
+    http_range: str, file_size: int, max_ranges: int = 16
+) -> Union[List[Tuple[int, int]], None]:
+    """Parse `Range` header (RFC 9110) into sorted, non-overlapping `(start, end)` byte ranges, `end` is exclusive.
+
+    Args:
+        http_range (str, required): `Range` header value, e.g. 'bytes=0-499,-500'.
+        file_size  (int, required): File size in bytes.
+        max_ranges (int, optional): Maximum number of requested ranges. Defaults to 16.
+
+    Raises:
+        RangeNotSatisfiable: If no range overlaps the file.
+
+    Returns:
+        Union[List[Tuple[int, int]], None]: Byte ranges, None if the header is invalid or has too many ranges
+                                            (it should be ignored and the full file sent).
+    """
+
+    _unit, _, _specs = http_range.partition("=")
+    if (_unit.strip().lower() != "bytes") or (not _specs.strip()):
+        return None
+
+    _ranges: List[Tuple[int, int]] = []
+    _count = 0
+    for _spec in _specs.split(","):
+        _spec = _spec.strip()
+        if not _spec:
+            continue
+
+        _count += 1
+        _match = _RANGE_SPEC_PATTERN.match(_spec)
+        if (_match is None) or (max_ranges < _count):
+            return None
+
+        _first, _last = _match.groups()
+        if _first:
+            _start = int(_first)
+            _end = (int(_last) + 1) if _last else file_size
+            if _last and (_end <= _start):
+                return None
+
+            if file_size <= _start:
+                continue
+
+            _ranges.append((_start, min(_end, file_size)))
+        elif _last:
+            _suffix = int(_last)
+            if (_suffix == 0) or (file_size == 0):
+                continue
+
+            _ranges.append((max(file_size - _suffix, 0), file_size))
+        else:
+            return None
+
+    if not _ranges:
+        raise RangeNotSatisfiable()
+
+    ## Overlapping and adjacent ranges are sent as one:
+    _ranges.sort()
+    _merged: List[Tuple[int, int]] = [_ranges[0]]
+    for _start, _end in _ranges[1:]:
+        _last_start, _last_end = _merged[-1]
+        if _start <= _last_end:
+            _merged[-1] = (_last_start, max(_last_end, _end))
+        else:
+            _merged.append((_start, _end))
+
+    return _merged
+
+
+def _is_zero_copy_safe(scope: Scope) -> bool:
+    """ASGI extension messages reach the server only if no `BaseHTTPMiddleware` based middleware is in between,
+    it accepts only 'http.response.body' messages from the application.
+    """
+
+    _app = scope.get("app")
+    _state = getattr(_app, "state", None)
+    if _state is None:
+        return True
+
+    _is_safe: Union[bool, None] = getattr(_state, "is_zero_copy_safe", None)
+    if _is_safe is None:
+        _is_safe = not any(
+            isinstance(_middleware.cls, type)
+            and issubclass(_middleware.cls, BaseHTTPMiddleware)
+            for _middleware in getattr(_app, "user_middleware", [])
+        )
+        _state.is_zero_copy_safe = _is_safe
+
+    return _is_safe
+
+
+def _read(file: BinaryIO, offset: int, size: int) -> bytes:
+    if hasattr(os, "pread"):
+        return os.pread(file.fileno(), size, offset)
+
+    file.seek(offset)
+    return file.read(size)
+
+
+class FileStreamResponse(FileResponse):
+    """File response for large files, file contents don't pass through Python memory when possible:
+
+    - `accel_header` (e.g. 'X-Accel-Redirect'): headers only, the reverse proxy sends the file.
+    - ASGI 'http.response.pathsend' (full file) or 'http.response.zerocopysend' (ranges) extensions,
+      when the server supports them and no `BaseHTTPMiddleware` is in the middleware stack.
+    - Otherwise `chunk_size` blocks are read in the threadpool (`os.pread()`, one call per block) and streamed,
+      stopped when the client disconnects.
+
+    Supports single and multiple byte ranges (`multipart/byteranges`), `If-Range`, `If-None-Match` and
+    `If-Modified-Since`. ETag is the given checksum or derived from (size, mtime).
+
+    Inherits:
+        FileResponse: File response class from Starlette.
+    """
+
+    chunk_size = 1024 * 1024
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        filename: Optional[str] = None,
+        stat_result: Optional[os.stat_result] = None,
+        content_disposition_type: str = "attachment",
+        etag: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        max_ranges: int = 16,
+        zero_copy: bool = True,
+        accel_header: Optional[str] = None,
+        accel_path: Optional[str] = None,
+    ) -> None:
+        """Constructor method for FileStreamResponse class.
+
+        Args:
+            path                     (Union[str, PathLike]         , required): File path.
+            status_code              (int                          , optional): Status code of full responses. Defaults to 200.
+            headers                  (Optional[Mapping[str, str]]  , optional): Extra headers. Defaults to None.
+            media_type               (Optional[str]                , optional): Media type, guessed from file name if not set. Defaults to None.
+            background               (Optional[BackgroundTask]     , optional): Background task. Defaults to None.
+            filename                 (Optional[str]                , optional): File name for `Content-Disposition` header. Defaults to None.
+            stat_result              (Optional[os.stat_result]     , optional): File stat, read before sending if not set. Defaults to None.
+            content_disposition_type (str                          , optional): 'attachment' or 'inline'. Defaults to 'attachment'.
+            etag                     (Optional[str]                , optional): Entity tag value without quotes (e.g. checksum). Defaults to None.
+            chunk_size               (Optional[int]                , optional): Read buffer size of streaming. Defaults to 1MiB.
+            max_ranges               (int                          , optional): More ranges are ignored, full file is sent. Defaults to 16.
+            zero_copy                (bool                         , optional): Use ASGI zero-copy extensions when supported. Defaults to True.
+            accel_header             (Optional[str]                , optional): Reverse proxy file sending header, e.g. 'X-Accel-Redirect'. Defaults to None.
+            accel_path               (Optional[str]                , optional): Value of `accel_header`. Defaults to None.
+        """
+
+        ## Used by `set_stat_headers()`, called by the parent constructor:
+        self._etag = f'"{etag}"' if etag else None
+        super().__init__(
+            path=path,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            background=background,
+            filename=filename,
+            stat_result=stat_result,
+            content_disposition_type=content_disposition_type,
+        )
+
+        if chunk_size:
+            self.chunk_size = chunk_size
+
+        self.max_ranges = max_ranges
+        self.zero_copy = zero_copy
+        self.accel_header = accel_header
+        self.accel_path = accel_path
+
+    def set_stat_headers(self, stat_result: os.stat_result) -> None:
+        if self._etag is None:
+            self._etag = f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+        self.headers.setdefault("etag", self._etag)
+        super().set_stat_headers(stat_result)
+
+    def _is_not_modified(self, scope: Scope, stat_result: os.stat_result) -> bool:
+        _request = Request(scope)
+        if "if-none-match" in _request.headers:
+            return ResponseCache.is_not_modified(
+                request=_request, etag=self.headers["etag"]
+            )
+
+        _if_modified_since = _request.headers.get("if-modified-since")
+        if _if_modified_since:
+            try:
+                return int(stat_result.st_mtime) <= int(
+                    parsedate_to_datetime(_if_modified_since).timestamp()
+                )
+            except (TypeError, ValueError):
+                pass
+
+        return False
+
+    def _is_range_valid(self, headers: Headers) -> bool:
+        ## Strong comparison, weak ETags never match:
+        _if_range = headers.get("if-range")
+        return (_if_range is None) or (
+            _if_range.strip() in (self.headers["etag"], self.headers["last-modified"])
+        )
+
+    def _get_raw_headers(self, exclude: Tuple[bytes, ...]) -> List[Tuple[bytes, bytes]]:
+        return [(_key, _value) for _key, _value in self.raw_headers if _key not in exclude]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        _stat = self.stat_result
+        if _stat is None:
+            try:
+                _stat = await anyio.to_thread.run_sync(os.stat, self.path)
+            except FileNotFoundError:
+                raise RuntimeError(f"File at path {self.path} does not exist.")
+
+            if not stat.S_ISREG(_stat.st_mode):
+                raise RuntimeError(f"File at path {self.path} is not a file.")
+
+            self.set_stat_headers(_stat)
+
+        _headers = Headers(scope=scope)
+        _is_head = scope["method"].upper() == "HEAD"
+
+        if self.accel_header and self.accel_path:
+            ## Reverse proxy handles ranges and conditional requests itself:
+            self.headers[self.accel_header] = self.accel_path
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": self.status_code,
+                    "headers": self._get_raw_headers(exclude=(b"content-length",)),
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+        elif self._is_not_modified(scope=scope, stat_result=_stat):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": self._get_raw_headers(
+                        exclude=(b"content-length", b"content-type", b"content-disposition")
+                    ),
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+        else:
+            _ranges: Union[List[Tuple[int, int]], None] = None
+            _http_range = _headers.get("range")
+            if _http_range and self._is_range_valid(_headers):
+                try:
+                    _ranges = parse_ranges(
+                        http_range=_http_range,
+                        file_size=_stat.st_size,
+                        max_ranges=self.max_ranges,
+                    )
+                except RangeNotSatisfiable:
+                    await send(
+                        {
+                            "type": "http.response.start",
+                            "status": 416,
+                            "headers": [
+                                (b"content-range", f"bytes */{_stat.st_size}".encode("latin-1")),
+                                (b"content-length", b"0"),
+                            ],
+                        }
+                    )
+                    await send({"type": "http.response.body", "body": b""})
+                    return
+
+            async with anyio.create_task_group() as _task_group:
+
+                async def _wrap(func) -> None:
+                    await func()
+                    _task_group.cancel_scope.cancel()
+
+                _task_group.start_soon(
+                    _wrap,
+                    partial(self._send_file, scope, send, _stat, _ranges, _is_head),
+                )
+                await _wrap(partial(self._listen_for_disconnect, receive))
+
+        if self.background is not None:
+            await self.background()
+
+    @staticmethod
+    async def _listen_for_disconnect(receive: Receive) -> None:
+        while True:
+            _message = await receive()
+            if _message["type"] == "http.disconnect":
+                break
+
+    async def _send_file(
+        self,
+        scope: Scope,
+        send: Send,
+        stat_result: os.stat_result,
+        ranges: Union[List[Tuple[int, int]], None],
+        is_head: bool,
+    ) -> None:
+        _file_size = stat_result.st_size
+        _status = self.status_code
+        _boundary: Union[str, None] = None
+        _content_type = self.headers.get("content-type", "application/octet-stream")
+        if ranges is None:
+            ranges = [(0, _file_size)]
+        elif len(ranges) == 1:
+            _status = 206
+            _start, _end = ranges[0]
+            self.headers["content-range"] = f"bytes {_start}-{_end - 1}/{_file_size}"
+            self.headers["content-length"] = str(_end - _start)
+        else:
+            _status = 206
+            _boundary = token_hex(13)
+            self.headers["content-type"] = f"multipart/byteranges; boundary={_boundary}"
+            self.headers["content-length"] = str(
+                sum(
+                    len(self._make_part_header(_boundary, _content_type, _start, _end, _file_size))
+                    + (_end - _start)
+                    + 2
+                    for _start, _end in ranges
+                )
+                + len(_boundary)
+                + 6
+            )
+
+        await send({"type": "http.response.start", "status": _status, "headers": self.raw_headers})
+        if is_head or (_file_size == 0):
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        _extensions: Dict[str, Any] = (scope.get("extensions") or {}) if self.zero_copy else {}
+        if _extensions and (not _is_zero_copy_safe(scope)):
+            _extensions = {}
+
+        if (_status != 206) and (_PATHSEND in _extensions):
+            await send({"type": _PATHSEND, "path": os.path.abspath(self.path)})
+            return
+
+        _file: BinaryIO = await anyio.to_thread.run_sync(open, self.path, "rb")
+        try:
+            for _start, _end in ranges:
+                if _boundary:
+                    await send(
+                        {
+                            "type": "http.response.body",
+                            "body": self._make_part_header(
+                                _boundary, _content_type, _start, _end, _file_size
+                            ),
+                            "more_body": True,
+                        }
+                    )
+
+                if _ZEROCOPYSEND in _extensions:
+                    await send(
+                        {
+                            "type": _ZEROCOPYSEND,
+                            "file": _file,
+                            "offset": _start,
+                            "count": _end - _start,
+                            "more_body": bool(_boundary),
+                        }
+                    )
+                else:
+                    await self._stream(send, _file, _start, _end, more_body=bool(_boundary))
+
+                if _boundary:
+                    await send({"type": "http.response.body", "body": b"\r\n", "more_body": True})
+
+            if _boundary:
+                await send(
+                    {"type": "http.response.body", "body": f"--{_boundary}--\r\n".encode("latin-1")}
+                )
+        finally:
+            await anyio.to_thread.run_sync(_file.close)
+
+    async def _stream(
+        self, send: Send, file: BinaryIO, start: int, end: int, more_body: bool
+    ) -> None:
+        while start < end:
+            _chunk: bytes = await anyio.to_thread.run_sync(
+                _read, file, start, min(self.chunk_size, end - start)
+            )
+            if not _chunk:
+                raise RuntimeError(f"File at path {self.path} was truncated while sending.")
+
+            start += len(_chunk)
+            _message: Message = {
+                "type": "http.response.body",
+                "body": _chunk,
+                "more_body": more_body or (start < end),
+            }
+            await send(_message)
+
+    @staticmethod
+    def _make_part_header(
+        boundary: str, content_type: str, start: int, end: int, file_size: int
+    ) -> bytes:
+        return (
+            f"--{boundary}\r\nContent-Type: {content_type}\r\n"
+            f"Content-Range: bytes {start}-{end - 1}/{file_size}\r\n\r\n"
+        ).encode("latin-1")
+
+
+__all__ = ["FileStreamResponse", "RangeNotSatisfiable", "parse_ranges"]
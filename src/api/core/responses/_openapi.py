@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import json
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import FastAPI, Request, Response
+from fastapi.dependencies.utils import get_flat_dependant
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+from pydantic.json_schema import JsonSchemaMode, models_json_schema
+
+from api.core import utils
+from ._cache import ResponseCache
+
+
+## Highest levels, schema is compressed only once:
+_LEVELS: Dict[str, int] = {"br": 11, "zstd": 19, "gzip": 9}
+## Schema extension with the route table fingerprint (see `OpenAPIDocument.get_fingerprint()`):
+_FINGERPRINT_KEY = "x-fingerprint"
+## Object addresses in reprs (e.g. `default_factory` functions) differ between processes:
+_ADDRESS_REGEX = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _is_model(model: Any) -> bool:
+    return isinstance(model, type) and issubclass(model, BaseModel)
+
+
+def _get_type_schema(type_: Any, mode: str) -> Any:
+    """JSON schema of a non-model type (e.g. `List[TaskPM]`), repr for types without JSON schema."""
+
+    if type_ is None:
+        return None
+
+    try:
+        return TypeAdapter(type_).json_schema(mode=mode)
+    except Exception:
+        return repr(type_)
+
+
+class OpenAPIDocument:
+    """OpenAPI schema pre-encoded as compact JSON and precompressed with every available encoding.
+    Each request only selects ready bytes, nothing is serialized or compressed per request.
+    """
+
+    def __init__(
+        self,
+        schema: Dict[str, Any],
+        cache_control: str = "public, max-age=300",
+        encodings: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Constructor method for OpenAPIDocument class.
+
+        Args:
+            schema        (Dict[str, Any]          , required): OpenAPI schema.
+            cache_control (str                     , optional): `Cache-Control` header value. Defaults to 'public, max-age=300'.
+            encodings     (Optional[Iterable[str]] , optional): Content encodings to precompress, preferred first.
+                                                                Defaults to all available encodings.
+        """
+
+        self.schema = schema
+        self.cache_control = cache_control
+        ## Same as `JSONResponse.render()` of FastAPI:
+        self.content: bytes = json.dumps(
+            schema, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+        self.etag: str = f'"{hashlib.blake2b(self.content, digest_size=16).hexdigest()}"'
+
+        if encodings is None:
+            encodings = utils.get_compression_encodings()
+
+        self.encodings: Tuple[str, ...] = tuple(
+            _encoding for _encoding in encodings if _encoding in _LEVELS
+        )
+        self._variants: Dict[str, bytes] = {}
+        for _encoding in self.encodings:
+            self._variants[_encoding] = utils.compress(
+                self.content, _encoding, _LEVELS[_encoding]
+            )
+
+    @property
+    def version(self) -> Optional[str]:
+        return self.schema.get("info", {}).get("version")
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        return self.schema.get(_FINGERPRINT_KEY)
+
+    @staticmethod
+    def get_fingerprint(app: FastAPI) -> str:
+        """Get hash of the application route table: app info, paths, methods, parameters, request and
+        response models (JSON schemas with nested models) of routes in the schema. Cheaper to compute at
+        startup than the whole schema, to check if a prebuilt schema still matches the application.
+
+        Args:
+            app (FastAPI, required): FastAPI application instance.
+
+        Returns:
+            str: Fingerprint as hex digest.
+        """
+
+        _parts: List[Any] = [
+            app.title,
+            app.version,
+            app.openapi_version,
+            app.summary,
+            app.description,
+            app.servers,
+            app.openapi_tags,
+        ]
+        ## Models of all routes, their JSON schemas (with nested models) are generated at once below:
+        _models: Dict[Tuple[Any, JsonSchemaMode], None] = {}
+        for _route in app.routes:
+            if (not isinstance(_route, APIRoute)) or (not _route.include_in_schema):
+                continue
+
+            _dependant = get_flat_dependant(_route.dependant, skip_repeats=True)
+            _params = [
+                (_field.name, repr(_field.field_info))
+                for _fields in (
+                    _dependant.path_params,
+                    _dependant.query_params,
+                    _dependant.header_params,
+                    _dependant.cookie_params,
+                    _dependant.body_params,
+                )
+                for _field in _fields
+            ]
+            _body_model = _route.body_field.type_ if _route.body_field else None
+            for _model, _mode in ((_body_model, "validation"), (_route.response_model, "serialization")):
+                if _is_model(_model):
+                    _models[(_model, _mode)] = None
+            _parts.append(
+                (
+                    _route.path,
+                    sorted(_route.methods),
+                    _route.name,
+                    _route.operation_id,
+                    _route.summary,
+                    _route.description,
+                    _route.status_code,
+                    _route.tags,
+                    _route.deprecated,
+                    sorted(str(_key) for _key in _route.responses),
+                    _params,
+                    repr(_body_model),
+                    None if _is_model(_body_model) else _get_type_schema(_body_model, "validation"),
+                    repr(_route.response_model),
+                    None
+                    if _is_model(_route.response_model)
+                    else _get_type_schema(_route.response_model, "serialization"),
+                )
+            )
+
+        _model_keys = sorted(
+            _models, key=lambda _key: (_key[0].__module__, _key[0].__qualname__, _key[1])
+        )
+        _, _model_schemas = models_json_schema(_model_keys)
+        _parts.append(_model_schemas)
+
+        _text = _ADDRESS_REGEX.sub("", repr(_parts))
+        return hashlib.blake2b(_text.encode("utf-8"), digest_size=16).hexdigest()
+
+    @classmethod
+    def from_app(cls, app: FastAPI, **kwargs) -> "OpenAPIDocument":
+        """Generate schema from application routes, with the route table fingerprint.
+
+        Args:
+            app      (FastAPI, required): FastAPI application instance.
+            **kwargs (Any    , optional): Other arguments for `OpenAPIDocument`.
+
+        Returns:
+            OpenAPIDocument: New OpenAPI document.
+        """
+
+        _schema: Dict[str, Any] = app.openapi()
+        _schema[_FINGERPRINT_KEY] = cls.get_fingerprint(app)
+        return cls(schema=_schema, **kwargs)
+
+    @classmethod
+    def from_file(cls, file_path: str, **kwargs) -> "OpenAPIDocument":
+        """Load prebuilt schema from JSON file (see `save()`).
+
+        Args:
+            file_path (str, required): OpenAPI JSON file path.
+            **kwargs  (Any, optional): Other arguments for `OpenAPIDocument`.
+
+        Returns:
+            OpenAPIDocument: New OpenAPI document.
+        """
+
+        with open(file_path, "r", encoding="utf-8") as _file:
+            _schema: Dict[str, Any] = json.load(_file)
+
+        return cls(schema=_schema, **kwargs)
+
+    def save(self, file_path: str) -> None:
+        """Save schema as human readable JSON file, same format as 'docs/pages/api-docs/openapi.json'.
+
+        Args:
+            file_path (str, required): OpenAPI JSON file path.
+        """
+
+        _dir_path = os.path.dirname(file_path)
+        if _dir_path:
+            os.makedirs(_dir_path, exist_ok=True)
+
+        _tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(_tmp_path, "w", encoding="utf-8") as _file:
+            json.dump(self.schema, _file, ensure_ascii=False, indent="\t")
+
+        os.replace(_tmp_path, file_path)
+        return
+
+    def make_response(self, request: Request) -> Response:
+        """Make response with the best encoding accepted by the client, or 304 if the client has it already.
+
+        Args:
+            request (Request, required): Request object from FastAPI.
+
+        Returns:
+            Response: OpenAPI JSON response.
+        """
+
+        _encoding: Optional[str] = None
+        _accept_encoding = request.headers.get("accept-encoding")
+        if _accept_encoding:
+            _encoding = utils.select_encoding(_accept_encoding, self.encodings)
+
+        _headers: Dict[str, str] = {
+            "Cache-Control": self.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+        ## Each encoded representation has its own strong entity tag:
+        _etag = self.etag if _encoding is None else f'{self.etag[:-1]}-{_encoding}"'
+        _headers["ETag"] = _etag
+        if ResponseCache.is_not_modified(request=request, etag=_etag):
+            return Response(status_code=304, headers=_headers)
+
+        _content = self.content
+        if _encoding:
+            _content = self._variants[_encoding]
+            _headers["Content-Encoding"] = _encoding
+
+        return Response(content=_content, media_type="application/json", headers=_headers)
+
+
+__all__ = ["OpenAPIDocument"]
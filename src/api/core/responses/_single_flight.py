@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import functools
+from typing import Any, Callable, List, Optional, Union
+
+from fastapi import Request, Response
+from starlette.concurrency import run_in_threadpool
+
+from api.core import utils
+from ._base import BaseResponse
+
+
+## Conditional request headers change the response (e.g. 304), so they are part of the key:
+_KEY_HEADERS: List[str] = ["if-none-match", "if-modified-since"]
+
+
+def _get_request(kwargs: dict) -> Union[Request, None]:
+    _request = kwargs.get("request")
+    if isinstance(_request, Request):
+        return _request
+
+    for _val in kwargs.values():
+        if isinstance(_val, Request):
+            return _val
+
+    return None
+
+
+def _for_request(response: Any, request: Request) -> Any:
+    if isinstance(response, BaseResponse):
+        return response.for_request(request)
+
+    if isinstance(response, Response):
+        ## Copy, response objects are not meant to be sent twice:
+        _response = Response(content=response.body, status_code=response.status_code)
+        _response.raw_headers = list(response.raw_headers)
+        return _response
+
+    return response
+
+
+def single_flight(
+    flight: Optional[utils.SingleFlight] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Route decorator to coalesce concurrent identical GET/HEAD requests into one handler call.
+
+    Requests are identical if they have the same method, path, normalized query, auth scope
+    and conditional headers (see `utils.get_request_key()`).
+    Followers get the leader's result re-rendered for their own request (`BaseResponse.for_request()`),
+    so `data` is computed and serialized only once.
+    The route handler must have a `request: Request` parameter, works for both sync and async handlers.
+    Requests are coalesced in the event loop, only the leader of a sync handler takes a threadpool thread
+    (default threadpool, put it above `thread_pools.route()` for a group threadpool).
+
+    Args:
+        flight (Optional[SingleFlight], optional): Shared `SingleFlight` object, new one per route if None.
+                                                   Defaults to None.
+
+    Returns:
+        Callable[[Callable[..., Any]], Callable[..., Any]]: Route handler decorator.
+    """
+
+    def _decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        _flight: utils.SingleFlight = flight or utils.SingleFlight()
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def _async_wrapper(*args, **kwargs) -> Any:
+                _request = _get_request(kwargs)
+                if (_request is None) or (_request.method not in ("GET", "HEAD")):
+                    return await func(*args, **kwargs)
+
+                _key = utils.get_request_key(request=_request, headers=_KEY_HEADERS)
+                _response, _is_shared = await _flight.async_do(
+                    _key, func, *args, **kwargs
+                )
+                if _is_shared:
+                    _response = _for_request(response=_response, request=_request)
+
+                return _response
+
+            return _async_wrapper
+
+        ## Followers of sync handlers wait in the event loop, not on a blocked threadpool thread:
+        @functools.wraps(func)
+        async def _wrapper(*args, **kwargs) -> Any:
+            _request = _get_request(kwargs)
+            if (_request is None) or (_request.method not in ("GET", "HEAD")):
+                return await run_in_threadpool(func, *args, **kwargs)
+
+            _key = utils.get_request_key(request=_request, headers=_KEY_HEADERS)
+            _response, _is_shared = await _flight.async_do(
+                _key, run_in_threadpool, func, *args, **kwargs
+            )
+            if _is_shared:
+                _response = _for_request(response=_response, request=_request)
+
+            return _response
+
+        return _wrapper
+
+    return _decorator
+
+
+__all__ = ["single_flight"]
@@ -3,6 +3,7 @@
 from fastapi import APIRouter, Request
 
 from api.core.schemas import BaseResPM
+from api.core.concurrency import thread_pools
 from api.core.responses import BaseResponse
 
 
@@ -39,7 +40,11 @@ async def get_ping(request: Request):
 )
 async def get_health(request: Request):
     _message = "Everything is OK."
-    _data = {"api": {"message": "API is up.", "is_alive": True}}
+    _data = {
+        "api": {"message": "API is up.", "is_alive": True},
+        ## Busy/queued counts of each threadpool group, queued calls mean the group is saturated:
+        "threadpools": thread_pools.get_stats(),
+    }
 
     return BaseResponse(
         request=request,
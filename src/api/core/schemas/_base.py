@@ -25,7 +25,10 @@ class IdPM(BasePM):
         max_length=64,
         title="ID",
         description="Identifier value of the resource.",
-        examples=["res1701388800_dc2cc6c9033c4837b6c34c8bb19bb289"],
+        examples=[
+            "res1701388800_dc2cc6c9033c4837b6c34c8bb19bb289",
+            "res01hgjx6p00k3v1r7dq0ymd1f2c",
+        ],
     )
 
 
@@ -5,5 +5,8 @@ from ._secure import *
 from ._http import *
 from ._dt import *
 from ._io import *
+from ._single_flight import *
+from ._compression import *
+from ._patterns import *
 from . import _validator as validator
 from . import _sanitizer as sanitizer
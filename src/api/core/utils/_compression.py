@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+import zlib
+import gzip
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class _GzipCompressor:
+    __slots__ = ("_obj",)
+
+    def __init__(self, level: int) -> None:
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, is_last: bool = False) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(
+            zlib.Z_FINISH if is_last else zlib.Z_SYNC_FLUSH
+        )
+
+
+class _BrotliCompressor:
+    __slots__ = ("_obj",)
+
+    def __init__(self, level: int) -> None:
+        import brotli
+
+        self._obj = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes, is_last: bool = False) -> bytes:
+        return self._obj.process(data) + (
+            self._obj.finish() if is_last else self._obj.flush()
+        )
+
+
+class _ZstdCompressor:
+    __slots__ = ("_obj", "_flush_block", "_flush_finish")
+
+    def __init__(self, level: int) -> None:
+        import zstandard
+
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._flush_finish = zstandard.COMPRESSOBJ_FLUSH_FINISH
+
+    def compress(self, data: bytes, is_last: bool = False) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(
+            self._flush_finish if is_last else self._flush_block
+        )
+
+
+def _gzip_compress(data: bytes, level: int) -> bytes:
+    ## `mtime=0` keeps output deterministic, same body always gives same bytes:
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def _brotli_compress(data: bytes, level: int) -> bytes:
+    import brotli
+
+    return brotli.compress(data, quality=level)
+
+
+def _zstd_compress(data: bytes, level: int) -> bytes:
+    import zstandard
+
+    ## Compressor objects are not thread-safe, one per call (cheap compared to compression):
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+## Content-Encoding -> (one-shot compress function, streaming compressor class, required module):
+_CODECS: Dict[str, Tuple[Callable[[bytes, int], bytes], Callable[[int], Any], str]] = {
+    "gzip": (_gzip_compress, _GzipCompressor, "zlib"),
+    "br": (_brotli_compress, _BrotliCompressor, "brotli"),
+    "zstd": (_zstd_compress, _ZstdCompressor, "zstandard"),
+}
+
+
+def get_compression_encodings() -> List[str]:
+    """Get content encodings supported by installed modules ('gzip' is always available).
+    'br' needs `brotli` and 'zstd' needs `zstandard` package.
+
+    Returns:
+        List[str]: Supported content encodings.
+    """
+
+    _encodings: List[str] = []
+    for _encoding, (_, _, _module_name) in _CODECS.items():
+        try:
+            __import__(_module_name)
+        except ImportError:
+            continue
+
+        _encodings.append(_encoding)
+
+    return _encodings
+
+
+## Header values repeat a lot (same browsers/clients), parsing is done once per value:
+@lru_cache(maxsize=256)
+def select_encoding(accept_encoding: str, encodings: Tuple[str, ...]) -> Optional[str]:
+    """Select content encoding from 'Accept-Encoding' header value by weights ('q'),
+    ties are resolved by the order of `encodings` (server preference).
+
+    Args:
+        accept_encoding (str            , required): 'Accept-Encoding' header value.
+        encodings       (Tuple[str, ...], required): Supported content encodings, preferred first.
+
+    Returns:
+        Optional[str]: Selected content encoding, None if nothing is acceptable.
+    """
+
+    _weights: Dict[str, float] = {}
+    for _part in accept_encoding.split(","):
+        _name, _, _params = _part.partition(";")
+        _name = _name.strip().lower()
+        if not _name:
+            continue
+
+        _weight = 1.0
+        _params = _params.strip().lower()
+        if _params.startswith("q="):
+            try:
+                _weight = float(_params[2:])
+            except ValueError:
+                _weight = 0.0
+
+        _weights[_name] = _weight
+
+    _selected: Optional[str] = None
+    _selected_weight = 0.0
+    for _encoding in encodings:
+        _weight = _weights.get(_encoding, _weights.get("*", 0.0))
+        if _weight > _selected_weight:
+            _selected, _selected_weight = _encoding, _weight
+
+    return _selected
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    """Compress whole data at once with the content encoding.
+
+    Args:
+        data     (bytes, required): Data to compress.
+        encoding (str  , required): Content encoding: 'gzip', 'br' or 'zstd'.
+        level    (int  , required): Compression level (quality for 'br').
+
+    Raises:
+        ValueError : If `encoding` is not supported.
+        ImportError: If the module required by `encoding` is not installed.
+
+    Returns:
+        bytes: Compressed data.
+    """
+
+    if encoding not in _CODECS:
+        raise ValueError(f"Unsupported compression encoding: '{encoding}'!")
+
+    return _CODECS[encoding][0](data, level)
+
+
+def get_compressor(encoding: str, level: int) -> Any:
+    """Get streaming compressor for the content encoding.
+    Each `compress(data, is_last)` call returns data flushed up to that point,
+    so streamed chunks reach the client without waiting for the whole body.
+
+    Args:
+        encoding (str, required): Content encoding: 'gzip', 'br' or 'zstd'.
+        level    (int, required): Compression level (quality for 'br').
+
+    Raises:
+        ValueError : If `encoding` is not supported.
+        ImportError: If the module required by `encoding` is not installed.
+
+    Returns:
+        Any: Streaming compressor with `compress(data: bytes, is_last: bool) -> bytes` method.
+    """
+
+    if encoding not in _CODECS:
+        raise ValueError(f"Unsupported compression encoding: '{encoding}'!")
+
+    return _CODECS[encoding][1](level)
+
+
+__all__ = [
+    "get_compression_encodings",
+    "select_encoding",
+    "compress",
+    "get_compressor",
+]
@@ -1,16 +1,19 @@
 # -*- coding: utf-8 -*-
 
-from typing import Tuple, Union
+from typing import List, Optional, Tuple, Union
 from urllib import request
+from urllib.parse import parse_qsl, urlencode
 from http import HTTPStatus
 from http.client import HTTPResponse
 
-import aiohttp
 from pydantic import validate_call, conint, AnyHttpUrl
 from starlette.datastructures import URL
 from fastapi import Request
 
 
+_DEFAULT_PORTS = {"http": 80, "https": 443, "ws": 80, "wss": 443}
+
+
 @validate_call
 def get_http_status(status_code: int) -> Tuple[HTTPStatus, bool]:
     """Get HTTP status code enum from integer value.
@@ -61,12 +64,85 @@ def get_relative_url(val: Union[Request, URL]) -> str:
     """
 
     if isinstance(val, Request):
-        val: URL = val.url
+        ## Build directly from ASGI scope, skips full URL parsing and stringifying:
+        _relative_url: str = val.scope["path"]
+        _query_string: bytes = val.scope.get("query_string", b"")
+        if _query_string:
+            _relative_url = f"{_relative_url}?{_query_string.decode()}"
+
+        return _relative_url
 
     _relative_url = str(val).replace(f"{val.scheme}://{val.netloc}", "")
     return _relative_url
 
 
+@validate_call(config={"arbitrary_types_allowed": True})
+def get_base_url(request: Request) -> str:
+    """Get base url (scheme, host and root path) without trailing slash from request object.
+    Same as `str(request.base_url)[:-1]`, but built directly from ASGI scope.
+
+    Args:
+        request (Request, required): Request object to extract base url.
+
+    Returns:
+        str: Base url without trailing slash.
+    """
+
+    _scope = request.scope
+    _base_url: str = _scope.get("app_root_path", _scope.get("root_path", ""))
+    if _base_url.endswith("/"):
+        _base_url = _base_url[:-1]
+
+    _host: Union[str, None] = None
+    for _key, _val in _scope["headers"]:
+        if _key == b"host":
+            _host = _val.decode("latin-1")
+            break
+
+    _scheme: str = _scope.get("scheme", "http")
+    if _host is not None:
+        _base_url = f"{_scheme}://{_host}{_base_url}"
+    elif _scope.get("server") is not None:
+        _host, _port = _scope["server"]
+        if _port == _DEFAULT_PORTS.get(_scheme):
+            _base_url = f"{_scheme}://{_host}{_base_url}"
+        else:
+            _base_url = f"{_scheme}://{_host}:{_port}{_base_url}"
+
+    return _base_url
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def get_request_key(request: Request, headers: Optional[List[str]] = None) -> str:
+    """Get normalized key of request: method, path, sorted query, auth scope and selected header values.
+    Requests with the same key expect the same response data, e.g. for caching or coalescing.
+
+    Args:
+        request (Request            , required): Request object to make key from.
+        headers (Optional[List[str]], optional): Lower-case header names to include in the key. Defaults to None.
+
+    Returns:
+        str: Request key.
+    """
+
+    _scope = request.scope
+    _query: str = ""
+    _query_string: bytes = _scope.get("query_string", b"")
+    if _query_string:
+        _query = urlencode(
+            sorted(parse_qsl(_query_string.decode("latin-1"), keep_blank_values=True))
+        )
+
+    ## `user_id` is set by auth dependencies (e.g. `auth_jwt`):
+    _auth_scope: str = getattr(request.state, "user_id", None) or ""
+    _key = f"{_scope['method']} {_scope['path']}?{_query}@{_auth_scope}"
+    if headers:
+        _header_vals = [request.headers.get(_header, "") for _header in headers]
+        _key = f"{_key}#{'#'.join(_header_vals)}"
+
+    return _key
+
+
 @validate_call
 async def async_is_connectable(
     url: AnyHttpUrl = "https://www.google.com",
@@ -84,6 +160,9 @@ async def async_is_connectable(
         bool: True if connectable, False otherwise.
     """
 
+    ## Imported lazily, `aiohttp` is heavy and only needed here:
+    import aiohttp
+
     try:
         async with aiohttp.ClientSession() as _session:
             async with _session.get(url, timeout=timeout) as _response:
@@ -123,6 +202,8 @@ def is_connectable(
 __all__ = [
     "get_http_status",
     "get_relative_url",
+    "get_base_url",
+    "get_request_key",
     "async_is_connectable",
     "is_connectable",
 ]
@@ -1,20 +1,244 @@
 # -*- coding: utf-8 -*-
 
 import os
+import json
 import errno
 import shutil
+import time
 import hashlib
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
-import aioshutil
+import anyio
+import anyio.to_thread
 import aiofiles.os
 from pydantic import validate_call, conint, constr
 from beans_logging import logger
 
-from api.core.constants import WarnEnum, HashAlgoEnum
+from api.core.constants import WarnEnum, HashAlgoEnum, PathOpStatusEnum
 
 
 _path_max_length = 1024
+## Read buffer of checksum functions, hashlib releases the GIL while hashing large chunks:
+_CHECKSUM_CHUNK_SIZE = 1024 * 1024
+## Sidecar cache file of `<file>` is `<file><suffix>`:
+CHECKSUM_SIDECAR_SUFFIX = ".checksums.json"
+## Paths per threadpool call of bulk operations:
+_BULK_BATCH_SIZE = 256
+
+
+class PathOpResult(NamedTuple):
+    """Result of one path in bulk filesystem operations."""
+
+    path: str
+    status: PathOpStatusEnum
+    error: Optional[str] = None
+
+
+def _warn_missing_file(file_path: str, warn_mode: WarnEnum) -> None:
+    _message = f"'{file_path}' file doesn't exist!"
+    if warn_mode == WarnEnum.ALWAYS:
+        logger.warning(_message)
+    elif warn_mode == WarnEnum.DEBUG:
+        logger.debug(_message)
+    elif warn_mode == WarnEnum.ERROR:
+        raise OSError(errno.ENOENT, _message)
+
+
+def _read_sidecar(file_path: str, stat: os.stat_result) -> Dict[str, str]:
+    try:
+        with open(f"{file_path}{CHECKSUM_SIDECAR_SUFFIX}", "r", encoding="utf-8") as _file:
+            _sidecar = json.load(_file)
+
+        if (
+            (_sidecar.get("path") == os.path.abspath(file_path))
+            and (_sidecar.get("size") == stat.st_size)
+            and (_sidecar.get("mtime_ns") == stat.st_mtime_ns)
+        ):
+            return dict(_sidecar["checksums"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+
+    return {}
+
+
+def _write_sidecar(
+    file_path: str, stat: os.stat_result, checksums: Dict[str, str]
+) -> None:
+    _sidecar_path = f"{file_path}{CHECKSUM_SIDECAR_SUFFIX}"
+    _tmp_path = f"{_sidecar_path}.{os.getpid()}.tmp"
+    try:
+        with open(_tmp_path, "w", encoding="utf-8") as _file:
+            json.dump(
+                {
+                    "path": os.path.abspath(file_path),
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "checksums": checksums,
+                },
+                _file,
+            )
+
+        os.replace(_tmp_path, _sidecar_path)
+    except OSError as err:
+        ## Cache only, e.g. read-only directory:
+        logger.debug(f"Failed to write '{_sidecar_path}' checksum sidecar: {err}")
+        try:
+            os.remove(_tmp_path)
+        except OSError:
+            pass
+
+
+def _compute_checksums(
+    file_path: str,
+    hash_methods: List[str],
+    chunk_size: int = _CHECKSUM_CHUNK_SIZE,
+    use_sidecar: bool = False,
+    warn_mode: WarnEnum = WarnEnum.DEBUG,
+) -> Union[Dict[str, str], None]:
+    """Checksum engine, computes all digests in one pass over the file with a reused read buffer.
+    Blocking, async functions run it with one threadpool call per file.
+    """
+
+    try:
+        _stat = os.stat(file_path)
+    except FileNotFoundError:
+        _stat = None
+
+    if (_stat is None) or (not os.path.isfile(file_path)):
+        _warn_missing_file(file_path=file_path, warn_mode=warn_mode)
+        return None
+
+    _checksums: Dict[str, str] = {}
+    if use_sidecar:
+        _checksums = _read_sidecar(file_path=file_path, stat=_stat)
+
+    _missing = [_method for _method in hash_methods if _method not in _checksums]
+    if _missing:
+        _hashes = [hashlib.new(_method) for _method in _missing]
+        ## File can grow after `stat()` (e.g. empty when stat'ed), a 1-byte buffer would read it byte by byte:
+        _buffer = bytearray(min(chunk_size, _stat.st_size) or chunk_size)
+        _view = memoryview(_buffer)
+        with open(file_path, "rb", buffering=0) as _file:
+            while True:
+                _size = _file.readinto(_buffer)
+                if not _size:
+                    break
+
+                _chunk = _view[:_size]
+                for _hash in _hashes:
+                    _hash.update(_chunk)
+
+        for _method, _hash in zip(_missing, _hashes):
+            _checksums[_method] = _hash.hexdigest()
+
+        if use_sidecar:
+            _write_sidecar(file_path=file_path, stat=_stat, checksums=_checksums)
+
+    return {_method: _checksums[_method] for _method in hash_methods}
+
+
+def _remove_path(path: str, is_dir: bool) -> PathOpResult:
+    try:
+        if is_dir:
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+    except FileNotFoundError:
+        return PathOpResult(path=path, status=PathOpStatusEnum.missing)
+    except OSError as err:
+        return PathOpResult(path=path, status=PathOpStatusEnum.failed, error=str(err))
+
+    return PathOpResult(path=path, status=PathOpStatusEnum.removed)
+
+
+def _remove_paths(paths: List[str], is_dir: bool) -> List[PathOpResult]:
+    """Remove a batch of paths in one threadpool call, errors are results instead of exceptions."""
+
+    return [_remove_path(path=_path, is_dir=is_dir) for _path in paths]
+
+
+def _scan_expired(
+    dir_path: str, max_age: float, exclude: List[str]
+) -> Tuple[List[str], List[str]]:
+    """Top-level entries of `dir_path` not modified for `max_age` seconds, with one `os.scandir()` pass.
+
+    Returns:
+        Tuple[List[str], List[str]]: Expired file paths and directory paths.
+    """
+
+    _exclude = {os.path.abspath(_path) for _path in exclude}
+    _expire_before = time.time() - max_age
+    _file_paths: List[str] = []
+    _dir_paths: List[str] = []
+    try:
+        with os.scandir(dir_path) as _entries:
+            for _entry in _entries:
+                _path = os.path.abspath(_entry.path)
+                ## Excluded paths and their parent directories are kept:
+                if any(
+                    (_exclude_path == _path) or _exclude_path.startswith(_path + os.sep)
+                    for _exclude_path in _exclude
+                ):
+                    continue
+
+                try:
+                    if _expire_before <= _entry.stat(follow_symlinks=False).st_mtime:
+                        continue
+
+                    if _entry.is_dir(follow_symlinks=False):
+                        _dir_paths.append(_entry.path)
+                    else:
+                        _file_paths.append(_entry.path)
+                except FileNotFoundError:
+                    pass
+    except FileNotFoundError:
+        pass
+
+    return _file_paths, _dir_paths
+
+
+def _log_results(
+    results: List[PathOpResult], action: str, warn_mode: WarnEnum
+) -> None:
+    _failed = [_result for _result in results if _result.status == PathOpStatusEnum.failed]
+    _removed_count = sum(
+        1 for _result in results if _result.status == PathOpStatusEnum.removed
+    )
+    _message = f"{action}: {_removed_count} removed, {len(results) - _removed_count - len(_failed)} missing, {len(_failed)} failed."
+    if _failed:
+        if warn_mode == WarnEnum.ERROR:
+            raise OSError(
+                errno.EIO, f"{_message} First error: '{_failed[0].path}' {_failed[0].error}"
+            )
+
+        if warn_mode != WarnEnum.IGNORE:
+            for _result in _failed:
+                logger.warning(f"Failed to remove '{_result.path}': {_result.error}")
+
+    if warn_mode == WarnEnum.ALWAYS:
+        logger.info(_message)
+    elif warn_mode == WarnEnum.DEBUG:
+        logger.debug(_message)
+
+
+async def _async_remove_paths(
+    paths: List[str], is_dir: bool, max_concurrency: int, batch_size: int
+) -> List[PathOpResult]:
+    _batches = [paths[_i : _i + batch_size] for _i in range(0, len(paths), batch_size)]
+    _batch_results: List[List[PathOpResult]] = [[] for _ in _batches]
+    _limiter = anyio.CapacityLimiter(max_concurrency)
+
+    async def _remove_batch(index: int) -> None:
+        _batch_results[index] = await anyio.to_thread.run_sync(
+            _remove_paths, _batches[index], is_dir, limiter=_limiter
+        )
+
+    async with anyio.create_task_group() as _task_group:
+        for _index in range(len(_batches)):
+            _task_group.start_soon(_remove_batch, _index)
+
+    return [_result for _results in _batch_results for _result in _results]
 
 
 ## Async:
@@ -86,6 +310,8 @@ async def async_remove_dir(
             elif warn_mode == WarnEnum.DEBUG:
                 logger.debug(_message)
 
+            import aioshutil
+
             await aioshutil.rmtree(remove_dir)
         except OSError as err:
             if (err.errno == errno.ENOENT) and (warn_mode == WarnEnum.DEBUG):
@@ -101,7 +327,7 @@ async def async_remove_dir(
             logger.debug(_message)
 
     elif warn_mode == WarnEnum.ERROR:
-        raise OSError(errno.ENOENT, f"'{create_dir}' directory doesn't exist!")
+        raise OSError(errno.ENOENT, f"'{remove_dir}' directory doesn't exist!")
 
     return
 
@@ -186,19 +412,128 @@ async def async_remove_files(
     return
 
 
+@validate_call
+async def async_bulk_remove_files(
+    file_paths: List[constr(strip_whitespace=True, min_length=1, max_length=_path_max_length)],  # type: ignore
+    max_concurrency: conint(ge=1, le=256) = 4,  # type: ignore
+    batch_size: conint(ge=1) = _BULK_BATCH_SIZE,  # type: ignore
+    warn_mode: WarnEnum = WarnEnum.DEBUG,
+) -> List[PathOpResult]:
+    """Asynchronous remove many files, in batches of `batch_size` paths per threadpool call,
+    at most `max_concurrency` batches at a time.
+
+    Args:
+        file_paths      (List[str], required): Remove file paths as list.
+        max_concurrency (int      , optional): Maximum concurrent threadpool calls. Defaults to 4.
+        batch_size      (int      , optional): Paths per threadpool call. Defaults to 256.
+        warn_mode       (str      , optional): Warning message mode, for example: 'ERROR', 'ALWAYS', 'DEBUG', 'IGNORE'. Defaults to 'DEBUG'.
+
+    Raises:
+        OSError: When warning mode is set to ERROR and any file failed to be removed.
+
+    Returns:
+        List[PathOpResult]: Result of each path, in the same order as `file_paths`.
+    """
+
+    _results = await _async_remove_paths(
+        paths=file_paths,
+        is_dir=False,
+        max_concurrency=max_concurrency,
+        batch_size=batch_size,
+    )
+    _log_results(results=_results, action="Removed files", warn_mode=warn_mode)
+    return _results
+
+
+@validate_call
+async def async_bulk_remove_dirs(
+    remove_dirs: List[constr(strip_whitespace=True, min_length=1, max_length=_path_max_length)],  # type: ignore
+    max_concurrency: conint(ge=1, le=256) = 4,  # type: ignore
+    batch_size: conint(ge=1) = 16,  # type: ignore
+    warn_mode: WarnEnum = WarnEnum.DEBUG,
+) -> List[PathOpResult]:
+    """Asynchronous remove many directories recursively, in batches of `batch_size` paths per threadpool call,
+    at most `max_concurrency` batches at a time.
+
+    Args:
+        remove_dirs     (List[str], required): Remove directories paths as list.
+        max_concurrency (int      , optional): Maximum concurrent threadpool calls. Defaults to 4.
+        batch_size      (int      , optional): Paths per threadpool call. Defaults to 16.
+        warn_mode       (str      , optional): Warning message mode, for example: 'ERROR', 'ALWAYS', 'DEBUG', 'IGNORE'. Defaults to 'DEBUG'.
+
+    Raises:
+        OSError: When warning mode is set to ERROR and any directory failed to be removed.
+
+    Returns:
+        List[PathOpResult]: Result of each path, in the same order as `remove_dirs`.
+    """
+
+    _results = await _async_remove_paths(
+        paths=remove_dirs,
+        is_dir=True,
+        max_concurrency=max_concurrency,
+        batch_size=batch_size,
+    )
+    _log_results(results=_results, action="Removed directories", warn_mode=warn_mode)
+    return _results
+
+
+@validate_call
+async def async_clean_dir(
+    dir_path: constr(strip_whitespace=True, min_length=1, max_length=_path_max_length),  # type: ignore
+    max_age: conint(ge=0),  # type: ignore
+    exclude: List[str] = [],
+    max_concurrency: conint(ge=1, le=256) = 4,  # type: ignore
+    batch_size: conint(ge=1) = _BULK_BATCH_SIZE,  # type: ignore
+    warn_mode: WarnEnum = WarnEnum.DEBUG,
+) -> List[PathOpResult]:
+    """Asynchronous remove top-level files and directories of `dir_path` not modified for `max_age` seconds.
+    Directory is scanned with `os.scandir()` in one threadpool call, then removed with bulk functions.
+
+    Args:
+        dir_path        (str      , required): Directory path to clean.
+        max_age         (int      , required): Entries modified earlier than this many seconds ago are removed.
+        exclude         (List[str], optional): Paths to keep, including their parent entries. Defaults to [].
+        max_concurrency (int      , optional): Maximum concurrent threadpool calls. Defaults to 4.
+        batch_size      (int      , optional): File paths per threadpool call. Defaults to 256.
+        warn_mode       (str      , optional): Warning message mode, for example: 'ERROR', 'ALWAYS', 'DEBUG', 'IGNORE'. Defaults to 'DEBUG'.
+
+    Raises:
+        OSError: When warning mode is set to ERROR and any entry failed to be removed.
+
+    Returns:
+        List[PathOpResult]: Result of each removed path.
+    """
+
+    _file_paths, _dir_paths = await anyio.to_thread.run_sync(
+        _scan_expired, dir_path, max_age, exclude
+    )
+    _results = await _async_remove_paths(
+        paths=_file_paths,
+        is_dir=False,
+        max_concurrency=max_concurrency,
+        batch_size=batch_size,
+    )
+    _results += await _async_remove_paths(
+        paths=_dir_paths, is_dir=True, max_concurrency=max_concurrency, batch_size=1
+    )
+    _log_results(results=_results, action=f"Cleaned '{dir_path}' directory", warn_mode=warn_mode)
+    return _results
+
+
 @validate_call
 async def async_get_file_checksum(
     file_path: constr(strip_whitespace=True, min_length=1, max_length=_path_max_length),  # type: ignore
     hash_method: HashAlgoEnum = HashAlgoEnum.md5,
-    chunk_size: conint(ge=10) = 4096,  # type: ignore
+    chunk_size: conint(ge=10) = _CHECKSUM_CHUNK_SIZE,  # type: ignore
     warn_mode: WarnEnum = WarnEnum.DEBUG,
 ) -> str:
-    """Asynchronous get file checksum.
+    """Asynchronous get file checksum, with one threadpool call.
 
     Args:
         file_path   (str         , required): Target file path.
         hash_method (HashAlgoEnum, optional): Hash method. Defaults to `HashAlgoEnum.md5`.
-        chunk_size  (int         , optional): Chunk size. Defaults to 4096.
+        chunk_size  (int         , optional): Read buffer size. Defaults to 1MiB.
         warn_mode   (str         , optional): Warning message mode, for example: 'ERROR', 'ALWAYS', 'DEBUG', 'IGNORE'. Defaults to 'DEBUG'.
 
     Raises:
@@ -208,27 +543,110 @@ async def async_get_file_checksum(
         str: File checksum.
     """
 
-    _file_checksum: str = None
-    if await aiofiles.os.path.isfile(file_path):
-        _file_hash = hashlib.new(hash_method.value)
-        async with aiofiles.open(file_path, "rb") as _file:
-            while True:
-                _file_chunk = await _file.read(chunk_size)
-                if not _file_chunk:
-                    break
-                _file_hash.update(_file_chunk)
+    _checksums = await anyio.to_thread.run_sync(
+        lambda: _compute_checksums(
+            file_path=file_path,
+            hash_methods=[hash_method.value],
+            chunk_size=chunk_size,
+            warn_mode=warn_mode,
+        )
+    )
+    _file_checksum: str = _checksums[hash_method.value] if _checksums else None
+    return _file_checksum
 
-        _file_checksum = _file_hash.hexdigest()
-    else:
-        _message = f"'{file_path}' file doesn't exist!"
-        if warn_mode == WarnEnum.ALWAYS:
-            logger.warning(_message)
-        elif warn_mode == WarnEnum.DEBUG:
-            logger.debug(_message)
-        elif warn_mode == WarnEnum.ERROR:
-            raise OSError(errno.ENOENT, _message)
 
-    return _file_checksum
+@validate_call
+async def async_get_file_checksums(
+    file_path: constr(strip_whitespace=True, min_length=1, max_length=_path_max_length),  # type: ignore
+    hash_methods: List[HashAlgoEnum] = [HashAlgoEnum.md5, HashAlgoEnum.sha256],
+    chunk_size: conint(ge=10) = _CHECKSUM_CHUNK_SIZE,  # type: ignore
+    use_sidecar: bool = False,
+    warn_mode: WarnEnum = WarnEnum.DEBUG,
+) -> Union[Dict[str, str], None]:
+    """Asynchronous get file checksums of multiple hash methods in one pass, with one threadpool call.
+
+    Args:
+        file_path    (str               , required): Target file path.
+        hash_methods (List[HashAlgoEnum], optional): Hash methods. Defaults to [md5, sha256].
+        chunk_size   (int               , optional): Read buffer size. Defaults to 1MiB.
+        use_sidecar  (bool              , optional): Reuse and save checksums in `<file_path>.checksums.json`, keyed by path, size and mtime. Defaults to False.
+        warn_mode    (str               , optional): Warning message mode, for example: 'ERROR', 'ALWAYS', 'DEBUG', 'IGNORE'. Defaults to 'DEBUG'.
+
+    Raises:
+        OSError: When warning mode is set to ERROR and file doesn't exist.
+
+    Returns:
+        Union[Dict[str, str], None]: Hash method -> checksum, None if file doesn't exist.
+    """
+
+    _checksums = await anyio.to_thread.run_sync(
+        lambda: _compute_checksums(
+            file_path=file_path,
+            hash_methods=[_method.value for _method in hash_methods],
+            chunk_size=chunk_size,
+            use_sidecar=use_sidecar,
+            warn_mode=warn_mode,
+        )
+    )
+    return _checksums
+
+
+@validate_call
+async def async_get_files_checksums(
+    file_paths: List[constr(strip_whitespace=True, min_length=1, max_length=_path_max_length)],  # type: ignore
+    hash_methods: List[HashAlgoEnum] = [HashAlgoEnum.md5, HashAlgoEnum.sha256],
+    chunk_size: conint(ge=10) = _CHECKSUM_CHUNK_SIZE,  # type: ignore
+    max_workers: conint(ge=1) = 4,  # type: ignore
+    use_sidecar: bool = False,
+    warn_mode: WarnEnum = WarnEnum.DEBUG,
+) -> Dict[str, Union[Dict[str, str], None]]:
+    """Asynchronous get checksums of many files in parallel, at most `max_workers` files at a time.
+
+    Args:
+        file_paths   (List[str]         , required): Target file paths.
+        hash_methods (List[HashAlgoEnum], optional): Hash methods. Defaults to [md5, sha256].
+        chunk_size   (int               , optional): Read buffer size. Defaults to 1MiB.
+        max_workers  (int               , optional): Maximum files checksummed at the same time. Defaults to 4.
+        use_sidecar  (bool              , optional): Reuse and save checksums in sidecar files. Defaults to False.
+        warn_mode    (str               , optional): Warning message mode, for example: 'ERROR', 'ALWAYS', 'DEBUG', 'IGNORE'. Defaults to 'DEBUG'.
+
+    Raises:
+        OSError: When warning mode is set to ERROR and a file doesn't exist.
+
+    Returns:
+        Dict[str, Union[Dict[str, str], None]]: File path -> hash method -> checksum, None for missing files.
+    """
+
+    _hash_methods = [_method.value for _method in hash_methods]
+    _limiter = anyio.CapacityLimiter(max_workers)
+    _results: Dict[str, Union[Dict[str, str], None]] = {}
+    _errors: Dict[str, OSError] = {}
+
+    async def _checksum(file_path: str) -> None:
+        try:
+            _results[file_path] = await anyio.to_thread.run_sync(
+                lambda: _compute_checksums(
+                    file_path=file_path,
+                    hash_methods=_hash_methods,
+                    chunk_size=chunk_size,
+                    use_sidecar=use_sidecar,
+                    warn_mode=warn_mode,
+                ),
+                limiter=_limiter,
+            )
+        except OSError as err:
+            ## Raised after the task group, not wrapped in an exception group:
+            _errors[file_path] = err
+
+    async with anyio.create_task_group() as _task_group:
+        for _file_path in dict.fromkeys(file_paths):
+            _task_group.start_soon(_checksum, _file_path)
+
+    for _file_path in file_paths:
+        if _file_path in _errors:
+            raise _errors[_file_path]
+
+    return {_file_path: _results[_file_path] for _file_path in file_paths}
 
 
 ## Sync:
@@ -315,7 +733,7 @@ def remove_dir(
             logger.debug(_message)
 
     elif warn_mode == WarnEnum.ERROR:
-        raise OSError(errno.ENOENT, f"'{create_dir}' directory doesn't exist!")
+        raise OSError(errno.ENOENT, f"'{remove_dir}' directory doesn't exist!")
 
     return
 
@@ -404,7 +822,7 @@ def remove_files(
 def get_file_checksum(
     file_path: constr(strip_whitespace=True, min_length=1, max_length=_path_max_length),  # type: ignore
     hash_method: HashAlgoEnum = HashAlgoEnum.md5,
-    chunk_size: conint(ge=10) = 4096,  # type: ignore
+    chunk_size: conint(ge=10) = _CHECKSUM_CHUNK_SIZE,  # type: ignore
     warn_mode: WarnEnum = WarnEnum.DEBUG,
 ) -> str:
     """Get file checksum.
@@ -412,7 +830,7 @@ def get_file_checksum(
     Args:
         file_path   (str         , required): Target file path.
         hash_method (HashAlgoEnum, optional): Hash method. Defaults to `HashAlgoEnum.md5`.
-        chunk_size  (int         , optional): Chunk size. Defaults to 4096.
+        chunk_size  (int         , optional): Read buffer size. Defaults to 1MiB.
         warn_mode   (str         , optional): Warning message mode, for example: 'ERROR', 'ALWAYS', 'DEBUG', 'IGNORE'. Defaults to 'DEBUG'.
 
     Raises:
@@ -422,27 +840,137 @@ def get_file_checksum(
         str: File checksum.
     """
 
-    _file_checksum: str = None
-    if os.path.isfile(file_path):
-        _file_hash = hashlib.new(hash_method.value)
-        with open(file_path, "rb") as _file:
-            while True:
-                _file_chunk = _file.read(chunk_size)
-                if not _file_chunk:
-                    break
-                _file_hash.update(_file_chunk)
+    _checksums = _compute_checksums(
+        file_path=file_path,
+        hash_methods=[hash_method.value],
+        chunk_size=chunk_size,
+        warn_mode=warn_mode,
+    )
+    _file_checksum: str = _checksums[hash_method.value] if _checksums else None
+    return _file_checksum
 
-        _file_checksum = _file_hash.hexdigest()
-    else:
-        _message = f"'{file_path}' file doesn't exist!"
-        if warn_mode == WarnEnum.ALWAYS:
-            logger.warning(_message)
-        elif warn_mode == WarnEnum.DEBUG:
-            logger.debug(_message)
-        elif warn_mode == WarnEnum.ERROR:
-            raise OSError(errno.ENOENT, _message)
 
-    return _file_checksum
+@validate_call
+def get_file_checksums(
+    file_path: constr(strip_whitespace=True, min_length=1, max_length=_path_max_length),  # type: ignore
+    hash_methods: List[HashAlgoEnum] = [HashAlgoEnum.md5, HashAlgoEnum.sha256],
+    chunk_size: conint(ge=10) = _CHECKSUM_CHUNK_SIZE,  # type: ignore
+    use_sidecar: bool = False,
+    warn_mode: WarnEnum = WarnEnum.DEBUG,
+) -> Union[Dict[str, str], None]:
+    """Get file checksums of multiple hash methods in one pass.
+
+    Args:
+        file_path    (str               , required): Target file path.
+        hash_methods (List[HashAlgoEnum], optional): Hash methods. Defaults to [md5, sha256].
+        chunk_size   (int               , optional): Read buffer size. Defaults to 1MiB.
+        use_sidecar  (bool              , optional): Reuse and save checksums in `<file_path>.checksums.json`, keyed by path, size and mtime. Defaults to False.
+        warn_mode    (str               , optional): Warning message mode, for example: 'ERROR', 'ALWAYS', 'DEBUG', 'IGNORE'. Defaults to 'DEBUG'.
+
+    Raises:
+        OSError: When warning mode is set to ERROR and file doesn't exist.
+
+    Returns:
+        Union[Dict[str, str], None]: Hash method -> checksum, None if file doesn't exist.
+    """
+
+    _checksums = _compute_checksums(
+        file_path=file_path,
+        hash_methods=[_method.value for _method in hash_methods],
+        chunk_size=chunk_size,
+        use_sidecar=use_sidecar,
+        warn_mode=warn_mode,
+    )
+    return _checksums
+
+
+@validate_call
+def read_checksums_sidecar(
+    file_path: constr(strip_whitespace=True, min_length=1, max_length=_path_max_length),  # type: ignore
+) -> Dict[str, str]:
+    """Read checksums from the sidecar cache file without hashing the file.
+
+    Args:
+        file_path (str, required): Target file path.
+
+    Raises:
+        OSError: If file doesn't exist.
+
+    Returns:
+        Dict[str, str]: Hash method -> checksum, empty if there is no sidecar or the file changed after it was written.
+    """
+
+    return _read_sidecar(file_path=file_path, stat=os.stat(file_path))
+
+
+@validate_call
+def write_checksums_sidecar(
+    file_path: constr(strip_whitespace=True, min_length=1, max_length=_path_max_length),  # type: ignore
+    checksums: Dict[str, str],
+) -> None:
+    """Save already known checksums (e.g. computed while receiving the file) as the sidecar cache file,
+    reused by checksum functions with `use_sidecar=True`.
+
+    Args:
+        file_path (str           , required): Target file path.
+        checksums (Dict[str, str], required): Hash method -> checksum of the current file content.
+
+    Raises:
+        OSError: If file doesn't exist.
+    """
+
+    _write_sidecar(file_path=file_path, stat=os.stat(file_path), checksums=checksums)
+    return
+
+
+@validate_call
+def get_files_checksums(
+    file_paths: List[constr(strip_whitespace=True, min_length=1, max_length=_path_max_length)],  # type: ignore
+    hash_methods: List[HashAlgoEnum] = [HashAlgoEnum.md5, HashAlgoEnum.sha256],
+    chunk_size: conint(ge=10) = _CHECKSUM_CHUNK_SIZE,  # type: ignore
+    max_workers: conint(ge=1) = 4,  # type: ignore
+    use_sidecar: bool = False,
+    warn_mode: WarnEnum = WarnEnum.DEBUG,
+) -> Dict[str, Union[Dict[str, str], None]]:
+    """Get checksums of many files in parallel threads, at most `max_workers` files at a time.
+
+    Args:
+        file_paths   (List[str]         , required): Target file paths.
+        hash_methods (List[HashAlgoEnum], optional): Hash methods. Defaults to [md5, sha256].
+        chunk_size   (int               , optional): Read buffer size. Defaults to 1MiB.
+        max_workers  (int               , optional): Maximum files checksummed at the same time. Defaults to 4.
+        use_sidecar  (bool              , optional): Reuse and save checksums in sidecar files. Defaults to False.
+        warn_mode    (str               , optional): Warning message mode, for example: 'ERROR', 'ALWAYS', 'DEBUG', 'IGNORE'. Defaults to 'DEBUG'.
+
+    Raises:
+        OSError: When warning mode is set to ERROR and a file doesn't exist.
+
+    Returns:
+        Dict[str, Union[Dict[str, str], None]]: File path -> hash method -> checksum, None for missing files.
+    """
+
+    _hash_methods = [_method.value for _method in hash_methods]
+    _file_paths = list(dict.fromkeys(file_paths))
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, max(len(_file_paths), 1))
+    ) as _executor:
+        _results = dict(
+            zip(
+                _file_paths,
+                _executor.map(
+                    lambda _file_path: _compute_checksums(
+                        file_path=_file_path,
+                        hash_methods=_hash_methods,
+                        chunk_size=chunk_size,
+                        use_sidecar=use_sidecar,
+                        warn_mode=warn_mode,
+                    ),
+                    _file_paths,
+                ),
+            )
+        )
+
+    return {_file_path: _results[_file_path] for _file_path in file_paths}
 
 
 __all__ = [
@@ -451,11 +979,22 @@ __all__ = [
     "async_remove_dirs",
     "async_remove_file",
     "async_remove_files",
+    "async_bulk_remove_files",
+    "async_bulk_remove_dirs",
+    "async_clean_dir",
     "async_get_file_checksum",
+    "async_get_file_checksums",
+    "async_get_files_checksums",
     "create_dir",
     "remove_dir",
     "remove_dirs",
     "remove_file",
     "remove_files",
     "get_file_checksum",
+    "get_file_checksums",
+    "get_files_checksums",
+    "read_checksums_sidecar",
+    "write_checksums_sidecar",
+    "CHECKSUM_SIDECAR_SUFFIX",
+    "PathOpResult",
 ]
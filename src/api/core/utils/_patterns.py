@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, NamedTuple, Pattern, Tuple, Union
+
+from api.core.constants import _regex
+from api.core.constants import (
+    SPECIAL_CHARS_BASE_REGEX,
+    SPECIAL_CHARS_LOW_REGEX,
+    SPECIAL_CHARS_MEDIUM_REGEX,
+    SPECIAL_CHARS_HIGH_REGEX,
+    SPECIAL_CHARS_STRICT_REGEX,
+)
+
+
+class CharClass(NamedTuple):
+    """Characters of a single character class pattern (e.g. `[&'"<>]`), for `str.translate()` based matching.
+
+    `ascii_table` maps every ASCII code point to None (delete) or itself, a full table is much faster
+    than a sparse mapping because `str.translate()` never has to handle missing keys.
+    It is only valid for ASCII strings.
+    """
+
+    chars: FrozenSet[str]
+    ascii_table: Tuple[Union[str, None], ...]
+
+
+## Escapes that match a literal character, others (\d, \w, \s, ...) are classes:
+_ESCAPE_CHARS: Dict[str, str] = {"t": "\t", "n": "\n", "r": "\r", "f": "\f", "v": "\v"}
+
+
+def _parse_char_class(pattern: str) -> Union[CharClass, None]:
+    """Parse a pattern that is a single, non-negated character class of literals (no ranges).
+
+    Args:
+        pattern (str, required): Regex pattern.
+
+    Returns:
+        Union[CharClass, None]: Parsed character class, None if the pattern is anything else.
+    """
+
+    if (len(pattern) < 3) or (pattern[0] != "[") or (pattern[-1] != "]"):
+        return None
+
+    _body = pattern[1:-1]
+    if _body.startswith("^"):
+        return None
+
+    _chars = set()
+    _i = 0
+    while _i < len(_body):
+        _char = _body[_i]
+        if _char == "\\":
+            _i += 1
+            if len(_body) <= _i:
+                return None
+
+            _char = _body[_i]
+            if _char in _ESCAPE_CHARS:
+                _char = _ESCAPE_CHARS[_char]
+            elif _char.isalnum():
+                return None
+        elif _char in "[]":
+            return None
+        elif (_char == "-") and (0 < _i < len(_body) - 1):
+            ## Range:
+            return None
+
+        _chars.add(_char)
+        _i += 1
+
+    ## Must match exactly the same ASCII characters as the regex:
+    _compiled = re.compile(pattern)
+    for _code in range(128):
+        if (chr(_code) in _chars) != bool(_compiled.match(chr(_code))):
+            return None
+
+    return CharClass(
+        chars=frozenset(_chars),
+        ascii_table=tuple(
+            None if chr(_code) in _chars else chr(_code) for _code in range(128)
+        ),
+    )
+
+
+## Compiled constant patterns (`api.core.constants`), keyed by the pattern string:
+REGEX_PATTERNS: Dict[str, Pattern] = {
+    getattr(_regex, _name): re.compile(getattr(_regex, _name))
+    for _name in _regex.__all__
+}
+
+_CHAR_CLASSES: Dict[str, CharClass] = {
+    _pattern: _char_class
+    for _pattern in REGEX_PATTERNS
+    if (_char_class := _parse_char_class(_pattern)) is not None
+}
+
+SPECIAL_CHARS_MODE_PATTERNS: Dict[str, str] = {
+    "BASE": SPECIAL_CHARS_BASE_REGEX,
+    "HTML": SPECIAL_CHARS_BASE_REGEX,
+    "LOW": SPECIAL_CHARS_LOW_REGEX,
+    "MEDIUM": SPECIAL_CHARS_MEDIUM_REGEX,
+    "HIGH": SPECIAL_CHARS_HIGH_REGEX,
+    "SCRIPT": SPECIAL_CHARS_HIGH_REGEX,
+    "SQL": SPECIAL_CHARS_HIGH_REGEX,
+    "STRICT": SPECIAL_CHARS_STRICT_REGEX,
+}
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str) -> Pattern:
+    return re.compile(pattern)
+
+
+def get_pattern(pattern: Union[Pattern, str]) -> Pattern:
+    """Get compiled pattern, from the registry for constant patterns.
+
+    Args:
+        pattern (Union[Pattern, str], required): Compiled pattern or pattern string.
+
+    Returns:
+        Pattern: Compiled pattern.
+    """
+
+    if isinstance(pattern, str):
+        _compiled = REGEX_PATTERNS.get(pattern)
+        if _compiled is None:
+            _compiled = _compile(pattern)
+
+        return _compiled
+
+    return pattern
+
+
+def get_char_class(pattern: str) -> Union[CharClass, None]:
+    """Get characters of a constant character class pattern.
+
+    Args:
+        pattern (str, required): Pattern string.
+
+    Returns:
+        Union[CharClass, None]: Character class, None if the pattern is not a registered character class.
+    """
+
+    return _CHAR_CLASSES.get(pattern)
+
+
+def get_special_chars_pattern(mode: str) -> str:
+    """Get special characters pattern of the mode.
+
+    Args:
+        mode (str, required): Mode name, case-insensitive: BASE/HTML, LOW, MEDIUM, HIGH/SCRIPT/SQL or STRICT.
+
+    Raises:
+        ValueError: If `mode` is unsupported.
+
+    Returns:
+        str: Pattern string.
+    """
+
+    _pattern = SPECIAL_CHARS_MODE_PATTERNS.get(mode)
+    if _pattern is None:
+        mode = mode.upper()
+        _pattern = SPECIAL_CHARS_MODE_PATTERNS.get(mode)
+        if _pattern is None:
+            raise ValueError(f"Unsupported mode: {mode}")
+
+    return _pattern
+
+
+__all__ = [
+    "CharClass",
+    "REGEX_PATTERNS",
+    "SPECIAL_CHARS_MODE_PATTERNS",
+    "get_pattern",
+    "get_char_class",
+    "get_special_chars_pattern",
+]
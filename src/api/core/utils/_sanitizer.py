@@ -1,18 +1,11 @@
 # -*- coding: utf-8 -*-
 
-import re
 import html
 from urllib.parse import quote
 
 from pydantic import validate_call, constr, AnyHttpUrl
 
-from api.core.constants import (
-    SPECIAL_CHARS_BASE_REGEX,
-    SPECIAL_CHARS_LOW_REGEX,
-    SPECIAL_CHARS_MEDIUM_REGEX,
-    SPECIAL_CHARS_HIGH_REGEX,
-    SPECIAL_CHARS_STRICT_REGEX,
-)
+from ._patterns import get_pattern, get_char_class, get_special_chars_pattern
 
 
 @validate_call
@@ -60,22 +53,13 @@ def clean_special_chars(val: str, mode: str = "LOW") -> str:
         str: Sanitized string.
     """
 
-    _pattern = r""
-    mode = mode.upper()
-    if (mode == "BASE") or (mode == "HTML"):
-        _pattern = SPECIAL_CHARS_BASE_REGEX
-    elif mode == "LOW":
-        _pattern = SPECIAL_CHARS_LOW_REGEX
-    elif mode == "MEDIUM":
-        _pattern = SPECIAL_CHARS_MEDIUM_REGEX
-    elif (mode == "HIGH") or (mode == "SCRIPT") or (mode == "SQL"):
-        _pattern = SPECIAL_CHARS_HIGH_REGEX
-    elif mode == "STRICT":
-        _pattern = SPECIAL_CHARS_STRICT_REGEX
+    _pattern = get_special_chars_pattern(mode)
+    _char_class = get_char_class(_pattern)
+    if (_char_class is not None) and val.isascii():
+        _sanitized = val.translate(_char_class.ascii_table)
     else:
-        raise ValueError(f"Unsupported mode: {mode}")
+        _sanitized = get_pattern(_pattern).sub("", val)
 
-    _sanitized = re.sub(pattern=_pattern, repl="", string=val)
     return _sanitized
 
 
@@ -1,29 +1,175 @@
 # -*- coding: utf-8 -*-
 
+import os
+import time
 import uuid
 import string
 import secrets
 import hashlib
+import threading
+from typing import Dict, List, Tuple
 
-from pydantic import validate_call, conint, constr
+from pydantic import validate_call, conint
 
-from api.core.constants import HashAlgoEnum
-from ._dt import now_ts
+from api.core.constants import HashAlgoEnum, UniqueIdModeEnum
+
+
+## Crockford's base32 in lowercase, keeps the ASCII order of the encoded values:
+_CROCKFORD_CHARS = "0123456789abcdefghjkmnpqrstvwxyz"
+## 10-bit value -> 2 characters:
+_CROCKFORD_PAIRS = tuple(_a + _b for _a in _CROCKFORD_CHARS for _b in _CROCKFORD_CHARS)
+_ULID_RANDOM_BYTES = 10
+_ULID_RANDOM_MAX = (1 << (_ULID_RANDOM_BYTES * 8)) - 1
+
+
+class _MonotonicIdGenerator:
+    """ULID generator: 48-bit millisecond timestamp + 80-bit random, 26 characters.
+
+    IDs generated in the same millisecond increment the previous random part, so IDs are unique and
+    lexicographically sorted in generation order within the process. Random bytes are drawn from
+    a per-process pool refilled in blocks, not with a syscall per ID.
+    """
+
+    def __init__(self, pool_size: int = 4096) -> None:
+        self._pool_size = pool_size - (pool_size % _ULID_RANDOM_BYTES)
+        self._reset()
+
+    def _reset(self) -> None:
+        ## Also called in forked child processes, they must not reuse the parent's pool or lock:
+        self._lock = threading.Lock()
+        self._pool = b""
+        self._pool_pos = 0
+        self._last_ms = -1
+        self._last_rand = 0
+        self._ts_part = ""
+
+    def _draw_random(self) -> int:
+        if len(self._pool) <= self._pool_pos:
+            self._pool = os.urandom(self._pool_size)
+            self._pool_pos = 0
+
+        _pos = self._pool_pos
+        self._pool_pos = _pos + _ULID_RANDOM_BYTES
+        return int.from_bytes(self._pool[_pos : self._pool_pos], "big")
+
+    def _set_ms(self, ms: int) -> None:
+        _pairs = _CROCKFORD_PAIRS
+        self._last_ms = ms
+        self._ts_part = (
+            _pairs[(ms >> 40) & 0x3FF]
+            + _pairs[(ms >> 30) & 0x3FF]
+            + _pairs[(ms >> 20) & 0x3FF]
+            + _pairs[(ms >> 10) & 0x3FF]
+            + _pairs[ms & 0x3FF]
+        )
+
+    def generate(self) -> str:
+        _now_ms = time.time_ns() // 1_000_000
+        with self._lock:
+            if self._last_ms < _now_ms:
+                self._set_ms(_now_ms)
+                _rand = self._draw_random()
+            else:
+                ## Same millisecond or the clock went back, keep the order:
+                _rand = self._last_rand + 1
+                if _ULID_RANDOM_MAX < _rand:
+                    self._set_ms(self._last_ms + 1)
+                    _rand = self._draw_random()
+
+            self._last_rand = _rand
+            _ts_part = self._ts_part
+
+        _pairs = _CROCKFORD_PAIRS
+        return (
+            _ts_part
+            + _pairs[(_rand >> 70) & 0x3FF]
+            + _pairs[(_rand >> 60) & 0x3FF]
+            + _pairs[(_rand >> 50) & 0x3FF]
+            + _pairs[(_rand >> 40) & 0x3FF]
+            + _pairs[(_rand >> 30) & 0x3FF]
+            + _pairs[(_rand >> 20) & 0x3FF]
+            + _pairs[(_rand >> 10) & 0x3FF]
+            + _pairs[_rand & 0x3FF]
+        )
+
+
+_ulid_generator = _MonotonicIdGenerator()
+os.register_at_fork(after_in_child=_ulid_generator._reset)
+
+_unique_id_mode = UniqueIdModeEnum.timestamp_uuid
 
 
 @validate_call
-def gen_unique_id(prefix: constr(strip_whitespace=True, max_length=32) = "") -> str:  # type: ignore
-    """Generate unique id.
+def set_unique_id_mode(mode: UniqueIdModeEnum) -> None:
+    """Set the ID format of `gen_unique_id()` for the process.
+
+    Args:
+        mode (UniqueIdModeEnum, required): 'timestamp_uuid': '<unix seconds>_<uuid4 hex>',
+            'ulid': 26 characters ULID, monotonic and sortable by millisecond.
+    """
+
+    global _unique_id_mode
+    _unique_id_mode = mode
+
+
+def gen_unique_id(prefix: str = "") -> str:
+    """Generate unique id, in the format set by `set_unique_id_mode()`.
+    Not wrapped with `validate_call`, it is called for every created resource.
 
     Args:
-        prefix (str, optional): Prefix of id. Defaults to ''.
+        prefix (str, optional): Prefix of id, max 32 characters. Defaults to ''.
+
+    Raises:
+        ValueError: If `prefix` is longer than 32 characters.
 
     Returns:
         str: Unique id.
     """
 
-    _id = str(f"{prefix}{now_ts()}_{uuid.uuid4().hex}").lower()
-    return _id
+    if prefix:
+        prefix = prefix.strip().lower()
+        if 32 < len(prefix):
+            raise ValueError(
+                f"`prefix` argument value is too long: {len(prefix)} > 32 characters!"
+            )
+
+    if _unique_id_mode is UniqueIdModeEnum.ulid:
+        return prefix + _ulid_generator.generate()
+
+    return f"{prefix}{int(time.time())}_{uuid.uuid4().hex}"
+
+
+def _make_random_table(chars: str) -> Tuple[bytes, bytes, int]:
+    """Byte -> character table for rejection sampling: bytes below the largest multiple of the alphabet
+    size map to `chars[byte % len(chars)]`, others are rejected (deleted) to avoid modulo bias.
+    """
+
+    _limit = 256 - (256 % len(chars))
+    _table = bytes(
+        ord(chars[_byte % len(chars)]) if _byte < _limit else 0 for _byte in range(256)
+    )
+    _reject = bytes(range(_limit, 256))
+    return _table, _reject, _limit
+
+
+## is_alphanum -> (table, reject, limit):
+_RANDOM_TABLES: Dict[bool, Tuple[bytes, bytes, int]] = {
+    True: _make_random_table(string.ascii_letters + string.digits),
+    False: _make_random_table(
+        string.ascii_letters + string.digits + string.punctuation
+    ),
+}
+
+
+def _gen_random_chars(count: int, is_alphanum: bool) -> str:
+    _table, _reject, _limit = _RANDOM_TABLES[is_alphanum]
+    _chars = b""
+    while len(_chars) < count:
+        ## Draw for the expected rejection ratio and a little more, one draw is almost always enough:
+        _size = ((count - len(_chars)) * 256) // _limit + 16
+        _chars += secrets.token_bytes(_size).translate(_table, _reject)
+
+    return _chars[:count].decode("ascii")
 
 
 @validate_call
@@ -38,14 +184,30 @@ def gen_random_string(length: conint(ge=1) = 16, is_alphanum: bool = True) -> st
         str: Generated random string.
     """
 
-    _base_chars = string.ascii_letters + string.digits
-    if not is_alphanum:
-        _base_chars += string.punctuation
-
-    _random_str = "".join(secrets.choice(_base_chars) for _i in range(length))
+    _random_str = _gen_random_chars(count=length, is_alphanum=is_alphanum)
     return _random_str
 
 
+@validate_call
+def gen_random_strings(
+    count: conint(ge=1), length: conint(ge=1) = 16, is_alphanum: bool = True  # type: ignore
+) -> List[str]:
+    """Generate secure random strings, with one random bytes draw for all of them.
+
+    Args:
+        count       (int , required): Number of strings.
+        length      (int , optional): Length of each string. Defaults to 16.
+        is_alphanum (bool, optional): If True, generate only alphanumeric strings. Defaults to True.
+
+    Returns:
+        List[str]: Generated random strings.
+    """
+
+    _chars = _gen_random_chars(count=count * length, is_alphanum=is_alphanum)
+    _random_strs = [_chars[_i : _i + length] for _i in range(0, len(_chars), length)]
+    return _random_strs
+
+
 @validate_call
 def hash_str(val: str, algorithm: HashAlgoEnum = HashAlgoEnum.sha256) -> str:
     """Hash a string using a specified hash algorithm.
@@ -69,7 +231,9 @@ def hash_str(val: str, algorithm: HashAlgoEnum = HashAlgoEnum.sha256) -> str:
 
 
 __all__ = [
+    "set_unique_id_mode",
     "gen_unique_id",
     "gen_random_string",
+    "gen_random_strings",
     "hash_str",
 ]
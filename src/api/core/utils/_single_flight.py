@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Tuple, Union
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Union[BaseException, None] = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one in-flight call.
+    The first caller (leader) runs the function, others wait and share its result or exception.
+    Nothing is kept after the call finishes, this is not a cache.
+
+    Sync calls (`do()`) are coordinated between threads, async calls (`async_do()`) within the event loop.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._futures: Dict[str, asyncio.Future] = {}
+
+    def do(self, key: str, func: Callable[..., Any], *args, **kwargs) -> Tuple[Any, bool]:
+        """Call function once for all concurrent callers with the same key (threads).
+
+        Args:
+            key      (str              , required): Key of the call, same key means same result.
+            func     (Callable[..., Any], required): Function to call.
+            *args    (Any              , optional): Positional arguments for the function.
+            **kwargs (Any              , optional): Keyword arguments for the function.
+
+        Returns:
+            Tuple[Any, bool]: Result and True if it was shared from another caller.
+        """
+
+        with self._lock:
+            _call: Union[_Call, None] = self._calls.get(key)
+            _is_leader = _call is None
+            if _is_leader:
+                _call = _Call()
+                self._calls[key] = _call
+
+        if not _is_leader:
+            _call.event.wait()
+            if _call.error is not None:
+                raise _call.error
+
+            return _call.result, True
+
+        try:
+            _call.result = func(*args, **kwargs)
+        except BaseException as err:
+            _call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+            _call.event.set()
+
+        return _call.result, False
+
+    async def async_do(
+        self, key: str, func: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Tuple[Any, bool]:
+        """Await coroutine function once for all concurrent callers with the same key (event loop).
+
+        Args:
+            key      (str                         , required): Key of the call, same key means same result.
+            func     (Callable[..., Awaitable[Any]], required): Coroutine function to await.
+            *args    (Any                         , optional): Positional arguments for the function.
+            **kwargs (Any                         , optional): Keyword arguments for the function.
+
+        Returns:
+            Tuple[Any, bool]: Result and True if it was shared from another caller.
+        """
+
+        _future: Union[asyncio.Future, None] = self._futures.get(key)
+        if _future is not None:
+            ## Don't let a cancelled follower cancel the shared call:
+            await asyncio.wait([_future])
+            if _future.cancelled():
+                ## Leader was cancelled (e.g. client disconnected), try again:
+                return await self.async_do(key, func, *args, **kwargs)
+
+            return _future.result(), True
+
+        _future = asyncio.get_running_loop().create_future()
+        self._futures[key] = _future
+        try:
+            _result = await func(*args, **kwargs)
+            _future.set_result(_result)
+        except asyncio.CancelledError:
+            _future.cancel()
+            raise
+        except BaseException as err:
+            _future.set_exception(err)
+            ## Mark as retrieved, followers may not exist:
+            _future.exception()
+            raise
+        finally:
+            del self._futures[key]
+
+        return _result, False
+
+
+__all__ = ["SingleFlight"]
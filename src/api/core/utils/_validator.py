@@ -1,18 +1,16 @@
 # -*- coding: utf-8 -*-
 
-import re
 from typing import List, Union, Pattern
 
 from pydantic import validate_call
 
-from api.core.constants import (
-    REQUEST_ID_REGEX,
-    SPECIAL_CHARS_BASE_REGEX,
-    SPECIAL_CHARS_LOW_REGEX,
-    SPECIAL_CHARS_MEDIUM_REGEX,
-    SPECIAL_CHARS_HIGH_REGEX,
-    SPECIAL_CHARS_STRICT_REGEX,
-)
+from api.core.constants import REQUEST_ID_REGEX
+from ._patterns import get_pattern, get_char_class, get_special_chars_pattern
+
+
+_REQUEST_ID_PATTERN = get_pattern(REQUEST_ID_REGEX)
+## Shorter strings are faster with regex search, it stops at the first match:
+_TRANSLATE_MIN_LEN = 128
 
 
 @validate_call
@@ -67,7 +65,7 @@ def is_request_id(val: str) -> bool:
         bool: True if the string is valid request ID, False otherwise.
     """
 
-    _is_valid = bool(re.match(pattern=REQUEST_ID_REGEX, string=val))
+    _is_valid = bool(_REQUEST_ID_PATTERN.match(val))
     return _is_valid
 
 
@@ -91,18 +89,18 @@ def is_blacklisted(val: str, blacklist: List[str]) -> bool:
 
 
 @validate_call
-def is_valid(val: str, pattern: Union[Pattern, str]) -> bool:
+def is_valid(val: str, pattern: Union[str, Pattern]) -> bool:
     """Check if the string is valid with given pattern.
 
     Args:
         val     (str                , required): String to check.
-        pattern (Union[Pattern, str], required): Pattern regex to check.
+        pattern (Union[str, Pattern], required): Pattern regex to check.
 
     Returns:
         bool: True if the string is valid with given pattern, False otherwise.
     """
 
-    _is_valid = bool(re.match(pattern=pattern, string=val))
+    _is_valid = bool(get_pattern(pattern).match(val))
     return _is_valid
 
 
@@ -121,24 +119,17 @@ def has_special_chars(val: str, mode: str = "LOW") -> bool:
         bool: True if the string has special characters, False otherwise.
     """
 
-    _has_special_chars = False
-
-    _pattern = r""
-    mode = mode.upper()
-    if (mode == "BASE") or (mode == "HTML"):
-        _pattern = SPECIAL_CHARS_BASE_REGEX
-    elif mode == "LOW":
-        _pattern = SPECIAL_CHARS_LOW_REGEX
-    elif mode == "MEDIUM":
-        _pattern = SPECIAL_CHARS_MEDIUM_REGEX
-    elif (mode == "HIGH") or (mode == "SCRIPT") or (mode == "SQL"):
-        _pattern = SPECIAL_CHARS_HIGH_REGEX
-    elif mode == "STRICT":
-        _pattern = SPECIAL_CHARS_STRICT_REGEX
+    _pattern = get_special_chars_pattern(mode)
+    _char_class = get_char_class(_pattern)
+    if (
+        (_char_class is not None)
+        and (_TRANSLATE_MIN_LEN <= len(val))
+        and val.isascii()
+    ):
+        _has_special_chars = len(val.translate(_char_class.ascii_table)) != len(val)
     else:
-        raise ValueError(f"Unsupported mode: {mode}")
+        _has_special_chars = bool(get_pattern(_pattern).search(val))
 
-    _has_special_chars = bool(re.search(pattern=_pattern, string=val))
     return _has_special_chars
 
 
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+from typing import Union
+
+from fastapi import APIRouter, Request, Path, Body, HTTPException
+from pydantic import constr
+
+from api.core.constants import ALPHANUM_HYPHEN_REGEX, ErrorCodeEnum, JobStatusEnum
+from api.config import config
+from api.core.exceptions import BaseHTTPException
+from api.core.jobs import JobPM, JobQueueFullError, JobWorkerPool, get_job_names
+from api.core.responses import BaseResponse
+from api.logger import logger
+
+from .schemas import JobCreatePM, JobResultPM, ResJobPM, ResJobResultPM
+
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+def _get_pool(request: Request) -> JobWorkerPool:
+    ## Started in lifespan, missing while starting up or after shut down:
+    _pool: Union[JobWorkerPool, None] = getattr(request.app.state, "jobs", None)
+    if (not _pool) or (not _pool.is_running):
+        raise BaseHTTPException(
+            error_enum=ErrorCodeEnum.SERVICE_UNAVAILABLE,
+            message="Job workers are not running!",
+        )
+
+    return _pool
+
+
+async def _get_job(request: Request, job_id: str) -> JobPM:
+    _job: Union[JobPM, None] = await _get_pool(request).get(job_id)
+    if not _job:
+        raise BaseHTTPException(
+            error_enum=ErrorCodeEnum.NOT_FOUND,
+            message=f"Not found job with '{job_id}' ID!",
+        )
+
+    return _job
+
+
+@router.post(
+    "/",
+    summary="Create Job",
+    status_code=202,
+    response_model=ResJobPM,
+    responses={400: {}, 422: {}, 503: {}},
+)
+async def create_job(
+    request: Request,
+    job_in: JobCreatePM = Body(
+        ...,
+        title="Job data",
+        description="Job to run in background.",
+    ),
+):
+    _request_id = request.state.request_id
+    logger.info(f"[{_request_id}] - Creating job with '{job_in.name}' name...")
+
+    _pool = _get_pool(request)
+    try:
+        _job: JobPM = await _pool.submit(
+            name=job_in.name, params=job_in.params, max_retries=job_in.max_retries
+        )
+
+        logger.success(f"[{_request_id}] - Successfully queued job with '{_job.id}' ID.")
+    except LookupError:
+        raise BaseHTTPException(
+            error_enum=ErrorCodeEnum.BAD_REQUEST,
+            message=f"Unknown '{job_in.name}' job name!",
+            detail={"available_names": get_job_names()},
+        )
+    except TypeError as err:
+        raise BaseHTTPException(
+            error_enum=ErrorCodeEnum.UNPROCESSABLE_ENTITY,
+            message=f"Invalid parameters of '{job_in.name}' job!",
+            detail={"error": str(err)},
+        )
+    except JobQueueFullError:
+        raise BaseHTTPException(
+            error_enum=ErrorCodeEnum.JOB_QUEUE_FULL,
+            headers={"Retry-After": str(max(int(config.api.jobs.poll_interval), 1))},
+        )
+    except Exception as err:
+        if isinstance(err, HTTPException):
+            raise
+
+        logger.error(f"[{_request_id}] - Failed to create job with '{job_in.name}' name!")
+        raise
+
+    _response = BaseResponse(
+        request=request,
+        status_code=202,
+        headers={"Location": str(request.url_for("get_job", job_id=_job.id))},
+        message="Successfully queued job.",
+        content=_job,
+        response_schema=ResJobPM,
+    )
+    return _response
+
+
+@router.get(
+    "/{job_id}",
+    summary="Get Job",
+    response_model=ResJobPM,
+    responses={404: {}, 422: {}, 503: {}},
+)
+async def get_job(
+    request: Request,
+    job_id: constr(strip_whitespace=True) = Path(  # type: ignore
+        ...,
+        min_length=8,
+        max_length=64,
+        pattern=ALPHANUM_HYPHEN_REGEX,
+        title="Job ID",
+        description="Job ID to get status.",
+        examples=["1701388800_dc2cc6c9033c4837b6c34c8bb19bb289"],
+    ),
+):
+    _request_id = request.state.request_id
+    logger.info(f"[{_request_id}] - Getting job with '{job_id}' ID...")
+
+    _job = await _get_job(request, job_id)
+    ## Result can be large, it's returned only by the result endpoint:
+    _job.result = None
+
+    logger.success(f"[{_request_id}] - Successfully retrieved job with '{job_id}' ID.")
+    _response = BaseResponse(
+        request=request,
+        message=f"Job is {_job.status.value}.",
+        content=_job,
+        response_schema=ResJobPM,
+    )
+    return _response
+
+
+@router.get(
+    "/{job_id}/result",
+    summary="Get Job Result",
+    response_model=ResJobResultPM,
+    responses={404: {}, 409: {}, 422: {}, 503: {}},
+)
+async def get_job_result(
+    request: Request,
+    job_id: constr(strip_whitespace=True) = Path(  # type: ignore
+        ...,
+        min_length=8,
+        max_length=64,
+        pattern=ALPHANUM_HYPHEN_REGEX,
+        title="Job ID",
+        description="Job ID to get result.",
+        examples=["1701388800_dc2cc6c9033c4837b6c34c8bb19bb289"],
+    ),
+):
+    _request_id = request.state.request_id
+    logger.info(f"[{_request_id}] - Getting result of job with '{job_id}' ID...")
+
+    _job = await _get_job(request, job_id)
+    if _job.status == JobStatusEnum.failed:
+        raise BaseHTTPException(
+            error_enum=ErrorCodeEnum.CONFLICT,
+            message=f"Job with '{job_id}' ID failed after {_job.attempts} attempt(s)!",
+            detail={"error": _job.error},
+        )
+
+    if _job.status != JobStatusEnum.succeeded:
+        raise BaseHTTPException(
+            error_enum=ErrorCodeEnum.CONFLICT,
+            message=f"Job with '{job_id}' ID is {_job.status.value}, result is not ready!",
+            headers={"Retry-After": str(max(int(config.api.jobs.poll_interval), 1))},
+        )
+
+    logger.success(
+        f"[{_request_id}] - Successfully retrieved result of job with '{job_id}' ID."
+    )
+    _response = BaseResponse(
+        request=request,
+        message="Successfully retrieved job result.",
+        content=JobResultPM(id=_job.id, status=_job.status, result=_job.result),
+        response_schema=ResJobResultPM,
+    )
+    return _response
+
+
+__all__ = ["router"]
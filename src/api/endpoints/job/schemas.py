@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any, Dict, Optional, Union
+
+from pydantic import Field, constr
+
+from api.core.constants import JobStatusEnum
+from api.core.jobs import JobPM
+from api.core.schemas import BasePM, BaseResPM
+
+
+## Jobs
+class JobCreatePM(BasePM):
+    name: constr(strip_whitespace=True) = Field(  # type: ignore
+        ...,
+        min_length=2,
+        max_length=128,
+        title="Job name",
+        description="Registered name of the job handler.",
+        examples=["tasks.report"],
+    )
+    params: Dict[str, Any] = Field(
+        default_factory=dict,
+        title="Job parameters",
+        description="Keyword arguments of the job handler.",
+        examples=[{"min_point": 50}],
+    )
+    max_retries: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=100,
+        title="Maximum retries",
+        description="Retries of a failed job, server default if null.",
+        examples=[3],
+    )
+
+
+class JobResultPM(BasePM):
+    id: str = Field(
+        ...,
+        title="ID",
+        description="Job ID.",
+        examples=["1701388800_dc2cc6c9033c4837b6c34c8bb19bb289"],
+    )
+    status: JobStatusEnum = Field(
+        ...,
+        title="Job status",
+        description="Status of the job.",
+        examples=["succeeded"],
+    )
+    result: Any = Field(
+        default=None,
+        title="Job result",
+        description="JSON result of the job handler.",
+        examples=[{"count": 100}],
+    )
+
+
+class ResJobPM(BaseResPM):
+    data: Union[JobPM, None] = Field(
+        default=None,
+        title="Job data",
+        description="Job status as a main data, result is returned by the result endpoint.",
+        examples=[
+            {
+                "id": "1701388800_dc2cc6c9033c4837b6c34c8bb19bb289",
+                "name": "tasks.report",
+                "params": {"min_point": 50},
+                "status": "queued",
+                "attempts": 0,
+                "max_attempts": 4,
+                "result": None,
+                "error": None,
+                "run_at": "2021-01-01T00:00:00+00:00",
+                "started_at": None,
+                "finished_at": None,
+                "updated_at": "2021-01-01T00:00:00+00:00",
+                "created_at": "2021-01-01T00:00:00+00:00",
+            }
+        ],
+    )
+
+
+class ResJobResultPM(BaseResPM):
+    data: Union[JobResultPM, None] = Field(
+        default=None,
+        title="Job result data",
+        description="Result of the succeeded job as a main data.",
+        examples=[
+            {
+                "id": "1701388800_dc2cc6c9033c4837b6c34c8bb19bb289",
+                "status": "succeeded",
+                "result": {"count": 51, "avg_point": 75.0},
+            }
+        ],
+    )
+
+
+## Jobs
+
+
+__all__ = [
+    "JobCreatePM",
+    "JobResultPM",
+    "ResJobPM",
+    "ResJobResultPM",
+]
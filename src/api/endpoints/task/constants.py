@@ -1 +1,20 @@
 # -*- coding: utf-8 -*-
+
+from enum import Enum
+
+
+class TaskOpEnum(str, Enum):
+    create = "create"
+    get = "get"
+    update = "update"
+    delete = "delete"
+    list = "list"
+
+
+## Comma separated sort fields of task list, `-` prefix is descending, e.g. 'point,-created_at':
+TASK_SORT_REGEX = r"^-?(name|point|created_at|updated_at)(,-?(name|point|created_at|updated_at)){0,3}$"
+## Comma separated response fields of task list, e.g. 'name,point':
+TASK_FIELDS_REGEX = r"^(id|name|point|created_at|updated_at|links)(,(id|name|point|created_at|updated_at|links))*$"
+
+
+__all__ = ["TaskOpEnum", "TASK_SORT_REGEX", "TASK_FIELDS_REGEX"]
@@ -1 +1,103 @@
 # -*- coding: utf-8 -*-
+
+from typing import Any, Dict, List, Union
+
+from pydantic import ValidationError
+
+from api.core.constants import ErrorCodeEnum
+from api.core.exceptions import BaseHTTPException
+from api.helpers.websocket import make_ws_error
+from api.logger import logger
+
+from .constants import TaskOpEnum
+from .schemas import TaskBasePM, TaskUpPM, TaskPM, TaskOpPM, TaskListParamsPM
+from . import service
+
+
+def _run_op(request_id: str, op: TaskOpPM) -> Dict[str, Any]:
+    _data = op.data or {}
+    if op.op == TaskOpEnum.create:
+        _task = service.create(request_id=request_id, task_in=TaskBasePM(**_data))
+        return {"ref": op.ref, "status": 201, "data": _task}
+
+    if op.op == TaskOpEnum.get:
+        _task: Union[TaskPM, None] = service.get(request_id=request_id, id=op.id)
+        if not _task:
+            raise BaseHTTPException(
+                error_enum=ErrorCodeEnum.NOT_FOUND,
+                message=f"Not found task with '{op.id}' ID!",
+            )
+
+        return {"ref": op.ref, "status": 200, "data": _task}
+
+    if op.op == TaskOpEnum.update:
+        _task = service.update(
+            request_id=request_id,
+            id=op.id,
+            **TaskUpPM(**_data).model_dump(exclude_unset=True),
+        )
+        return {"ref": op.ref, "status": 200, "data": _task}
+
+    if op.op == TaskOpEnum.delete:
+        service.delete(request_id=request_id, id=op.id)
+        return {"ref": op.ref, "status": 204}
+
+    _params = TaskListParamsPM(**_data)
+    _task_list, _all_count = service.get_list(
+        request_id=request_id,
+        offset=_params.skip,
+        limit=_params.limit,
+        **_params.model_dump(exclude={"skip", "limit"}),
+    )
+    return {
+        "ref": op.ref,
+        "status": 200,
+        "data": _task_list,
+        "meta": {"list_count": len(_task_list), "all_count": _all_count},
+    }
+
+
+def run_ops(request_id: str, ops: List[Any]) -> List[Dict[str, Any]]:
+    """Run task operations of WebSocket messages in order, one result per operation.
+    Failed operations get an error result and don't stop the others.
+
+    Args:
+        request_id (str      , required): ID of the connection.
+        ops        (List[Any], required): Parsed operation objects, e.g. `{"ref": 1, "op": "get", "id": "..."}`.
+
+    Returns:
+        List[Dict[str, Any]]: Results, e.g. `{"ref": 1, "status": 200, "data": {...}}`.
+    """
+
+    _results: List[Dict[str, Any]] = []
+    for _op in ops:
+        _ref = _op.get("ref") if isinstance(_op, dict) else None
+        try:
+            _results.append(_run_op(request_id=request_id, op=TaskOpPM.model_validate(_op)))
+        except ValidationError as err:
+            _results.append(
+                make_ws_error(
+                    ErrorCodeEnum.UNPROCESSABLE_ENTITY,
+                    ref=_ref,
+                    detail=err.errors(include_url=False, include_context=False),
+                )
+            )
+        except BaseHTTPException as err:
+            _results.append(
+                {
+                    "ref": _ref,
+                    "status": err.status_code,
+                    "error": {
+                        "code": err.detail["error"]["code"],
+                        "message": err.detail["message"],
+                    },
+                }
+            )
+        except Exception:
+            logger.exception(f"[{request_id}] - Failed to run task operation!")
+            _results.append(make_ws_error(ErrorCodeEnum.INTERNAL_SERVER_ERROR, ref=_ref))
+
+    return _results
+
+
+__all__ = ["run_ops"]
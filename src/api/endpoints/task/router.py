@@ -1,21 +1,49 @@
 # -*- coding: utf-8 -*-
 
-from typing import List, Tuple, Union
-
-from fastapi import APIRouter, Request, Path, Body, Query, HTTPException
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Tuple, Union
+
+from fastapi import (
+    APIRouter,
+    Request,
+    Path,
+    Body,
+    Query,
+    Header,
+    Depends,
+    HTTPException,
+    WebSocket,
+)
+from fastapi.responses import StreamingResponse
 from pydantic import constr
 
 from api.core.constants import ALPHANUM_HYPHEN_REGEX, ErrorCodeEnum
+from api.config import config
 from api.core import utils
 from api.core.exceptions import BaseHTTPException
-from api.core.responses import BaseResponse
+from api.core.concurrency import thread_pools
+from api.core.dependencies.auth import auth_ws_jwt
+from api.core.events import EventSubscribersLimitError
+from api.core.responses import (
+    BaseResponse,
+    ResponseCache,
+    ResponseCacheEntry,
+    single_flight,
+)
+from api.helpers.websocket import WebSocketBatchServer
 from api.logger import logger
 
+from .constants import TASK_SORT_REGEX, TASK_FIELDS_REGEX
 from .schemas import TaskBasePM, TaskPM, TaskUpPM, ResTaskPM, ResTasksPM
-from . import service
+from . import service, handlers
 
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
+_response_cache = ResponseCache(**config.api.cache.response.model_dump())
+_ws_server = WebSocketBatchServer(
+    **config.api.websocket.model_dump(exclude={"enabled", "allow_query_token"})
+)
 
 
 @router.get(
@@ -24,6 +52,8 @@ router = APIRouter(prefix="/tasks", tags=["Tasks"])
     response_model=ResTasksPM,
     responses={422: {}},
 )
+@single_flight()
+@thread_pools.route("tasks")
 def get_tasks(
     request: Request,
     skip: int = Query(
@@ -44,13 +74,97 @@ def get_tasks(
     is_desc: bool = Query(
         default=True,
         title="Sort Direction",
-        description="Is sort descending or ascending.",
+        description="Is sort descending or ascending (by creation order, when `sort` is not set).",
         examples=[True],
     ),
+    name_prefix: Union[str, None] = Query(
+        default=None,
+        min_length=1,
+        max_length=64,
+        title="Name prefix",
+        description="Case-insensitive prefix of task name.",
+        examples=["Task 1"],
+    ),
+    name_contains: Union[str, None] = Query(
+        default=None,
+        min_length=1,
+        max_length=64,
+        title="Name contains",
+        description="Case-insensitive part of task name.",
+        examples=["report"],
+    ),
+    min_point: Union[int, None] = Query(
+        default=None,
+        ge=0,
+        le=100,
+        title="Minimum point",
+        description="Minimum point of tasks (inclusive).",
+        examples=[50],
+    ),
+    max_point: Union[int, None] = Query(
+        default=None,
+        ge=0,
+        le=100,
+        title="Maximum point",
+        description="Maximum point of tasks (inclusive).",
+        examples=[100],
+    ),
+    created_from: Union[datetime, None] = Query(
+        default=None,
+        title="Created from",
+        description="Minimum creation time (inclusive), UTC if timezone is not set.",
+        examples=["2021-01-01T00:00:00Z"],
+    ),
+    created_to: Union[datetime, None] = Query(
+        default=None,
+        title="Created to",
+        description="Maximum creation time (inclusive), UTC if timezone is not set.",
+        examples=["2021-12-31T23:59:59Z"],
+    ),
+    updated_from: Union[datetime, None] = Query(
+        default=None,
+        title="Updated from",
+        description="Minimum update time (inclusive), UTC if timezone is not set.",
+        examples=["2021-01-01T00:00:00Z"],
+    ),
+    updated_to: Union[datetime, None] = Query(
+        default=None,
+        title="Updated to",
+        description="Maximum update time (inclusive), UTC if timezone is not set.",
+        examples=["2021-12-31T23:59:59Z"],
+    ),
+    sort: Union[str, None] = Query(
+        default=None,
+        max_length=128,
+        pattern=TASK_SORT_REGEX,
+        title="Sort",
+        description="Comma separated sort fields (`name`, `point`, `created_at`, `updated_at`), "
+        "`-` prefix is descending.",
+        examples=["-point,created_at"],
+    ),
+    fields: Union[str, None] = Query(
+        default=None,
+        max_length=128,
+        pattern=TASK_FIELDS_REGEX,
+        title="Fields",
+        description="Comma separated fields of tasks to return, `id` is always returned.",
+        examples=["name,point"],
+    ),
 ):
     _request_id = request.state.request_id
     logger.info(f"[{_request_id}] - Getting task list...")
 
+    _version = service.get_version()
+    _cache_key = _response_cache.make_key(request)
+    _cache_entry: Union[ResponseCacheEntry, None] = _response_cache.get(
+        key=_cache_key, version=_version
+    )
+    if _cache_entry:
+        logger.success(f"[{_request_id}] - Successfully retrieved task list from cache.")
+        return _response_cache.make_response(
+            request=request, entry=_cache_entry, response_schema=ResTasksPM
+        )
+
     _message = "Not found any task!"
     _task_list: List[TaskPM] = []
     _links = {
@@ -63,7 +177,19 @@ def get_tasks(
     _all_count = 0
     try:
         _result_tuple: Tuple[List[TaskPM], int] = service.get_list(
-            request_id=_request_id, offset=skip, limit=(limit + 1), is_desc=is_desc
+            request_id=_request_id,
+            offset=skip,
+            limit=(limit + 1),
+            is_desc=is_desc,
+            name_prefix=name_prefix,
+            name_contains=name_contains,
+            min_point=min_point,
+            max_point=max_point,
+            created_from=created_from,
+            created_to=created_to,
+            updated_from=updated_from,
+            updated_to=updated_to,
+            sort=sort,
         )
         _task_list, _all_count = _result_tuple
 
@@ -107,8 +233,9 @@ def get_tasks(
         logger.error(f"[{_request_id}] - Failed to get task list!")
         raise
 
-    _response = BaseResponse(
-        request=request,
+    _cache_entry = _response_cache.set(
+        key=_cache_key,
+        version=_version,
         message=_message,
         content=_task_list,
         links=_links,
@@ -117,6 +244,11 @@ def get_tasks(
             "all_count": _all_count,
         },
         response_schema=ResTasksPM,
+        ## Unrequested fields are skipped by the serializer:
+        include={"__all__": {"id", *fields.split(",")}} if fields else None,
+    )
+    _response = _response_cache.make_response(
+        request=request, entry=_cache_entry, response_schema=ResTasksPM
     )
     return _response
 
@@ -128,6 +260,7 @@ def get_tasks(
     response_model=ResTaskPM,
     responses={422: {}},
 )
+@thread_pools.route("tasks")
 def create_task(
     request: Request,
     task_in: TaskBasePM = Body(
@@ -165,12 +298,91 @@ def create_task(
     return _response
 
 
+@router.get(
+    "/events",
+    summary="Stream Task Events",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"text/event-stream": {}},
+            "description": "`task.created`, `task.updated` and `task.deleted` events, `reset` when events were missed.",
+        },
+        503: {},
+    },
+    include_in_schema=config.api.events.enabled,
+)
+async def stream_task_events(
+    request: Request,
+    last_event_id: Union[str, None] = Header(
+        default=None,
+        max_length=64,
+        title="Last event ID",
+        description="ID of the last received event, sent by `EventSource` when reconnecting.",
+        examples=["9f86d081-42"],
+    ),
+):
+    _request_id = request.state.request_id
+    if not config.api.events.enabled:
+        raise BaseHTTPException(error_enum=ErrorCodeEnum.NOT_FOUND)
+
+    try:
+        _subscriber = service.task_events.subscribe(last_event_id=last_event_id)
+    except EventSubscribersLimitError:
+        raise BaseHTTPException(
+            error_enum=ErrorCodeEnum.SERVICE_UNAVAILABLE,
+            message="Too many task event subscribers!",
+            headers={"Retry-After": str(max(config.api.events.retry // 1000, 1))},
+        )
+
+    logger.info(
+        f"[{_request_id}] - Streaming task events, subscribers: {len(service.task_events)}."
+    )
+    _response = StreamingResponse(
+        service.task_events.stream(
+            _subscriber,
+            heartbeat=config.api.events.heartbeat,
+            retry=config.api.events.retry,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    return _response
+
+
+@router.websocket("/ws", name="task_ops_ws")
+async def task_ops_ws(websocket: WebSocket, auth_payload: Dict[str, Any] = Depends(auth_ws_jwt)):
+    """Task CRUD operations over one WebSocket connection, authenticated once with the access token (JWT).
+    Messages are arrays of `{"ref": 1, "op": "create|get|update|delete|list", "id": "...", "data": {...}}`
+    operations, results are sent in batches as arrays of `{"ref": 1, "status": 200, "data": {...}}`.
+    """
+
+    _request_id = websocket.headers.get("X-Request-ID") or uuid.uuid4().hex
+
+    async def _run_ops(ops: List[Any]) -> List[Dict[str, Any]]:
+        ## One threadpool call per batch instead of per operation:
+        return await thread_pools.run_sync("tasks", handlers.run_ops, _request_id, ops)
+
+    logger.info(
+        f"[{_request_id}] - Task operations WebSocket connected, user: '{websocket.state.user_id}', "
+        f"connections: {len(_ws_server) + 1}."
+    )
+    await _ws_server.serve(
+        websocket,
+        _run_ops,
+        expires_at=auth_payload.get("exp"),
+        subprotocol=websocket.state.subprotocol,
+    )
+    logger.info(f"[{_request_id}] - Task operations WebSocket closed.")
+
+
 @router.get(
     "/{task_id}",
     summary="Get Task",
     response_model=ResTaskPM,
     responses={404: {}, 422: {}},
 )
+@single_flight()
+@thread_pools.route("tasks")
 def get_task(
     request: Request,
     task_id: constr(strip_whitespace=True) = Path(  # type: ignore
@@ -186,13 +398,26 @@ def get_task(
     _request_id = request.state.request_id
     logger.info(f"[{_request_id}] - Getting task with '{task_id}' ID...")
 
+    _version = service.get_version()
+    _cache_key = _response_cache.make_key(request)
+    _cache_entry: Union[ResponseCacheEntry, None] = _response_cache.get(
+        key=_cache_key, version=_version
+    )
+    if _cache_entry:
+        logger.success(
+            f"[{_request_id}] - Successfully retrieved task with '{task_id}' ID from cache."
+        )
+        return _response_cache.make_response(
+            request=request, entry=_cache_entry, response_schema=ResTaskPM
+        )
+
     try:
         _task: Union[TaskPM, None] = service.get(request_id=_request_id, id=task_id)
 
         if not _task:
             raise BaseHTTPException(
                 error_enum=ErrorCodeEnum.NOT_FOUND,
-                message=f"Not found task with '{id}' ID!",
+                message=f"Not found task with '{task_id}' ID!",
             )
 
         logger.success(
@@ -205,11 +430,17 @@ def get_task(
         logger.error(f"[{_request_id}] - Failed to get task with '{task_id}' ID!")
         raise
 
-    _response = BaseResponse(
-        request=request,
+    _cache_entry = _response_cache.set(
+        key=_cache_key,
+        version=_version,
         message="Successfully retrieved task info.",
         content=_task,
         response_schema=ResTaskPM,
+        ## Strong ETag from the entity itself, changes on every update:
+        etag=f"{_task.id}-{int(_task.updated_at.timestamp() * 1_000_000)}",
+    )
+    _response = _response_cache.make_response(
+        request=request, entry=_cache_entry, response_schema=ResTaskPM
     )
     return _response
 
@@ -220,6 +451,7 @@ def get_task(
     response_model=ResTaskPM,
     responses={404: {}, 422: {}},
 )
+@thread_pools.route("tasks")
 def update_task(
     request: Request,
     task_id: constr(strip_whitespace=True) = Path(  # type: ignore
@@ -270,6 +502,7 @@ def update_task(
     status_code=204,
     responses={404: {}, 422: {}},
 )
+@thread_pools.route("tasks")
 def delete_task(
     request: Request,
     task_id: str = Path(
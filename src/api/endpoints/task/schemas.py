@@ -1,14 +1,17 @@
 # -*- coding: utf-8 -*-
 
-from typing import Union, List, Optional
+from datetime import datetime
+from typing import Any, Dict, Union, List, Optional
 from typing_extensions import Self
 
-from pydantic import Field, model_validator, ConfigDict
+from pydantic import Field, model_validator, ConfigDict, StrictInt, constr
 
-from api.core.constants import ALPHANUM_EXTEND_REGEX
+from api.core.constants import ALPHANUM_EXTEND_REGEX, ALPHANUM_HYPHEN_REGEX
 from api.config import config
 from api.core.schemas import IdPM, TimestampPM, BasePM, BaseResPM, LinksResPM
 
+from .constants import TaskOpEnum, TASK_SORT_REGEX
+
 
 _tasks_base_url = f"{config.api.prefix}/tasks"
 
@@ -120,10 +123,79 @@ class ResTasksPM(BaseResPM):
 ## Tasks
 
 
+## WebSocket operations
+class TaskOpPM(BasePM):
+    ref: Union[StrictInt, constr(max_length=64), None] = Field(  # type: ignore
+        default=None,
+        title="Reference",
+        description="Client reference of the operation, returned with its result.",
+        examples=[1],
+    )
+    op: TaskOpEnum = Field(
+        ...,
+        title="Operation",
+        description="Operation name.",
+        examples=[TaskOpEnum.get],
+    )
+    id: Optional[
+        constr(strip_whitespace=True, min_length=8, max_length=64, pattern=ALPHANUM_HYPHEN_REGEX)  # type: ignore
+    ] = Field(
+        default=None,
+        title="Task ID",
+        description="Task ID for 'get', 'update' and 'delete' operations.",
+        examples=["1701388800_a0dc99d68d5e427eafe00525fac47012"],
+    )
+    data: Optional[Dict[str, Any]] = Field(
+        default=None,
+        title="Operation data",
+        description="Task data for 'create' and 'update', or list parameters for 'list' operations.",
+        examples=[{"name": "Task 1", "point": 70}],
+    )
+
+    @model_validator(mode="after")
+    def _check_all(self) -> Self:
+        if (self.op in (TaskOpEnum.get, TaskOpEnum.update, TaskOpEnum.delete)) and (
+            not self.id
+        ):
+            raise ValueError(f"`id` is required for '{self.op.value}' operation!")
+
+        return self
+
+
+class TaskListParamsPM(BasePM):
+    skip: int = Field(default=0, ge=0, title="Skip", description="Number of data to skip.")
+    limit: int = Field(
+        default=100, ge=1, le=1000, title="Limit", description="Limit of data list."
+    )
+    is_desc: bool = Field(
+        default=True, title="Sort Direction", description="Is sort descending or ascending."
+    )
+    name_prefix: Optional[str] = Field(default=None, min_length=1, max_length=64)
+    name_contains: Optional[str] = Field(default=None, min_length=1, max_length=64)
+    min_point: Optional[int] = Field(default=None, ge=0, le=100)
+    max_point: Optional[int] = Field(default=None, ge=0, le=100)
+    created_from: Optional[datetime] = Field(default=None)
+    created_to: Optional[datetime] = Field(default=None)
+    updated_from: Optional[datetime] = Field(default=None)
+    updated_to: Optional[datetime] = Field(default=None)
+    sort: Optional[str] = Field(
+        default=None,
+        max_length=128,
+        pattern=TASK_SORT_REGEX,
+        title="Sort",
+        description="Comma separated sort fields, `-` prefix is descending.",
+    )
+
+
+## WebSocket operations
+
+
 __all__ = [
     "TaskBasePM",
     "TaskUpPM",
     "TaskPM",
     "ResTaskPM",
     "ResTasksPM",
+    "TaskOpPM",
+    "TaskListParamsPM",
 ]
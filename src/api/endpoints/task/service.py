@@ -1,22 +1,135 @@
 # -*- coding: utf-8 -*-
 
-from typing import List, Tuple, Union
+import threading
+import functools
+import itertools
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from pydantic import validate_call
+from pydantic import validate_call, conint, constr
 
 from api.core.constants import ErrorCodeEnum, WarnEnum
+from api.config import config
 from api.core import utils
+from api.core.events import EventBroadcaster
+from api.core.indexes import PrefixTrie, SortedIndex
 from api.core.exceptions import BaseHTTPException
+from api.core.jobs import register_job
 from api.logger import log_mode
 
+from .constants import TASK_SORT_REGEX
 from .schemas import TaskPM, TaskBasePM
 
 
 ## NOTE: This is a mock database for demonstration purposes.
 _TASKS_DB: List[TaskPM] = []
-for _i in range(1, 101):
-    _task = TaskPM(name=f"Task {_i}", point=_i)
-    _TASKS_DB.append(_task)
+
+## Secondary indexes, items are insertion sequences of tasks (stable order of equal keys):
+_INDEX_LOCK = threading.Lock()
+_SEQ_COUNTER = itertools.count(1)
+_SEQS: Dict[str, int] = {}
+_TASKS_BY_SEQ: Dict[int, TaskPM] = {}
+_NAME_INDEX = PrefixTrie()
+_POINT_INDEX = SortedIndex()
+_CREATED_AT_INDEX = SortedIndex()
+_UPDATED_AT_INDEX = SortedIndex()
+_SORT_INDEXES: Dict[str, SortedIndex] = {
+    "point": _POINT_INDEX,
+    "created_at": _CREATED_AT_INDEX,
+    "updated_at": _UPDATED_AT_INDEX,
+}
+_SORT_KEYS: Dict[str, Callable[[Tuple[int, TaskPM]], Any]] = {
+    "name": lambda _item: _item[1].name.casefold(),
+    "point": lambda _item: _item[1].point,
+    "created_at": lambda _item: _item[1].created_at.timestamp(),
+    "updated_at": lambda _item: _item[1].updated_at.timestamp(),
+}
+
+
+def _index_task(seq: int, task: TaskPM) -> None:
+    """Add task to the secondary indexes, call it under `_INDEX_LOCK`."""
+
+    _NAME_INDEX.add(task.name, seq)
+    _POINT_INDEX.add(task.point, seq)
+    _CREATED_AT_INDEX.add(task.created_at.timestamp(), seq)
+    _UPDATED_AT_INDEX.add(task.updated_at.timestamp(), seq)
+    return
+
+
+def _unindex_task(seq: int, task: TaskPM) -> None:
+    """Remove task from the secondary indexes before it's changed or deleted, call it under `_INDEX_LOCK`."""
+
+    _NAME_INDEX.remove(task.name, seq)
+    _POINT_INDEX.remove(task.point, seq)
+    _CREATED_AT_INDEX.remove(task.created_at.timestamp(), seq)
+    _UPDATED_AT_INDEX.remove(task.updated_at.timestamp(), seq)
+    return
+
+
+def _add_task(task: TaskPM) -> None:
+    """Add task to the database and indexes, call it under `_INDEX_LOCK`."""
+
+    _seq = next(_SEQ_COUNTER)
+    _TASKS_DB.append(task)
+    _SEQS[task.id] = _seq
+    _TASKS_BY_SEQ[_seq] = task
+    _index_task(_seq, task)
+    return
+
+
+with _INDEX_LOCK:
+    for _i in range(1, 101):
+        _add_task(TaskPM(name=f"Task {_i}", point=_i))
+
+## Data version for cache invalidation, changed under `_INDEX_LOCK` together with the data:
+_DB_VERSION: int = 0
+
+## Change feed of create/update/delete, streamed by `GET /tasks/events`:
+task_events = EventBroadcaster(
+    **config.api.events.model_dump(include={"buffer_size", "queue_size", "max_subscribers"})
+)
+
+
+def get_version() -> int:
+    """Get current data version, changes after every create/update/delete.
+
+    Returns:
+        int: Current data version.
+    """
+
+    return _DB_VERSION
+
+
+def _bump_version() -> None:
+    """Bump data version, call it under `_INDEX_LOCK` after the data is mutated.
+    Concurrent mutations can't store an older version over a newer one."""
+
+    global _DB_VERSION
+    _DB_VERSION += 1
+    return
+
+
+def _to_ts(dt: Optional[datetime]) -> Union[float, None]:
+    if dt is None:
+        return None
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+
+    return dt.timestamp()
+
+
+def _sort_tasks(
+    items: List[Tuple[int, TaskPM]], sort_keys: List[Tuple[str, bool]]
+) -> List[Tuple[int, TaskPM]]:
+    """Sort (sequence, task) pairs by multiple keys, ties keep insertion order in direction of the first key."""
+
+    items.sort(key=lambda _item: _item[0], reverse=sort_keys[0][1])
+    ## Stable sorts from the last key to the first:
+    for _field, _is_desc in reversed(sort_keys):
+        items.sort(key=_SORT_KEYS[_field], reverse=_is_desc)
+
+    return items
 
 
 @validate_call
@@ -25,16 +138,41 @@ def get_list(
     offset: int = 0,
     limit: int = 100,
     is_desc: bool = True,
+    name_prefix: Optional[str] = None,
+    name_contains: Optional[str] = None,
+    min_point: Optional[int] = None,
+    max_point: Optional[int] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    updated_from: Optional[datetime] = None,
+    updated_to: Optional[datetime] = None,
+    sort: Optional[constr(pattern=TASK_SORT_REGEX)] = None,  # type: ignore
     warn_mode: WarnEnum = WarnEnum.IGNORE,
 ) -> Tuple[List[TaskPM], int]:
-    """Get list of tasks and total count.
+    """Get filtered and sorted list of tasks and total count of matched tasks.
+
+    Candidates are taken from the most selective secondary index (name prefix trie, point or timestamp
+    sorted indexes) and checked against the other filters. Without filters, a single sort field with a sorted
+    index is read in order and only `offset + limit` tasks are taken.
 
     Args:
-        request_id    (str         , required): ID of the request.
-        offset        (int         , optional): Offset of the query. Defaults to 0.
-        limit         (int         , optional): Limit of the query. Defaults to 100.
-        is_desc       (bool        , optional): Is descending or ascending. Defaults to True.
-        warn_mode     (WarnEnum    , optional): Warning mode. Defaults to `WarnEnum.IGNORE`.
+        request_id    (str               , required): ID of the request.
+        offset        (int               , optional): Offset of the query. Defaults to 0.
+        limit         (int               , optional): Limit of the query. Defaults to 100.
+        is_desc       (bool              , optional): Is descending or ascending insertion order, when `sort` is
+                                                      not set. Defaults to True.
+        name_prefix   (Optional[str]     , optional): Case-insensitive name prefix. Defaults to None.
+        name_contains (Optional[str]     , optional): Case-insensitive name substring. Defaults to None.
+        min_point     (Optional[int]     , optional): Minimum point (inclusive). Defaults to None.
+        max_point     (Optional[int]     , optional): Maximum point (inclusive). Defaults to None.
+        created_from  (Optional[datetime], optional): Minimum creation time (inclusive, UTC if naive).
+                                                      Defaults to None.
+        created_to    (Optional[datetime], optional): Maximum creation time (inclusive). Defaults to None.
+        updated_from  (Optional[datetime], optional): Minimum update time (inclusive). Defaults to None.
+        updated_to    (Optional[datetime], optional): Maximum update time (inclusive). Defaults to None.
+        sort          (Optional[str]     , optional): Comma separated sort fields, `-` prefix is descending,
+                                                      e.g. 'point,-created_at'. Defaults to None.
+        warn_mode     (WarnEnum          , optional): Warning mode. Defaults to `WarnEnum.IGNORE`.
 
     Returns:
         Tuple[List[TaskPM], int]: List of tasks and total count as tuple.
@@ -42,12 +180,92 @@ def get_list(
 
     log_mode(message=f"[{request_id}] - Getting task list...", warn_mode=warn_mode)
 
-    _task_list: List[TaskPM] = _TASKS_DB
-    _all_count = len(_task_list)
-    if is_desc:
-        _task_list = _task_list[::-1]
-
-    _task_list = _task_list[offset : offset + limit]
+    _sort_keys: List[Tuple[str, bool]] = []
+    if sort:
+        _sort_keys = [
+            (_field.lstrip("-"), _field.startswith("-")) for _field in sort.split(",")
+        ]
+
+    _ranges: List[Tuple[SortedIndex, Any, Any]] = []
+    if (min_point is not None) or (max_point is not None):
+        _ranges.append((_POINT_INDEX, min_point, max_point))
+
+    _created_range = (_to_ts(created_from), _to_ts(created_to))
+    if _created_range != (None, None):
+        _ranges.append((_CREATED_AT_INDEX, *_created_range))
+
+    _updated_range = (_to_ts(updated_from), _to_ts(updated_to))
+    if _updated_range != (None, None):
+        _ranges.append((_UPDATED_AT_INDEX, *_updated_range))
+
+    _name_prefix = name_prefix.casefold() if name_prefix else None
+    _name_contains = name_contains.casefold() if name_contains else None
+
+    def _is_match(task: TaskPM) -> bool:
+        _name = task.name.casefold()
+        if _name_prefix and (not _name.startswith(_name_prefix)):
+            return False
+
+        if _name_contains and (_name_contains not in _name):
+            return False
+
+        if (min_point is not None) and (task.point < min_point):
+            return False
+
+        if (max_point is not None) and (max_point < task.point):
+            return False
+
+        for _ts, (_min_ts, _max_ts) in (
+            (task.created_at.timestamp(), _created_range),
+            (task.updated_at.timestamp(), _updated_range),
+        ):
+            if ((_min_ts is not None) and (_ts < _min_ts)) or (
+                (_max_ts is not None) and (_max_ts < _ts)
+            ):
+                return False
+
+        return True
+
+    with _INDEX_LOCK:
+        if (not _ranges) and (not _name_prefix) and (not _name_contains):
+            _all_count = len(_TASKS_DB)
+            if not _sort_keys:
+                _task_list: List[TaskPM] = _TASKS_DB[::-1] if is_desc else _TASKS_DB
+                _task_list = _task_list[offset : offset + limit]
+            elif (len(_sort_keys) == 1) and (_sort_keys[0][0] in _SORT_INDEXES):
+                _field, _is_desc = _sort_keys[0]
+                _seqs = itertools.islice(
+                    _SORT_INDEXES[_field].scan(reverse=_is_desc), offset, offset + limit
+                )
+                _task_list = [_TASKS_BY_SEQ[_seq] for _seq in _seqs]
+            else:
+                _items = _sort_tasks(list(_TASKS_BY_SEQ.items()), _sort_keys)
+                _task_list = [_task for _, _task in _items[offset : offset + limit]]
+        else:
+            ## (candidate count, candidate sequences) of each indexed filter, only the smallest is scanned:
+            _plans: List[Tuple[int, Callable[[], Iterator[int]]]] = [
+                (_index.count(_min_key, _max_key), functools.partial(_index.scan, _min_key, _max_key))
+                for _index, _min_key, _max_key in _ranges
+            ]
+            if _name_prefix:
+                _plans.append(
+                    (_NAME_INDEX.count(_name_prefix), functools.partial(_NAME_INDEX.scan, _name_prefix))
+                )
+
+            _seqs = min(_plans, key=lambda _plan: _plan[0])[1]() if _plans else _TASKS_BY_SEQ
+            _items: List[Tuple[int, TaskPM]] = []
+            for _seq in _seqs:
+                _task = _TASKS_BY_SEQ[_seq]
+                if _is_match(_task):
+                    _items.append((_seq, _task))
+
+            _all_count = len(_items)
+            if _sort_keys:
+                _items = _sort_tasks(_items, _sort_keys)
+            else:
+                _items.sort(key=lambda _item: _item[0], reverse=is_desc)
+
+            _task_list = [_task for _, _task in _items[offset : offset + limit]]
 
     log_mode(
         message=f"[{request_id}] - Successfully retrieved task list.",
@@ -75,7 +293,11 @@ def create(
     log_mode(message=f"[{request_id}] - Creating task...", warn_mode=warn_mode)
 
     _task: TaskPM = TaskPM(**task_in.model_dump())
-    _TASKS_DB.append(_task)
+    with _INDEX_LOCK:
+        _add_task(_task)
+        _bump_version()
+
+    task_events.publish("task.created", _task)
 
     log_mode(
         message=f"[{request_id}] - Successfully created task with '{_task.id}' ID.",
@@ -106,10 +328,7 @@ def get(
         warn_mode=warn_mode,
     )
 
-    _task: Union[TaskPM, None] = None
-    for _task_db in _TASKS_DB:
-        if _task_db.id == id:
-            _task = _task_db
+    _task: Union[TaskPM, None] = _TASKS_BY_SEQ.get(_SEQS.get(id))
 
     if _task:
         log_mode(
@@ -166,11 +385,24 @@ def update(
     if "id" in kwargs:
         del kwargs["id"]
 
-    for _key, _value in kwargs.items():
-        if hasattr(_task, _key):
-            setattr(_task, _key, _value)
+    with _INDEX_LOCK:
+        _seq = _SEQS.get(id)
+        if _seq is None:
+            raise BaseHTTPException(
+                error_enum=ErrorCodeEnum.NOT_FOUND,
+                message=f"Not found task with '{id}' ID!",
+            )
+
+        _unindex_task(_seq, _task)
+        for _key, _value in kwargs.items():
+            if hasattr(_task, _key):
+                setattr(_task, _key, _value)
 
-    _task.updated_at = utils.now_utc_dt()
+        _task.updated_at = utils.now_utc_dt()
+        _index_task(_seq, _task)
+        _bump_version()
+
+    task_events.publish("task.updated", _task)
 
     log_mode(
         message=f"[{request_id}] - Successfully updated task with '{id}' ID.",
@@ -202,16 +434,23 @@ def delete(
         message=f"[{request_id}] - Deleting task with '{id}' ID...", warn_mode=warn_mode
     )
 
-    for _i, _task in enumerate(_TASKS_DB):
-        if _task.id == id:
-            del _TASKS_DB[_i]
+    with _INDEX_LOCK:
+        _seq: Union[int, None] = _SEQS.pop(id, None)
+        if _seq is not None:
+            _task = _TASKS_BY_SEQ.pop(_seq)
+            _unindex_task(_seq, _task)
+            _TASKS_DB.remove(_task)
+            _bump_version()
 
-            log_mode(
-                message=f"[{request_id}] - Successfully deleted task with '{id}' ID.",
-                level="SUCCESS",
-                warn_mode=warn_mode,
-            )
-            return
+    if _seq is not None:
+        task_events.publish("task.deleted", {"id": id})
+
+        log_mode(
+            message=f"[{request_id}] - Successfully deleted task with '{id}' ID.",
+            level="SUCCESS",
+            warn_mode=warn_mode,
+        )
+        return
 
     raise BaseHTTPException(
         error_enum=ErrorCodeEnum.NOT_FOUND,
@@ -219,10 +458,40 @@ def delete(
     )
 
 
+## Runs as a background job (`POST /jobs` with `tasks.report` name), reads the whole task list:
+@register_job("tasks.report")
+@validate_call
+def make_report(min_point: conint(ge=0, le=100) = 0) -> Dict[str, Any]:  # type: ignore
+    """Make a point report of tasks.
+
+    Args:
+        min_point (int, optional): Minimum point of counted tasks. Defaults to 0.
+
+    Returns:
+        Dict[str, Any]: Task count, total, average, minimum and maximum points and data version.
+    """
+
+    _version = get_version()
+    _points = [_task.point for _task in list(_TASKS_DB) if min_point <= _task.point]
+    _count = len(_points)
+    _report = {
+        "count": _count,
+        "total_point": sum(_points),
+        "avg_point": (sum(_points) / _count) if _count else None,
+        "min_point": min(_points, default=None),
+        "max_point": max(_points, default=None),
+        "version": _version,
+    }
+    return _report
+
+
 __all__ = [
+    "task_events",
+    "get_version",
     "get_list",
     "create",
     "get",
     "update",
     "delete",
+    "make_report",
 ]
@@ -0,0 +1,430 @@
+# -*- coding: utf-8 -*-
+
+import os
+import base64
+import binascii
+import mimetypes
+from email.utils import format_datetime
+from typing import Dict, Tuple, Union
+
+from fastapi import APIRouter, Request, Response, Path, Header, HTTPException
+from pydantic import constr
+
+from api.core.constants import ALPHANUM_HYPHEN_REGEX, ErrorCodeEnum
+from api.config import config
+from api.core import utils
+from api.core.exceptions import BaseHTTPException
+from api.core.concurrency import thread_pools
+from api.core.responses import BaseResponse, FileStreamResponse
+from api.logger import logger
+
+from .schemas import UploadPM, ResUploadPM
+from .service import UploadStore
+
+
+## tus protocol (https://tus.io/protocols/resumable-upload) version and supported extensions:
+TUS_VERSION = "1.0.0"
+_TUS_EXTENSIONS = "creation,creation-with-upload,expiration,termination"
+_OFFSET_CONTENT_TYPE = "application/offset+octet-stream"
+
+router = APIRouter(prefix="/uploads", tags=["Uploads"])
+_store = UploadStore(
+    uploads_dir=config.api.paths.uploads_dir,
+    partial_dir=config.api.paths.partial_uploads_dir,
+    **config.api.uploads.model_dump(exclude={"enabled", "download"}),
+)
+
+
+def get_upload_store() -> UploadStore:
+    """Get upload store of the router, e.g. for periodic cleanup.
+
+    Returns:
+        UploadStore: Upload store.
+    """
+
+    return _store
+
+
+def _make_headers(upload: UploadPM) -> Dict[str, str]:
+    _headers = {
+        "Tus-Resumable": TUS_VERSION,
+        "Upload-Offset": str(upload.offset),
+        "Upload-Length": str(upload.length),
+        "Cache-Control": "no-store",
+    }
+    if upload.expires_at:
+        _headers["Upload-Expires"] = format_datetime(upload.expires_at, usegmt=True)
+
+    return _headers
+
+
+def _parse_filename(upload_metadata: Union[str, None]) -> Union[str, None]:
+    """Get file name from `Upload-Metadata` header: comma separated `<key> <base64 value>` pairs."""
+
+    if not upload_metadata:
+        return None
+
+    for _pair in upload_metadata.split(","):
+        _key, _, _value = _pair.strip().partition(" ")
+        if _key != "filename":
+            continue
+
+        try:
+            _filename = base64.b64decode(_value.strip(), validate=True).decode("utf-8")
+        except (binascii.Error, UnicodeDecodeError):
+            raise BaseHTTPException(
+                error_enum=ErrorCodeEnum.BAD_REQUEST,
+                message="Invalid 'filename' in 'Upload-Metadata' header!",
+            )
+
+        ## Only for display and downloads, files are stored by upload ID:
+        _filename = utils.sanitizer.clean_special_chars(
+            _filename.replace("/", "_").replace("\\", "_"), "BASE"
+        ).strip()[:255]
+        return _filename or None
+
+    return None
+
+
+def _get_content_length(request: Request) -> Union[int, None]:
+    _content_length = request.headers.get("content-length")
+    if _content_length and _content_length.isdigit():
+        return int(_content_length)
+
+    return None
+
+
+def _stat_with_checksums(file_path: str) -> Tuple[os.stat_result, Dict[str, str]]:
+    return os.stat(file_path), utils.read_checksums_sidecar(file_path)
+
+
+def _get_upload(upload_id: str) -> UploadPM:
+    _upload = _store.get(upload_id)
+    if not _upload:
+        raise BaseHTTPException(
+            error_enum=ErrorCodeEnum.NOT_FOUND,
+            message=f"Not found upload with '{upload_id}' ID!",
+        )
+
+    return _upload
+
+
+@router.options("/", summary="Upload Capabilities", status_code=204)
+def get_upload_options():
+    return Response(
+        status_code=204,
+        headers={
+            "Tus-Resumable": TUS_VERSION,
+            "Tus-Version": TUS_VERSION,
+            "Tus-Extension": _TUS_EXTENSIONS,
+            "Tus-Max-Size": str(_store.max_size),
+        },
+    )
+
+
+@router.post(
+    "/",
+    summary="Create Upload",
+    status_code=201,
+    response_model=ResUploadPM,
+    responses={400: {}, 413: {}, 422: {}, 507: {}},
+)
+async def create_upload(
+    request: Request,
+    upload_length: int = Header(
+        ...,
+        ge=0,
+        title="Upload length",
+        description="Total size of the file in bytes.",
+        examples=[1048576],
+    ),
+    upload_metadata: Union[str, None] = Header(
+        default=None,
+        max_length=4096,
+        title="Upload metadata",
+        description="Comma separated `<key> <base64 value>` pairs, only `filename` is used.",
+        examples=["filename YXJjaGl2ZS50YXIuZ3o="],
+    ),
+):
+    _request_id = request.state.request_id
+    logger.info(f"[{_request_id}] - Creating upload with {upload_length} bytes length...")
+
+    try:
+        _filename = _parse_filename(upload_metadata)
+        _upload: UploadPM = await thread_pools.run_sync(
+            "uploads", _store.create, upload_length, _filename
+        )
+
+        ## Data can be sent in the creation request (creation-with-upload extension):
+        if (
+            request.headers.get("content-type", "").startswith(_OFFSET_CONTENT_TYPE)
+            and (not _upload.is_completed)
+        ):
+            _upload = await _store.write(
+                id=_upload.id,
+                offset=0,
+                chunks=request.stream(),
+                content_length=_get_content_length(request),
+            )
+
+        logger.success(
+            f"[{_request_id}] - Successfully created upload with '{_upload.id}' ID."
+        )
+    except Exception as err:
+        if isinstance(err, HTTPException):
+            raise
+
+        logger.error(f"[{_request_id}] - Failed to create upload!")
+        raise
+
+    _headers = _make_headers(_upload)
+    _headers["Location"] = str(request.url_for("get_upload", upload_id=_upload.id))
+    _response = BaseResponse(
+        request=request,
+        status_code=201,
+        headers=_headers,
+        message="Successfully created upload.",
+        content=_upload,
+        response_schema=ResUploadPM,
+    )
+    return _response
+
+
+@router.head(
+    "/{upload_id}",
+    summary="Get Upload Offset",
+    responses={404: {}, 422: {}},
+)
+@thread_pools.route("uploads")
+def get_upload_offset(
+    request: Request,
+    upload_id: constr(strip_whitespace=True) = Path(  # type: ignore
+        ...,
+        min_length=8,
+        max_length=64,
+        pattern=ALPHANUM_HYPHEN_REGEX,
+        title="Upload ID",
+        description="Upload ID to get offset.",
+        examples=["1701388800_a0dc99d68d5e427eafe00525fac47012"],
+    ),
+):
+    _upload = _get_upload(upload_id=upload_id)
+    return Response(status_code=200, headers=_make_headers(_upload))
+
+
+@router.get(
+    "/{upload_id}",
+    summary="Get Upload",
+    response_model=ResUploadPM,
+    responses={404: {}, 422: {}},
+)
+@thread_pools.route("uploads")
+def get_upload(
+    request: Request,
+    upload_id: constr(strip_whitespace=True) = Path(  # type: ignore
+        ...,
+        min_length=8,
+        max_length=64,
+        pattern=ALPHANUM_HYPHEN_REGEX,
+        title="Upload ID",
+        description="Upload ID to get.",
+        examples=["1701388800_a0dc99d68d5e427eafe00525fac47012"],
+    ),
+):
+    _request_id = request.state.request_id
+    logger.info(f"[{_request_id}] - Getting upload with '{upload_id}' ID...")
+
+    _upload = _get_upload(upload_id=upload_id)
+    logger.success(
+        f"[{_request_id}] - Successfully retrieved upload with '{upload_id}' ID."
+    )
+
+    _response = BaseResponse(
+        request=request,
+        headers=_make_headers(_upload),
+        message="Successfully retrieved upload info.",
+        content=_upload,
+        response_schema=ResUploadPM,
+    )
+    return _response
+
+
+@router.get(
+    "/{upload_id}/content",
+    summary="Download Upload",
+    response_class=FileStreamResponse,
+    responses={
+        200: {"content": {"application/octet-stream": {}}},
+        206: {"description": "Partial Content"},
+        304: {"description": "Not Modified"},
+        404: {},
+        416: {"description": "Range Not Satisfiable"},
+        422: {},
+    },
+)
+async def download_upload(
+    request: Request,
+    upload_id: constr(strip_whitespace=True) = Path(  # type: ignore
+        ...,
+        min_length=8,
+        max_length=64,
+        pattern=ALPHANUM_HYPHEN_REGEX,
+        title="Upload ID",
+        description="Completed upload ID to download.",
+        examples=["1701388800_a0dc99d68d5e427eafe00525fac47012"],
+    ),
+):
+    _request_id = request.state.request_id
+    logger.info(f"[{_request_id}] - Downloading upload with '{upload_id}' ID...")
+
+    _upload: Union[UploadPM, None] = await thread_pools.run_sync(
+        "uploads", _store.get, upload_id
+    )
+    if (not _upload) or (not _upload.is_completed):
+        raise BaseHTTPException(
+            error_enum=ErrorCodeEnum.NOT_FOUND,
+            message=f"Not found completed upload with '{upload_id}' ID!",
+        )
+
+    _file_path = _store.get_file_path(upload_id)
+    try:
+        _stat, _checksums = await thread_pools.run_sync(
+            "uploads", _stat_with_checksums, _file_path
+        )
+    except FileNotFoundError:
+        raise BaseHTTPException(
+            error_enum=ErrorCodeEnum.NOT_FOUND,
+            message=f"Not found completed upload with '{upload_id}' ID!",
+        )
+
+    _filename = _upload.filename or upload_id
+    _download_config = config.api.uploads.download
+    _response = FileStreamResponse(
+        path=_file_path,
+        headers={"Cache-Control": _download_config.cache_control},
+        media_type=mimetypes.guess_type(_filename)[0] or "application/octet-stream",
+        filename=_filename,
+        stat_result=_stat,
+        ## Strong ETag from the content, (size, mtime) based if the file changed after the checksum:
+        etag=_checksums.get("sha256") or next(iter(_checksums.values()), None),
+        chunk_size=_download_config.chunk_size,
+        max_ranges=_download_config.max_ranges,
+        zero_copy=_download_config.zero_copy,
+        accel_header=_download_config.accel_header,
+        accel_path=f"{_download_config.accel_prefix.rstrip('/')}/{upload_id}",
+    )
+    logger.success(
+        f"[{_request_id}] - Successfully prepared download of upload with '{upload_id}' ID."
+    )
+    return _response
+
+
+## Same handler for HEAD, separate route keeps operation IDs of the schema unique:
+router.add_api_route(
+    "/{upload_id}/content",
+    download_upload,
+    methods=["HEAD"],
+    name="head_download_upload",
+    response_class=FileStreamResponse,
+    include_in_schema=False,
+)
+
+
+@router.patch(
+    "/{upload_id}",
+    summary="Upload Data",
+    status_code=204,
+    responses={404: {}, 409: {}, 413: {}, 415: {}, 422: {}, 423: {}, 507: {}},
+)
+async def upload_data(
+    request: Request,
+    upload_id: constr(strip_whitespace=True) = Path(  # type: ignore
+        ...,
+        min_length=8,
+        max_length=64,
+        pattern=ALPHANUM_HYPHEN_REGEX,
+        title="Upload ID",
+        description="Upload ID to append data.",
+        examples=["1701388800_a0dc99d68d5e427eafe00525fac47012"],
+    ),
+    upload_offset: int = Header(
+        ...,
+        ge=0,
+        title="Upload offset",
+        description="Offset of the request body data, must match the current upload offset.",
+        examples=[0],
+    ),
+):
+    _request_id = request.state.request_id
+    logger.info(
+        f"[{_request_id}] - Uploading data to '{upload_id}' upload at {upload_offset} offset..."
+    )
+
+    if not request.headers.get("content-type", "").startswith(_OFFSET_CONTENT_TYPE):
+        raise BaseHTTPException(
+            error_enum=ErrorCodeEnum.UNSUPPORTED_MEDIA_TYPE,
+            message=f"Content-Type must be '{_OFFSET_CONTENT_TYPE}'!",
+        )
+
+    try:
+        _upload: UploadPM = await _store.write(
+            id=upload_id,
+            offset=upload_offset,
+            chunks=request.stream(),
+            content_length=_get_content_length(request),
+        )
+
+        _message = f"Successfully uploaded data to '{upload_id}' upload, offset: {_upload.offset}/{_upload.length}."
+        if _upload.is_completed:
+            _message = f"Successfully completed upload with '{upload_id}' ID."
+
+        logger.success(f"[{_request_id}] - {_message}")
+    except Exception as err:
+        if isinstance(err, HTTPException):
+            raise
+
+        logger.error(f"[{_request_id}] - Failed to upload data to '{upload_id}' upload!")
+        raise
+
+    return Response(status_code=204, headers=_make_headers(_upload))
+
+
+@router.delete(
+    "/{upload_id}",
+    summary="Delete Upload",
+    status_code=204,
+    responses={404: {}, 422: {}, 423: {}},
+)
+@thread_pools.route("uploads")
+def delete_upload(
+    request: Request,
+    upload_id: str = Path(
+        ...,
+        min_length=8,
+        max_length=64,
+        pattern=ALPHANUM_HYPHEN_REGEX,
+        title="Upload ID",
+        description="Upload ID to delete.",
+        examples=["1701388800_a0dc99d68d5e427eafe00525fac47012"],
+    ),
+):
+    _request_id = request.state.request_id
+    logger.info(f"[{_request_id}] - Deleting upload with '{upload_id}' ID...")
+
+    try:
+        _store.delete(upload_id)
+
+        logger.success(
+            f"[{_request_id}] - Successfully deleted upload with '{upload_id}' ID."
+        )
+    except Exception as err:
+        if isinstance(err, HTTPException):
+            raise
+
+        logger.error(f"[{_request_id}] - Failed to delete upload with '{upload_id}' ID!")
+        raise
+
+    return Response(status_code=204, headers={"Tus-Resumable": TUS_VERSION})
+
+
+__all__ = ["router", "TUS_VERSION", "get_upload_store"]
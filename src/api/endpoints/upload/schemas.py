@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from typing import Dict, Union
+
+from pydantic import Field
+
+from api.core.schemas import IdPM, TimestampPM, BaseResPM
+
+
+## Uploads
+class UploadPM(TimestampPM, IdPM):
+    filename: Union[str, None] = Field(
+        default=None,
+        max_length=255,
+        title="File name",
+        description="Original file name from `Upload-Metadata` header.",
+        examples=["archive.tar.gz"],
+    )
+    length: int = Field(
+        ...,
+        ge=0,
+        title="Upload length",
+        description="Total size of the file in bytes.",
+        examples=[1048576],
+    )
+    offset: int = Field(
+        default=0,
+        ge=0,
+        title="Upload offset",
+        description="Number of bytes received.",
+        examples=[524288],
+    )
+    is_completed: bool = Field(
+        default=False,
+        title="Is completed",
+        description="Is all data received and the file moved into uploads directory.",
+        examples=[False],
+    )
+    checksums: Dict[str, str] = Field(
+        default_factory=dict,
+        title="Checksums",
+        description="Hash method -> hex digest of the completed file.",
+        examples=[
+            {
+                "md5": "b6d81b360a5672d80c27430f39153e2c",
+                "sha256": "30e14955ebf1352266dc2ff8067e68104607e750abb9d3b36582b8af909fcb58",
+            }
+        ],
+    )
+    expires_at: Union[datetime, None] = Field(
+        default=None,
+        title="Expires at",
+        description="Incomplete upload is removed after this time.",
+        examples=["2021-01-02T00:00:00+00:00"],
+    )
+
+
+class ResUploadPM(BaseResPM):
+    data: Union[UploadPM, None] = Field(
+        default=None,
+        title="Upload data",
+        description="Upload as a main data.",
+        examples=[
+            {
+                "id": "1699928748406212_46D46E7E55FA4A6E8478BD6B04195793",
+                "filename": "archive.tar.gz",
+                "length": 1048576,
+                "offset": 0,
+                "is_completed": False,
+                "checksums": {},
+                "expires_at": "2021-01-02T00:00:00+00:00",
+                "updated_at": "2021-01-01T00:00:00+00:00",
+                "created_at": "2021-01-01T00:00:00+00:00",
+            }
+        ],
+    )
+
+
+## Uploads
+
+
+__all__ = [
+    "UploadPM",
+    "ResUploadPM",
+]
@@ -0,0 +1,557 @@
+# -*- coding: utf-8 -*-
+
+import os
+import errno
+import shutil
+import asyncio
+import hashlib
+import threading
+import time
+from datetime import timedelta
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    ## Not available on Windows, only in-process locks are used:
+    fcntl = None
+
+from starlette.requests import ClientDisconnect
+
+from api.core.constants import ErrorCodeEnum, HashAlgoEnum
+from api.core import utils
+from api.core.concurrency import thread_pools
+from api.core.exceptions import BaseHTTPException
+from api.logger import logger
+
+from .schemas import UploadPM
+
+
+## Files of `<id>` upload: partial data and info in partial uploads directory,
+## completed data as `<id>` and its info in uploads directory:
+_PART_SUFFIX = ".part"
+_INFO_SUFFIX = ".json"
+## Quota usage is counted again from the directories after this many seconds:
+_USAGE_TTL = 60
+
+
+class _ActiveUpload:
+    """Per-process state of a partial upload: lock against concurrent PATCH requests and running hashes,
+    valid only while every received byte went through them (`hashed_offset` == file size).
+    """
+
+    __slots__ = ("lock", "hashes", "hashed_offset")
+
+    def __init__(self, hash_methods: List[str]) -> None:
+        self.lock = asyncio.Lock()
+        self.hashes: Union[List[Any], None] = [
+            hashlib.new(_method) for _method in hash_methods
+        ]
+        self.hashed_offset = 0
+
+
+class UploadStore:
+    """Resumable uploads (tus-style offsets) stored on disk.
+
+    Request body chunks are buffered up to `write_buffer_size` and written to `<partial_dir>/<id>.part`
+    in the 'uploads' threadpool, hashed in the same call. Completed files are moved atomically
+    (`os.replace()`) into `uploads_dir`, with their checksums saved as the sidecar cache file.
+    The upload offset is the size of the partial file, so uploads can be resumed after a restart
+    (checksums are then computed from the file once).
+    """
+
+    def __init__(
+        self,
+        uploads_dir: str,
+        partial_dir: str,
+        max_size: int,
+        quota: int,
+        min_free_space: int,
+        expire: int,
+        write_buffer_size: int,
+        hash_methods: List[HashAlgoEnum],
+    ) -> None:
+        """Constructor method for UploadStore class.
+
+        Args:
+            uploads_dir       (str               , required): Completed uploads directory.
+            partial_dir       (str               , required): Partial uploads directory.
+            max_size          (int               , required): Maximum size of one upload in bytes.
+            quota             (int               , required): Maximum total size of completed and in-progress uploads in bytes.
+            min_free_space    (int               , required): Free disk space to keep in bytes.
+            expire            (int               , required): Incomplete uploads expire after this many seconds.
+            write_buffer_size (int               , required): Received data is written to disk in blocks of this size.
+            hash_methods      (List[HashAlgoEnum], required): Checksums computed while receiving data.
+        """
+
+        self.uploads_dir = uploads_dir
+        self.partial_dir = partial_dir
+        self.max_size = max_size
+        self.quota = quota
+        self.min_free_space = min_free_space
+        self.expire = expire
+        self.write_buffer_size = write_buffer_size
+        self.hash_methods: List[str] = [_method.value for _method in hash_methods]
+
+        self._active: Dict[str, _ActiveUpload] = {}
+        self._usage_lock = threading.Lock()
+        self._used = 0
+        self._used_at: Union[float, None] = None
+
+    ## Paths:
+    def _get_part_path(self, id: str) -> str:
+        return os.path.join(self.partial_dir, f"{id}{_PART_SUFFIX}")
+
+    def _get_partial_info_path(self, id: str) -> str:
+        return os.path.join(self.partial_dir, f"{id}{_INFO_SUFFIX}")
+
+    def get_file_path(self, id: str) -> str:
+        """Get path of the completed upload file.
+
+        Args:
+            id (str, required): Upload ID.
+
+        Returns:
+            str: File path.
+        """
+
+        return os.path.join(self.uploads_dir, id)
+
+    def _get_info_path(self, id: str) -> str:
+        return os.path.join(self.uploads_dir, f"{id}{_INFO_SUFFIX}")
+
+    @staticmethod
+    def _save_info(file_path: str, upload: UploadPM) -> None:
+        _tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(_tmp_path, "w", encoding="utf-8") as _file:
+            _file.write(upload.model_dump_json())
+
+        os.replace(_tmp_path, file_path)
+
+    @staticmethod
+    def _load_info(file_path: str) -> Union[UploadPM, None]:
+        try:
+            with open(file_path, "r", encoding="utf-8") as _file:
+                return UploadPM.model_validate_json(_file.read())
+        except FileNotFoundError:
+            return None
+
+    ## Quota:
+    def _count_usage(self) -> int:
+        """Count completed file sizes and declared lengths of partial uploads."""
+
+        _used = 0
+        for _dir, _suffix in ((self.uploads_dir, ""), (self.partial_dir, _INFO_SUFFIX)):
+            try:
+                with os.scandir(_dir) as _entries:
+                    for _entry in _entries:
+                        if not _entry.is_file():
+                            continue
+
+                        if _suffix:
+                            if _entry.name.endswith(_suffix):
+                                _upload = self._load_info(_entry.path)
+                                _used += _upload.length if _upload else 0
+                        elif not _entry.name.endswith((_INFO_SUFFIX, ".tmp")):
+                            ## Completed file, info and checksum sidecar files end with '.json':
+                            _used += _entry.stat().st_size
+            except FileNotFoundError:
+                pass
+
+        return _used
+
+    def _reserve(self, length: int) -> None:
+        with self._usage_lock:
+            _now = time.monotonic()
+            if (self._used_at is None) or (_USAGE_TTL <= (_now - self._used_at)):
+                self._used = self._count_usage()
+                self._used_at = _now
+
+            if self.quota < (self._used + length):
+                raise BaseHTTPException(error_enum=ErrorCodeEnum.UPLOAD_QUOTA_EXCEEDED)
+
+            self._used += length
+
+    def _release(self, length: int) -> None:
+        with self._usage_lock:
+            self._used = max(self._used - length, 0)
+
+    def _check_free_space(self, length: int) -> None:
+        if (shutil.disk_usage(self.partial_dir).free - length) < self.min_free_space:
+            raise BaseHTTPException(error_enum=ErrorCodeEnum.INSUFFICIENT_STORAGE)
+
+    ## Sync, run in the 'uploads' threadpool:
+    def create(self, length: int, filename: Optional[str] = None) -> UploadPM:
+        """Create a new upload, empty uploads are completed immediately.
+
+        Args:
+            length   (int          , required): Total size of the file in bytes.
+            filename (Optional[str], optional): Original file name. Defaults to None.
+
+        Raises:
+            BaseHTTPException: 413, if `length` is larger than the maximum upload size.
+            BaseHTTPException: 507, if quota is exceeded or not enough free disk space.
+
+        Returns:
+            UploadPM: Created upload.
+        """
+
+        if self.max_size < length:
+            raise BaseHTTPException(
+                error_enum=ErrorCodeEnum.REQUEST_ENTITY_TOO_LARGE,
+                message=f"Upload length {length} is larger than maximum {self.max_size} bytes!",
+            )
+
+        os.makedirs(self.partial_dir, exist_ok=True)
+        os.makedirs(self.uploads_dir, exist_ok=True)
+        self._check_free_space(length)
+        self._reserve(length)
+        try:
+            _upload = UploadPM(length=length, filename=filename)
+            _upload.expires_at = _upload.created_at + timedelta(seconds=self.expire)
+            ## Exclusive create, data file must exist before its info:
+            with open(self._get_part_path(_upload.id), "xb"):
+                pass
+
+            self._save_info(self._get_partial_info_path(_upload.id), _upload)
+        except BaseException:
+            self._release(length)
+            raise
+
+        if length == 0:
+            _upload = self._complete(
+                upload=_upload, checksums=self._get_checksums(_upload.id, None)
+            )
+
+        return _upload
+
+    def get(self, id: str) -> Union[UploadPM, None]:
+        """Get upload with the current offset.
+
+        Args:
+            id (str, required): Upload ID.
+
+        Returns:
+            Union[UploadPM, None]: Upload, None if not found or expired.
+        """
+
+        _upload = self._load_info(self._get_info_path(id))
+        if _upload:
+            return _upload
+
+        _upload = self._load_info(self._get_partial_info_path(id))
+        if (not _upload) or (_upload.expires_at and (_upload.expires_at < utils.now_utc_dt())):
+            return None
+
+        try:
+            _upload.offset = os.path.getsize(self._get_part_path(id))
+        except FileNotFoundError:
+            return None
+
+        return _upload
+
+    def delete(self, id: str) -> None:
+        """Delete partial or completed upload and its files.
+
+        Args:
+            id (str, required): Upload ID.
+
+        Raises:
+            BaseHTTPException: 404, if upload not found.
+            BaseHTTPException: 423, if data is being received for the upload.
+        """
+
+        _active = self._active.get(id)
+        if _active and _active.lock.locked():
+            raise BaseHTTPException(
+                error_enum=ErrorCodeEnum.LOCKED,
+                message=f"Upload with '{id}' ID is in progress!",
+            )
+
+        _upload = self.get(id)
+        if not _upload:
+            raise BaseHTTPException(
+                error_enum=ErrorCodeEnum.NOT_FOUND,
+                message=f"Not found upload with '{id}' ID!",
+            )
+
+        if _upload.is_completed:
+            _file_path = self.get_file_path(id)
+            _paths = [
+                self._get_info_path(id),
+                _file_path,
+                f"{_file_path}{utils.CHECKSUM_SIDECAR_SUFFIX}",
+            ]
+        else:
+            _paths = [self._get_partial_info_path(id), self._get_part_path(id)]
+
+        for _path in _paths:
+            try:
+                os.remove(_path)
+            except FileNotFoundError:
+                pass
+
+        self._active.pop(id, None)
+        self._release(_upload.length)
+        return
+
+    def _open_part(self, id: str) -> Tuple[BinaryIO, int]:
+        """Open partial file for appending, locked against other processes (workers)."""
+
+        _file = open(self._get_part_path(id), "r+b")
+        if fcntl:
+            try:
+                fcntl.flock(_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                _file.close()
+                raise BaseHTTPException(
+                    error_enum=ErrorCodeEnum.LOCKED,
+                    message=f"Upload with '{id}' ID is in progress!",
+                )
+
+        return _file, _file.seek(0, os.SEEK_END)
+
+    @staticmethod
+    def _write_part(
+        file: BinaryIO, data: bytearray, hashes: Union[List[Any], None]
+    ) -> None:
+        file.write(data)
+        if hashes:
+            for _hash in hashes:
+                _hash.update(data)
+
+    def _get_checksums(
+        self, id: str, hashes: Union[List[Any], None]
+    ) -> Dict[str, str]:
+        if hashes:
+            return {
+                _method: _hash.hexdigest()
+                for _method, _hash in zip(self.hash_methods, hashes)
+            }
+
+        ## Running hashes are lost (e.g. upload resumed after a restart):
+        return utils.get_file_checksums(
+            file_path=self._get_part_path(id), hash_methods=self.hash_methods
+        )
+
+    def _move(self, src_path: str, dst_path: str) -> None:
+        try:
+            os.replace(src_path, dst_path)
+        except OSError as err:
+            if err.errno != errno.EXDEV:
+                raise
+
+            ## Different filesystems, copy next to the destination and then replace atomically:
+            _tmp_path = f"{dst_path}.{os.getpid()}.tmp"
+            try:
+                shutil.copyfile(src_path, _tmp_path)
+                os.replace(_tmp_path, dst_path)
+            except BaseException:
+                if os.path.exists(_tmp_path):
+                    os.remove(_tmp_path)
+                raise
+
+            os.remove(src_path)
+
+    def _complete(self, upload: UploadPM, checksums: Dict[str, str]) -> UploadPM:
+        _file_path = self.get_file_path(upload.id)
+        self._move(self._get_part_path(upload.id), _file_path)
+        utils.write_checksums_sidecar(file_path=_file_path, checksums=checksums)
+
+        upload.offset = upload.length
+        upload.is_completed = True
+        upload.checksums = checksums
+        upload.expires_at = None
+        upload.updated_at = utils.now_utc_dt()
+        self._save_info(self._get_info_path(upload.id), upload)
+        os.remove(self._get_partial_info_path(upload.id))
+        return upload
+
+    def _scan_expired(self) -> Tuple[List[str], int]:
+        """Files of expired partial uploads and orphaned temporary files, with their reserved lengths."""
+
+        _now = utils.now_utc_dt()
+        _expire_before = time.time() - self.expire
+        _file_paths: List[str] = []
+        _length = 0
+        try:
+            with os.scandir(self.partial_dir) as _entries:
+                for _entry in _entries:
+                    _id, _, _suffix = _entry.name.partition(".")
+                    _active = self._active.get(_id)
+                    if _active and _active.lock.locked():
+                        continue
+
+                    if _suffix == _INFO_SUFFIX[1:]:
+                        _upload = self._load_info(_entry.path)
+                        if _upload and _upload.expires_at and (_upload.expires_at < _now):
+                            _file_paths += [_entry.path, self._get_part_path(_id)]
+                            _length += _upload.length
+                            self._active.pop(_id, None)
+                    elif (_suffix != _PART_SUFFIX[1:]) or (
+                        not os.path.exists(self._get_partial_info_path(_id))
+                    ):
+                        ## Leftover '.tmp' files and data without info (e.g. crash while creating):
+                        try:
+                            if _entry.stat().st_mtime < _expire_before:
+                                _file_paths.append(_entry.path)
+                        except FileNotFoundError:
+                            pass
+        except FileNotFoundError:
+            pass
+
+        return _file_paths, _length
+
+    ## Async:
+    async def remove_expired(
+        self, max_concurrency: int = 4, batch_size: int = 256
+    ) -> List[utils.PathOpResult]:
+        """Remove expired partial uploads and release their quota.
+
+        Args:
+            max_concurrency (int, optional): Maximum concurrent threadpool calls. Defaults to 4.
+            batch_size      (int, optional): File paths per threadpool call. Defaults to 256.
+
+        Returns:
+            List[utils.PathOpResult]: Result of each removed file.
+        """
+
+        _file_paths, _length = await thread_pools.run_sync("uploads", self._scan_expired)
+        if not _file_paths:
+            return []
+
+        _results = await utils.async_bulk_remove_files(
+            file_paths=_file_paths,
+            max_concurrency=max_concurrency,
+            batch_size=batch_size,
+        )
+        self._release(_length)
+        return _results
+
+    async def write(
+        self,
+        id: str,
+        offset: int,
+        chunks: AsyncIterator[bytes],
+        content_length: Optional[int] = None,
+    ) -> UploadPM:
+        """Append request body chunks to the partial upload at `offset`, complete the upload when all data is received.
+        Nothing is buffered beyond `write_buffer_size`, data received before a client disconnect is kept.
+
+        Args:
+            id             (str                , required): Upload ID.
+            offset         (int                , required): Upload offset of the first chunk, must match the current offset.
+            chunks         (AsyncIterator[bytes], required): Request body chunks (`request.stream()`).
+            content_length (Optional[int]      , optional): Request body size, if known. Defaults to None.
+
+        Raises:
+            BaseHTTPException: 404, if upload not found or expired.
+            BaseHTTPException: 409, if `offset` doesn't match the current offset.
+            BaseHTTPException: 413, if data exceeds the upload length.
+            BaseHTTPException: 423, if data is being received for the upload in another request.
+            BaseHTTPException: 507, if not enough free disk space.
+
+        Returns:
+            UploadPM: Upload with the new offset.
+        """
+
+        _active = self._active.get(id)
+        if _active is None:
+            _active = self._active.setdefault(id, _ActiveUpload(self.hash_methods))
+
+        if _active.lock.locked():
+            raise BaseHTTPException(
+                error_enum=ErrorCodeEnum.LOCKED,
+                message=f"Upload with '{id}' ID is in progress!",
+            )
+
+        async with _active.lock:
+            _upload = await thread_pools.run_sync("uploads", self.get, id)
+            if (not _upload) or _upload.is_completed:
+                self._active.pop(id, None)
+                if _upload:
+                    raise BaseHTTPException(
+                        error_enum=ErrorCodeEnum.CONFLICT,
+                        message=f"Upload with '{id}' ID is already completed!",
+                    )
+
+                raise BaseHTTPException(
+                    error_enum=ErrorCodeEnum.NOT_FOUND,
+                    message=f"Not found upload with '{id}' ID!",
+                )
+
+            if (content_length is not None) and (
+                _upload.length < (offset + content_length)
+            ):
+                raise BaseHTTPException(
+                    error_enum=ErrorCodeEnum.REQUEST_ENTITY_TOO_LARGE,
+                    message=f"Data exceeds upload length {_upload.length} bytes!",
+                )
+
+            _file, _offset = await thread_pools.run_sync("uploads", self._open_part, id)
+            _received = _offset
+            _is_too_large = False
+            if _active.hashed_offset != _offset:
+                _active.hashes = None
+
+            try:
+                if offset != _offset:
+                    raise BaseHTTPException(
+                        error_enum=ErrorCodeEnum.CONFLICT,
+                        message=f"Upload offset {offset} doesn't match current offset {_offset}!",
+                        headers={"Upload-Offset": str(_offset)},
+                    )
+
+                await thread_pools.run_sync(
+                    "uploads", self._check_free_space, _upload.length - _offset
+                )
+
+                _buffer = bytearray()
+                try:
+                    async for _chunk in chunks:
+                        if _upload.length < (_received + len(_buffer) + len(_chunk)):
+                            _is_too_large = True
+                            break
+
+                        _buffer += _chunk
+                        if self.write_buffer_size <= len(_buffer):
+                            _data, _buffer = _buffer, bytearray()
+                            await thread_pools.run_sync(
+                                "uploads", self._write_part, _file, _data, _active.hashes
+                            )
+                            _received += len(_data)
+                except ClientDisconnect:
+                    logger.warning(
+                        f"Client disconnected while uploading '{id}', received {_received + len(_buffer)}/{_upload.length} bytes."
+                    )
+
+                if _buffer:
+                    await thread_pools.run_sync(
+                        "uploads", self._write_part, _file, _buffer, _active.hashes
+                    )
+                    _received += len(_buffer)
+            finally:
+                await thread_pools.run_sync("uploads", _file.close)
+                _active.hashed_offset = _received
+
+            if _is_too_large:
+                raise BaseHTTPException(
+                    error_enum=ErrorCodeEnum.REQUEST_ENTITY_TOO_LARGE,
+                    message=f"Data exceeds upload length {_upload.length} bytes!",
+                    headers={"Upload-Offset": str(_received)},
+                )
+
+            _upload.offset = _received
+            if _received == _upload.length:
+                _checksums = await thread_pools.run_sync(
+                    "uploads", self._get_checksums, id, _active.hashes
+                )
+                _upload = await thread_pools.run_sync(
+                    "uploads", self._complete, _upload, _checksums
+                )
+                self._active.pop(id, None)
+
+        return _upload
+
+
+__all__ = ["UploadStore"]
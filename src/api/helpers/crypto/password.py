@@ -3,7 +3,8 @@
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 from pydantic import validate_call, SecretStr
-from fastapi.concurrency import run_in_threadpool
+
+from api.core.concurrency import thread_pools
 
 
 @validate_call
@@ -79,8 +80,8 @@ async def async_hash(
         str: Hashed password.
     """
 
-    _hash_password: str = await run_in_threadpool(
-        hash, password, password_salt, password_pepper
+    _hash_password: str = await thread_pools.run_sync(
+        "crypto", hash, password, password_salt, password_pepper
     )
     return _hash_password
 
@@ -104,8 +105,8 @@ async def async_verify(
         bool: True if password is match, False otherwise.
     """
 
-    _is_match: bool = await run_in_threadpool(
-        verify, hashed_password, password, password_salt, password_pepper
+    _is_match: bool = await thread_pools.run_sync(
+        "crypto", verify, hashed_password, password, password_salt, password_pepper
     )
     return _is_match
 
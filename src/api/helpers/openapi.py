@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import argparse
+from typing import List, Optional
+
+from pydantic import validate_call
+
+from api.core.responses import OpenAPIDocument
+
+
+@validate_call
+def generate_openapi(output_path: str, check: bool = False) -> bool:
+    """Generate OpenAPI schema from application routes and save it to a JSON file.
+
+    Args:
+        output_path (str , required): OpenAPI JSON file path.
+        check       (bool, optional): Only check if the file is up to date, don't write. Defaults to False.
+
+    Returns:
+        bool: True if the file was already up to date.
+    """
+
+    ## Imported here, creating the application loads all routers:
+    from api.bootstrap import create_app
+
+    _document = OpenAPIDocument.from_app(app=create_app(), encodings=[])
+    _is_up_to_date = False
+    if os.path.isfile(output_path):
+        try:
+            _is_up_to_date = (
+                OpenAPIDocument.from_file(output_path, encodings=[]).content
+                == _document.content
+            )
+        except ValueError:
+            _is_up_to_date = False
+
+    if (not check) and (not _is_up_to_date):
+        _document.save(output_path)
+
+    return _is_up_to_date
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Command line entry: `python -m api.helpers.openapi --output=openapi.json [--check]`.
+
+    Args:
+        args (Optional[List[str]], optional): Command line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: Exit code, 1 if `--check` found an outdated file.
+    """
+
+    _parser = argparse.ArgumentParser(
+        description="Generate OpenAPI schema JSON file from application routes."
+    )
+    _parser.add_argument(
+        "-o", "--output", required=True, help="OpenAPI JSON file path to write."
+    )
+    _parser.add_argument(
+        "-c",
+        "--check",
+        action="store_true",
+        help="Only check if the file is up to date (exit code 1 if not).",
+    )
+    _args = _parser.parse_args(args)
+
+    _is_up_to_date = generate_openapi(output_path=_args.output, check=_args.check)
+    if _args.check and (not _is_up_to_date):
+        print(f"'{_args.output}' is outdated!", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+__all__ = ["generate_openapi", "main"]
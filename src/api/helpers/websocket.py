@@ -1 +1,273 @@
 # -*- coding: utf-8 -*-
+
+import time
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from fastapi import WebSocket, status
+from pydantic_core import from_json, to_json
+from starlette.websockets import WebSocketDisconnect, WebSocketState
+
+from api.core.constants import ErrorCodeEnum
+from api.logger import logger
+
+
+## Executes operations of queued messages at once, returns one result per operation:
+BatchHandler = Callable[[List[Any]], Awaitable[List[Dict[str, Any]]]]
+## Queued message: operations or an error result of the whole message:
+_QueueItem = Tuple[Union[List[Any], None], Union[Dict[str, Any], None]]
+
+
+def make_ws_error(
+    error_enum: ErrorCodeEnum,
+    ref: Any = None,
+    message: Optional[str] = None,
+    detail: Any = None,
+) -> Dict[str, Any]:
+    """Make a compact error result of an operation.
+
+    Args:
+        error_enum (ErrorCodeEnum, required): Error code enum, its status code and message are used.
+        ref        (Any          , optional): Client reference of the operation. Defaults to None.
+        message    (Optional[str], optional): Error message, error code message if None. Defaults to None.
+        detail     (Any          , optional): Error detail. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: Error result, e.g. `{"ref": 1, "status": 404, "error": {"code": "404_00000", ...}}`.
+    """
+
+    _error: Dict[str, Any] = {
+        "code": error_enum.value.code,
+        "message": message or error_enum.value.message,
+    }
+    if detail is not None:
+        _error["detail"] = detail
+
+    return {"ref": ref, "status": error_enum.value.status_code, "error": _error}
+
+
+class WebSocketBatchServer:
+    """Serves pipelined operations over WebSocket connections with batched results.
+
+    A message is a JSON array of operations (or one operation object). Received messages are queued and
+    executed together by the handler, up to `max_batch_ops` operations in order, and their results are sent
+    back as one JSON array message. Reading pauses while `queue_size` messages are waiting, so a client
+    sending faster than operations run is slowed down by TCP flow control instead of growing memory.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 1000,
+        max_message_size: int = 1_048_576,
+        max_ops: int = 1000,
+        max_batch_ops: int = 5000,
+        queue_size: int = 16,
+        idle_timeout: float = 300.0,
+        send_timeout: float = 10.0,
+    ) -> None:
+        """Constructor method for WebSocketBatchServer class.
+
+        Args:
+            max_connections  (int  , optional): Concurrent connections in this process. Defaults to 1000.
+            max_message_size (int  , optional): Maximum message size in bytes, advisory (checked after the server
+                                                buffered it), set the server limit too. Defaults to 1048576.
+            max_ops          (int  , optional): Maximum operations in one message. Defaults to 1000.
+            max_batch_ops    (int  , optional): Maximum operations executed and answered at once. Defaults to 5000.
+            queue_size       (int  , optional): Received messages waiting per connection. Defaults to 16.
+            idle_timeout     (float, optional): Seconds without messages before closing. Defaults to 300.0.
+            send_timeout     (float, optional): Seconds to wait for a slow client to read. Defaults to 10.0.
+        """
+
+        self.max_connections = max_connections
+        self.max_message_size = max_message_size
+        self.max_ops = max_ops
+        self.max_batch_ops = max_batch_ops
+        self.queue_size = queue_size
+        self.idle_timeout = idle_timeout
+        self.send_timeout = send_timeout
+
+        self._connections = 0
+
+    def __len__(self) -> int:
+        return self._connections
+
+    def _parse(self, message: Dict[str, Any]) -> _QueueItem:
+        _data: Union[str, bytes, None] = message.get("text")
+        if _data is None:
+            _data = message.get("bytes") or b""
+
+        try:
+            _ops = from_json(_data)
+        except ValueError:
+            return None, make_ws_error(
+                ErrorCodeEnum.BAD_REQUEST, message="Message is not a valid JSON!"
+            )
+
+        if isinstance(_ops, dict):
+            _ops = [_ops]
+
+        if not isinstance(_ops, list):
+            return None, make_ws_error(
+                ErrorCodeEnum.BAD_REQUEST,
+                message="Message must be an operation object or array of operations!",
+            )
+
+        if self.max_ops < len(_ops):
+            return None, make_ws_error(
+                ErrorCodeEnum.REQUEST_ENTITY_TOO_LARGE,
+                message=f"Too many operations in one message, limit: {self.max_ops}!",
+            )
+
+        return _ops, None
+
+    async def _read(
+        self,
+        websocket: WebSocket,
+        queue: "asyncio.Queue[Union[_QueueItem, None]]",
+        expires_at: Optional[float],
+    ) -> Tuple[int, str]:
+        """Receive messages into the queue until the client disconnects or a limit is reached.
+
+        Returns:
+            Tuple[int, str]: Close code and reason, code is 0 if the client disconnected.
+        """
+
+        while True:
+            _timeout = self.idle_timeout
+            if expires_at:
+                _timeout = min(_timeout, expires_at - time.time())
+                if _timeout <= 0:
+                    return status.WS_1008_POLICY_VIOLATION, "Access token has expired!"
+
+            try:
+                _message = await asyncio.wait_for(websocket.receive(), timeout=_timeout)
+            except asyncio.TimeoutError:
+                if expires_at and (expires_at <= time.time()):
+                    continue
+
+                return status.WS_1000_NORMAL_CLOSURE, "Idle timeout!"
+
+            if _message["type"] == "websocket.disconnect":
+                return 0, ""
+
+            ## Advisory, message is already buffered here. Server limit (uvicorn `ws_max_size`) is the real one:
+            _size = len(_message.get("text") or "") or len(_message.get("bytes") or b"")
+            if self.max_message_size < _size:
+                return (
+                    status.WS_1009_MESSAGE_TOO_BIG,
+                    f"Message is too big, limit: {self.max_message_size} bytes!",
+                )
+
+            ## Waits while the queue is full, next messages stay unread (backpressure):
+            await queue.put(self._parse(_message))
+
+    async def _execute(
+        self,
+        websocket: WebSocket,
+        queue: "asyncio.Queue[Union[_QueueItem, None]]",
+        handler: BatchHandler,
+    ) -> None:
+        """Execute queued messages in batches and send their results, until None is queued."""
+
+        _is_last = False
+        while not _is_last:
+            _items: List[_QueueItem] = []
+            _item = await queue.get()
+            _count = 0
+            ## Coalesce messages received while the previous batch was running, None is the end:
+            while _item is not None:
+                _items.append(_item)
+                _count += len(_item[0] or [])
+                if queue.empty() or (self.max_batch_ops <= _count):
+                    break
+
+                _item = queue.get_nowait()
+
+            _is_last = _item is None
+            _ops: List[Any] = []
+            for _item_ops, _ in _items:
+                if _item_ops:
+                    _ops.extend(_item_ops)
+
+            _op_results = iter(await handler(_ops)) if _ops else iter(())
+            _results: List[Dict[str, Any]] = []
+            for _item_ops, _error in _items:
+                if _error:
+                    _results.append(_error)
+                elif _item_ops:
+                    _results.extend(next(_op_results) for _ in _item_ops)
+
+            if _results:
+                await asyncio.wait_for(
+                    websocket.send({"type": "websocket.send", "text": to_json(_results).decode()}),
+                    timeout=self.send_timeout,
+                )
+
+    async def serve(
+        self,
+        websocket: WebSocket,
+        handler: BatchHandler,
+        expires_at: Optional[float] = None,
+        subprotocol: Optional[str] = None,
+    ) -> None:
+        """Accept the connection and serve operations until the client disconnects or a limit is reached.
+
+        Args:
+            websocket   (WebSocket      , required): Not accepted WebSocket connection (already authenticated).
+            handler     (BatchHandler   , required): Async function executing a list of operations.
+            expires_at  (Optional[float], optional): Unix timestamp to close the connection at, e.g. access token
+                                                     expiration. Defaults to None.
+            subprotocol (Optional[str]  , optional): Selected subprotocol to accept the connection with.
+                                                     Defaults to None.
+        """
+
+        if self.max_connections <= self._connections:
+            await websocket.close(
+                code=status.WS_1013_TRY_AGAIN_LATER, reason="Too many connections!"
+            )
+            return
+
+        self._connections += 1
+        _queue: "asyncio.Queue[Union[_QueueItem, None]]" = asyncio.Queue(
+            maxsize=self.queue_size
+        )
+        _reader: Union[asyncio.Task, None] = None
+        _executor: Union[asyncio.Task, None] = None
+        _code, _reason = 0, ""
+        try:
+            await websocket.accept(subprotocol=subprotocol)
+            _reader = asyncio.create_task(self._read(websocket, _queue, expires_at))
+            _executor = asyncio.create_task(self._execute(websocket, _queue, handler))
+            await asyncio.wait({_reader, _executor}, return_when=asyncio.FIRST_COMPLETED)
+            if _executor.done():
+                ## Results not read within `send_timeout` or the handler failed:
+                _reader.cancel()
+                _err = _executor.exception()
+                if isinstance(_err, asyncio.TimeoutError):
+                    _code, _reason = status.WS_1013_TRY_AGAIN_LATER, "Client is too slow!"
+                elif not isinstance(_err, WebSocketDisconnect):
+                    logger.opt(exception=_err).error("Failed to execute WebSocket operations!")
+                    _code, _reason = status.WS_1011_INTERNAL_ERROR, "Internal server error!"
+            else:
+                _code, _reason = _reader.result()
+                if _code:
+                    ## Results of already received messages are sent before closing:
+                    await _queue.put(None)
+                    await asyncio.wait({_executor})
+        except WebSocketDisconnect:
+            pass
+        finally:
+            for _task in (_reader, _executor):
+                if _task and (not _task.done()):
+                    _task.cancel()
+
+            self._connections -= 1
+
+        if _code and (websocket.client_state == WebSocketState.CONNECTED):
+            try:
+                await websocket.close(code=_code, reason=_reason)
+            except Exception:
+                pass
+
+
+__all__ = ["BatchHandler", "make_ws_error", "WebSocketBatchServer"]
@@ -1,22 +1,33 @@
 # -*- coding: utf-8 -*-
 
 import os
-from typing import AsyncGenerator
+import signal
+import asyncio
+import threading
+from typing import AsyncGenerator, Union
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 
 from api.core import utils
-from api.config import config
-from api.helpers.crypto import asymmetric as asymmetric_helper
-from api.helpers.crypto import ssl as ssl_helper
-from api.logger import logger
+from api.core.cache import BaseCache, create_cache
+from api.core.concurrency import thread_pools
+from api.core.constants import PathOpStatusEnum
+from api.core.configs import RuntimeConfig, load_runtime_config
+from api.core.jobs import JobWorkerPool, create_job_worker_pool
+from api.config import CONFIGS_DIR, config, runtime_config
+from api.logger import logger, set_log_level
+from api.router import build_openapi
 
 
 def pre_init() -> None:
     """Pre-initialization tasks before creating FastAPI application."""
 
     if config.api.security.ssl.generate:
+        ## Crypto helpers pull in `cryptography` x509/RSA, import only when needed:
+        from api.helpers.crypto import ssl as ssl_helper
+
         ssl_helper.create_ssl_certs(
             ssl_dir=config.api.paths.ssl_dir,
             key_fname=config.api.security.ssl.key_fname,
@@ -57,6 +68,172 @@ async def _async_create_dirs() -> None:
     return
 
 
+async def _async_connect_cache(app: FastAPI) -> None:
+    """Create and connect cache backend, available as `app.state.cache`.
+
+    Args:
+        app (FastAPI, required): FastAPI application instance.
+
+    Raises:
+        SystemExit: If failed to connect cache backend.
+    """
+
+    _cache: BaseCache = create_cache(cache_config=config.api.cache)
+    try:
+        await _cache.connect()
+    except Exception:
+        logger.exception(f"Failed to connect '{config.api.cache.backend.value}' cache:")
+        raise SystemExit(1)
+
+    app.state.cache = _cache
+    return
+
+
+async def _async_start_jobs(app: FastAPI) -> None:
+    """Create job worker pool and start workers, available as `app.state.jobs`.
+
+    Args:
+        app (FastAPI, required): FastAPI application instance.
+
+    Raises:
+        SystemExit: If failed to connect job queue.
+    """
+
+    _pool: JobWorkerPool = create_job_worker_pool(
+        jobs_config=config.api.jobs, db_file=config.api.paths.jobs_db_file
+    )
+    try:
+        await _pool.start()
+    except Exception:
+        logger.exception(f"Failed to start '{config.api.jobs.backend.value}' job queue:")
+        raise SystemExit(1)
+
+    app.state.jobs = _pool
+    return
+
+
+async def reload_runtime_config() -> bool:
+    """Re-read config files and atomically swap the hot-reloadable runtime config (see `RuntimeConfig`).
+    Invalid config is logged and ignored, current config stays in use.
+
+    Returns:
+        bool: True if the runtime config changed.
+    """
+
+    _old_version, _old_config = runtime_config.get()
+    try:
+        _runtime_config: RuntimeConfig = await run_in_threadpool(
+            load_runtime_config, [CONFIGS_DIR]
+        )
+    except Exception as err:
+        logger.warning(f"Invalid runtime config, keeping current config: {err}")
+        return False
+
+    if runtime_config.swap(config=_runtime_config) == _old_version:
+        return False
+
+    if _runtime_config.log_level != _old_config.log_level:
+        await run_in_threadpool(set_log_level, _runtime_config.log_level)
+
+    logger.info(f"Reloaded runtime config, version: {runtime_config.version}")
+    return True
+
+
+async def _async_watch_configs(stop_event: asyncio.Event) -> None:
+    """Reload runtime config whenever YAML config files change.
+
+    Args:
+        stop_event (asyncio.Event, required): Event to stop watching, checked by the watcher thread.
+    """
+
+    ## Imported lazily, only needed when config watcher is enabled:
+    from watchfiles import awatch
+
+    try:
+        async for _changes in awatch(
+            CONFIGS_DIR,
+            watch_filter=lambda _change, _path: _path.endswith((".yml", ".yaml")),
+            debounce=config.api.live_reload.debounce,
+            recursive=False,
+            stop_event=stop_event,
+        ):
+            await reload_runtime_config()
+    except Exception:
+        logger.exception("Config watcher stopped, runtime config is not live reloaded anymore:")
+
+
+async def _async_run_cleanup() -> None:
+    """Remove expired entries of `tmp_dir` and expired partial uploads."""
+
+    try:
+        _results = await utils.async_clean_dir(
+            dir_path=config.api.paths.tmp_dir,
+            max_age=config.api.cleanup.tmp_max_age,
+            exclude=[config.api.paths.uploads_dir, config.api.paths.partial_uploads_dir],
+            max_concurrency=config.api.cleanup.max_concurrency,
+            batch_size=config.api.cleanup.batch_size,
+        )
+        if config.api.uploads.enabled:
+            from api.endpoints.upload.router import get_upload_store
+
+            _results += await get_upload_store().remove_expired(
+                max_concurrency=config.api.cleanup.max_concurrency,
+                batch_size=config.api.cleanup.batch_size,
+            )
+    except Exception:
+        logger.exception("Failed to run cleanup:")
+        return
+
+    _removed_count = sum(
+        1 for _result in _results if _result.status == PathOpStatusEnum.removed
+    )
+    _failed_count = sum(
+        1 for _result in _results if _result.status == PathOpStatusEnum.failed
+    )
+    if _removed_count or _failed_count:
+        logger.info(
+            f"Cleanup removed {_removed_count} path(s), {_failed_count} path(s) failed."
+        )
+
+
+async def _async_cleanup_loop(stop_event: asyncio.Event) -> None:
+    """Run cleanup on startup and then every `cleanup.interval` seconds.
+
+    Args:
+        stop_event (asyncio.Event, required): Event to stop the loop.
+    """
+
+    while not stop_event.is_set():
+        await _async_run_cleanup()
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=config.api.cleanup.interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+def _add_sighup_handler() -> bool:
+    """Reload runtime config on 'SIGHUP' signal.
+
+    Returns:
+        bool: True if the signal handler is added, False if not supported (e.g. Windows, non-main thread).
+    """
+
+    if (not hasattr(signal, "SIGHUP")) or (
+        threading.current_thread() is not threading.main_thread()
+    ):
+        return False
+
+    _loop = asyncio.get_running_loop()
+    try:
+        _loop.add_signal_handler(
+            signal.SIGHUP, lambda: _loop.create_task(reload_runtime_config())
+        )
+    except (NotImplementedError, RuntimeError, ValueError):
+        return False
+
+    return True
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Lifespan context manager for FastAPI application.
@@ -67,8 +244,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
 
     logger.info("Preparing to startup...")
+    ## Before anything runs in the threadpool:
+    thread_pools.configure(
+        default_tokens=config.api.threadpool.default_tokens,
+        groups=config.api.threadpool.groups,
+    )
     # await _async_create_dirs()
+    if config.api.uploads.enabled:
+        await utils.async_create_dir(config.api.paths.uploads_dir)
+        await utils.async_create_dir(config.api.paths.partial_uploads_dir)
+
     if config.api.security.asymmetric.generate:
+        from api.helpers.crypto import asymmetric as asymmetric_helper
+
         await asymmetric_helper.async_create_keys(
             asymmetric_keys_dir=config.api.paths.asymmetric_keys_dir,
             key_size=config.api.security.asymmetric.key_size,
@@ -76,6 +264,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             public_key_fname=config.api.security.asymmetric.public_key_fname,
         )
 
+    await _async_connect_cache(app=app)
+    if config.api.jobs.enabled:
+        await _async_start_jobs(app=app)
+
+    if app.openapi_url:
+        app.state.openapi = await run_in_threadpool(build_openapi, app)
+
+    _watch_stop_event = asyncio.Event()
+    _watch_task: Union[asyncio.Task, None] = None
+    if config.api.live_reload.watch:
+        _watch_task = asyncio.create_task(_async_watch_configs(_watch_stop_event))
+
+    _is_sighup = config.api.live_reload.sighup and _add_sighup_handler()
+
+    _cleanup_stop_event = asyncio.Event()
+    _cleanup_task: Union[asyncio.Task, None] = None
+    if config.api.cleanup.enabled:
+        _cleanup_task = asyncio.create_task(_async_cleanup_loop(_cleanup_stop_event))
+
     ## Add startup code here...
     logger.success("Finished preparation to startup.")
     logger.opt(colors=True).info(f"Version: <c>{config.version}</c>")
@@ -89,10 +296,28 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     logger.info("Praparing to shutdown...")
     ## Add shutdown code here...
+    if _cleanup_task:
+        _cleanup_stop_event.set()
+        await _cleanup_task
+
+    if _watch_task:
+        ## Watcher thread must finish before the event loop is closed:
+        _watch_stop_event.set()
+        await _watch_task
+
+    if _is_sighup:
+        asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+
+    if config.api.jobs.enabled:
+        ## Running jobs get `drain_timeout` seconds to finish, the rest are queued again:
+        await app.state.jobs.stop(timeout=config.api.jobs.drain_timeout)
+
+    await app.state.cache.close()
     logger.success("Finished preparation to shutdown.")
 
 
 __all__ = [
     "pre_init",
+    "reload_runtime_config",
     "lifespan",
 ]
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
 from pydantic import validate_call
-from fastapi.concurrency import run_in_threadpool
 
 from beans_logging import Logger, LoggerLoader
 from beans_logging_fastapi import (
@@ -11,6 +10,7 @@ from beans_logging_fastapi import (
 )
 
 from api.core.constants import WarnEnum
+from api.core.concurrency import thread_pools
 from api.config import config
 
 
@@ -27,20 +27,48 @@ def _http_file_format(record: dict) -> str:
     return _format
 
 
-if config.logger.extra.http_file_enabled:
-    add_http_file_handler(
-        logger_loader=logger_loader,
-        log_path=config.logger.extra.http_log_path,
-        err_path=config.logger.extra.http_err_path,
-        formatter=_http_file_format,
-    )
+def _add_http_handlers() -> None:
+    if config.logger.extra.http_file_enabled:
+        add_http_file_handler(
+            logger_loader=logger_loader,
+            log_path=config.logger.extra.http_log_path,
+            err_path=config.logger.extra.http_err_path,
+            formatter=_http_file_format,
+        )
 
-if config.logger.extra.http_json_enabled:
-    add_http_file_json_handler(
-        logger_loader=logger_loader,
-        log_path=config.logger.extra.http_json_path,
-        err_path=config.logger.extra.http_json_err_path,
-    )
+    if config.logger.extra.http_json_enabled:
+        add_http_file_json_handler(
+            logger_loader=logger_loader,
+            log_path=config.logger.extra.http_json_path,
+            err_path=config.logger.extra.http_json_err_path,
+        )
+
+    return
+
+
+_add_http_handlers()
+
+
+@validate_call
+def set_log_level(level: str) -> bool:
+    """Change log level of all handlers at runtime (live config reload).
+
+    Args:
+        level (str, required): New log level.
+
+    Returns:
+        bool: True if the log level changed, False if it was already set.
+    """
+
+    level = level.upper()
+    if logger_loader.config.level == level:
+        return False
+
+    logger_loader.update_config(config={"level": level})
+    ## Reloading removes every handler, HTTP file handlers are added again:
+    logger_loader.load()
+    _add_http_handlers()
+    return True
 
 
 @validate_call
@@ -96,22 +124,22 @@ async def async_log_mode(
     level = level.upper()
     if warn_mode == WarnEnum.ALWAYS:
         if level == "INFO":
-            await run_in_threadpool(logger.info, message)
+            await thread_pools.run_sync("logging", logger.info, message)
         elif level == "SUCCESS":
-            await run_in_threadpool(logger.success, message)
+            await thread_pools.run_sync("logging", logger.success, message)
         elif level == "WARNING":
-            await run_in_threadpool(logger.warning, message)
+            await thread_pools.run_sync("logging", logger.warning, message)
         elif level == "ERROR":
-            await run_in_threadpool(logger.error, message)
+            await thread_pools.run_sync("logging", logger.error, message)
         elif level == "CRITICAL":
-            await run_in_threadpool(logger.critical, message)
+            await thread_pools.run_sync("logging", logger.critical, message)
         elif level == "TRACE":
-            await run_in_threadpool(logger.trace, message)
+            await thread_pools.run_sync("logging", logger.trace, message)
         else:
             raise ValueError(f"Unknown log level: '{level}'")
 
     elif warn_mode == WarnEnum.DEBUG:
-        await run_in_threadpool(logger.debug, message)
+        await thread_pools.run_sync("logging", logger.debug, message)
 
     return
 
@@ -119,6 +147,7 @@ async def async_log_mode(
 __all__ = [
     "logger_loader",
     "logger",
+    "set_log_level",
     "log_mode",
     "async_log_mode",
 ]
@@ -2,8 +2,6 @@
 
 from pydantic import validate_call
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from beans_logging_fastapi import (
@@ -12,8 +10,15 @@ from beans_logging_fastapi import (
     ResponseHTTPInfoMiddleware,
 )
 
-from api.config import config
-from api.core.middlewares import ProcessTimeMiddleware, RequestIdMiddleware
+from api.config import config, runtime_config
+from api.core.middlewares import (
+    ProcessTimeMiddleware,
+    RequestIdMiddleware,
+    RuntimeCORSMiddleware,
+    CompressionMiddleware,
+    RateLimitMiddleware,
+    LoadSheddingMiddleware,
+)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -25,6 +30,22 @@ def add_middlewares(app: FastAPI) -> None:
     """
 
     ## Add more middlewares here...
+    ## Innermost, measured latency is the handler latency:
+    app.add_middleware(
+        LoadSheddingMiddleware, load_shedding_config=config.api.load_shedding
+    )
+    ## Inside of request info middleware, it needs proxy-aware client host:
+    app.add_middleware(
+        RateLimitMiddleware,
+        rate_limit_config=config.api.security.rate_limit,
+        jwt_config=config.api.security.jwt,
+    )
+    ## Precompressed static responses still pass through logging and other middlewares:
+    app.add_middleware(
+        CompressionMiddleware,
+        runtime_config=runtime_config,
+        compression_config=config.api.compression,
+    )
     app.add_middleware(ResponseHTTPInfoMiddleware)
     app.add_middleware(
         HttpAccessLogMiddleware,
@@ -36,8 +57,8 @@ def add_middlewares(app: FastAPI) -> None:
         has_proxy_headers=config.api.behind_proxy,
         has_cf_headers=config.api.behind_cf_proxy,
     )
-    app.add_middleware(GZipMiddleware, minimum_size=config.api.gzip_min_size)
-    app.add_middleware(CORSMiddleware, **config.api.security.cors.model_dump())
+    ## CORS settings are hot-reloadable, see `api.config.runtime_config`:
+    app.add_middleware(RuntimeCORSMiddleware, runtime_config=runtime_config)
     app.add_middleware(
         TrustedHostMiddleware, allowed_hosts=config.api.security.allowed_hosts
     )
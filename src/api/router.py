@@ -1,12 +1,65 @@
 # -*- coding: utf-8 -*-
 
+import os
+
 from pydantic import validate_call
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Request, Response
+from fastapi.concurrency import run_in_threadpool
 
 from api.config import config
+from api.logger import logger
+from api.core.responses import OpenAPIDocument
 from api.core.routers.utils import router as utils_router
 from api.core.routers.default import router as default_router
 from api.endpoints.task.router import router as task_router
+from api.endpoints.upload.router import router as upload_router
+from api.endpoints.job.router import router as job_router
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def build_openapi(app: FastAPI) -> OpenAPIDocument:
+    """Load prebuilt OpenAPI schema file (`config.api.docs.openapi_file`) if it matches the current version
+    and route table fingerprint, otherwise generate schema from application routes.
+
+    Args:
+        app (FastAPI, required): FastAPI app instance.
+
+    Returns:
+        OpenAPIDocument: OpenAPI document, pre-encoded and precompressed.
+    """
+
+    _cache_control = config.api.docs.openapi_cache_control
+    _file_path = config.api.docs.openapi_file
+    if _file_path and os.path.isfile(_file_path):
+        try:
+            _document = OpenAPIDocument.from_file(_file_path, cache_control=_cache_control)
+            if (_document.version == config.version) and (
+                _document.fingerprint == OpenAPIDocument.get_fingerprint(app)
+            ):
+                app.openapi_schema = _document.schema
+                return _document
+
+            logger.warning(
+                f"OpenAPI schema file '{_file_path}' (version '{_document.version}') doesn't match the "
+                "application routes, generating schema..."
+            )
+        except Exception:
+            logger.exception(
+                f"Failed to load OpenAPI schema file '{_file_path}', generating schema:"
+            )
+
+    _document = OpenAPIDocument.from_app(app, cache_control=_cache_control)
+    return _document
+
+
+async def _get_openapi(request: Request) -> Response:
+    ## Normally prepared on startup (lifespan), generated here only on the first request without it:
+    _document = getattr(request.app.state, "openapi", None)
+    if _document is None:
+        _document = await run_in_threadpool(build_openapi, request.app)
+        request.app.state.openapi = _document
+
+    return _document.make_response(request)
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
@@ -19,6 +72,12 @@ def add_routers(app: FastAPI) -> None:
 
     _api_router = APIRouter(prefix=config.api.prefix)
     _api_router.include_router(task_router)
+    if config.api.uploads.enabled:
+        _api_router.include_router(upload_router)
+
+    if config.api.jobs.enabled:
+        _api_router.include_router(job_router)
+
     _api_router.include_router(utils_router)
     ## Add more API routers here...
 
@@ -27,7 +86,16 @@ def add_routers(app: FastAPI) -> None:
     app.include_router(_api_router)
     app.include_router(default_router)
 
+    if app.openapi_url:
+        ## Replace FastAPI's OpenAPI route, it serializes the schema again on every request:
+        app.router.routes[:] = [
+            _route
+            for _route in app.router.routes
+            if getattr(_route, "path", None) != app.openapi_url
+        ]
+        app.add_route(app.openapi_url, _get_openapi, include_in_schema=False)
+
     return
 
 
-__all__ = ["add_routers"]
+__all__ = ["build_openapi", "add_routers"]
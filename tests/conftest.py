@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import time
+import fnmatch
 import logging
+import threading
+import socketserver
+from typing import Dict, List, Optional, Tuple, Union
 
 import pytest
 
@@ -17,3 +22,164 @@ def setup_and_teardown():
 
     # Equivalent of tearDown
     logger.info("Tearing down!")
+
+
+class _FakeRedisHandler(socketserver.StreamRequestHandler):
+    """Minimal RESP2 handler, enough for the cache backends (no external Redis needed)."""
+
+    server: "FakeRedisServer"
+
+    def _read_command(self) -> Union[List[bytes], None]:
+        _line = self.rfile.readline()
+        if not _line:
+            return None
+
+        if not _line.startswith(b"*"):
+            return _line.strip().split()
+
+        _args: List[bytes] = []
+        for _ in range(int(_line[1:])):
+            _size = int(self.rfile.readline()[1:])
+            _args.append(self.rfile.read(_size + 2)[:-2])
+
+        return _args
+
+    def _encode(self, val) -> bytes:
+        if val is None:
+            return b"$-1\r\n"
+
+        if isinstance(val, bool):
+            return b"+OK\r\n" if val else b"$-1\r\n"
+
+        if isinstance(val, int):
+            return b":%d\r\n" % val
+
+        if isinstance(val, Exception):
+            return b"-ERR %s\r\n" % str(val).encode()
+
+        if isinstance(val, bytes):
+            return b"$%d\r\n%s\r\n" % (len(val), val)
+
+        if isinstance(val, list):
+            return b"*%d\r\n" % len(val) + b"".join(self._encode(_v) for _v in val)
+
+        raise TypeError(val)
+
+    def handle(self) -> None:
+        self.server.connection_count += 1
+        while True:
+            _args = self._read_command()
+            if not _args:
+                return
+
+            self.server.command_count += 1
+            try:
+                _reply = self.server.execute(
+                    _args[0].decode().upper(), [_arg for _arg in _args[1:]]
+                )
+            except Exception as err:
+                _reply = err
+
+            self.wfile.write(self._encode(_reply))
+
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _FakeRedisHandler)
+        self.data: Dict[bytes, Tuple[Optional[float], bytes]] = {}
+        self.lock = threading.Lock()
+        self.connection_count = 0
+        self.command_count = 0
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.server_address[1]}/0"
+
+    def _get(self, key: bytes) -> Union[bytes, None]:
+        _entry = self.data.get(key)
+        if _entry is None:
+            return None
+
+        _expire_at, _value = _entry
+        if (_expire_at is not None) and (_expire_at <= time.monotonic()):
+            del self.data[key]
+            return None
+
+        return _value
+
+    def execute(self, command: str, args: List[bytes]):
+        with self.lock:
+            if command == "PING":
+                return b"PONG"
+
+            if command in ("CLIENT", "SELECT"):
+                return True
+
+            if command == "GET":
+                return self._get(args[0])
+
+            if command == "MGET":
+                return [self._get(_key) for _key in args]
+
+            if command == "SET":
+                _expire_at = None
+                _options = [_arg.upper() for _arg in args[2:]]
+                if b"PX" in _options:
+                    _ttl = int(args[2 + _options.index(b"PX") + 1]) / 1000
+                    _expire_at = time.monotonic() + _ttl
+                elif b"EX" in _options:
+                    _ttl = int(args[2 + _options.index(b"EX") + 1])
+                    _expire_at = time.monotonic() + _ttl
+
+                if (b"NX" in _options) and (self._get(args[0]) is not None):
+                    return None
+
+                self.data[args[0]] = (_expire_at, args[1])
+                return True
+
+            if command == "INCRBY":
+                _expire_at = self.data[args[0]][0] if self._get(args[0]) else None
+                _count = int(self._get(args[0]) or 0) + int(args[1])
+                self.data[args[0]] = (_expire_at, str(_count).encode())
+                return _count
+
+            if command in ("DEL", "UNLINK"):
+                return sum(1 for _key in args if self.data.pop(_key, None))
+
+            if command == "SCAN":
+                _pattern = "*"
+                if b"MATCH" in [_arg.upper() for _arg in args]:
+                    _upper_args = [_arg.upper() for _arg in args]
+                    _pattern = args[_upper_args.index(b"MATCH") + 1].decode()
+
+                _keys = [
+                    _key
+                    for _key in list(self.data)
+                    if self._get(_key) is not None
+                    and fnmatch.fnmatchcase(_key.decode(), _pattern)
+                ]
+                return [b"0", _keys]
+
+            if command == "FLUSHDB":
+                self.data.clear()
+                return True
+
+        raise ValueError(f"unknown command '{command}'")
+
+
+@pytest.fixture(scope="session")
+def fake_redis_server():
+    _server = FakeRedisServer()
+    _thread = threading.Thread(target=_server.serve_forever, daemon=True)
+    _thread.start()
+    yield _server
+    _server.shutdown()
+    _server.server_close()
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+
+import anyio
+
+from src.main import app  # noqa: F401
+from api.core import utils
+from api.core.constants import HashAlgoEnum, PathOpStatusEnum
+from api.endpoints.upload.service import UploadStore
+
+
+def _touch(file_path: str, age: float = 0) -> str:
+    with open(file_path, "wb") as _file:
+        _file.write(b"data")
+
+    if age:
+        _mtime = time.time() - age
+        os.utime(file_path, (_mtime, _mtime))
+    return file_path
+
+
+def test_bulk_remove_files(tmp_path):
+    _file_paths = [_touch(str(tmp_path / f"{_i}.txt")) for _i in range(300)]
+    _missing_path = str(tmp_path / "missing.txt")
+
+    _results = anyio.run(
+        lambda: utils.async_bulk_remove_files(
+            file_paths=[*_file_paths, _missing_path], max_concurrency=2, batch_size=64
+        )
+    )
+    assert len(_results) == 301
+    assert {_result.path: _result.status for _result in _results}[_missing_path] == (
+        PathOpStatusEnum.missing
+    )
+    assert sum(1 for _result in _results if _result.status == PathOpStatusEnum.removed) == 300
+    assert not os.listdir(tmp_path)
+
+
+def test_clean_dir(tmp_path):
+    _keep_dir = tmp_path / "keep" / "uploads"
+    _keep_dir.mkdir(parents=True)
+    (tmp_path / "old_dir").mkdir()
+    _touch(str(tmp_path / "old_dir" / "file.txt"))
+    _mtime = time.time() - 3600
+    os.utime(tmp_path / "old_dir", (_mtime, _mtime))
+    os.utime(tmp_path / "keep", (_mtime, _mtime))
+    _touch(str(tmp_path / "old.txt"), age=3600)
+    _touch(str(tmp_path / "new.txt"))
+
+    _results = anyio.run(
+        lambda: utils.async_clean_dir(
+            dir_path=str(tmp_path), max_age=60, exclude=[str(_keep_dir)]
+        )
+    )
+    assert sorted(os.path.basename(_result.path) for _result in _results) == [
+        "old.txt",
+        "old_dir",
+    ]
+    assert sorted(os.listdir(tmp_path)) == ["keep", "new.txt"]
+
+
+def test_remove_expired_uploads(tmp_path):
+    _store = UploadStore(
+        uploads_dir=str(tmp_path / "uploads"),
+        partial_dir=str(tmp_path / "partial_uploads"),
+        max_size=1024,
+        quota=1024,
+        min_free_space=0,
+        expire=60,
+        write_buffer_size=4096,
+        hash_methods=[HashAlgoEnum.md5],
+    )
+    os.makedirs(_store.partial_dir)
+    _upload = _store.create(length=1000)
+    ## Expire the upload and leave an orphaned temporary file:
+    _upload.expires_at = utils.now_utc_dt().replace(year=2000)
+    _store._save_info(_store._get_partial_info_path(_upload.id), _upload)
+    _touch(os.path.join(_store.partial_dir, "orphan.json.tmp"), age=3600)
+
+    _results = anyio.run(_store.remove_expired)
+    assert len(_results) == 3
+    assert not os.listdir(_store.partial_dir)
+    assert _store.get(_upload.id) is None
+    ## Quota is released:
+    _store.create(length=1000)
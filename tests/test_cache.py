@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+from api.core.constants import CacheBackendEnum
+from api.core.configs import CacheConfig
+from api.core.cache import (
+    BaseCache,
+    MemoryCache,
+    RedisCache,
+    TieredCache,
+    create_cache,
+)
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def _check_basic(cache: BaseCache) -> None:
+    await cache.clear()
+    assert await cache.get("a") is None
+
+    await cache.set("a", b"1")
+    assert await cache.get("a") == b"1"
+
+    await cache.set_many({"b": b"2", "c": b"3"})
+    assert await cache.get_many(["a", "b", "c", "x"]) == {
+        "a": b"1",
+        "b": b"2",
+        "c": b"3",
+    }
+
+    await cache.delete("a")
+    assert await cache.get("a") is None
+
+    await cache.set("ttl", b"1", ttl=0.05)
+    assert await cache.get("ttl") == b"1"
+    time.sleep(0.1)
+    assert await cache.get("ttl") is None
+
+    _calls = []
+
+    async def _loader() -> bytes:
+        _calls.append(1)
+        return b"loaded"
+
+    assert await cache.get_or_set("lazy", _loader) == b"loaded"
+    assert await cache.get_or_set("lazy", _loader) == b"loaded"
+    assert len(_calls) == 1
+
+    await cache.clear()
+    assert await cache.get_many(["b", "c", "lazy"]) == {}
+
+
+async def test_memory_cache():
+    _cache = MemoryCache(max_size=3)
+    await _check_basic(_cache)
+
+    for _key in ("a", "b", "c"):
+        await _cache.set(_key, b"v")
+
+    await _cache.get("a")
+    await _cache.set("d", b"v")
+    assert len(_cache) == 3
+    assert await _cache.get("b") is None
+    assert await _cache.get("a") == b"v"
+
+
+async def test_redis_cache(fake_redis_server):
+    _cache = RedisCache(url=fake_redis_server.url, key_prefix="test:", max_connections=4)
+    async with _cache:
+        await _check_basic(_cache)
+
+        ## Other apps' keys on the shared server are untouched:
+        await _cache.client.set("other:key", b"1")
+        await _cache.set("mine", b"1")
+        await _cache.clear()
+        assert await _cache.client.get("other:key") == b"1"
+
+        _command_count = fake_redis_server.command_count
+        await _cache.set_many({f"k{_i}": b"v" for _i in range(50)})
+        await _cache.get_many([f"k{_i}" for _i in range(50)])
+        ## Pipelined SETs are still 50 commands, but reads are one MGET:
+        assert fake_redis_server.command_count - _command_count == 51
+
+    with pytest.raises(RuntimeError):
+        await _cache.get("a")
+
+    ## Without prefix `clear()` would wipe the whole (shared) database:
+    _unprefixed = RedisCache(url=fake_redis_server.url)
+    async with _unprefixed:
+        await _unprefixed.client.set("other:key", b"1")
+        with pytest.raises(RuntimeError):
+            await _unprefixed.clear()
+        assert await _unprefixed.client.get("other:key") == b"1"
+
+
+async def test_tiered_cache(fake_redis_server):
+    _l1 = MemoryCache()
+    _l2 = RedisCache(url=fake_redis_server.url, key_prefix="tiered:")
+    _cache = TieredCache(l1=_l1, l2=_l2, l1_ttl=0.05)
+    async with _cache:
+        await _check_basic(_cache)
+
+        ## Read-through from L2 back-fills L1:
+        await _l2.set("shared", b"1")
+        assert await _l1.get("shared") is None
+        assert await _cache.get("shared") == b"1"
+        assert await _l1.get("shared") == b"1"
+
+        ## L1 expires on its own TTL, then picks up changes made by other processes:
+        await _l2.set("shared", b"2")
+        assert await _cache.get("shared") == b"1"
+        time.sleep(0.1)
+        assert await _cache.get("shared") == b"2"
+
+        await _cache.delete("shared")
+        assert await _l1.get("shared") is None
+        assert await _l2.get("shared") is None
+
+
+async def test_create_cache(fake_redis_server):
+    assert isinstance(create_cache(CacheConfig()), MemoryCache)
+
+    _cache_config = CacheConfig(
+        backend=CacheBackendEnum.tiered, redis={"url": fake_redis_server.url}
+    )
+    _cache = create_cache(_cache_config)
+    assert isinstance(_cache, TieredCache)
+    assert isinstance(_cache.l2, RedisCache)
+
+
+def test_lifespan_cache():
+    with TestClient(app) as _client:
+        assert isinstance(app.state.cache, BaseCache)
+        assert _client.get("/api/v1/ping").status_code == 200
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import os
+import hashlib
+
+import pytest
+
+from src.main import app  # noqa: F401
+from api.core import utils
+from api.core.constants import HashAlgoEnum
+
+
+def _write_file(file_path: str, size: int) -> bytes:
+    _data = os.urandom(size)
+    with open(file_path, "wb") as _file:
+        _file.write(_data)
+
+    return _data
+
+
+def test_file_checksums(tmp_path):
+    _file_path = str(tmp_path / "file.bin")
+    _data = _write_file(_file_path, 3 * 1024 * 1024 + 7)
+
+    assert utils.get_file_checksum(_file_path) == hashlib.md5(_data).hexdigest()
+    assert utils.get_file_checksums(
+        _file_path, hash_methods=[HashAlgoEnum.md5, HashAlgoEnum.sha256], chunk_size=4096
+    ) == {
+        "md5": hashlib.md5(_data).hexdigest(),
+        "sha256": hashlib.sha256(_data).hexdigest(),
+    }
+    assert utils.get_file_checksums(str(tmp_path / "missing.bin")) is None
+    with pytest.raises(OSError):
+        utils.get_file_checksums(str(tmp_path / "missing.bin"), warn_mode="ERROR")
+
+
+def test_file_checksums_sidecar(tmp_path):
+    _file_path = str(tmp_path / "file.bin")
+    _write_file(_file_path, 1024)
+    _checksums = utils.get_file_checksums(_file_path, use_sidecar=True)
+    _sidecar_path = f"{_file_path}{utils.CHECKSUM_SIDECAR_SUFFIX}"
+    assert os.path.isfile(_sidecar_path)
+
+    ## Unchanged file (same path, size and mtime), checksums come from the sidecar:
+    _stat = os.stat(_file_path)
+    with open(_file_path, "r+b") as _file:
+        _file.write(b"x")
+
+    os.utime(_file_path, ns=(_stat.st_atime_ns, _stat.st_mtime_ns))
+    assert utils.get_file_checksums(_file_path, use_sidecar=True) == _checksums
+
+    ## Changed mtime, checksums are computed again:
+    os.utime(_file_path, ns=(_stat.st_atime_ns, _stat.st_mtime_ns + 1_000_000))
+    assert utils.get_file_checksums(_file_path, use_sidecar=True) != _checksums
+
+
+@pytest.mark.anyio
+async def test_files_checksums(tmp_path):
+    _file_paths = [str(tmp_path / f"file{_i}.bin") for _i in range(6)]
+    _expected = {}
+    for _i, _file_path in enumerate(_file_paths):
+        _data = _write_file(_file_path, 256 * 1024 + _i)
+        _expected[_file_path] = {
+            "md5": hashlib.md5(_data).hexdigest(),
+            "sha256": hashlib.sha256(_data).hexdigest(),
+        }
+
+    _missing_path = str(tmp_path / "missing.bin")
+    _expected[_missing_path] = None
+    _file_paths.append(_missing_path)
+
+    assert utils.get_files_checksums(_file_paths, max_workers=3) == _expected
+    assert await utils.async_get_files_checksums(_file_paths, max_workers=3) == _expected
+    ## Same error as the sync function, not an exception group:
+    with pytest.raises(OSError):
+        utils.get_files_checksums([_missing_path, _file_paths[0]], warn_mode="ERROR")
+
+    with pytest.raises(OSError):
+        await utils.async_get_files_checksums([_missing_path, _file_paths[0]], warn_mode="ERROR")
+
+    assert (
+        await utils.async_get_file_checksum(_file_paths[0], hash_method="sha256")
+        == _expected[_file_paths[0]]["sha256"]
+    )
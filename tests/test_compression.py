@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+import json
+
+import pytest
+import brotli
+import zstandard
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.main import app
+from api.config import config, runtime_config
+from api.core import utils
+from api.core.configs import CompressionConfig
+from api.core.middlewares import CompressionMiddleware
+from api.core.responses import ResponseCache
+
+
+_BODY = b'{"items": [' + b",".join([b'{"id": %d, "name": "task"}' % _i for _i in range(500)]) + b"]}"
+_DECOMPRESS = {
+    "gzip": gzip.decompress,
+    "br": brotli.decompress,
+    "zstd": lambda _data: zstandard.ZstdDecompressor().decompressobj().decompress(_data),
+}
+
+
+def _create_app(**kwargs) -> FastAPI:
+    _app = FastAPI()
+    _app.add_middleware(
+        CompressionMiddleware,
+        runtime_config=runtime_config,
+        compression_config=CompressionConfig(**kwargs),
+    )
+    _app.state.calls = 0
+
+    @_app.get("/json")
+    def _get_json():
+        return PlainTextResponse(_BODY, media_type="application/json")
+
+    @_app.get("/small")
+    def _get_small():
+        return PlainTextResponse(b"{}", media_type="application/json")
+
+    @_app.get("/image")
+    def _get_image():
+        return PlainTextResponse(_BODY, media_type="image/png")
+
+    @_app.get("/stream")
+    def _get_stream():
+        return StreamingResponse(iter([_BODY, _BODY]), media_type="text/plain")
+
+    @_app.get("/etag")
+    def _get_etag(request: Request):
+        _headers = {"ETag": '"abc"'}
+        if ResponseCache.is_not_modified(request=request, etag='"abc"'):
+            return Response(status_code=304, headers=_headers)
+
+        return PlainTextResponse(_BODY, media_type="application/json", headers=_headers)
+
+    @_app.get("/static")
+    def _get_static():
+        _app.state.calls += 1
+        _body = _BODY if _app.state.calls <= 6 else b'{"changed": true}' * 10
+        return PlainTextResponse(
+            _body, media_type="application/json", headers={"X-Calls": str(_app.state.calls)}
+        )
+
+    return _app
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+def test_compress_roundtrip(encoding: str):
+    assert _DECOMPRESS[encoding](utils.compress(_BODY, encoding, 5)) == _BODY
+
+    _compressor = utils.get_compressor(encoding, 5)
+    _data = _compressor.compress(_BODY[:1000]) + _compressor.compress(_BODY[1000:], True)
+    assert _DECOMPRESS[encoding](_data) == _BODY
+
+
+def test_select_encoding():
+    _middleware = CompressionMiddleware(
+        app=None, runtime_config=runtime_config, compression_config=CompressionConfig()
+    )
+    assert _middleware.select_encoding("gzip, deflate, br, zstd") == "br"
+    assert _middleware.select_encoding("gzip;q=1.0, br;q=0.5") == "gzip"
+    assert _middleware.select_encoding("zstd, gzip") == "zstd"
+    assert _middleware.select_encoding("*") == "br"
+    assert _middleware.select_encoding("br;q=0, *;q=0.1") == "zstd"
+    assert _middleware.select_encoding("identity") is None
+    assert _middleware.select_encoding("deflate") is None
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+def test_compression_middleware(encoding: str):
+    _client = TestClient(_create_app())
+    _headers = {"Accept-Encoding": encoding}
+
+    _response = _client.get("/json", headers=_headers)
+    assert _response.headers["Content-Encoding"] == encoding
+    assert _response.headers["Vary"] == "Accept-Encoding"
+    assert int(_response.headers["Content-Length"]) < len(_BODY)
+    assert _response.content == _BODY
+
+    _response = _client.get("/stream", headers=_headers)
+    assert _response.headers["Content-Encoding"] == encoding
+    assert "Content-Length" not in _response.headers
+    assert _response.content == _BODY * 2
+
+    for _path in ("/small", "/image"):
+        _response = _client.get(_path, headers=_headers)
+        assert "Content-Encoding" not in _response.headers
+
+    _response = _client.get("/json", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in _response.headers
+    assert _response.content == _BODY
+
+
+def test_compression_etag():
+    _client = TestClient(_create_app())
+    _response = _client.get("/etag", headers={"Accept-Encoding": "br"})
+    assert _response.headers["ETag"] == '"abc-br"'
+
+    _headers = {"Accept-Encoding": "br", "If-None-Match": '"abc-br"'}
+    _response = _client.get("/etag", headers=_headers)
+    assert _response.status_code == 304
+    assert _response.headers["ETag"] == '"abc-br"'
+
+    ## Other encodings are other representations, uncompressed one has the upstream entity tag:
+    _response = _client.get("/etag", headers={"Accept-Encoding": "gzip", "If-None-Match": '"abc-br"'})
+    assert (_response.status_code, _response.headers["ETag"]) == (304, '"abc"')
+    _response = _client.get("/etag", headers={"Accept-Encoding": "identity"})
+    assert _response.headers["ETag"] == '"abc"'
+
+
+def test_compression_offload():
+    _client = TestClient(_create_app(offload_min_size=0))
+    _response = _client.get("/json", headers={"Accept-Encoding": "br"})
+    assert _response.headers["Content-Encoding"] == "br"
+    assert _response.content == _BODY
+
+
+def test_compression_static(monkeypatch: pytest.MonkeyPatch):
+    _compressed = []
+    _compress = utils.compress
+
+    def _counted_compress(data: bytes, encoding: str, level: int) -> bytes:
+        _compressed.append(encoding)
+        return _compress(data, encoding, level)
+
+    monkeypatch.setattr(utils, "compress", _counted_compress)
+    _app = _create_app(static={"paths": ["/static"]})
+    _client = TestClient(_app)
+
+    for _ in range(3):
+        for _encoding in ("br", "gzip"):
+            _response = _client.get("/static", headers={"Accept-Encoding": _encoding})
+            assert _response.headers["Content-Encoding"] == _encoding
+            assert _response.content == _BODY
+
+    ## Compressed once per encoding, but the app (and outer middlewares) still handles every request:
+    assert sorted(_compressed) == ["br", "gzip"]
+    assert (_app.state.calls, _response.headers["X-Calls"]) == (6, "6")
+
+    ## Changed body is compressed again, static paths are compressed below `gzip_min_size` too:
+    _response = _client.get("/static", headers={"Accept-Encoding": "br"})
+    assert len(_response.content) < runtime_config.config.gzip_min_size
+    assert _response.headers["Content-Encoding"] == "br"
+    assert _response.content == b'{"changed": true}' * 10
+    assert len(_compressed) == 3
+
+
+def test_openapi_precompressed():
+    _client = TestClient(app)
+    for _ in range(2):
+        _response = _client.get(config.api.docs.openapi_url, headers={"Accept-Encoding": "br"})
+        assert _response.status_code == 200
+        assert _response.headers["Content-Encoding"] == "br"
+        assert _response.headers["X-Request-ID"]
+        assert json.loads(_response.content)["openapi"]
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import shutil
+import pathlib
+
+import pytest
+
+from src.main import app  # noqa: F401
+from api.config import config
+from api.core.configs import MainConfig, load_config
+from api.core.configs import _snapshot
+
+
+_CONFIGS_DIR = pathlib.Path(__file__).parent.parent / "src" / "api" / "configs"
+
+
+@pytest.fixture
+def configs_dir(tmp_path: pathlib.Path) -> str:
+    _configs_dir = tmp_path / "configs"
+    shutil.copytree(_CONFIGS_DIR, _configs_dir)
+    return str(_configs_dir)
+
+
+@pytest.fixture
+def load_calls(monkeypatch: pytest.MonkeyPatch) -> list:
+    _calls = []
+    _load = _snapshot._load
+
+    def _counted_load(**kwargs):
+        _calls.append(1)
+        return _load(**kwargs)
+
+    monkeypatch.setattr(_snapshot, "_load", _counted_load)
+    return _calls
+
+
+def test_config_snapshot(
+    configs_dir: str,
+    tmp_path: pathlib.Path,
+    load_calls: list,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _snapshot_dir = str(tmp_path / "snapshot")
+
+    _config = load_config(MainConfig, [configs_dir], snapshot_dir=_snapshot_dir)
+    assert _config == config
+    assert len(load_calls) == 1
+    assert (tmp_path / "snapshot" / _snapshot._SNAPSHOT_FNAME).is_file()
+
+    _config = load_config(MainConfig, [configs_dir], snapshot_dir=_snapshot_dir)
+    assert _config == config
+    assert len(load_calls) == 1
+
+    ## Config file changed:
+    _api_yml = pathlib.Path(configs_dir) / "api.yml"
+    _api_yml.write_text(_api_yml.read_text().replace("port: 8000", "port: 8001"))
+    _config = load_config(MainConfig, [configs_dir], snapshot_dir=_snapshot_dir)
+    assert _config.api.port == 8001
+    assert len(load_calls) == 2
+
+    ## Any file of config directories changed, also nested and non-YAML ones:
+    _description_md = pathlib.Path(configs_dir) / "docs" / "description.md"
+    _description_md.write_text(_description_md.read_text() + "\nChanged.\n")
+    load_config(MainConfig, [configs_dir], snapshot_dir=_snapshot_dir)
+    assert len(load_calls) == 3
+
+    ## Environment variable changed:
+    monkeypatch.setenv("FT_API_PORT", "8002")
+    _config = load_config(MainConfig, [configs_dir], snapshot_dir=_snapshot_dir)
+    assert _config.api.port == 8002
+    assert len(load_calls) == 4
+
+    load_config(MainConfig, [configs_dir], snapshot_dir=_snapshot_dir)
+    assert len(load_calls) == 4
+
+    ## Corrupted snapshot is replaced:
+    _snapshot_path = tmp_path / "snapshot" / _snapshot._SNAPSHOT_FNAME
+    _snapshot_path.write_bytes(_snapshot_path.read_bytes()[:100])
+    _config = load_config(MainConfig, [configs_dir], snapshot_dir=_snapshot_dir)
+    assert _config.api.port == 8002
+    assert len(load_calls) == 5
+    load_config(MainConfig, [configs_dir], snapshot_dir=_snapshot_dir)
+    assert len(load_calls) == 5
+
+
+def test_bench_config_load(benchmark, configs_dir: str):
+    benchmark(load_config, MainConfig, [configs_dir])
+
+
+def test_bench_config_snapshot_load(benchmark, configs_dir: str, tmp_path: pathlib.Path):
+    _snapshot_dir = str(tmp_path / "snapshot")
+    load_config(MainConfig, [configs_dir], snapshot_dir=_snapshot_dir)
+    benchmark(load_config, MainConfig, [configs_dir], snapshot_dir=_snapshot_dir)
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+import os
+import hashlib
+from typing import Any, Dict, List
+
+import anyio
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+from api.core.constants import HashAlgoEnum
+from api.core.responses import FileStreamResponse, RangeNotSatisfiable, parse_ranges
+from api.endpoints.upload import router as upload_router
+from api.endpoints.upload.service import UploadStore
+
+
+_URL = "/api/v1/uploads/"
+
+
+@pytest.fixture()
+def uploaded(tmp_path, monkeypatch):
+    _store = UploadStore(
+        uploads_dir=str(tmp_path / "uploads"),
+        partial_dir=str(tmp_path / "partial_uploads"),
+        max_size=1024 * 1024,
+        quota=2 * 1024 * 1024,
+        min_free_space=0,
+        expire=3600,
+        write_buffer_size=4096,
+        hash_methods=[HashAlgoEnum.sha256],
+    )
+    monkeypatch.setattr(upload_router, "_store", _store)
+
+    _client = TestClient(app)
+    _data = os.urandom(100_000)
+    _response = _client.post(_URL, headers={"Upload-Length": str(len(_data))})
+    _upload_id = _response.json()["data"]["id"]
+    _response = _client.patch(
+        f"{_URL}{_upload_id}",
+        headers={
+            "Content-Type": "application/offset+octet-stream",
+            "Upload-Offset": "0",
+        },
+        content=_data,
+    )
+    assert _response.status_code == 204
+    return _client, f"{_URL}{_upload_id}/content", _data
+
+
+def test_parse_ranges():
+    assert parse_ranges("bytes=0-9,5-20,-5,100-", 50) == [(0, 21), (45, 50)]
+    assert parse_ranges("bytes=-100", 50) == [(0, 50)]
+    assert parse_ranges("bytes=5-3", 50) is None
+    assert parse_ranges("items=0-1", 50) is None
+    assert parse_ranges("bytes=0-0,2-2,4-4", 50, max_ranges=2) is None
+    with pytest.raises(RangeNotSatisfiable):
+        parse_ranges("bytes=60-", 50)
+
+
+def test_download(uploaded):
+    _client, _url, _data = uploaded
+
+    _response = _client.get(_url)
+    assert _response.status_code == 200
+    assert _response.content == _data
+    assert _response.headers["Accept-Ranges"] == "bytes"
+    _etag = _response.headers["ETag"]
+    assert _etag == f'"{hashlib.sha256(_data).hexdigest()}"'
+
+    assert _client.get(_url, headers={"If-None-Match": _etag}).status_code == 304
+
+    _response = _client.head(_url)
+    assert _response.status_code == 200
+    assert _response.headers["Content-Length"] == str(len(_data))
+    assert not _response.content
+
+
+def test_download_ranges(uploaded):
+    _client, _url, _data = uploaded
+
+    _response = _client.get(_url, headers={"Range": "bytes=10-19"})
+    assert _response.status_code == 206
+    assert _response.content == _data[10:20]
+    assert _response.headers["Content-Range"] == f"bytes 10-19/{len(_data)}"
+
+    _response = _client.get(_url, headers={"Range": "bytes=0-1,-3"})
+    assert _response.status_code == 206
+    _content_type = _response.headers["Content-Type"]
+    assert _content_type.startswith("multipart/byteranges; boundary=")
+    _boundary = _content_type.split("boundary=")[1]
+    assert int(_response.headers["Content-Length"]) == len(_response.content)
+    assert _response.content == (
+        f"--{_boundary}\r\nContent-Type: application/octet-stream\r\n"
+        f"Content-Range: bytes 0-1/{len(_data)}\r\n\r\n".encode()
+        + _data[:2]
+        + f"\r\n--{_boundary}\r\nContent-Type: application/octet-stream\r\n"
+        f"Content-Range: bytes {len(_data) - 3}-{len(_data) - 1}/{len(_data)}\r\n\r\n".encode()
+        + _data[-3:]
+        + f"\r\n--{_boundary}--\r\n".encode()
+    )
+
+    ## Changed representation, full file is sent:
+    _response = _client.get(_url, headers={"Range": "bytes=0-1", "If-Range": '"old"'})
+    assert _response.status_code == 200
+    assert _response.content == _data
+
+    _response = _client.get(_url, headers={"Range": f"bytes={len(_data)}-"})
+    assert _response.status_code == 416
+    assert _response.headers["Content-Range"] == f"bytes */{len(_data)}"
+
+
+async def _call(response: FileStreamResponse, extensions: Dict[str, Any], headers=()) -> List[Dict[str, Any]]:
+    _messages: List[Dict[str, Any]] = []
+    _scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": list(headers),
+        "extensions": extensions,
+    }
+
+    async def _receive() -> Dict[str, Any]:
+        await anyio.sleep(10)
+        return {"type": "http.disconnect"}
+
+    async def _send(message: Dict[str, Any]) -> None:
+        _messages.append(message)
+
+    await response(_scope, _receive, _send)
+    return _messages
+
+
+def test_zero_copy(tmp_path):
+    _file_path = str(tmp_path / "file.bin")
+    with open(_file_path, "wb") as _file:
+        _file.write(os.urandom(1000))
+
+    _messages = anyio.run(
+        _call, FileStreamResponse(_file_path), {"http.response.pathsend": {}}
+    )
+    assert [_message["type"] for _message in _messages] == [
+        "http.response.start",
+        "http.response.pathsend",
+    ]
+    assert _messages[1]["path"] == os.path.abspath(_file_path)
+
+    _messages = anyio.run(
+        _call,
+        FileStreamResponse(_file_path),
+        {"http.response.zerocopysend": {}},
+        [(b"range", b"bytes=100-199")],
+    )
+    assert _messages[0]["status"] == 206
+    assert (_messages[1]["offset"], _messages[1]["count"]) == (100, 100)
+
+    _messages = anyio.run(
+        _call,
+        FileStreamResponse(
+            _file_path, accel_header="X-Accel-Redirect", accel_path="/protected/file.bin"
+        ),
+        {},
+    )
+    assert (b"x-accel-redirect", b"/protected/file.bin") in _messages[0]["headers"]
+    assert _messages[1]["body"] == b""
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+from typing import Any, Dict, List
+
+from src.main import app
+from api.core.events import EventBroadcaster
+from api.endpoints.task import service as task_service
+from api.endpoints.task.schemas import TaskBasePM
+
+
+async def _read_all(broadcaster: EventBroadcaster, subscriber) -> bytes:
+    _frames = b""
+    _stream = broadcaster.stream(subscriber, heartbeat=0.05)
+    async for _chunk in _stream:
+        _frames += _chunk
+        if b": ping" in _chunk:
+            break
+
+    await _stream.aclose()
+    return _frames
+
+
+def test_fan_out_and_resume():
+    async def _run() -> None:
+        _broadcaster = EventBroadcaster(buffer_size=4, queue_size=3)
+        _subscribers = [_broadcaster.subscribe() for _ in range(100)]
+
+        ## From a worker thread, as sync routes publish:
+        _thread = threading.Thread(
+            target=lambda: [_broadcaster.publish("task.updated", {"n": _i}) for _i in range(2)]
+        )
+        _thread.start()
+        _thread.join()
+        _last_id = _broadcaster.publish("task.deleted", {"id": "x"})
+
+        _frames = await _read_all(_broadcaster, _subscribers[0])
+        assert _frames.count(b"event: task.updated") == 2
+        assert f"id: {_last_id}\nevent: task.deleted".encode() in _frames
+        assert len(_broadcaster) == 99
+
+        ## Slow consumer is evicted when its queue is full:
+        _broadcaster.publish("task.updated", {"n": 3})
+        await asyncio.sleep(0)
+        assert len(_broadcaster) == 0
+        assert (await _subscribers[1].get(timeout=0.01)) is None
+
+        ## Resume after the last received event, from the ring buffer:
+        _subscriber = _broadcaster.subscribe(last_event_id=_last_id)
+        _frames = await _read_all(_broadcaster, _subscriber)
+        assert b'data: {"n":3}' in _frames
+        assert b"task.deleted" not in _frames
+
+        ## Unknown, too old (out of the ring buffer) or future event IDs get a reset event:
+        for _i in range(2):
+            _broadcaster.publish("task.updated", {"n": 4 + _i})
+
+        for _event_id in ("other-1", f"{_broadcaster.stream_id}-1", f"{_broadcaster.stream_id}-99"):
+            _subscriber = _broadcaster.subscribe(last_event_id=_event_id)
+            _frames = await _read_all(_broadcaster, _subscriber)
+            assert b"event: reset" in _frames
+            assert b"task.updated" not in _frames
+
+    asyncio.run(_run())
+
+
+def test_task_events_endpoint():
+    async def _run() -> List[Dict[str, Any]]:
+        _messages: List[Dict[str, Any]] = []
+        _disconnect = asyncio.Event()
+        _scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.3"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/v1/tasks/events",
+            "raw_path": b"/api/v1/tasks/events",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"testserver")],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+            "state": {},
+        }
+        _is_requested = False
+
+        async def _receive() -> Dict[str, Any]:
+            nonlocal _is_requested
+            if not _is_requested:
+                _is_requested = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            await _disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        async def _send(message: Dict[str, Any]) -> None:
+            _messages.append(message)
+            if message["type"] == "http.response.start":
+                await asyncio.to_thread(
+                    task_service.create, request_id="test", task_in=TaskBasePM(name="SSE task")
+                )
+            elif b"event: task.created" in message.get("body", b""):
+                _disconnect.set()
+
+        await asyncio.wait_for(app(_scope, _receive, _send), timeout=10)
+        return _messages
+
+    _messages = asyncio.run(_run())
+    assert _messages[0]["status"] == 200
+    assert (b"content-type", b"text/event-stream; charset=utf-8") in _messages[0]["headers"]
+    _body = b"".join(_message.get("body", b"") for _message in _messages[1:])
+    assert _body.startswith(b"retry: 3000\n\n")
+    assert b'"name":"SSE task"' in _body
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import pathlib
+import subprocess
+
+
+_SRC_DIR = str(pathlib.Path(__file__).parent.parent.resolve() / "src")
+## Generous default, CI runners are noisy. Override with `TEST_IMPORT_BUDGET_SEC` env:
+_IMPORT_BUDGET_SEC = float(os.getenv("TEST_IMPORT_BUDGET_SEC", "2.0"))
+## Heavy modules that should only be imported on first use:
+_LAZY_MODULES = [
+    "aiohttp",
+    "aioshutil",
+    "argon2",
+    "jwt",
+    "cryptography.x509",
+    "cryptography.hazmat.primitives.asymmetric.rsa",
+    "uvicorn",
+    "redis",
+]
+_IMPORT_CODE = f"""
+import sys, time, json
+_start = time.perf_counter()
+import main
+_elapsed = time.perf_counter() - _start
+_loaded = [_m for _m in {_LAZY_MODULES!r} if _m in sys.modules]
+print(json.dumps({{"elapsed": _elapsed, "loaded": _loaded}}))
+"""
+
+
+def _import_main() -> dict:
+    _result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_CODE],
+        cwd=_SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(_result.stdout.strip().splitlines()[-1])
+
+
+def test_import_time_budget():
+    ## Best of 3 fresh interpreters, first one also warms up the bytecode cache:
+    _elapsed = min(_import_main()["elapsed"] for _ in range(3))
+    assert (
+        _elapsed < _IMPORT_BUDGET_SEC
+    ), f"Importing 'main' took {_elapsed:.3f}s, budget is {_IMPORT_BUDGET_SEC:.3f}s!"
+
+
+def test_heavy_modules_lazy():
+    _loaded = _import_main()["loaded"]
+    assert not _loaded, f"Heavy modules imported eagerly by 'main': {_loaded}"
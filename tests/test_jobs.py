@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+from api.core.constants import JobStatusEnum
+from api.core.jobs import (
+    JobPM,
+    JobQueueFullError,
+    JobWorkerPool,
+    MemoryJobQueue,
+    SQLiteJobQueue,
+    register_job,
+)
+
+
+_URL = "/api/v1/jobs/"
+_calls = {"flaky": 0, "blocking": 0}
+
+
+@register_job("tests.flaky")
+async def _flaky_job(fail_count: int) -> int:
+    _calls["flaky"] += 1
+    if _calls["flaky"] <= fail_count:
+        raise RuntimeError("Temporary failure")
+
+    return _calls["flaky"]
+
+
+@register_job("tests.sleep")
+async def _sleep_job(seconds: float) -> str:
+    await asyncio.sleep(seconds)
+    return "done"
+
+
+@register_job("tests.blocking", executor="thread")
+def _blocking_job(seconds: float) -> str:
+    _calls["blocking"] += 1
+    time.sleep(seconds)
+    return "done"
+
+
+async def _wait_finished(pool: JobWorkerPool, job_id: str) -> JobPM:
+    for _ in range(200):
+        _job = await pool.get(job_id)
+        if _job.status in (JobStatusEnum.succeeded, JobStatusEnum.failed):
+            return _job
+
+        await asyncio.sleep(0.02)
+
+    raise TimeoutError(job_id)
+
+
+def test_jobs_api():
+    with TestClient(app) as _client:
+        _response = _client.post(_URL, json={"name": "tasks.report", "params": {"min_point": 50}})
+        assert _response.status_code == 202
+        _job_url = _response.headers["Location"]
+        assert _response.json()["data"]["status"] == "queued"
+
+        for _ in range(100):
+            _response = _client.get(_job_url)
+            assert _response.status_code == 200
+            if _response.json()["data"]["status"] == "succeeded":
+                break
+
+            time.sleep(0.02)
+
+        _response = _client.get(f"{_job_url}/result")
+        assert _response.status_code == 200
+        _result = _response.json()["data"]["result"]
+        assert (_result["min_point"], _result["max_point"]) == (50, 100)
+
+        _response = _client.post(_URL, json={"name": "tasks.report", "params": {"point": 1}})
+        assert _response.status_code == 422
+
+        _response = _client.post(_URL, json={"name": "tasks.missing"})
+        assert _response.status_code == 400
+        assert "tasks.report" in _response.json()["error"]["detail"]["available_names"]
+
+        assert _client.get(f"{_URL}1701388800_missing").status_code == 404
+
+
+def test_retry_with_backoff():
+    async def _run() -> None:
+        _calls["flaky"] = 0
+        _pool = JobWorkerPool(
+            queue=MemoryJobQueue(), workers=2, retry_backoff=0.01, poll_interval=0.01
+        )
+        await _pool.start()
+
+        _job = await _pool.submit("tests.flaky", params={"fail_count": 2})
+        _job = await _wait_finished(_pool, _job.id)
+        assert (_job.status, _job.attempts, _job.result) == (JobStatusEnum.succeeded, 3, 3)
+
+        _calls["flaky"] = 0
+        _job = await _pool.submit("tests.flaky", params={"fail_count": 5}, max_retries=1)
+        _job = await _wait_finished(_pool, _job.id)
+        assert (_job.status, _job.attempts) == (JobStatusEnum.failed, 2)
+        assert _job.error == "RuntimeError: Temporary failure"
+
+        with pytest.raises(TypeError):
+            await _pool.submit("tests.flaky", params={"unknown": 1})
+
+        ## Invalid parameter values are not retried:
+        _job = await _pool.submit("tasks.report", params={"min_point": 500})
+        _job = await _wait_finished(_pool, _job.id)
+        assert (_job.status, _job.attempts) == (JobStatusEnum.failed, 1)
+
+        await _pool.stop()
+
+    asyncio.run(_run())
+
+
+def test_queue_limit():
+    async def _run() -> None:
+        _queue = MemoryJobQueue(max_size=1)
+        await _queue.put(JobPM(name="tests.sleep"))
+        with pytest.raises(JobQueueFullError):
+            await _queue.put(JobPM(name="tests.sleep"))
+
+    asyncio.run(_run())
+
+
+def test_sqlite_drain_and_resume(tmp_path):
+    _db_file = str(tmp_path / "jobs.sqlite3")
+
+    async def _run() -> None:
+        _pool = JobWorkerPool(queue=SQLiteJobQueue(db_file=_db_file), poll_interval=0.01)
+        await _pool.start()
+        _fast_job = await _pool.submit("tests.sleep", params={"seconds": 0.01})
+        _slow_job = await _pool.submit("tests.sleep", params={"seconds": 60})
+        await asyncio.sleep(0.2)
+
+        ## Running job doesn't finish in time, it's queued again for the next start:
+        await _pool.stop(timeout=0.1)
+        _pool = JobWorkerPool(queue=SQLiteJobQueue(db_file=_db_file), workers=0)
+        await _pool.start()
+        assert (await _pool.get(_fast_job.id)).status == JobStatusEnum.succeeded
+        _job = await _pool.get(_slow_job.id)
+        assert (_job.status, _job.attempts) == (JobStatusEnum.queued, 0)
+        await _pool.stop()
+
+    asyncio.run(_run())
+
+
+def test_thread_job_not_run_twice(tmp_path):
+    _db_file = str(tmp_path / "jobs.sqlite3")
+
+    async def _run() -> None:
+        _calls["blocking"] = 0
+        _pool = JobWorkerPool(
+            queue=SQLiteJobQueue(db_file=_db_file), timeout=0.1, retry_backoff=0.01, poll_interval=0.01
+        )
+        await _pool.start()
+
+        ## Timed out thread can't be stopped, the attempt isn't retried while it's still running:
+        _job = await _pool.submit("tests.blocking", params={"seconds": 0.3})
+        _job = await _wait_finished(_pool, _job.id)
+        assert (_job.status, _job.attempts) == (JobStatusEnum.failed, 1)
+        assert _job.error.startswith("JobTimeoutError:")
+        await asyncio.sleep(0.4)
+        assert _calls["blocking"] == 1
+        await _pool.stop()
+
+        ## Running thread job is waited for on stop, not queued again:
+        _pool = JobWorkerPool(queue=SQLiteJobQueue(db_file=_db_file), poll_interval=0.01)
+        await _pool.start()
+        _job = await _pool.submit("tests.blocking", params={"seconds": 0.3})
+        await asyncio.sleep(0.1)
+        await _pool.stop(timeout=0.01)
+
+        _pool = JobWorkerPool(queue=SQLiteJobQueue(db_file=_db_file), workers=0)
+        await _pool.start()
+        _job = await _pool.get(_job.id)
+        assert (_job.status, _job.result) == (JobStatusEnum.succeeded, "done")
+        assert _calls["blocking"] == 2
+        await _pool.stop()
+
+    asyncio.run(_run())
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from src.main import app
+from api.core.constants import ConcurrencyAlgorithmEnum
+from api.core.configs import LoadSheddingConfig
+from api.core.concurrency import AdaptiveConcurrencyLimiter
+from api.core.middlewares import LoadSheddingMiddleware, RequestIdMiddleware
+
+
+def test_aimd_limiter():
+    _limiter = AdaptiveConcurrencyLimiter(
+        algorithm=ConcurrencyAlgorithmEnum.aimd,
+        initial_limit=2,
+        min_limit=1,
+        max_limit=3,
+        latency_threshold=0.5,
+        backoff_ratio=0.5,
+    )
+
+    assert _limiter.try_acquire()
+    assert _limiter.try_acquire()
+    assert not _limiter.try_acquire()
+    assert _limiter.rejected == 1
+
+    _limiter.release(latency=0.1)
+    assert _limiter.limit == 3
+    _limiter.release(latency=1.0)
+    assert _limiter.limit == 1
+    assert _limiter.inflight == 0
+
+
+def test_gradient_limiter():
+    _limiter = AdaptiveConcurrencyLimiter(
+        algorithm=ConcurrencyAlgorithmEnum.gradient,
+        initial_limit=20,
+        min_limit=2,
+        max_limit=100,
+    )
+
+    def _run(latency: float) -> None:
+        for _ in range(_limiter.limit):
+            _limiter.try_acquire()
+
+        for _ in range(_limiter.inflight):
+            _limiter.release(latency=latency)
+
+    for _ in range(20):
+        _run(latency=0.01)
+
+    _stable_limit = _limiter.limit
+    assert 20 < _stable_limit
+
+    ## Latency growing far over the baseline shrinks the limit:
+    _run(latency=0.2)
+
+    assert _limiter.limit < _stable_limit
+
+
+@pytest.mark.anyio
+async def test_load_shedding_middleware():
+    _app = FastAPI()
+    _app.add_middleware(
+        LoadSheddingMiddleware,
+        load_shedding_config=LoadSheddingConfig(
+            enabled=True,
+            retry_after=3,
+            classes={"default": {"initial_limit": 1, "min_limit": 1, "max_limit": 1}},
+            exempt_routes=["get_free"],
+        ),
+    )
+    _app.add_middleware(RequestIdMiddleware)
+    _event = asyncio.Event()
+
+    @_app.get("/slow")
+    async def get_slow():
+        await _event.wait()
+        return {}
+
+    @_app.get("/free", name="get_free")
+    async def get_free():
+        return {}
+
+    _transport = httpx.ASGITransport(app=_app)
+    async with httpx.AsyncClient(transport=_transport, base_url="http://test") as _client:
+        _task = asyncio.create_task(_client.get("/slow"))
+        await asyncio.sleep(0.05)
+
+        _response = await _client.get("/slow")
+        assert _response.status_code == 503
+        assert _response.headers["Retry-After"] == "3"
+        assert _response.json()["error"]["code"] == "503_00001"
+        assert (await _client.get("/free")).status_code == 200
+
+        _event.set()
+        assert (await _task).status_code == 200
+        assert (await _client.get("/slow")).status_code == 200
+
+
+@pytest.mark.anyio
+async def test_release_at_response_start(monkeypatch):
+    _latencies = []
+    _release = AdaptiveConcurrencyLimiter.release
+
+    _events = []
+
+    def _record_release(self, latency=None) -> None:
+        _latencies.append(latency)
+        _events.append("released")
+        _release(self, latency=latency)
+
+    monkeypatch.setattr(AdaptiveConcurrencyLimiter, "release", _record_release)
+    _app = FastAPI()
+    _app.add_middleware(
+        LoadSheddingMiddleware, load_shedding_config=LoadSheddingConfig(enabled=True)
+    )
+
+    async def _slow_body():
+        yield b"start"
+        ## Slow client reading a large body:
+        await asyncio.sleep(0.2)
+        _events.append("body_end")
+        yield b"end"
+
+    @_app.get("/download")
+    async def get_download():
+        return StreamingResponse(_slow_body())
+
+    _transport = httpx.ASGITransport(app=_app)
+    async with httpx.AsyncClient(transport=_transport, base_url="http://test") as _client:
+        assert (await _client.get("/download")).content == b"startend"
+
+    assert len(_latencies) == 1
+    assert _latencies[0] < 0.1
+    ## Slot isn't held while the body is streamed:
+    assert _events == ["released", "body_end"]
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+import json
+import pathlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from src.main import app
+from api.config import config
+from api import router as router_module
+from api.router import build_openapi
+from api.core.responses import OpenAPIDocument
+from api.helpers.openapi import generate_openapi
+
+
+def test_openapi_route():
+    _client = TestClient(app)
+    _response = _client.get(config.api.docs.openapi_url, headers={"Accept-Encoding": "br"})
+    assert _response.status_code == 200
+    assert _response.headers["Content-Encoding"] == "br"
+    assert _response.headers["Cache-Control"] == config.api.docs.openapi_cache_control
+    assert json.loads(_response.content) == app.openapi()
+
+    _etag = _response.headers["ETag"]
+    _response = _client.get(
+        config.api.docs.openapi_url,
+        headers={"Accept-Encoding": "br", "If-None-Match": _etag},
+    )
+    assert _response.status_code == 304
+    assert _response.headers["ETag"] == _etag
+
+    _response = _client.get(config.api.docs.openapi_url, headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in _response.headers
+    assert _response.headers["ETag"] != _etag
+    assert _response.content == app.state.openapi.content
+
+
+def test_openapi_operation_ids():
+    _operation_ids = [
+        _operation["operationId"]
+        for _path_item in app.openapi()["paths"].values()
+        for _operation in _path_item.values()
+    ]
+    assert len(_operation_ids) == len(set(_operation_ids))
+
+
+def test_openapi_fingerprint():
+    def _get_fingerprint(inner_type: type) -> str:
+        class InnerPM(BaseModel):
+            value: inner_type
+
+        class ResPM(BaseModel):
+            data: InnerPM
+
+        _app = FastAPI()
+
+        @_app.get("/items", response_model=ResPM)
+        def get_items():
+            return {}
+
+        return OpenAPIDocument.get_fingerprint(_app)
+
+    assert _get_fingerprint(int) == _get_fingerprint(int)
+    ## Nested models are part of the fingerprint:
+    assert _get_fingerprint(int) != _get_fingerprint(str)
+
+
+def test_build_openapi_file(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    _file_path = tmp_path / "openapi.json"
+    _schema = dict(
+        app.openapi(),
+        **{"x-prebuilt": True, "x-fingerprint": OpenAPIDocument.get_fingerprint(app)},
+    )
+    OpenAPIDocument(schema=_schema, encodings=[]).save(str(_file_path))
+    _docs = config.api.docs.model_copy(update={"openapi_file": str(_file_path)})
+    _config = config.model_copy(
+        update={"api": config.api.model_copy(update={"docs": _docs})}
+    )
+    monkeypatch.setattr(router_module, "config", _config)
+    monkeypatch.setattr(app, "openapi_schema", app.openapi_schema)
+
+    assert build_openapi(app).schema["x-prebuilt"]
+
+    ## Outdated file is ignored, other version or other routes:
+    for _update in ({"info": dict(_schema["info"], version="0.0.0")}, {"x-fingerprint": "other"}):
+        monkeypatch.setattr(app, "openapi_schema", None)
+        OpenAPIDocument(schema=dict(_schema, **_update), encodings=[]).save(str(_file_path))
+        assert "x-prebuilt" not in build_openapi(app).schema
+
+
+def test_generate_openapi(tmp_path: pathlib.Path):
+    _file_path = str(tmp_path / "openapi.json")
+    assert not generate_openapi(output_path=_file_path, check=True)
+    assert not generate_openapi(output_path=_file_path)
+    assert generate_openapi(output_path=_file_path, check=True)
+    with open(_file_path, "r", encoding="utf-8") as _file:
+        assert json.load(_file)["info"]["version"] == config.version
+
+
+def test_openapi_docs_file_up_to_date():
+    ## Regenerate with `./scripts/openapi.sh` after changing routes or schemas:
+    _file_path = pathlib.Path(__file__).parent.parent / "docs" / "pages" / "api-docs" / "openapi.json"
+    assert generate_openapi(output_path=str(_file_path), check=True)
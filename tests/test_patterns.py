@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import re
+import random
+import string
+from typing import List
+
+import pytest
+
+from src.main import app  # noqa: F401
+from api.core import utils
+from api.core.constants import ALPHANUM_HOST_REGEX, REQUEST_ID_REGEX
+
+
+_MODES = ["BASE", "HTML", "LOW", "MEDIUM", "HIGH", "SCRIPT", "SQL", "STRICT"]
+
+
+def _gen_texts() -> List[str]:
+    _random = random.Random(0)
+    _texts = ["", "Task 1", "작업 <이름> Ажил & 'нэр'", "a\tb\nc d"]
+    for _length in (8, 64, 300):
+        for _ in range(20):
+            _texts.append("".join(_random.choices(string.printable, k=_length)))
+
+    return _texts
+
+
+def test_registry():
+    _registered = utils.REGEX_PATTERNS[ALPHANUM_HOST_REGEX]
+    assert utils.get_pattern(ALPHANUM_HOST_REGEX) is _registered
+    _compiled = re.compile(r"^x+$")
+    assert utils.get_pattern(_compiled) is _compiled
+    assert utils.get_pattern(r"^y+$") is utils.get_pattern(r"^y+$")
+
+    ## Only literal character classes have `str.translate()` tables:
+    for _mode in _MODES:
+        assert utils.get_char_class(utils.get_special_chars_pattern(_mode)) is not None
+
+    assert utils.get_char_class(ALPHANUM_HOST_REGEX) is None
+    assert utils.get_char_class(REQUEST_ID_REGEX) is None
+
+
+@pytest.mark.parametrize("mode", _MODES)
+def test_special_chars_same_as_regex(mode: str):
+    _pattern = utils.get_special_chars_pattern(mode)
+    for _text in _gen_texts():
+        assert utils.validator.has_special_chars(_text, mode.lower()) == bool(
+            re.search(_pattern, _text)
+        )
+        assert utils.sanitizer.clean_special_chars(_text, mode) == re.sub(
+            _pattern, "", _text
+        )
+
+
+def test_unsupported_mode():
+    with pytest.raises(ValueError, match="Unsupported mode: NOPE"):
+        utils.validator.has_special_chars("text", "nope")
+
+    with pytest.raises(ValueError, match="Unsupported mode: NOPE"):
+        utils.sanitizer.clean_special_chars("text", "nope")
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+import string
+from collections import Counter
+
+from src.main import app  # noqa: F401
+from api.core import utils
+
+
+_ALPHANUM_CHARS = set(string.ascii_letters + string.digits)
+_ALL_CHARS = _ALPHANUM_CHARS | set(string.punctuation)
+
+
+def test_gen_random_string():
+    for _length in (1, 16, 64, 1000):
+        _random_str = utils.gen_random_string(_length)
+        assert len(_random_str) == _length
+        assert set(_random_str) <= _ALPHANUM_CHARS
+
+    assert set(utils.gen_random_string(1000, is_alphanum=False)) <= _ALL_CHARS
+
+
+def test_gen_random_strings():
+    _random_strs = utils.gen_random_strings(1000, length=32)
+    assert len(_random_strs) == 1000
+    assert all(len(_random_str) == 32 for _random_str in _random_strs)
+    assert len(set(_random_strs)) == 1000
+
+
+def test_random_string_distribution():
+    ## Rejection sampling, every character is equally likely (expected 1000 each):
+    _counts = Counter(utils.gen_random_string(62_000))
+    assert set(_counts) == _ALPHANUM_CHARS
+    assert 800 < min(_counts.values()) and max(_counts.values()) < 1200
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.main import app
+from api.config import config
+from api.core.cache import MemoryCache, RedisCache
+from api.core.configs import RateLimitConfig
+from api.core.middlewares import RateLimitMiddleware, RequestIdMiddleware
+from api.core.rate_limit import SharedRateLimiter, TokenBucketLimiter
+from api.helpers.crypto import jwt as jwt_helper
+
+
+def test_token_bucket():
+    _limiter = TokenBucketLimiter(max_keys=2)
+
+    assert _limiter.acquire("a", rate=1.0, burst=2, now=0.0) == (True, 1.0)
+    assert _limiter.acquire("a", rate=1.0, burst=2, now=0.0) == (True, 0.0)
+    assert _limiter.acquire("a", rate=1.0, burst=2, now=0.5) == (False, 0.5)
+    assert _limiter.acquire("a", rate=1.0, burst=2, now=1.0)[0]
+
+    _limiter.acquire("b", rate=1.0, burst=2, now=1.0)
+    _limiter.acquire("c", rate=1.0, burst=2, now=1.0)
+    ## Least recently used bucket is evicted and starts full again:
+    assert len(_limiter) == 2
+    assert _limiter.acquire("a", rate=1.0, burst=2, now=1.0) == (True, 1.0)
+
+
+@pytest.mark.anyio
+async def test_shared_rate_limiter(fake_redis_server):
+    _now = 1_000_000.0
+    async with RedisCache(url=fake_redis_server.url, key_prefix="rl:") as _redis:
+        for _cache in (MemoryCache(), _redis):
+            await _cache.clear()
+            _limiter = SharedRateLimiter(cache=_cache)
+            for _ in range(3):
+                assert (await _limiter.acquire("k", rate=1.0, burst=3, now=_now))[0]
+
+            _is_allowed, _retry_after = await _limiter.acquire(
+                "k", rate=1.0, burst=3, now=_now + 1.0
+            )
+            assert not _is_allowed
+            assert 0 < _retry_after <= 3
+
+            ## Previous window is weighted by its remaining overlap:
+            assert (await _limiter.acquire("k", rate=1.0, burst=3, now=_now + 5.5))[0]
+
+
+def _create_app(**kwargs) -> FastAPI:
+    _app = FastAPI()
+    _rate_limit_config = RateLimitConfig(
+        **{
+            "enabled": True,
+            "default": {"rate": 0.01, "burst": 2},
+            "routes": {"get_slow": {"rate": 0.01, "burst": 1}},
+            "exempt_routes": ["get_free"],
+            **kwargs,
+        }
+    )
+    _app.add_middleware(
+        RateLimitMiddleware,
+        rate_limit_config=_rate_limit_config,
+        jwt_config=config.api.security.jwt,
+    )
+    _app.add_middleware(RequestIdMiddleware)
+
+    @_app.get("/free", name="get_free")
+    def get_free():
+        return {}
+
+    @_app.get("/slow", name="get_slow")
+    def get_slow():
+        return {}
+
+    @_app.get("/items/{item_id}", name="get_item")
+    def get_item(item_id: int):
+        return {}
+
+    return _app
+
+
+def test_rate_limit_middleware():
+    with TestClient(_create_app()) as _client:
+        _response = _client.get("/items/1")
+        assert _response.status_code == 200
+        assert _response.headers["RateLimit-Limit"] == "2"
+        assert _response.headers["RateLimit-Remaining"] == "1"
+        assert _client.get("/items/2").status_code == 200
+
+        _response = _client.get("/items/3")
+        assert _response.status_code == 429
+        assert 1 <= int(_response.headers["Retry-After"])
+        assert _response.headers["RateLimit-Remaining"] == "0"
+        assert _response.json()["error"]["code"] == "429_00001"
+
+        ## Per-route rule has its own bucket:
+        assert _client.get("/slow").status_code == 200
+        assert _client.get("/slow").status_code == 429
+
+        for _ in range(5):
+            _response = _client.get("/free")
+            assert _response.status_code == 200
+            assert "RateLimit-Limit" not in _response.headers
+
+
+def test_rate_limit_key_by_jwt():
+    _secret = config.api.security.jwt.secret
+    _algorithm = config.api.security.jwt.algorithm
+
+    def _auth_headers(sub: str) -> dict:
+        _token = jwt_helper.encode(
+            payload={"sub": sub, "jti": sub, "exp": int(time.time()) + 60},
+            key=_secret,
+            algorithm=_algorithm,
+        )
+        return {"Authorization": f"Bearer {_token}"}
+
+    with TestClient(_create_app()) as _client:
+        for _ in range(2):
+            assert _client.get("/items/1", headers=_auth_headers("user1")).status_code == 200
+
+        assert _client.get("/items/1", headers=_auth_headers("user1")).status_code == 429
+        ## Other users and anonymous clients have their own buckets:
+        assert _client.get("/items/1", headers=_auth_headers("user2")).status_code == 200
+        assert _client.get("/items/1").status_code == 200
+        ## Invalid tokens fall back to client IP:
+        _headers = {"Authorization": "Bearer invalid"}
+        assert _client.get("/items/1", headers=_headers).status_code == 200
+        assert _client.get("/items/1", headers=_headers).status_code == 429
+
+
+def test_rate_limit_key_by_api_key():
+    with TestClient(_create_app(key_by=["api_key", "ip"], api_keys=["known-key"])) as _client:
+        _headers = {"X-API-Key": "known-key"}
+        for _ in range(2):
+            assert _client.get("/items/1", headers=_headers).status_code == 200
+
+        assert _client.get("/items/1", headers=_headers).status_code == 429
+        ## Unknown keys don't get their own buckets, they share the client IP bucket:
+        assert _client.get("/items/1", headers={"X-API-Key": "random-1"}).status_code == 200
+        assert _client.get("/items/1", headers={"X-API-Key": "random-2"}).status_code == 200
+        assert _client.get("/items/1", headers={"X-API-Key": "random-3"}).status_code == 429
+
+
+def test_app_rate_limit_exempt():
+    with TestClient(app) as _client:
+        for _ in range(50):
+            _response = _client.get("/api/v1/ping")
+            assert _response.status_code == 200
+            assert "RateLimit-Limit" not in _response.headers
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+from fastapi.testclient import TestClient
+
+from src.main import app
+from api.config import config
+from api.core.responses import ResponseCache
+
+
+client = TestClient(app)
+
+_TASKS_URL = f"{config.api.prefix}/tasks"
+
+
+def _get_task_id() -> str:
+    _response = client.get(f"{_TASKS_URL}/?limit=1")
+    return _response.json()["data"][0]["id"]
+
+
+def test_task_etag_not_modified():
+    _task_url = f"{_TASKS_URL}/{_get_task_id()}"
+
+    _response = client.get(_task_url)
+    assert _response.status_code == 200
+    _etag = _response.headers["ETag"]
+    assert _etag.startswith('"') and _etag.endswith('"')
+    assert (
+        _response.headers["Cache-Control"]
+        == config.api.cache.response.cache_control["get_task"]
+    )
+
+    _response = client.get(_task_url, headers={"If-None-Match": _etag})
+    assert _response.status_code == 304
+    assert _response.content == b""
+    assert _response.headers["ETag"] == _etag
+
+    _response = client.get(_task_url, headers={"If-None-Match": f'"other", W/{_etag}'})
+    assert _response.status_code == 304
+
+    _response = client.get(_task_url, headers={"If-None-Match": '"other"'})
+    assert _response.status_code == 200
+    assert _response.json()["data"]["id"] in _task_url
+
+
+def test_task_update_invalidates():
+    _task_url = f"{_TASKS_URL}/{_get_task_id()}"
+
+    _response = client.get(_task_url)
+    _etag = _response.headers["ETag"]
+    _point = _response.json()["data"]["point"]
+    _list_etag = client.get(f"{_TASKS_URL}/?limit=1").headers["ETag"]
+
+    _new_point = (_point + 1) % 100
+    assert client.put(_task_url, json={"point": _new_point}).status_code == 200
+
+    _response = client.get(_task_url, headers={"If-None-Match": _etag})
+    assert _response.status_code == 200
+    assert _response.headers["ETag"] != _etag
+    assert _response.json()["data"]["point"] == _new_point
+
+    _response = client.get(
+        f"{_TASKS_URL}/?limit=1", headers={"If-None-Match": _list_etag}
+    )
+    assert _response.status_code == 200
+    assert _response.json()["data"][0]["point"] == _new_point
+
+
+def test_tasks_list_cache():
+    _response = client.get(f"{_TASKS_URL}/?skip=1&limit=3")
+    assert _response.status_code == 200
+    _etag = _response.headers["ETag"]
+    assert (
+        _response.headers["Cache-Control"]
+        == config.api.cache.response.cache_control["get_tasks"]
+    )
+
+    ## Same query in different order is the same cache entry:
+    _response = client.get(
+        f"{_TASKS_URL}/?limit=3&skip=1", headers={"If-None-Match": _etag}
+    )
+    assert _response.status_code == 304
+
+    _response = client.get(f"{_TASKS_URL}/?skip=2&limit=3")
+    assert _response.headers["ETag"] != _etag
+
+    _response = client.post(f"{_TASKS_URL}/", json={"name": "Task cache", "point": 1})
+    assert _response.status_code == 201
+    _task_id = _response.json()["data"]["id"]
+
+    _response = client.get(f"{_TASKS_URL}/?limit=1")
+    assert _response.json()["data"][0]["id"] == _task_id
+
+    assert client.delete(f"{_TASKS_URL}/{_task_id}").status_code == 204
+    assert client.get(f"{_TASKS_URL}/{_task_id}").status_code == 404
+    assert client.get(f"{_TASKS_URL}/?limit=1").json()["data"][0]["id"] != _task_id
+
+
+def test_cache_lru_version():
+    _cache = ResponseCache(max_size=2)
+
+    _cache.set(key="a", version=1, content={"a": 1})
+    _cache.set(key="b", version=1, content={"b": 1})
+    assert _cache.get(key="a", version=1)
+    _cache.set(key="c", version=1, content={"c": 1})
+
+    assert _cache.get(key="b", version=1) is None
+    assert _cache.get(key="a", version=1).content_json == b'{"a":1}'
+    assert _cache.get(key="a", version=2) is None
+    assert _cache.get(key="a", version=1) is None
+
+    _cache = ResponseCache(enabled=False)
+    _entry = _cache.set(key="a", version=1, content=[1, 2])
+    assert _entry.etag
+    assert _cache.get(key="a", version=1) is None
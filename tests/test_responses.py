@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+import json
+from typing import Optional
+
+import pytest
+from starlette.requests import Request
+from fastapi.testclient import TestClient
+
+from src.main import app
+from api.config import config
+from api.core import utils
+from api.core.responses import BaseResponse
+from api.endpoints.task import service as task_service
+from api.endpoints.task.schemas import ResTaskPM
+
+
+client = TestClient(app)
+
+_REQUEST_ID = "211203afa2844d55b1c9d38b9f8a7063"
+
+
+def _make_request(
+    path: str = "/api/v1/ping",
+    query_string: bytes = b"",
+    headers: Optional[list] = None,
+    root_path: str = "",
+    server: tuple = ("testserver", 80),
+    scheme: str = "http",
+) -> Request:
+    if headers is None:
+        headers = [(b"host", b"testserver")]
+
+    _scope = {
+        "type": "http",
+        "method": "GET",
+        "scheme": scheme,
+        "path": path,
+        "root_path": root_path,
+        "query_string": query_string,
+        "headers": headers,
+        "server": server,
+        "state": {"request_id": _REQUEST_ID},
+    }
+    return Request(_scope)
+
+
+def test_ping_envelope():
+    _response = client.get("/api/v1/ping?a=1", headers={"X-Request-ID": _REQUEST_ID})
+    assert _response.status_code == 200
+
+    _body = _response.json()
+    assert _body["message"] == "Pong!"
+    assert _body["links"] == {"self": "/api/v1/ping?a=1"}
+    assert _body["meta"] == {
+        "request_id": _REQUEST_ID,
+        "base_url": "http://testserver",
+        "method": "GET",
+        "api_version": config.api.version,
+        "version": config.version,
+    }
+    assert _response.headers["X-Request-ID"] == _REQUEST_ID
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"query_string": b"skip=0&limit=10"},
+        {"root_path": "/prefix", "path": "/prefix/api/v1/ping"},
+        {"headers": [(b"host", b"example.com:8443")], "scheme": "https"},
+        {"headers": [], "server": ("127.0.0.1", 8000)},
+        {"headers": [], "server": ("127.0.0.1", 443), "scheme": "https"},
+        {"headers": [], "server": None},
+    ],
+)
+def test_request_urls(kwargs: dict):
+    _request = _make_request(**kwargs)
+    assert utils.get_base_url(_request) == str(_request.base_url)[:-1]
+    assert utils.get_relative_url(_request) == str(_request.url).replace(
+        f"{_request.url.scheme}://{_request.url.netloc}", ""
+    )
+
+
+def test_error_headers():
+    _response = BaseResponse(request=_make_request(), status_code=503)
+    assert _response.headers["X-Error-Code"] == "503_00000"
+    assert _response.headers["Cache-Control"] == "no-cache, no-store, must-revalidate"
+    assert _response.headers["Retry-After"] == "1800"
+
+    _response = BaseResponse(
+        request=_make_request(),
+        status_code=503,
+        error={"code": "503_10000", "detail": "secret"},
+        headers={"Retry-After": "5"},
+    )
+    assert _response.headers["X-Error-Code"] == "503_10000"
+    assert _response.headers["Retry-After"] == "5"
+    if not config.debug:
+        assert json.loads(_response.body)["error"]["detail"] is None
+
+    _response = BaseResponse(request=_make_request(), status_code=404)
+    assert _response.headers["X-Error-Code"] == "404_00000"
+    assert "Cache-Control" not in _response.headers
+    assert json.loads(_response.body)["message"] == "Not Found"
+
+
+def test_bench_ping_response(benchmark):
+    _request = _make_request()
+    _response: BaseResponse = benchmark(
+        BaseResponse,
+        request=_request,
+        message="Pong!",
+        headers={"Cache-Control": "no-cache"},
+    )
+    assert _response.status_code == 200
+
+
+def test_bench_task_response(benchmark):
+    _task = task_service._TASKS_DB[0]
+    _request = _make_request(path=f"/api/v1/tasks/{_task.id}")
+    _response: BaseResponse = benchmark(
+        BaseResponse,
+        request=_request,
+        message="Successfully retrieved task info.",
+        content=_task,
+        response_schema=ResTaskPM,
+    )
+    assert json.loads(_response.body)["data"]["id"] == _task.id
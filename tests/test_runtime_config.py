@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+import shutil
+import pathlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from src.main import app  # noqa: F401
+from api.config import config, runtime_config
+from api.core.configs import (
+    CompressionConfig,
+    RuntimeConfig,
+    VersionedConfig,
+    load_runtime_config,
+)
+from api.core.middlewares import CompressionMiddleware, RuntimeCORSMiddleware
+from api import lifespan as lifespan_module
+
+
+_CONFIGS_DIR = pathlib.Path(__file__).parent.parent / "src" / "api" / "configs"
+
+
+@pytest.fixture
+def configs_dir(tmp_path: pathlib.Path) -> pathlib.Path:
+    _configs_dir = tmp_path / "configs"
+    shutil.copytree(_CONFIGS_DIR, _configs_dir)
+    return _configs_dir
+
+
+def _create_app(versioned_config: VersionedConfig) -> FastAPI:
+    _app = FastAPI()
+    _app.add_middleware(
+        CompressionMiddleware,
+        runtime_config=versioned_config,
+        compression_config=CompressionConfig(),
+    )
+    _app.add_middleware(RuntimeCORSMiddleware, runtime_config=versioned_config)
+
+    @_app.get("/text")
+    def _get_text():
+        return PlainTextResponse("x" * 2048)
+
+    return _app
+
+
+def test_runtime_config_initial(configs_dir: pathlib.Path):
+    _runtime_config = load_runtime_config([str(configs_dir)])
+    assert _runtime_config.log_level == config.logger.level.value
+    assert _runtime_config.gzip_min_size == config.api.gzip_min_size
+    assert _runtime_config.cors == config.api.security.cors
+    assert runtime_config.config == _runtime_config
+
+
+def test_versioned_config(configs_dir: pathlib.Path):
+    _versioned_config = VersionedConfig(config=load_runtime_config([str(configs_dir)]))
+    assert _versioned_config.version == 1
+
+    ## Same values don't change the version:
+    assert _versioned_config.swap(load_runtime_config([str(configs_dir)])) == 1
+
+    _api_yml = configs_dir / "api.yml"
+    _api_yml.write_text(_api_yml.read_text().replace("gzip_min_size: 1024", "gzip_min_size: 4096"))
+    assert _versioned_config.swap(load_runtime_config([str(configs_dir)])) == 2
+    assert _versioned_config.get() == (2, _versioned_config.config)
+    assert _versioned_config.config.gzip_min_size == 4096
+
+    _api_yml.write_text(_api_yml.read_text().replace("gzip_min_size: 4096", "gzip_min_size: -1"))
+    with pytest.raises(ValueError):
+        load_runtime_config([str(configs_dir)])
+
+
+def test_runtime_middlewares():
+    _cors = config.api.security.cors.model_copy(update={"allow_origins": ["http://a.test"]})
+    _versioned_config = VersionedConfig(
+        config=RuntimeConfig(log_level="INFO", gzip_min_size=1024, cors=_cors)
+    )
+    _client = TestClient(_create_app(_versioned_config))
+    _headers = {"Accept-Encoding": "gzip", "Origin": "http://b.test"}
+
+    _response = _client.get("/text", headers=_headers)
+    assert _response.headers.get("Content-Encoding") == "gzip"
+    assert "Access-Control-Allow-Origin" not in _response.headers
+
+    _versioned_config.swap(
+        RuntimeConfig(
+            log_level="INFO",
+            gzip_min_size=4096,
+            cors=_cors.model_copy(update={"allow_origins": ["http://b.test"]}),
+        )
+    )
+    _response = _client.get("/text", headers=_headers)
+    assert "Content-Encoding" not in _response.headers
+    assert _response.headers["Access-Control-Allow-Origin"] == "http://b.test"
+
+
+@pytest.mark.anyio
+async def test_reload_runtime_config(
+    configs_dir: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    _versioned_config = VersionedConfig(config=runtime_config.config)
+    _log_levels = []
+    monkeypatch.setattr(lifespan_module, "CONFIGS_DIR", str(configs_dir))
+    monkeypatch.setattr(lifespan_module, "runtime_config", _versioned_config)
+    monkeypatch.setattr(lifespan_module, "set_log_level", _log_levels.append)
+
+    assert not await lifespan_module.reload_runtime_config()
+
+    _logger_yml = configs_dir / "logger.yml"
+    _logger_yml.write_text(
+        _logger_yml.read_text().replace(
+            f'level: "{config.logger.level.value}"', 'level: "DEBUG"'
+        )
+    )
+    assert await lifespan_module.reload_runtime_config()
+    assert _versioned_config.version == 2
+    assert _log_levels == ["DEBUG"]
+
+    ## Invalid config keeps the current one:
+    _logger_yml.write_text(_logger_yml.read_text().replace('level: "DEBUG"', 'level: "LOUD"'))
+    assert not await lifespan_module.reload_runtime_config()
+    assert _versioned_config.version == 2
+    assert _versioned_config.config.log_level == "DEBUG"
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+import threading
+
+import anyio.to_thread
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from src.main import app as main_app
+from api.core import utils
+from api.core.middlewares import RequestIdMiddleware
+from api.core.responses import BaseResponse, single_flight
+
+
+_N_REQUESTS = 8
+
+
+def test_single_flight_threads():
+    _flight = utils.SingleFlight()
+    _calls = []
+    _barrier = threading.Barrier(_N_REQUESTS)
+    _results = []
+
+    def _compute() -> int:
+        _calls.append(1)
+        time.sleep(0.2)
+        return 42
+
+    def _worker() -> None:
+        _barrier.wait()
+        _results.append(_flight.do("key", _compute))
+
+    _threads = [threading.Thread(target=_worker) for _ in range(_N_REQUESTS)]
+    for _thread in _threads:
+        _thread.start()
+
+    for _thread in _threads:
+        _thread.join()
+
+    assert len(_calls) == 1
+    assert sorted(_results) == [(42, False)] + [(42, True)] * (_N_REQUESTS - 1)
+
+    def _fail() -> None:
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        _flight.do("key", _fail)
+
+    ## Nothing is kept after the call:
+    assert _flight.do("key", lambda: 1) == (1, False)
+
+
+@pytest.mark.anyio
+async def test_single_flight_async():
+    _flight = utils.SingleFlight()
+    _calls = []
+
+    async def _compute(val: int) -> int:
+        _calls.append(1)
+        await asyncio.sleep(0.1)
+        return val
+
+    _results = await asyncio.gather(
+        *[_flight.async_do("key", _compute, 7) for _ in range(_N_REQUESTS)]
+    )
+    assert len(_calls) == 1
+    assert sorted(_results) == [(7, False)] + [(7, True)] * (_N_REQUESTS - 1)
+
+    ## Cancelled leader doesn't fail the followers:
+    _leader = asyncio.ensure_future(_flight.async_do("key", _compute, 8))
+    await asyncio.sleep(0)
+    _follower = asyncio.ensure_future(_flight.async_do("key", _compute, 8))
+    await asyncio.sleep(0)
+    _leader.cancel()
+    assert await _follower == (8, False)
+
+
+def _create_app() -> FastAPI:
+    _app = FastAPI()
+    _app.add_middleware(RequestIdMiddleware)
+    _app.state.calls = []
+
+    @_app.get("/sync/{item_id}")
+    @single_flight()
+    def _get_sync(request: Request, item_id: str, q: str = ""):
+        _app.state.calls.append(item_id)
+        time.sleep(0.2)
+        return BaseResponse(request=request, content={"id": item_id, "q": q})
+
+    @_app.get("/async/{item_id}")
+    @single_flight()
+    async def _get_async(request: Request, item_id: str, q: str = ""):
+        _app.state.calls.append(item_id)
+        await asyncio.sleep(0.2)
+        return BaseResponse(request=request, content={"id": item_id, "q": q})
+
+    return _app
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("route", ["sync", "async"])
+async def test_single_flight_route(route: str, monkeypatch: pytest.MonkeyPatch):
+    ## Followers don't take threads: with a single thread they would run the handler again one by one:
+    monkeypatch.setattr(anyio.to_thread.current_default_thread_limiter(), "total_tokens", 1)
+    _app = _create_app()
+    _transport = httpx.ASGITransport(app=_app)
+    async with httpx.AsyncClient(transport=_transport, base_url="http://test") as _client:
+        _responses = await asyncio.gather(
+            *[
+                _client.get(
+                    f"/{route}/1?b=2&q=x" if _i % 2 else f"/{route}/1?q=x&b=2",
+                    headers={"X-Request-ID": f"request{_i}"},
+                )
+                for _i in range(_N_REQUESTS)
+            ],
+            _client.get(f"/{route}/2"),
+        )
+
+    assert sorted(_app.state.calls) == ["1", "2"]
+    for _i, _response in enumerate(_responses[:-1]):
+        _body = _response.json()
+        assert _response.status_code == 200
+        assert _body["data"] == {"id": "1", "q": "x"}
+        ## Each coalesced request still gets its own request specific metadata:
+        assert _body["meta"]["request_id"] == f"request{_i}"
+        assert _response.headers["X-Request-ID"] == f"request{_i}"
+
+    assert _responses[-1].json()["data"] == {"id": "2", "q": ""}
+
+
+def test_task_routes_decorated():
+    for _route in main_app.routes:
+        if getattr(_route, "name", None) in ("get_tasks", "get_task"):
+            assert hasattr(_route.endpoint, "__wrapped__")
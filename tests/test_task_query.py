@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+from fastapi.testclient import TestClient
+
+from src.main import app
+from api.config import config
+from api.core.indexes import PrefixTrie, SortedIndex
+
+
+_TASKS_URL = f"{config.api.prefix}/tasks/"
+
+
+def test_indexes():
+    _index = SortedIndex()
+    for _seq, _key in enumerate([5, 1, 5, 3, 9], start=1):
+        _index.add(_key, _seq)
+
+    assert list(_index.scan()) == [2, 4, 1, 3, 5]
+    assert list(_index.scan(min_key=3, max_key=5, reverse=True)) == [3, 1, 4]
+    assert _index.count(min_key=5) == 3
+    assert _index.remove(5, 1) and (not _index.remove(5, 1))
+    assert list(_index.scan(min_key=5, max_key=5)) == [3]
+
+    _trie = PrefixTrie()
+    for _seq, _key in enumerate(["Task 1", "task 10", "Task 2", "Other"], start=1):
+        _trie.add(_key, _seq)
+
+    assert (_trie.count("TASK 1"), set(_trie.scan("task 1"))) == (2, {1, 2})
+    assert _trie.remove("task 10", 2) and (not _trie.remove("Task 3", 3))
+    assert (_trie.count("task"), len(_trie), list(_trie.scan("x"))) == (2, 3, [])
+
+
+def test_filter_sort_fields():
+    with TestClient(app) as _client:
+        _params = {"name_prefix": "task 1", "max_point": 15, "sort": "-point", "limit": 3}
+        _response = _client.get(_TASKS_URL, params=_params)
+        assert _response.status_code == 200
+        _json = _response.json()
+        assert [_task["point"] for _task in _json["data"]] == [15, 14, 13]
+        assert _json["meta"]["all_count"] == 7
+        assert "name_prefix=task+1" in _json["links"]["next"]
+
+        _params = {"name_contains": "9", "min_point": 90, "sort": "name", "fields": "name"}
+        _json = _client.get(_TASKS_URL, params=_params).json()
+        assert [_task["name"] for _task in _json["data"]][:2] == ["Task 90", "Task 91"]
+        assert set(_json["data"][0].keys()) == {"id", "name"}
+
+        ## Without filters, sorted index is read in order:
+        _json = _client.get(_TASKS_URL, params={"sort": "point", "skip": 1, "limit": 2}).json()
+        assert [_task["point"] for _task in _json["data"]] == [2, 3]
+
+        _task = _client.post(_TASKS_URL, json={"name": "Indexed task", "point": 0}).json()["data"]
+        _task_url = f"{_TASKS_URL}{_task['id']}"
+        _params = {"created_from": _task["created_at"], "max_point": 0, "sort": "point,-created_at"}
+        assert _client.get(_TASKS_URL, params=_params).json()["data"][0]["id"] == _task["id"]
+
+        ## Indexes follow updates and deletes:
+        _client.put(_task_url, json={"name": "Renamed task", "point": 100})
+        _json = _client.get(_TASKS_URL, params={"name_prefix": "indexed"}).json()
+        assert _json["meta"]["all_count"] == 0
+        _json = _client.get(_TASKS_URL, params={"name_prefix": "renamed", "min_point": 100}).json()
+        assert _json["data"][0]["id"] == _task["id"]
+
+        _client.delete(_task_url)
+        _json = _client.get(_TASKS_URL, params={"name_prefix": "renamed"}).json()
+        assert _json["meta"]["all_count"] == 0
+
+        assert _client.get(_TASKS_URL, params={"sort": "id"}).status_code == 422
+        assert _client.get(_TASKS_URL, params={"fields": "name,secret"}).status_code == 422
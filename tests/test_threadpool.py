@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.main import app
+from api.core.configs import ThreadPoolConfig
+from api.core.concurrency import ThreadPoolGroups
+
+
+def test_threadpool_config():
+    _config = ThreadPoolConfig(
+        default_tokens="{cpu_count}", groups={"a": 2, "b": "{cpu_count}"}
+    )
+    assert _config.default_tokens == os.cpu_count()
+    assert _config.groups == {"a": 2, "b": os.cpu_count()}
+
+    with pytest.raises(ValueError):
+        ThreadPoolConfig(groups={"a": 0})
+
+
+@pytest.mark.anyio
+async def test_thread_pool_groups():
+    _thread_pools = ThreadPoolGroups()
+    _thread_pools.configure(default_tokens=40, groups={"small": 2})
+
+    _running = 0
+    _max_running = 0
+    _lock = threading.Lock()
+
+    def _work() -> None:
+        nonlocal _running, _max_running
+        with _lock:
+            _running += 1
+            _max_running = max(_max_running, _running)
+
+        time.sleep(0.02)
+        with _lock:
+            _running -= 1
+
+    _tasks = [
+        asyncio.create_task(_thread_pools.run_sync("small", _work)) for _ in range(6)
+    ]
+    await asyncio.sleep(0.01)
+    _stats = _thread_pools.get_stats()
+    assert _stats["small"] == {"total": 2, "busy": 2, "queued": 4}
+
+    await asyncio.gather(*_tasks)
+    assert _max_running == 2
+    assert _thread_pools.get_stats()["small"]["busy"] == 0
+
+
+def test_thread_pool_route():
+    _thread_pools = ThreadPoolGroups()
+
+    @asynccontextmanager
+    async def _lifespan(app: FastAPI):
+        _thread_pools.configure(default_tokens=40, groups={"items": 1})
+        yield
+
+    _app = FastAPI(lifespan=_lifespan)
+
+    @_app.get("/items/{item_id}")
+    @_thread_pools.route("items")
+    def get_item(request: Request, item_id: int):
+        return {"item_id": item_id, "thread": threading.current_thread().name}
+
+    with TestClient(_app) as _client:
+        _data = _client.get("/items/1").json()
+        assert _data["item_id"] == 1
+        assert _data["thread"] != threading.main_thread().name
+        assert _client.get("/items/x").status_code == 422
+        assert _thread_pools.get_limiter("items").total_tokens == 1
+
+    with pytest.raises(TypeError):
+
+        @_thread_pools.route("items")
+        async def _async_handler():
+            pass
+
+
+def test_health_threadpools():
+    with TestClient(app) as _client:
+        _threadpools = _client.get("/api/v1/health").json()["data"]["threadpools"]
+        assert "tasks" in _threadpools
+        assert set(_threadpools["default"]) == {"total", "busy", "queued"}
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+import time
+import threading
+
+import pytest
+
+from src.main import app  # noqa: F401
+from api.core import utils
+from api.core.constants import UniqueIdModeEnum
+
+
+_CROCKFORD_CHARS = "0123456789abcdefghjkmnpqrstvwxyz"
+
+
+@pytest.fixture
+def ulid_mode():
+    utils.set_unique_id_mode(UniqueIdModeEnum.ulid)
+    yield
+    utils.set_unique_id_mode(UniqueIdModeEnum.timestamp_uuid)
+
+
+def test_timestamp_uuid():
+    _ts, _uuid_hex = utils.gen_unique_id().split("_")
+    assert abs(int(_ts) - time.time()) < 5
+    assert len(_uuid_hex) == 32
+    assert utils.gen_unique_id(" Res ").startswith("res")
+
+    with pytest.raises(ValueError):
+        utils.gen_unique_id("x" * 33)
+
+
+def test_ulid(ulid_mode):
+    _now_ms = time.time_ns() // 1_000_000
+    _ids = [utils.gen_unique_id() for _ in range(10_000)]
+
+    assert all((len(_id) == 26) and set(_id) <= set(_CROCKFORD_CHARS) for _id in _ids)
+    assert len(set(_ids)) == len(_ids)
+    ## Monotonic, including IDs generated in the same millisecond:
+    assert _ids == sorted(_ids)
+
+    _ts_ms = 0
+    for _char in _ids[0][:10]:
+        _ts_ms = (_ts_ms << 5) | _CROCKFORD_CHARS.index(_char)
+
+    assert abs(_ts_ms - _now_ms) < 5_000
+    assert utils.gen_unique_id("res").startswith("res")
+
+
+def test_ulid_threads(ulid_mode):
+    _ids = []
+
+    def _worker() -> None:
+        _ids.extend(utils.gen_unique_id() for _ in range(2_000))
+
+    _threads = [threading.Thread(target=_worker) for _ in range(4)]
+    for _thread in _threads:
+        _thread.start()
+
+    for _thread in _threads:
+        _thread.join()
+
+    assert len(set(_ids)) == len(_ids)
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+import os
+import base64
+import hashlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+from api.core import utils
+from api.core.constants import HashAlgoEnum
+from api.endpoints.upload import router as upload_router
+from api.endpoints.upload.service import UploadStore
+
+
+_URL = "/api/v1/uploads/"
+_OFFSET_HEADERS = {"Content-Type": "application/offset+octet-stream"}
+
+
+@pytest.fixture()
+def store(tmp_path, monkeypatch) -> UploadStore:
+    _store = UploadStore(
+        uploads_dir=str(tmp_path / "uploads"),
+        partial_dir=str(tmp_path / "partial_uploads"),
+        max_size=1024 * 1024,
+        quota=2 * 1024 * 1024,
+        min_free_space=0,
+        expire=3600,
+        write_buffer_size=4096,
+        hash_methods=[HashAlgoEnum.md5, HashAlgoEnum.sha256],
+    )
+    monkeypatch.setattr(upload_router, "_store", _store)
+    return _store
+
+
+@pytest.fixture()
+def client() -> TestClient:
+    return TestClient(app)
+
+
+def _create(client: TestClient, length: int, filename: str = "data.bin") -> str:
+    _metadata = "filename " + base64.b64encode(filename.encode()).decode()
+    _response = client.post(
+        _URL, headers={"Upload-Length": str(length), "Upload-Metadata": _metadata}
+    )
+    assert _response.status_code == 201
+    assert _response.headers["Upload-Offset"] == "0"
+    assert _response.headers["Location"].endswith(_response.json()["data"]["id"])
+    return _response.json()["data"]["id"]
+
+
+def _patch(client: TestClient, upload_id: str, offset: int, data: bytes, **kwargs):
+    return client.patch(
+        f"{_URL}{upload_id}",
+        headers={**_OFFSET_HEADERS, "Upload-Offset": str(offset)},
+        content=data,
+        **kwargs,
+    )
+
+
+def test_chunked_upload(store: UploadStore, client: TestClient):
+    _data = os.urandom(300_000)
+    _upload_id = _create(client, len(_data), filename="../dir/<report>.pdf")
+
+    ## Chunks of any size, not aligned to the write buffer:
+    _offset = 0
+    for _size in (1, 70_001, 100_000, 129_998):
+        _response = _patch(client, _upload_id, _offset, _data[_offset : _offset + _size])
+        assert _response.status_code == 204
+        _offset += _size
+        assert _response.headers["Upload-Offset"] == str(_offset)
+        assert _response.headers["Tus-Resumable"] == "1.0.0"
+
+    _response = client.get(f"{_URL}{_upload_id}")
+    assert _response.status_code == 200
+    _info = _response.json()["data"]
+    assert _info["is_completed"] is True
+    assert _info["filename"] == ".._dir_report.pdf"
+    assert _info["checksums"] == {
+        "md5": hashlib.md5(_data).hexdigest(),
+        "sha256": hashlib.sha256(_data).hexdigest(),
+    }
+
+    _file_path = store.get_file_path(_upload_id)
+    with open(_file_path, "rb") as _file:
+        assert _file.read() == _data
+
+    assert not os.listdir(store.partial_dir)
+    ## Checksums computed while receiving are reused from the sidecar:
+    assert utils.get_file_checksums(_file_path, use_sidecar=True) == _info["checksums"]
+
+    assert _patch(client, _upload_id, len(_data), b"x").status_code == 409
+
+    assert client.delete(f"{_URL}{_upload_id}").status_code == 204
+    assert not os.path.exists(_file_path)
+    assert client.head(f"{_URL}{_upload_id}").status_code == 404
+
+
+def test_resume_after_restart(store: UploadStore, client: TestClient):
+    _data = os.urandom(50_000)
+    _upload_id = _create(client, len(_data))
+    assert _patch(client, _upload_id, 0, _data[:20_000]).status_code == 204
+
+    ## Running hashes are lost, offset is read from the partial file:
+    store._active.clear()
+    _response = client.head(f"{_URL}{_upload_id}")
+    assert _response.status_code == 200
+    assert _response.headers["Upload-Offset"] == "20000"
+    assert _response.headers["Upload-Length"] == "50000"
+    assert "Upload-Expires" in _response.headers
+
+    _response = _patch(client, _upload_id, 10_000, _data[10_000:])
+    assert _response.status_code == 409
+    assert _response.headers["Upload-Offset"] == "20000"
+
+    assert _patch(client, _upload_id, 20_000, _data[20_000:]).status_code == 204
+    _info = client.get(f"{_URL}{_upload_id}").json()["data"]
+    assert _info["checksums"]["sha256"] == hashlib.sha256(_data).hexdigest()
+
+
+def test_upload_limits(store: UploadStore, client: TestClient):
+    _response = client.post(_URL, headers={"Upload-Length": str(store.max_size + 1)})
+    assert _response.status_code == 413
+
+    _upload_id = _create(client, 1000)
+    _response = _patch(client, _upload_id, 0, os.urandom(1001))
+    assert _response.status_code == 413
+
+    _response = client.patch(
+        f"{_URL}{_upload_id}", headers={"Upload-Offset": "0"}, content=b"data"
+    )
+    assert _response.status_code == 415
+
+    ## Declared lengths of partial uploads count towards the quota:
+    _create(client, store.max_size)
+    _response = client.post(_URL, headers={"Upload-Length": str(store.max_size)})
+    assert _response.status_code == 507
+    assert _response.json()["error"]["code"] == "507_00001"
+
+    assert client.delete(f"{_URL}{_upload_id}").status_code == 204
+    assert client.get(f"{_URL}{_upload_id}").status_code == 404
+
+
+def test_empty_upload(store: UploadStore, client: TestClient):
+    _upload_id = _create(client, 0)
+    _info = client.get(f"{_URL}{_upload_id}").json()["data"]
+    assert _info["is_completed"] is True
+    assert _info["checksums"]["md5"] == hashlib.md5(b"").hexdigest()
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from src.main import app
+from api.config import config
+from api.core.dependencies import auth as auth_module
+from api.helpers.crypto import jwt as jwt_helper
+from api.helpers.websocket import WebSocketBatchServer
+
+
+_URL = "/api/v1/tasks/ws"
+
+
+def _encode_token(exp: int) -> str:
+    return jwt_helper.encode(
+        payload={"sub": "user1", "jti": "user1", "exp": exp},
+        key=config.api.security.jwt.secret,
+        algorithm=config.api.security.jwt.algorithm,
+    )
+
+
+def _auth_headers(exp: int) -> dict:
+    return {"Authorization": f"Bearer {_encode_token(exp)}"}
+
+
+def test_task_ops():
+    with TestClient(app) as _client:
+        for _headers in ({}, {"Authorization": "Bearer invalid"}):
+            with pytest.raises(WebSocketDisconnect) as _exc_info:
+                with _client.websocket_connect(_URL, headers=_headers) as _websocket:
+                    _websocket.receive_json()
+
+            assert _exc_info.value.code == 1008
+
+        with _client.websocket_connect(
+            _URL, headers=_auth_headers(int(time.time()) + 60)
+        ) as _websocket:
+            _websocket.send_json(
+                [
+                    {"ref": 1, "op": "create", "data": {"name": "WS task", "point": 5}},
+                    {"ref": 2, "op": "get", "id": "1701388800_missing"},
+                    {"ref": 3, "op": "update"},
+                    {"ref": 4, "op": "list", "data": {"limit": 2, "name_prefix": "ws"}},
+                ]
+            )
+            _results = _websocket.receive_json()
+            assert [(_result["ref"], _result["status"]) for _result in _results] == [
+                (1, 201),
+                (2, 404),
+                (3, 422),
+                (4, 200),
+            ]
+            _task_id = _results[0]["data"]["id"]
+            assert _results[3]["data"][0]["id"] == _task_id
+
+            _websocket.send_json(
+                [
+                    {"ref": "a", "op": "update", "id": _task_id, "data": {"point": 9}},
+                    {"ref": "b", "op": "delete", "id": _task_id},
+                ]
+            )
+            _results = _websocket.receive_json()
+            assert _results[0]["data"]["point"] == 9
+            assert _results[1] == {"ref": "b", "status": 204}
+
+            _websocket.send_text("not json")
+            assert _websocket.receive_json()[0]["status"] == 400
+
+            _websocket.send_text("x" * (config.api.websocket.max_message_size + 1))
+            with pytest.raises(WebSocketDisconnect) as _exc_info:
+                _websocket.receive_json()
+
+            assert _exc_info.value.code == 1009
+
+
+def test_token_sources():
+    _token = _encode_token(int(time.time()) + 60)
+    with TestClient(app) as _client:
+        with _client.websocket_connect(_URL, subprotocols=["bearer", _token]) as _websocket:
+            assert _websocket.accepted_subprotocol == "bearer"
+            _websocket.send_json({"ref": 1, "op": "list", "data": {"limit": 1}})
+            assert _websocket.receive_json()[0]["status"] == 200
+
+        ## Query parameter is disabled by default, URLs are written to access logs:
+        assert not config.api.websocket.allow_query_token
+        with pytest.raises(WebSocketDisconnect) as _exc_info:
+            with _client.websocket_connect(f"{_URL}?access_token={_token}") as _websocket:
+                _websocket.receive_json()
+
+        assert _exc_info.value.code == 1008
+
+
+def test_disabled_before_auth(monkeypatch):
+    _websocket_config = config.api.websocket.model_copy(update={"enabled": False})
+    _api_config = config.api.model_copy(update={"websocket": _websocket_config})
+    monkeypatch.setattr(auth_module, "config", config.model_copy(update={"api": _api_config}))
+
+    ## Rejected without decoding the token:
+    _decoded: List[str] = []
+    monkeypatch.setattr(
+        auth_module, "decode_access_token", lambda access_token: _decoded.append(access_token)
+    )
+    with TestClient(app) as _client:
+        with pytest.raises(WebSocketDisconnect) as _exc_info:
+            with _client.websocket_connect(
+                _URL, headers=_auth_headers(int(time.time()) + 60)
+            ) as _websocket:
+                _websocket.receive_json()
+
+    assert _exc_info.value.code == 1008
+    assert _exc_info.value.reason == "WebSocket endpoints are disabled!"
+    assert not _decoded
+
+
+def test_batching_and_limits():
+    _calls: List[int] = []
+    _server = WebSocketBatchServer(max_connections=1, max_ops=3, queue_size=4)
+    _app = FastAPI()
+
+    async def _handler(ops: List[Any]) -> List[Dict[str, Any]]:
+        _calls.append(len(ops))
+        ## Next messages arrive while the first batch is running:
+        await asyncio.sleep(0.2 if len(_calls) == 1 else 0)
+        return [{"ref": _op["ref"], "status": 200} for _op in ops]
+
+    @_app.websocket("/ws")
+    async def _ws(websocket: WebSocket):
+        await _server.serve(websocket, _handler)
+
+    with TestClient(_app) as _client:
+        with _client.websocket_connect("/ws") as _websocket:
+            _websocket.send_json({"ref": 1})
+            _websocket.send_json([{"ref": 2}, {"ref": 3}])
+            _websocket.send_json([{"ref": 4}] * 4)
+            _websocket.send_json([{"ref": 5}])
+
+            assert [_result["ref"] for _result in _websocket.receive_json()] == [1]
+            ## Queued messages are executed and answered together, errors keep their position:
+            _results = _websocket.receive_json()
+            assert [_result["ref"] for _result in _results] == [2, 3, None, 5]
+            assert _results[2]["status"] == 413
+            assert _calls == [1, 3]
+
+            with pytest.raises(WebSocketDisconnect) as _exc_info:
+                with _client.websocket_connect("/ws") as _other_websocket:
+                    _other_websocket.receive_json()
+
+            assert _exc_info.value.code == 1013
+
+        assert len(_server) == 0